@@ -0,0 +1,204 @@
+import json
+import os
+from datetime import date
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import artifact
+import screener
+
+# Daily history of the published records, one compressed columnar file per market and day:
+#   data/archive/date=2026-10-16/SP500.parquet, data/archive/date=2026-10-16/KOSPI.parquet, ...
+# A day's files are written by that day's full run (a rerun the same day replaces them) and
+# never change afterwards, so the archive only grows at its end. Queries read the files
+# memory-mapped, with just the columns and rows they need.
+ARCHIVE_DIR = os.path.join(artifact.DATA_DIR, 'archive')
+COMPRESSION = 'zstd'
+
+# Per-ticker trend summary for the frontend's sparklines: data/trends.json
+TRENDS_NAME = 'trends.json'
+TREND_DAYS = 30
+# Streak of days the price stayed near its ATH, with the table's green-cell threshold
+NEAR_ATH = dict(screener.GREEN_CELLS)['price_to_ath']['min']
+
+
+def _partition(day, root):
+    return os.path.join(root, f"date={day}")
+
+
+def archived_dates(root=ARCHIVE_DIR):
+    # Archived days, oldest first, as 'YYYY-MM-DD'
+    if not os.path.isdir(root):
+        return []
+    return sorted(d[len('date='):] for d in os.listdir(root) if d.startswith('date='))
+
+
+def _market_files(day, root):
+    partition = _partition(day, root)
+    if not os.path.isdir(partition):
+        return {}
+    return {f[:-len('.parquet')]: os.path.join(partition, f) for f in sorted(os.listdir(partition)) if f.endswith('.parquet')}
+
+
+def append(market_data, day=None, root=ARCHIVE_DIR):
+    # Store {market: records} as the archive of `day` (today by default)
+    day = (day or date.today()).isoformat()
+    partition = _partition(day, root)
+    os.makedirs(partition, exist_ok=True)
+    for name, records in market_data.items():
+        if not records:
+            continue
+        table = pa.Table.from_pandas(pd.DataFrame.from_records(records), preserve_index=False)
+        path = os.path.join(partition, f"{name}.parquet")
+        tmp_path = path + '.tmp'
+        pq.write_table(table, tmp_path, compression=COMPRESSION)
+        os.replace(tmp_path, path)
+    print(f"Archived {', '.join(market_data)} for {day}")
+
+
+def _read(path, columns=None, ticker=None):
+    # Columns added later are missing from older files; they come back as NaN
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    available = parquet_file.schema_arrow.names
+    selected = None if columns is None else [c for c in columns if c in available]
+    table = parquet_file.read(columns=selected)
+    if ticker is not None:
+        table = table.filter(pc.equal(table['ticker'], ticker))
+    df = table.to_pandas()
+    return df.reindex(columns=columns) if columns is not None else df
+
+
+def ticker_history(ticker, fields=None, start=None, end=None, market=None, root=ARCHIVE_DIR):
+    # Archived values of one ticker by day: a frame indexed by date with its market and
+    # `fields` (every field by default). A ticker listed by two markets is taken from
+    # `market`, or from the first one in name order.
+    columns = None if fields is None else ['ticker'] + list(fields)
+    frames = []
+    for day in archived_dates(root):
+        if (start and day < str(start)) or (end and day > str(end)):
+            continue
+        for name, path in _market_files(day, root).items():
+            if market and name != market:
+                continue
+            df = _read(path, columns, ticker)
+            if not df.empty:
+                frames.append(df.head(1).assign(date=pd.Timestamp(day), market=name))
+                break
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames).set_index('date').drop(columns='ticker')
+
+
+def snapshot(day=None, root=ARCHIVE_DIR):
+    # {market: records} of the last archived day up to `day` (the newest one by default),
+    # and that day
+    days = [d for d in archived_dates(root) if day is None or d <= str(day)]
+    if not days:
+        return {}, None
+    records = {name: _read(path).to_dict('records') for name, path in _market_files(days[-1], root).items()}
+    for rows in records.values():
+        for row in rows:
+            row.update({k: None for k, v in row.items() if isinstance(v, float) and pd.isna(v)})
+    return records, days[-1]
+
+
+def screen_as_of(day=None, screen='recommended', root=ARCHIVE_DIR):
+    # The results of a screen on the records archived for `day` (or the last day before),
+    # as {market: [top records]}. Screens are evaluated with their current definitions.
+    market_data, archived = snapshot(day, root)
+    results = screener.screen_markets(market_data)
+    return {market: screens[screen] for market, screens in results.items()}, archived
+
+
+def _near_ath(day, root):
+    # Tickers archived on `day` within NEAR_ATH of their ATH
+    frames = [_read(path, ['ticker', 'price_to_ath']) for path in _market_files(day, root).values()]
+    if not frames:
+        return set()
+    table = pd.concat(frames).drop_duplicates('ticker')
+    return set(table.loc[table['price_to_ath'] >= NEAR_ATH, 'ticker'])
+
+
+def _streaks_before(dates, first, state, root):
+    # {ticker: near-ATH streak} as of the archived day before `first`. The last run's state
+    # (streaks as of an earlier day) is carried forward over the days since; only without one
+    # is the archive read from its start.
+    end = dates.index(first)
+    if end == 0:
+        return None, {}
+    start = 0
+    streaks = {}
+    if state and state.get('date') in dates[:end]:
+        start = dates.index(state['date']) + 1
+        streaks = dict(state.get('days', {}))
+    for day in dates[start:end]:
+        streaks = {ticker: streaks.get(ticker, 0) + 1 for ticker in _near_ath(day, root)}
+    return dates[end - 1], streaks
+
+
+def trends(root=ARCHIVE_DIR, days=TREND_DAYS, state=None):
+    # Per-ticker summary of the archive: the last `days` prices scaled to 0-100 for a
+    # sparkline (null where the ticker was not listed), their change, and for how many
+    # archived days in a row the price has been within NEAR_ATH of its ATH. Only the last
+    # `days` are read in full; the streaks before them continue `state`, the 'streaks' entry
+    # of the previous summary.
+    dates = archived_dates(root)
+    if not dates:
+        return None
+    window = dates[-days:]
+    base_date, base = _streaks_before(dates, window[0], state, root)
+    frames = []
+    for day in window:
+        for name, path in _market_files(day, root).items():
+            frames.append(_read(path, ['ticker', 'price', 'price_to_ath']).assign(date=day))
+    table = pd.concat(frames).drop_duplicates(['date', 'ticker'])
+    prices = table.pivot(index='ticker', columns='date', values='price').reindex(columns=window)
+    near_ath = table.pivot(index='ticker', columns='date', values='price_to_ath').reindex(columns=window) >= NEAR_ATH
+    streaks = near_ath.iloc[:, ::-1].cumprod(axis=1).sum(axis=1)
+
+    latest = set(table.loc[table['date'] == dates[-1], 'ticker'])
+    low = prices.min(axis=1)
+    span = prices.max(axis=1) - low
+    scaled = prices.sub(low, axis=0).div(span.where(span > 0), axis=0).mul(100).round()
+    scaled = scaled.where(span > 0, 50).where(prices.notna())
+    first = prices.bfill(axis=1).iloc[:, 0]
+    last = prices.ffill(axis=1).iloc[:, -1]
+    summary = {}
+    for ticker in sorted(latest):
+        points = [None if pd.isna(v) else int(v) for v in scaled.loc[ticker]]
+        change = last[ticker] / first[ticker] - 1 if first[ticker] > 0 else None
+        streak = int(streaks.get(ticker, 0))
+        if streak == len(window):
+            streak += base.get(ticker, 0)
+        summary[ticker] = {
+            "points": points,
+            "change": round(float(change), 4) if change is not None else None,
+            "near_ath_days": streak,
+        }
+    result = {"format": artifact.FORMAT_VERSION, "dates": window, "near_ath": NEAR_ATH, "tickers": summary}
+    if base_date:
+        result["streaks"] = {"date": base_date, "days": dict(sorted(base.items()))}
+    return result
+
+
+def write_trends(data_root=artifact.DATA_DIR, root=None):
+    # data/trends.json from the archive, announced in the manifest's exports. An unchanged
+    # summary (a rerun on the same data) leaves the file and the manifest as they are.
+    path = os.path.join(data_root, TRENDS_NAME)
+    previous = None
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            previous = json.load(f)
+    summary = trends(root or os.path.join(data_root, 'archive'), state=(previous or {}).get('streaks'))
+    if summary is None:
+        return None
+    changed = previous != summary
+    if changed:
+        artifact.write_json(path, summary)
+    manifest = artifact.load_manifest(data_root)
+    manifest.setdefault("exports", {})["trends"] = TRENDS_NAME
+    artifact.write_manifest(manifest, data_root, touched=changed)
+    return path
@@ -0,0 +1,444 @@
+import filecmp
+import json
+import math
+import os
+import unicodedata
+from datetime import datetime, timezone
+
+# Published data, one columnar file per market: data/SP500.json, data/NASDAQ.json, ...
+DATA_DIR = 'data'
+
+FORMAT_VERSION = 1
+
+# Markets with more records than this are split into shards of SHARD_SIZE records:
+# data/<market>.json keeps the first shard inline and lists the others, which live in
+# data/shards/<market>/<version>-<n>.json. The frontend can render the first (top ranked)
+# shard while the rest downloads in parallel.
+SHARD_SIZE = int(os.environ.get('STOCKMAP_SHARD_SIZE', 1000))
+
+
+def _clean(value):
+    # JSON has no NaN/Infinity, the frontend treats null as "no data"
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def encode_columnar(records):
+    # Key names are stored once and every field becomes one array, in record order
+    keys = list(records[0].keys()) if records else []
+    return {
+        "keys": keys,
+        "columns": [[_clean(r.get(k)) for r in records] for k in keys],
+    }
+
+
+def decode_columnar(payload):
+    keys = payload["keys"]
+    return [dict(zip(keys, row)) for row in zip(*payload["columns"])] if keys else []
+
+
+# --- Sort orders and search index ---
+# Every snapshot carries, for each sortable table column, the record indices in ascending
+# order (ties keep the published order), and a sorted prefix index over tickers and names.
+# The frontend then switches order by picking an index array and finds a search match by
+# binary search instead of sorting and scanning every row.
+SORT_COLUMNS = [
+    'ticker', 'name', 'ath', 'lowest_after_ath', 'price', 'correction_ratio', 'price_to_ath',
+    'days_since_ath', 'ma_20_spread', 'ma_50_spread', 'ma_20_50_spread', 'ma_spread_percentile',
+    'eps_q0', 'eps_q1', 'eps_q2', 'eps_q3', 'per', 'roe', 'green_cells',
+]
+
+
+def _collation_key(text):
+    # Close to the browser's localeCompare: case-insensitive, spaces before punctuation
+    # before digits and letters
+    text = unicodedata.normalize('NFKD', text).casefold()
+    return ''.join(c if c.isalnum() else ('\x00' if c.isspace() else '\x01' + c) for c in text)
+
+
+def _sort_value(value):
+    # Strings compare like localeCompare, missing numbers sort below every number like the
+    # frontend's old comparator (null -> -Infinity)
+    if isinstance(value, str):
+        return (1, _collation_key(value), value)
+    value = _clean(value)
+    return (0, -math.inf if value is None else value, '')
+
+
+def sort_orders(records, columns=SORT_COLUMNS):
+    present = set(records[0]) if records else set()
+    return {
+        column: sorted(range(len(records)), key=lambda i: _sort_value(records[i].get(column)))
+        for column in columns if column in present
+    }
+
+
+def normalize_search(text):
+    # Same as normalizeSearch in script.js: NFKC, lower case, letters and digits only
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    return ''.join(c for c in text if c.isalnum())
+
+
+def _has_hangul(text):
+    return any('\uac00' <= c <= '\ud7a3' for c in text)
+
+
+def _name_keys(name):
+    # The whole name and every word of it onwards ("apple inc" -> "appleinc", "inc").
+    # Korean names have no word breaks to go by, so every suffix is a key ("삼성전자" is
+    # found by "전자" too).
+    words = [normalize_search(w) for w in unicodedata.normalize('NFKC', name or '').split()]
+    words = [w for w in words if w]
+    keys = {''.join(words[i:]) for i in range(len(words))}
+    full = ''.join(words)
+    if _has_hangul(full):
+        keys.update(full[i:] for i in range(len(full)))
+    return keys
+
+
+def _prefix_index(pairs):
+    pairs = sorted(pairs)
+    return {"keys": [k for k, _ in pairs], "rows": [i for _, i in pairs]}
+
+
+def search_index(records):
+    return {
+        "ticker": _prefix_index((normalize_search(r.get('ticker')), i) for i, r in enumerate(records)),
+        "name": _prefix_index((key, i) for i, r in enumerate(records) for key in _name_keys(r.get('name'))),
+    }
+
+
+def market_path(name, root=DATA_DIR):
+    return os.path.join(root, f"{name}.json")
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_market(name, root=DATA_DIR):
+    # The snapshot of a market with its shards (if any) joined back into one payload
+    path = market_path(name, root)
+    if not os.path.exists(path):
+        return None
+    payload = _read_json(path)
+    for shard_file in payload.pop("shards", []):
+        shard = _read_json(os.path.join(root, shard_file))
+        payload["columns"] = [a + b for a, b in zip(payload["columns"], shard["columns"])]
+    return payload
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return text
+
+
+def _prune_shards(name, keep_versions, root):
+    # Shards of the previous version stay around for clients that are still loading it
+    shard_dir = os.path.join(root, 'shards', name)
+    if not os.path.isdir(shard_dir):
+        return
+    for file_name in os.listdir(shard_dir):
+        if file_name.split('-')[0] not in keep_versions:
+            os.remove(os.path.join(shard_dir, file_name))
+
+
+def write_market(name, records, version, root=DATA_DIR, previous_version=None):
+    payload = {
+        "format": FORMAT_VERSION,
+        "market": name,
+        "version": version,
+        "generated_at": datetime.now().isoformat(timespec='seconds'),
+        "count": len(records),
+        **encode_columnar(records),
+        "orders": sort_orders(records),
+        "search": search_index(records),
+    }
+    index = dict(payload)
+    shards = []
+    if len(records) > SHARD_SIZE:
+        index.update(encode_columnar(records[:SHARD_SIZE]))
+        for n, start in enumerate(range(SHARD_SIZE, len(records), SHARD_SIZE), 1):
+            shard_file = f"shards/{name}/{version}-{n}.json"
+            shard_path = os.path.join(root, shard_file)
+            write_json(shard_path, {"columns": encode_columnar(records[start:start + SHARD_SIZE])["columns"]})
+            shards.append(shard_file)
+        index["shards"] = shards
+    path = market_path(name, root)
+    write_json(path, index)
+    _prune_shards(name, {version, previous_version}, root)
+    return payload
+
+
+# --- Deltas ---
+# Every run also publishes what changed against the previous snapshot of each market, and
+# data/manifest.json lists the current version plus the last MAX_DELTAS deltas, so a
+# browser with a cached snapshot only downloads the few fields that moved.
+MANIFEST_NAME = 'manifest.json'
+MAX_DELTAS = 10
+
+
+def compute_delta(old_records, new_records):
+    old_by_ticker = {r['ticker']: r for r in old_records}
+    new_tickers = {r['ticker'] for r in new_records}
+    changed = {}
+    added = []
+    for record in new_records:
+        old = old_by_ticker.get(record['ticker'])
+        if old is None:
+            added.append({k: _clean(v) for k, v in record.items()})
+            continue
+        fields = {k: _clean(v) for k, v in record.items() if _clean(v) != old.get(k) or k not in old}
+        if fields:
+            changed[record['ticker']] = fields
+    removed = [t for t in old_by_ticker if t not in new_tickers]
+    return {"changed": changed, "added": added, "removed": removed}
+
+
+def _delta_payload(name, previous, version, records, delta, indexes=None):
+    # Sort orders and the search index (taken from `indexes` when given) only come along
+    # when tickers, names or fields changed; otherwise the frontend carries them over to the
+    # new record order and re-sorts the numeric columns itself
+    keys = encode_columnar(records[:1])["keys"]
+    reindexed = (delta["added"] or delta["removed"] or previous["keys"] != keys
+                 or any('name' in fields for fields in delta["changed"].values()))
+    if reindexed and indexes is None:
+        indexes = {"orders": sort_orders(records), "search": search_index(records)}
+    return {
+        "format": FORMAT_VERSION,
+        "market": name,
+        "from": previous["version"],
+        "to": version,
+        "keys": keys,
+        "order": [r['ticker'] for r in records],
+        **({"orders": indexes["orders"], "search": indexes["search"]} if reindexed else {}),
+        **delta,
+    }
+
+
+def apply_delta(records, delta):
+    # Same as applyDelta in script.js, without the sort orders and search index
+    by_ticker = {r['ticker']: dict(r) for r in records}
+    for ticker in delta["removed"]:
+        by_ticker.pop(ticker, None)
+    for ticker, fields in delta["changed"].items():
+        if ticker in by_ticker:
+            by_ticker[ticker].update(fields)
+    for record in delta["added"]:
+        by_ticker[record['ticker']] = record
+    return [by_ticker[t] for t in delta["order"] if t in by_ticker]
+
+
+def load_manifest(root=DATA_DIR):
+    path = os.path.join(root, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {"format": FORMAT_VERSION, "markets": {}}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _normalized(data, ignore=()):
+    # `data` as it reads back from JSON, without the `ignore` keys
+    return json.loads(json.dumps({k: v for k, v in data.items() if k not in ignore}, ensure_ascii=False))
+
+
+def write_manifest(manifest, root=DATA_DIR, touched=False):
+    # The manifest is only rewritten, with a new generated_at, when something in it changed or
+    # a file it names was rewritten in place (`touched`), so rerunning on the same data leaves
+    # data/ byte for byte as it was
+    path = os.path.join(root, MANIFEST_NAME)
+    if os.path.exists(path) and not touched:
+        previous = load_manifest(root)
+        if _normalized(previous, ('generated_at',)) == _normalized(manifest, ('generated_at',)):
+            manifest["generated_at"] = previous.get("generated_at")
+            return manifest
+    manifest["generated_at"] = datetime.now().isoformat(timespec='seconds')
+    write_json(path, manifest)
+    return manifest
+
+
+def new_version():
+    return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def publish(market_data, root=DATA_DIR, version=None, labels=None, recommendations=None, screens=None):
+    # Write snapshots, deltas and the manifest for {market: records}. The screener's
+    # `recommendations` ({market: {screen: records}}) and metadata (`screens`) go into the
+    # manifest, so the recommendation row renders before any market file is loaded.
+    manifest = load_manifest(root)
+    version = version or new_version()
+
+    for name, records in market_data.items():
+        entry = manifest["markets"].get(name, {"deltas": []})
+        order = [r['ticker'] for r in records]
+        previous = load_market(name, root)
+        delta = None
+        if previous and previous.get("version"):
+            old_records = decode_columnar(previous)
+            delta = compute_delta(old_records, records)
+            unchanged = (not any(delta.values())
+                         and [r['ticker'] for r in old_records] == order
+                         and previous["keys"] == encode_columnar(records[:1])["keys"])
+            if unchanged:
+                print(f"[{name}] No changes since {previous['version']}, keeping the published snapshot")
+                _drop_intraday(name, manifest["markets"].get(name, {}), root)
+                if name in manifest["markets"] and labels and name in labels:
+                    manifest["markets"][name]["label"] = labels[name]
+                if name in manifest["markets"] and recommendations and name in recommendations:
+                    manifest["markets"][name]["recommendations"] = recommendations[name]
+                continue
+
+        payload = write_market(name, records, version, root, previous["version"] if previous else None)
+        _drop_intraday(name, entry, root)
+
+        deltas = entry.get("deltas", [])
+        if delta is not None:
+            delta_file = f"deltas/{name}/{previous['version']}_{version}.json"
+            write_json(os.path.join(root, delta_file), _delta_payload(name, previous, version, records, delta, payload))
+            deltas.append({"from": previous["version"], "to": version, "file": delta_file})
+            print(f"[{name}] Delta {previous['version']} -> {version}: {len(delta['changed'])} changed, "
+                  f"{len(delta['added'])} added, {len(delta['removed'])} removed")
+
+        # Only the newest deltas are kept; clients further behind download the snapshot
+        for old in deltas[:-MAX_DELTAS]:
+            old_path = os.path.join(root, old["file"])
+            if os.path.exists(old_path):
+                os.remove(old_path)
+        manifest["markets"][name] = {
+            "label": (labels or {}).get(name, entry.get("label", name)),
+            "version": version,
+            "count": len(records),
+            "file": f"{name}.json",
+            "deltas": deltas[-MAX_DELTAS:],
+            "recommendations": (recommendations or {}).get(name, entry.get("recommendations", {})),
+        }
+
+    if screens:
+        manifest.update(screens)
+    manifest["format"] = FORMAT_VERSION
+    return write_manifest(manifest, root)
+
+
+# --- Intraday refreshes ---
+# The price refresh runs every few minutes while the market is open, far too often for the
+# delta chain above (MAX_DELTAS would cover an hour and a half). Its result is published
+# beside the chain instead: data/intraday/<market>.json is one delta from the published
+# snapshot to the latest quotes, overwritten by every refresh and listed as the manifest
+# entry's "intraday". Browsers apply it on top of the snapshot they have (cached or not)
+# without caching it, and the next full run drops it.
+def _intraday_file(name):
+    return f"intraday/{name}.json"
+
+
+def _drop_intraday(name, entry, root):
+    entry.pop("intraday", None)
+    path = os.path.join(root, _intraday_file(name))
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def load_records(name, root=DATA_DIR):
+    # Records of a market as the browser shows them: the snapshot plus its intraday refresh
+    payload = load_market(name, root)
+    if payload is None:
+        return None
+    records = decode_columnar(payload)
+    intraday = load_manifest(root)["markets"].get(name, {}).get("intraday")
+    if intraday and intraday["from"] == payload["version"]:
+        records = apply_delta(records, _read_json(os.path.join(root, intraday["file"])))
+    return records
+
+
+def publish_intraday(market_data, root=DATA_DIR, recommendations=None, screens=None):
+    # Publish {market: records} as the intraday refresh of the published snapshots
+    manifest = load_manifest(root)
+    version = new_version()
+    for name, records in market_data.items():
+        entry = manifest["markets"].get(name)
+        previous = load_market(name, root)
+        if entry is None or previous is None:
+            print(f"[{name}] No published snapshot to refresh")
+            continue
+        delta = compute_delta(decode_columnar(previous), records)
+        intraday_file = _intraday_file(name)
+        path = os.path.join(root, intraday_file)
+        payload = _delta_payload(name, previous, version, records, delta)
+        current = entry.get("intraday")
+        if (current and current["from"] == previous["version"] and os.path.exists(path)
+                and _normalized(_read_json(path), ('to',)) == _normalized(payload, ('to',))):
+            print(f"[{name}] No price changes since the last refresh")
+            continue
+        write_json(path, payload)
+        entry["intraday"] = {"from": previous["version"], "to": version, "file": intraday_file, "count": len(records)}
+        if recommendations and name in recommendations:
+            entry["recommendations"] = recommendations[name]
+        print(f"[{name}] Intraday {previous['version']} -> {version}: {len(delta['changed'])} changed")
+
+    if screens:
+        manifest.update(screens)
+    return write_manifest(manifest, root)
+
+
+def retire(keep, root=DATA_DIR):
+    # Remove markets that are not published any more (e.g. after switching universe mode)
+    manifest = load_manifest(root)
+    retired = [name for name in manifest["markets"] if name not in keep]
+    if not retired:
+        return
+    for name in retired:
+        entry = manifest["markets"].pop(name)
+        for delta in entry.get("deltas", []):
+            if os.path.exists(os.path.join(root, delta["file"])):
+                os.remove(os.path.join(root, delta["file"]))
+        _drop_intraday(name, entry, root)
+        if os.path.exists(market_path(name, root)):
+            os.remove(market_path(name, root))
+        _prune_shards(name, set(), root)
+        print(f"[{name}] Not part of this universe any more, removed from the manifest")
+    write_manifest(manifest, root)
+
+
+# --- Parquet export ---
+# The daily full run also writes its snapshots as one table over all markets, with the
+# market and snapshot version of every row, for analysis outside the browser (the page
+# links it). Intraday refreshes leave it alone:
+#   pd.read_parquet('data/stockmap.parquet')
+PARQUET_NAME = 'stockmap.parquet'
+
+
+def export_parquet(root=DATA_DIR):
+    import pandas as pd
+
+    manifest = load_manifest(root)
+    frames = []
+    for name, entry in manifest["markets"].items():
+        payload = load_market(name, root)
+        if not payload:
+            continue
+        frame = pd.DataFrame(dict(zip(payload["keys"], payload["columns"])))
+        frame.insert(0, "version", entry.get("version"))
+        frame.insert(0, "market", name)
+        frames.append(frame)
+    if not frames:
+        return None
+    path = os.path.join(root, PARQUET_NAME)
+    tmp_path = path + '.tmp'
+    pd.concat(frames, ignore_index=True).to_parquet(tmp_path, index=False)
+    # An export of the same snapshots is left alone, so a rerun changes nothing
+    changed = not (os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False))
+    if changed:
+        os.replace(tmp_path, path)
+    else:
+        os.remove(tmp_path)
+    # The manifest tells the frontend that the export exists; its generated_at is the
+    # export's cache buster
+    manifest.setdefault("exports", {})["parquet"] = PARQUET_NAME
+    write_manifest(manifest, root, touched=changed)
+    return path
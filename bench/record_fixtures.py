@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+
+import pandas as pd
+import yahooquery as yq
+import FinanceDataReader as fdr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import history_store
+import providers
+from fetch_all_data import FUNDAMENTAL_MODULES
+from replay import FIXTURE_DIR
+
+# Records one live response per provider call used by the pipeline so run_bench.py can
+# replay them offline. A mix of large/small caps from every market keeps the shapes honest.
+SAMPLE = [
+    'AAPL', 'MSFT', 'NVDA', 'AMZN', 'GOOGL', 'META', 'BRK-B', 'JPM', 'XOM', 'JNJ',
+    'INTC', 'CSCO', 'XEL', 'PLTR', 'ARM', 'MRNA', 'ZS', 'DDOG', 'SMCI', 'COIN',
+    '005930.KS', '000660.KS', '035420.KS', '005380.KS', '051910.KS', '068270.KS',
+]
+
+
+def main():
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    t = yq.Ticker(SAMPLE)
+
+    print("Recording quoteSummary modules...")
+    modules = t.get_modules([m for m in FUNDAMENTAL_MODULES if m not in providers.TIME_SERIES])
+    for module, (kind, frequency) in providers.TIME_SERIES.items():
+        print(f"Recording {module} time series...")
+        series = providers.time_series_modules(t.get_financial_data([kind], frequency=frequency, trailing=False), module)
+        for symbol, value in series.items():
+            if isinstance(modules.get(symbol), dict):
+                modules[symbol][module] = value
+    with open(os.path.join(FIXTURE_DIR, 'modules.json'), 'w') as f:
+        json.dump(modules, f, default=str)
+
+    for interval, period in history_store.LOOKBACK.items():
+        print(f"Recording {period} of {interval} history...")
+        frames = history_store.split_history(t.history(period=period, interval=interval))
+        pd.concat(frames, names=['symbol', 'date']).to_parquet(os.path.join(FIXTURE_DIR, f"history_{interval}.parquet"))
+
+    print("Recording quotes...")
+    with open(os.path.join(FIXTURE_DIR, 'quotes.json'), 'w') as f:
+        json.dump(t.quotes, f, default=str)
+
+    print("Recording FinanceDataReader daily history...")
+    start = (pd.Timestamp.today() - pd.DateOffset(years=history_store.LOOKBACK_YEARS['1d'])).strftime('%Y-%m-%d')
+    codes = [symbol.split('.')[0] for symbol in SAMPLE if symbol.endswith('.KS')]
+    readers = {code: fdr.DataReader(code, start) for code in codes}
+    pd.concat(readers, names=['code', 'date']).to_parquet(os.path.join(FIXTURE_DIR, 'datareader.parquet'))
+
+    for market in ('KOSPI', 'NASDAQ'):
+        print(f"Recording {market} listing...")
+        fdr.StockListing(market).to_parquet(os.path.join(FIXTURE_DIR, f"listing_{market}.parquet"))
+
+    print(f"Fixtures written to {FIXTURE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
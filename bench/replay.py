@@ -0,0 +1,208 @@
+import json
+import os
+import time
+import zlib
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+import providers
+
+# Offline stand-ins for yahooquery and FinanceDataReader. They serve the responses saved by
+# record_fixtures.py; any requested symbol is mapped onto one of the recorded tickers, so a
+# handful of recordings can play a universe of thousands. Without recordings a deterministic
+# synthetic set is generated instead (quotes and KRX prices then follow the last recorded close).
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def _synthetic_fixtures(count=25):
+    today = date.today()
+    daily_dates = pd.bdate_range(today - timedelta(days=400), today)
+    weekly_dates = pd.date_range(today - timedelta(days=365 * 20), today, freq='W-MON')
+    history = {'1d': {}, '1wk': {}}
+    modules = {}
+    for i in range(count):
+        symbol = f"TPL{i:02d}"
+        rng = np.random.default_rng(i)
+        for interval, dates in (('1d', daily_dates), ('1wk', weekly_dates)):
+            close = np.abs(50 + 10 * i + np.cumsum(rng.normal(0, 1, len(dates)))) + 1
+            history[interval][symbol] = pd.DataFrame({
+                'open': close, 'high': close * 1.02, 'low': close * 0.98,
+                'close': close, 'volume': 1e6, 'adjclose': close,
+            }, index=pd.DatetimeIndex(dates, name='date'))
+        quarters = pd.date_range(end=today, periods=5, freq='QE')[:-1]
+        series = pd.date_range(end=today, periods=9, freq='QE')[:-1]
+        modules[symbol] = {
+            'summaryDetail': {'trailingPE': 10.0 + i, 'forwardPE': 9.0 + i},
+            'defaultKeyStatistics': {'earningsQuarterlyGrowth': 0.01 * i, 'trailingPE': 10.0 + i,
+                                     'trailingEps': 1.0 + 0.1 * i, 'forwardEps': 1.2 + 0.1 * i},
+            'financialData': {'returnOnEquity': 0.005 * i, 'earningsGrowth': 0.02 * i},
+            'earningsHistory': {'history': [{'quarter': q.strftime('%Y-%m-%d'), 'epsActual': 0.25 + 0.01 * (i + n)}
+                                            for n, q in enumerate(quarters)]},
+            'calendarEvents': {'earnings': {'earningsDate': [(today + timedelta(days=30 + i)).isoformat()]}},
+            'quarterlyEps': {'history': [{'asOfDate': q.strftime('%Y-%m-%d'), 'DilutedEPS': 0.2 + 0.01 * (i + n)}
+                                         for n, q in enumerate(series)]},
+        }
+    return history, modules, {}, {}, {}
+
+
+def load_fixtures(root=FIXTURE_DIR):
+    modules_path = os.path.join(root, 'modules.json')
+    if not os.path.exists(modules_path):
+        print(f"No recorded fixtures in {root}, using synthetic ones (run bench/record_fixtures.py to record)")
+        return _synthetic_fixtures() + ('synthetic',)
+
+    with open(modules_path) as f:
+        modules = json.load(f)
+    history = {}
+    for interval in ('1d', '1wk'):
+        df = pd.read_parquet(os.path.join(root, f"history_{interval}.parquet"))
+        history[interval] = {t: df.xs(t, level=0) for t in df.index.get_level_values(0).unique()}
+    listings = {}
+    for name in os.listdir(root):
+        if name.startswith('listing_') and name.endswith('.parquet'):
+            listings[name[len('listing_'):-len('.parquet')]] = pd.read_parquet(os.path.join(root, name))
+    quotes = {}
+    quotes_path = os.path.join(root, 'quotes.json')
+    if os.path.exists(quotes_path):
+        with open(quotes_path) as f:
+            quotes = {s: q for s, q in json.load(f).items() if isinstance(q, dict)}
+    readers = {}
+    readers_path = os.path.join(root, 'datareader.parquet')
+    if os.path.exists(readers_path):
+        df = pd.read_parquet(readers_path)
+        readers = {code: df.xs(code, level=0) for code in df.index.get_level_values(0).unique()}
+    return history, modules, listings, quotes, readers, 'recorded'
+
+
+class Replay:
+    def __init__(self, root=FIXTURE_DIR, latency=0.0):
+        self.history, self.modules, self.listings, self.quotes, self.readers, self.source = load_fixtures(root)
+        self.templates = sorted(t for t in self.history['1d'] if t in self.history['1wk'])
+        # KRX codes the bulk listing has to cover (set by the benchmark for its KRX universe)
+        self.krx_codes = []
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def template_for(self, symbol):
+        if symbol in self.history['1d']:
+            return symbol
+        return self.templates[zlib.crc32(symbol.encode()) % len(self.templates)]
+
+    def request(self):
+        with self.lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    # yahooquery.Ticker look-alike
+    def Ticker(self, symbols, **kwargs):
+        return ReplayTicker(self, [symbols] if isinstance(symbols, str) else list(symbols))
+
+    def quote(self, symbol):
+        # Recorded quote of the symbol's template, or one at its last recorded close. Market
+        # caps of synthetic quotes spread over 1e5..1e8 shares so the prefilter drops some.
+        template = self.template_for(symbol)
+        quote = dict(self.quotes.get(template) or {})
+        if not quote:
+            close = float(self.history['1d'][template]['close'].iloc[-1])
+            shares = 10 ** (5 + zlib.crc32(symbol.encode()) % 4)
+            quote = {'regularMarketPrice': close, 'marketCap': close * shares}
+        quote['regularMarketTime'] = int(time.time())
+        return quote
+
+    # FinanceDataReader.StockListing look-alike. The KRX listing lists self.krx_codes, each
+    # priced like its template.
+    def StockListing(self, market):
+        self.request()
+        if market == 'KRX':
+            rows = []
+            for code in self.krx_codes:
+                quote = self.quote(f"{code}.KS")
+                rows.append({'Code': code, 'Name': f"KRX {code}", 'Market': 'KOSPI',
+                             'Close': quote['regularMarketPrice'], 'Marcap': quote.get('marketCap', 0)})
+            return pd.DataFrame(rows, columns=['Code', 'Name', 'Market', 'Close', 'Marcap'])
+        if market not in self.listings:
+            raise ValueError(f"No recorded listing for {market}")
+        return self.listings[market].copy()
+
+    # FinanceDataReader.DataReader look-alike: daily bars of one KRX code from `start`
+    def DataReader(self, code, start=None, end=None):
+        self.request()
+        if self.readers:
+            df = self.readers[sorted(self.readers)[zlib.crc32(code.encode()) % len(self.readers)]]
+        else:
+            df = self.history['1d'][self.template_for(f"{code}.KS")][['open', 'high', 'low', 'close', 'volume']]
+            df = df.rename(columns=str.capitalize)
+        if start:
+            df = df[df.index >= pd.Timestamp(start)]
+        return df.copy()
+
+
+class ReplayTicker:
+    def __init__(self, replay, symbols):
+        self.replay = replay
+        self.symbols = symbols
+
+    def get_modules(self, modules):
+        self.replay.request()
+        modules = modules if isinstance(modules, list) else modules.split()
+        out = {}
+        for symbol in self.symbols:
+            recorded = self.replay.modules.get(self.replay.template_for(symbol), {})
+            out[symbol] = {m: recorded[m] for m in modules if m in recorded} if isinstance(recorded, dict) else recorded
+        return out
+
+    # Only the series recorded as modules ('quarterlyEps': {'history': [...]}) are served
+    def get_financial_data(self, types, frequency='a', trailing=True):
+        self.replay.request()
+        types = types if isinstance(types, list) else types.split()
+        rows = []
+        for symbol in self.symbols:
+            recorded = self.replay.modules.get(self.replay.template_for(symbol), {})
+            recorded = recorded if isinstance(recorded, dict) else {}
+            for module, (kind, module_frequency) in providers.TIME_SERIES.items():
+                if kind not in types or module_frequency != frequency:
+                    continue
+                for quarter in recorded.get(module, {}).get('history', []):
+                    rows.append({'symbol': symbol, 'asOfDate': quarter['asOfDate'], 'periodType': '3M', kind: quarter[kind]})
+        if not rows:
+            return f"fundamentals time series not found for {', '.join(self.symbols)}"
+        return pd.DataFrame(rows).set_index('symbol')
+
+    @property
+    def quotes(self):
+        self.replay.request()
+        return {symbol: self.replay.quote(symbol) for symbol in self.symbols}
+
+    def _module(self, module):
+        return {s: v.get(module, {}) if isinstance(v, dict) else v for s, v in self.get_modules([module]).items()}
+
+    @property
+    def summary_detail(self):
+        return self._module('summaryDetail')
+
+    @property
+    def key_stats(self):
+        return self._module('defaultKeyStatistics')
+
+    @property
+    def financial_data(self):
+        return self._module('financialData')
+
+    def history(self, period='ytd', interval='1d', start=None, end=None, **kwargs):
+        self.replay.request()
+        frames = {}
+        for symbol in self.symbols:
+            df = self.replay.history[interval][self.replay.template_for(symbol)]
+            if start:
+                df = df[df.index >= pd.Timestamp(start)]
+            elif period and period.endswith('y'):
+                df = df[df.index >= pd.Timestamp(date.today()) - pd.DateOffset(years=int(period[:-1]))]
+            frames[symbol] = df
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, names=['symbol', 'date'])
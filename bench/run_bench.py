@@ -0,0 +1,188 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import artifact
+import fetch_all_data
+import instrumentation
+import isolation
+import providers
+import scheduler
+from replay import Replay
+
+# Offline throughput/memory benchmark of the fetch paths on synthetic universes, replaying
+# recorded provider responses. Every run appends one JSON line to bench/results.jsonl.
+RESULTS_PATH = os.path.join(REPO_DIR, 'bench', 'results.jsonl')
+DEFAULT_SIZES = [100, 1000, 5000]
+# Timed paths of every size: the default (Yahoo) route cold and warm, the KRX route, the
+# market-cap prefilter and the intraday price refresh
+PHASES = ('cold', 'warm', 'krx_cold', 'krx_warm', 'prefilter', 'refresh')
+
+
+def install(replay):
+    providers.yq = replay
+    providers.fdr = replay
+    fetch_all_data.rate_limiter = scheduler.TokenBucket(1e9, capacity=1e9)
+
+
+def run_once(replay, count, fn, *args):
+    # Stage timings come from the pipeline's own run report (summed over worker threads)
+    report = instrumentation.reset(profile=False)
+    requests_before = replay.requests
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn(*args)
+    seconds = time.perf_counter() - started
+    return result, {
+        "seconds": round(seconds, 3),
+        "tickers_per_sec": round(count / seconds, 1) if seconds else None,
+        "requests": replay.requests - requests_before,
+        "stage_thread_seconds": {k: v["seconds"] for k, v in report.to_dict()["stages"].items()},
+    }
+
+
+def run_pipeline(name, items, replay):
+    records, stats = run_once(replay, len(items), fetch_all_data.process_market, name, items)
+    return records, {**stats, "records": len(records)}
+
+
+def peak_memory(name, items, replay):
+    # Peak traced allocation (MB) of a cold run on an empty store and of the warm run after
+    # it. tracemalloc slows the pipeline down, so these runs are kept apart from the timed ones.
+    peaks = {}
+    for phase in ('cold', 'warm'):
+        tracemalloc.start()
+        try:
+            run_pipeline(name, items, replay)
+            peaks[phase] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1)
+        finally:
+            tracemalloc.stop()
+    return peaks
+
+
+@contextlib.contextmanager
+def scratch_dir():
+    # A fresh working directory (empty cache/ and data/) per measurement
+    workdir = tempfile.mkdtemp(prefix='stockmap-bench-')
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        fetch_all_data.quarantine = isolation.Quarantine()
+        yield workdir
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_size(size, replay):
+    items = [(f"SYN{i:05d}", f"Synthetic {i}", "Bench") for i in range(size)]
+    # The KRX route: quotes from the bulk listing, history from FinanceDataReader per code
+    krx_items = [(f"{i:06d}.KS", f"KRX {i}", "Bench") for i in range(size)]
+    replay.krx_codes = [f"{i:06d}" for i in range(size)]
+    with scratch_dir():
+        _, cold = run_pipeline("BENCH", items, replay)   # empty store: full backfill
+        records, warm = run_pipeline("BENCH", items, replay)   # nightly case: delta fetch only
+        _, krx_cold = run_pipeline("KOSPI", krx_items, replay)
+        krx_records, krx_warm = run_pipeline("KOSPI", krx_items, replay)
+
+        kept, prefilter = run_once(replay, 2 * size, fetch_all_data.prefilter_market_cap,
+                                   {"NASDAQ": items, "KOSPI": krx_items})
+        prefilter["records"] = sum(len(v) for v in kept.values())
+
+        # Intraday refresh of both markets from the indicator state the runs above left
+        with contextlib.redirect_stdout(io.StringIO()):
+            artifact.publish({"BENCH": records, "KOSPI": krx_records})
+        _, refresh = run_once(replay, 2 * size, fetch_all_data.refresh_prices, None, True)
+    with scratch_dir():
+        peaks = peak_memory("BENCH", items, replay)
+    return {"tickers": size, "cold": cold, "warm": warm, "krx_cold": krx_cold, "krx_warm": krx_warm,
+            "prefilter": prefilter, "refresh": refresh, "peak_memory_mb": peaks}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(entry, previous):
+    print(f"Compared with {previous['commit']} ({previous['timestamp']}):")
+    before = {r['tickers']: r for r in previous['results']}
+    for result in entry['results']:
+        old = before.get(result['tickers'])
+        if not old:
+            continue
+        for phase in PHASES:
+            if phase not in result or phase not in old:
+                continue
+            ratio = result[phase]['seconds'] / old[phase]['seconds'] if old[phase]['seconds'] else float('nan')
+            print(f"  {result['tickers']:>6} tickers {phase}: {old[phase]['seconds']:.2f}s -> {result[phase]['seconds']:.2f}s ({ratio:.2f}x)")
+        # Results before the cold peak was sampled hold the warm peak as a single number
+        old_peaks = old['peak_memory_mb'] if isinstance(old['peak_memory_mb'], dict) else {'warm': old['peak_memory_mb']}
+        for phase, peak in result['peak_memory_mb'].items():
+            if phase in old_peaks:
+                print(f"  {result['tickers']:>6} tickers {phase} peak memory: {old_peaks[phase]} MB -> {peak} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark of the fetch pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated seconds per provider request")
+    parser.add_argument('--workers', type=int, default=fetch_all_data.MAX_WORKERS)
+    parser.add_argument('--output', default=RESULTS_PATH)
+    parser.add_argument('--compare', action='store_true', help="compare with the previous result of the same setup")
+    args = parser.parse_args()
+
+    fetch_all_data.MAX_WORKERS = args.workers
+    replay = Replay(latency=args.latency)
+    install(replay)
+
+    entry = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "fixtures": replay.source,
+        "latency": args.latency,
+        "workers": args.workers,
+        "results": [],
+    }
+    for size in args.sizes:
+        result = run_size(size, replay)
+        entry["results"].append(result)
+        print(f"{size:>6} tickers: cold {result['cold']['seconds']:.2f}s ({result['cold']['tickers_per_sec']}/s), "
+              f"warm {result['warm']['seconds']:.2f}s ({result['warm']['tickers_per_sec']}/s), "
+              f"KRX {result['krx_cold']['seconds']:.2f}s/{result['krx_warm']['seconds']:.2f}s, "
+              f"prefilter {result['prefilter']['seconds']:.2f}s, refresh {result['refresh']['seconds']:.2f}s, "
+              f"peak {result['peak_memory_mb']['cold']} MB cold / {result['peak_memory_mb']['warm']} MB warm")
+
+    previous = None
+    if os.path.exists(args.output):
+        with open(args.output) as f:
+            for line in f:
+                old = json.loads(line)
+                if all(old.get(k) == entry[k] for k in ('fixtures', 'latency', 'workers')):
+                    previous = old
+    with open(args.output, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+    print(f"Results appended to {args.output}")
+
+    if args.compare and previous:
+        compare(entry, previous)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import heapq
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+
+# Results of the run in progress, streamed to disk as chunks finish:
+#   cache/checkpoints/<run_id>/SP500.jsonl, NASDAQ.jsonl, ...
+# Each file is append-only: the records of a chunk (sorted by the final sort key), then a
+# commit line listing the chunk's tickers. Records without a commit line after them are a
+# chunk that was still being written when the job died and are thrown away.
+CHECKPOINT_DIR = os.path.join('cache', 'checkpoints')
+
+
+def new_run_id():
+    return datetime.now().strftime('%Y%m%dT%H%M%S')
+
+
+def latest_run_id(root=CHECKPOINT_DIR):
+    if not os.path.isdir(root):
+        return None
+    runs = sorted(d for d in os.listdir(root) if os.path.isdir(os.path.join(root, d)))
+    return runs[-1] if runs else None
+
+
+def remove_run(run_id, root=CHECKPOINT_DIR):
+    shutil.rmtree(os.path.join(root, run_id), ignore_errors=True)
+
+
+def remove_runs(root=CHECKPOINT_DIR):
+    # Drop the checkpoints of every finished or abandoned run
+    if not os.path.isdir(root):
+        return
+    for run_id in os.listdir(root):
+        remove_run(run_id, root)
+
+
+def _read_chunks(path):
+    # (tickers, start, end) of every committed chunk, its records being the lines between
+    # the two byte offsets, and the byte offset after the last commit line. Only the commit
+    # lines are parsed; the records stay on disk until merged() streams them.
+    chunks = []
+    end = 0
+    if not os.path.exists(path):
+        return chunks, end
+    with open(path, 'rb') as f:
+        start = position = 0
+        for line in f:
+            if line.startswith(b'{"commit"'):
+                try:
+                    tickers = json.loads(line)['commit']
+                except ValueError:
+                    break  # torn write at the end of the file
+                chunks.append((tickers, start, position))
+                start = end = position + len(line)
+            position += len(line)
+    return chunks, end
+
+
+def _chunk_records(f, start, end):
+    # Records of one chunk, read one line at a time from `f`, which the chunks share
+    while start < end:
+        f.seek(start)
+        line = f.readline()
+        start += len(line)
+        yield json.loads(line)['record']
+
+
+class CheckpointWriter:
+    # Append-only result log of one market, shared by all worker threads
+    def __init__(self, run_id, market, sort_key, root=CHECKPOINT_DIR):
+        self.path = os.path.join(root, run_id, f"{market}.jsonl")
+        self.sort_key = sort_key
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        chunks, end = _read_chunks(self.path)
+        self.done = {ticker for tickers, _, _ in chunks for ticker in tickers}
+        if os.path.exists(self.path) and os.path.getsize(self.path) > end:
+            # Cut off the half-written chunk so new chunks start on a clean line
+            with open(self.path, 'r+b') as f:
+                f.truncate(end)
+
+    def write_chunk(self, tickers, records):
+        lines = [json.dumps({'record': r}, ensure_ascii=False) for r in sorted(records, key=self.sort_key, reverse=True)]
+        lines.append(json.dumps({'commit': list(tickers)}))
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.done.update(tickers)
+
+    def merged(self):
+        # Every chunk is already sorted, so the final order is a k-way merge of the chunks.
+        # The merge reads each chunk lazily, holding one record per chunk in memory.
+        chunks, _ = _read_chunks(self.path)
+        if not chunks:
+            return
+        with open(self.path, 'rb') as f:
+            yield from heapq.merge(*(_chunk_records(f, start, end) for _, start, end in chunks),
+                                   key=self.sort_key, reverse=True)
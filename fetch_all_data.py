@@ -1,16 +1,27 @@
+import argparse
+import os
+import time
 import pandas as pd
 import json
-import urllib.request
-import yahooquery as yq
 import pytz
 from datetime import datetime
-import FinanceDataReader as fdr
+import fundamentals_cache
+import history_store
+import indicator_state
+import metrics
+import providers
+import scheduler
+import isolation
+import universe_cache
+import artifact
+import checkpoint
+import instrumentation
+import screener
 
 def get_sp500_items():
     print("Fetching S&P 500 companies...")
     url = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
-    req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-    html = urllib.request.urlopen(req).read()
+    html = universe_cache.fetch_url(url, {'User-Agent': 'Mozilla/5.0'})
     tables = pd.read_html(html)
     df = tables[0]
     return list(zip(df['Symbol'].tolist(), df['Security'].tolist(), df['GICS Sector'].tolist()))
@@ -18,15 +29,15 @@ def get_sp500_items():
 def get_nasdaq_items():
     print("Fetching NASDAQ top 300 companies...")
     url = 'https://api.nasdaq.com/api/screener/stocks?tableonly=true&limit=5000&exchange=NASDAQ'
-    req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0', 'Accept': 'application/json, text/plain, */*'})
-    resp = urllib.request.urlopen(req).read()
+    resp = universe_cache.fetch_url(url, {'User-Agent': 'Mozilla/5.0', 'Accept': 'application/json, text/plain, */*'})
     data = json.loads(resp)['data']['table']['rows']
     
     df_mcap = pd.DataFrame(data)
     df_mcap['marketCapNum'] = df_mcap['marketCap'].astype(str).str.replace(',', '', regex=False).apply(pd.to_numeric, errors='coerce')
     top300 = df_mcap.sort_values('marketCapNum', ascending=False).head(300).copy()
     
-    df_fdr = fdr.StockListing('NASDAQ')
+    instrumentation.report.request('fdr')
+    df_fdr = providers.finance_datareader().StockListing('NASDAQ')
     df_merged = top300.merge(df_fdr, left_on='symbol', right_on='Symbol', how='left')
     
     top300_tickers = df_merged['symbol'].tolist()
@@ -38,181 +49,498 @@ def get_nasdaq_items():
 
 def get_kospi_items():
     print("Fetching KOSPI 100 companies...")
-    df = fdr.StockListing('KOSPI')
+    instrumentation.report.request('fdr')
+    df = providers.finance_datareader().StockListing('KOSPI')
     top100 = df.sort_values('Marcap', ascending=False).head(100)
     tickers = top100['Code'] + '.KS'
     return list(zip(tickers.tolist(), top100['Name'].tolist(), top100['Dept'].fillna("N/A").tolist()))
 
-tz = pytz.timezone('US/Eastern')
-now = datetime.now(tz)
-is_market_open = False
-if now.weekday() < 5 and now.hour >= 9 and now.hour < 16:
-    if now.hour == 9 and now.minute < 30:
-        is_market_open = False
-    else:
-        is_market_open = True
+def get_exchange_items(exchange):
+    # Every listing of a US exchange ("NASDAQ", "NYSE") from the NASDAQ screener
+    print(f"Fetching all {exchange} listings...")
+    url = f'https://api.nasdaq.com/api/screener/stocks?tableonly=true&download=true&exchange={exchange}'
+    resp = universe_cache.fetch_url(url, {'User-Agent': 'Mozilla/5.0', 'Accept': 'application/json, text/plain, */*'})
+    data = json.loads(resp)['data']
+    rows = data['rows'] if data.get('rows') else data['table']['rows']
+    items = []
+    for row in rows:
+        symbol = str(row.get('symbol') or '').strip()
+        # Preferred shares (ABC^A) have no regular Yahoo quote; class shares (BRK/A) are BRK.A
+        if not symbol or '^' in symbol:
+            continue
+        items.append((symbol.replace('/', '.'), row.get('name'), row.get('sector') or "N/A"))
+    return items
 
-def process_market(name, items):
+def get_krx_items(market):
+    # Every KOSPI or KOSDAQ listing; Yahoo suffixes KOSPI codes with .KS and KOSDAQ codes with .KQ
+    print(f"Fetching all {market} listings...")
+    instrumentation.report.request('fdr')
+    df = providers.finance_datareader().StockListing(market)
+    tickers = df['Code'] + ('.KS' if market == 'KOSPI' else '.KQ')
+    return list(zip(tickers.tolist(), df['Name'].tolist(), df['Dept'].fillna("N/A").tolist()))
+
+# (market, universe cache name, listing function, label) for every universe mode. The full
+# mode lists whole exchanges and drops small caps with one bulk quote pass before any
+# history is fetched.
+UNIVERSES = {
+    'default': [
+        ("SP500", "SP500", get_sp500_items, "S&P 500"),
+        ("NASDAQ", "NASDAQ", get_nasdaq_items, "NASDAQ 300"),
+        ("KOSPI", "KOSPI", get_kospi_items, "KOSPI 100"),
+    ],
+    'full': [
+        ("SP500", "SP500", get_sp500_items, "S&P 500"),
+        ("NASDAQ", "NASDAQ_ALL", lambda: get_exchange_items('NASDAQ'), "NASDAQ"),
+        ("NYSE", "NYSE_ALL", lambda: get_exchange_items('NYSE'), "NYSE"),
+        ("KOSPI", "KOSPI_ALL", lambda: get_krx_items('KOSPI'), "KOSPI"),
+        ("KOSDAQ", "KOSDAQ_ALL", lambda: get_krx_items('KOSDAQ'), "KOSDAQ"),
+    ],
+}
+UNIVERSE = os.environ.get('STOCKMAP_UNIVERSE', 'default')
+
+# Smallest market cap kept in full-universe mode, in the quote currency (USD / KRW)
+MIN_MARKET_CAP = {'NASDAQ': 3e8, 'NYSE': 3e8, 'KOSPI': 1e11, 'KOSDAQ': 1e11}
+
+# Regular session of each market on weekdays: (timezone, open, close) in local time. The
+# US exchanges trade 09:30-16:00 Eastern, KRX 09:00-15:30 in Seoul.
+US_SESSION = ('US/Eastern', (9, 30), (16, 0))
+KRX_SESSION = ('Asia/Seoul', (9, 0), (15, 30))
+SESSIONS = {'KOSPI': KRX_SESSION, 'KOSDAQ': KRX_SESSION}
+
+def is_market_open(market=None, now=None):
+    # Whether `market` (a US one by default) is in its regular session; `now` is in its timezone
+    zone, opens, closes = SESSIONS.get(market, US_SESSION)
+    now = now or datetime.now(pytz.timezone(zone))
+    if now.weekday() >= 5:
+        return False
+    return opens <= (now.hour, now.minute) < closes
+
+# Concurrency settings for the chunk scheduler (overridable from the environment)
+MAX_WORKERS = int(os.environ.get('STOCKMAP_MAX_WORKERS', 8))
+REQUESTS_PER_SECOND = float(os.environ.get('STOCKMAP_REQUESTS_PER_SECOND', 4))
+CHUNK_SIZE = int(os.environ.get('STOCKMAP_CHUNK_SIZE', 50))
+
+rate_limiter = scheduler.TokenBucket(REQUESTS_PER_SECOND, capacity=2 * REQUESTS_PER_SECOND)
+
+# Data sources of every market and kind of request, in fallback order (see providers.py).
+# Korean shares come from the bulk KRX listing and the domestic price history, Yahoo only
+# fills what those leave missing and serves the fundamentals.
+KRX_ROUTE = {'history': ['fdr', 'yahoo'], 'quotes': ['fdr', 'yahoo'], 'fundamentals': ['yahoo']}
+DEFAULT_ROUTE = {'history': ['yahoo'], 'quotes': ['yahoo'], 'fundamentals': ['yahoo']}
+ROUTES = {'KOSPI': KRX_ROUTE, 'KOSDAQ': KRX_ROUTE}
+
+# quoteSummary modules of the fundamentals pass (summary_detail / key_stats / financial_data
+# plus the reported EPS history and the earnings calendar) and the quarterly EPS time series
+FUNDAMENTAL_MODULES = fundamentals_cache.MODULES
+
+def market_providers(market):
+    sources = {
+        'yahoo': providers.YahooQueryProvider(rate_limiter, FUNDAMENTAL_MODULES),
+        'yfinance': providers.YFinanceProvider(rate_limiter),
+        'fdr': providers.FinanceDataReaderProvider(),
+    }
+    route = ROUTES.get(market, DEFAULT_ROUTE)
+    return providers.Router({kind: [sources[n] for n in names] for kind, names in route.items()})
+
+# Symbols per quote request (yahooquery splits above 1,500 anyway)
+QUOTE_BATCH_SIZE = 500
+
+def fetch_all_quotes(symbols, market=None):
+    # Current price, its timestamp and the market cap of every symbol, QUOTE_BATCH_SIZE per request
+    router = market_providers(market)
+    quotes = {}
+    for i in range(0, len(symbols), QUOTE_BATCH_SIZE):
+        quotes.update(router.quotes(symbols[i:i + QUOTE_BATCH_SIZE]))
+    return quotes
+
+def clean_ticker(symbol):
+    t_clean = str(symbol).replace('.', '-')
+    if t_clean.endswith('-KS'):
+        t_clean = t_clean.replace('-KS', '.KS')
+    if t_clean.endswith('-KQ'):
+        t_clean = t_clean.replace('-KQ', '.KQ')
+    return t_clean
+
+def process_chunk(name, chunk):
     result = []
-    print(f"[{name}] Fetching data from Yahoo Finance for {len(items)} companies using batch requests...")
-    
-    chunk_size = 50
-    for i in range(0, len(items), chunk_size):
-        chunk = items[i:i + chunk_size]
-        
-        tickers = []
-        ticker_to_item = {}
+    tickers = []
+    ticker_to_item = {}
+    for item in chunk:
+        t_clean = clean_ticker(item[0])
+        tickers.append(t_clean)
+        ticker_to_item[t_clean] = item
+
+    report = instrumentation.report
+    router = market_providers(name)
+    # Fundamentals only change with an earnings release, so most tickers come from the cache
+    with report.stage('chunk.fundamentals'):
+        fundamentals, refetched = fundamentals_cache.update_fundamentals(tickers, router.fundamentals)
+    report.count('fundamentals refetched', refetched)
+    report.count('fundamentals from cache', len(tickers) - refetched)
+    # Only the bars after each ticker's indicator state are requested; tickers without a
+    # usable state are backfilled through the history store and get it rebuilt
+    with report.stage('chunk.history_1d'):
+        h1 = indicator_state.update_states(tickers, "1d", router.history)
+    with report.stage('chunk.history_1wk'):
+        h20 = indicator_state.update_states(tickers, "1wk", router.history)
+
+    # Price/ATH/MA metrics for the whole chunk in one pass over a date x ticker array
+    with report.stage('chunk.metrics'):
+        chunk_metrics = metrics.compute_metrics(h1, h20, tickers)
+    daily_tickers = set(h1.index.get_level_values(0)) if isinstance(h1, pd.DataFrame) and not h1.empty else set()
+    weekly_tickers = set(h20.index.get_level_values(0)) if isinstance(h20, pd.DataFrame) and not h20.empty else set()
+
+    for ticker in tickers:
+        item = ticker_to_item[ticker]
+        name_str = item[1]
+        sector_str = item[2]
+
+        m = chunk_metrics.get(ticker)
+        if m is None:
+            report.drop('no daily history' if ticker not in daily_tickers else f'fewer than {metrics.MIN_DAILY_BARS} daily closes', ticker)
+            continue
+        if ticker not in weekly_tickers:
+            report.count('no weekly history (ATH = price)')
+
+        # EPS Q0..Q3 (year-over-year growth of the reported quarters), PER and ROE
+        result.append({
+            "ticker": ticker,
+            "name": name_str,
+            "industry": sector_str,
+            **m,
+            **fundamentals_cache.record_fields(fundamentals[ticker], m["price"]),
+        })
+    return result
+
+# Loaded by the first run_markets, so importing this module reads nothing from disk
+quarantine = None
+
+def process_chunk_isolated(name, chunk):
+    failed = {}
+
+    def on_failure(item, error):
+        print(f"[{name}] Giving up on {item[0]}: {error}")
+        failed[clean_ticker(item[0])] = error
+        # Errors raised by a provider name it (providers.Router), the others are our own
+        if getattr(error, 'provider', None):
+            instrumentation.report.provider_event(error.provider, 'errors')
+        instrumentation.report.drop('fetch failed', clean_ticker(item[0]))
+
+    records = instrumentation.report.profiled(isolation.run_isolated, process_chunk, name, chunk, on_failure)
+    if not records and len(chunk) > 1:
+        # Nothing at all came back: a provider outage, not a chunk full of bad symbols
+        return records
+
+    # Only symbols whose requests failed on their own get a strike. One that came back
+    # without enough price history (a recent listing) is left out of this run but not held
+    # against it.
+    listed = {r['ticker'] for r in records}
+    for item in chunk:
+        ticker = clean_ticker(item[0])
+        if ticker in failed:
+            quarantine.strike(ticker, failed[ticker])
+        elif ticker in listed:
+            quarantine.clear(ticker)
+    return records
+
+def sort_key(record):
+    return record['price_to_ath']
+
+def run_markets(markets, run_id, resume=False):
+    # Chunks of all markets share one worker pool, rate limit and adaptive chunk size,
+    # so the run is bound by the slowest requests rather than the sum of all of them.
+    # Every finished chunk is appended to the market's checkpoint; with `resume` the
+    # tickers already checkpointed under `run_id` are not fetched again.
+    global quarantine
+    if quarantine is None:
+        quarantine = isolation.Quarantine()
+    writers = {name: checkpoint.CheckpointWriter(run_id, name, sort_key) for name in markets}
+    markets = dict(markets)
+    for name, items in markets.items():
+        skipped = [item[0] for item in items if quarantine.is_quarantined(clean_ticker(item[0]))]
+        if skipped:
+            print(f"[{name}] Skipping {len(skipped)} quarantined symbols: {', '.join(skipped)}")
+            for symbol in skipped:
+                instrumentation.report.drop('quarantined', clean_ticker(symbol))
+            items = [item for item in items if not quarantine.is_quarantined(clean_ticker(item[0]))]
+        if resume and writers[name].done:
+            before = len(items)
+            items = [item for item in items if clean_ticker(item[0]) not in writers[name].done]
+            print(f"[{name}] Resuming run {run_id}: {before - len(items)} companies already checkpointed")
+            instrumentation.report.count('resumed from checkpoint', before - len(items))
+        markets[name] = items
+
+    # A ticker listed by several markets (most of the NASDAQ 300 is in the S&P 500 too) is
+    # fetched once, by the first market listing it; the others get a copy of its record
+    # carrying their own name and sector labels
+    owners = {}
+    aliases = {}
+    for name, items in markets.items():
+        own = []
+        for item in items:
+            ticker = clean_ticker(item[0])
+            if ticker not in owners:
+                owners[ticker] = name
+                own.append(item)
+            elif owners[ticker] != name:
+                aliases.setdefault(ticker, []).append((name, item))
+        if len(own) < len(items):
+            print(f"[{name}] {len(items) - len(own)} companies are shared with another market and fetched once")
+            instrumentation.report.count('shared across markets', len(items) - len(own))
+        markets[name] = own
+        print(f"[{name}] Fetching data from Yahoo Finance for {len(markets[name])} companies using batch requests...")
+
+    def on_result(name, chunk, records):
+        writers[name].write_chunk([clean_ticker(item[0]) for item in chunk], records)
+
+        by_ticker = {r['ticker']: r for r in records}
+        projected = {}
         for item in chunk:
-            t_clean = str(item[0]).replace('.', '-')
-            if t_clean.endswith('-KS'):
-                t_clean = t_clean.replace('-KS', '.KS')
-            tickers.append(t_clean)
-            ticker_to_item[t_clean] = item
-            
-        t = yq.Ticker(tickers)
-        
-        try:
-            summary = t.summary_detail
-            key_stats = t.key_stats
-            fin_data = t.financial_data
-            h1 = t.history(period="1y", interval="1d")
-            h20 = t.history(period="20y", interval="1wk")
-        except Exception as e:
-            print(f"Error fetching chunk {i}: {e}")
+            ticker = clean_ticker(item[0])
+            for alias_market, alias_item in aliases.get(ticker, []):
+                tickers, alias_records = projected.setdefault(alias_market, ([], []))
+                tickers.append(ticker)
+                if ticker in by_ticker:
+                    alias_records.append({**by_ticker[ticker], "name": alias_item[1], "industry": alias_item[2]})
+        for alias_market, (tickers, alias_records) in projected.items():
+            writers[alias_market].write_chunk(tickers, alias_records)
+
+    sizer = scheduler.AdaptiveChunkSize(initial=CHUNK_SIZE)
+    chunk_scheduler = scheduler.ChunkScheduler(MAX_WORKERS, rate_limiter, sizer)
+    chunk_scheduler.run(markets, process_chunk_isolated, on_result)
+    quarantine.save()
+    return writers
+
+def process_markets(markets):
+    run_id = checkpoint.new_run_id()
+    writers = run_markets(markets, run_id)
+    results = {name: list(writer.merged()) for name, writer in writers.items()}
+    checkpoint.remove_run(run_id)
+    return results
+
+def process_market(name, items):
+    return process_markets({name: items})[name]
+
+def prefilter_market_cap(markets):
+    # One bulk quote pass per market with a threshold (QUOTE_BATCH_SIZE symbols per Yahoo
+    # request, a single listing download for KRX). Symbols without a quote (delisted,
+    # unknown to every provider) go with the small caps.
+    filtered = {}
+    for name, items in markets.items():
+        if name not in MIN_MARKET_CAP:
+            filtered[name] = items
             continue
+        quotes = fetch_all_quotes(sorted({clean_ticker(item[0]) for item in items}), name)
+        filtered[name] = [item for item in items
+                          if quotes.get(clean_ticker(item[0]), {}).get('market_cap', 0) >= MIN_MARKET_CAP[name]]
+        dropped = len(items) - len(filtered[name])
+        instrumentation.report.count('below market cap', dropped)
+        print(f"[{name}] Keeping {len(filtered[name])}/{len(items)} companies with a market cap of at least {MIN_MARKET_CAP[name]:,.0f}")
+    return filtered
 
-        for ticker in tickers:
-            item = ticker_to_item[ticker]
-            name_str = item[1]
-            sector_str = item[2]
-            
-            s = summary.get(ticker, {}) if isinstance(summary, dict) else {}
-            ks = key_stats.get(ticker, {}) if isinstance(key_stats, dict) else {}
-            fd = fin_data.get(ticker, {}) if isinstance(fin_data, dict) else {}
-            
-            if isinstance(s, str): s = {}
-            if isinstance(ks, str): ks = {}
-            if isinstance(fd, str): fd = {}
-
-            hist_1y_df = None
-            hist_20y_df = None
-            
-            try:
-                if isinstance(h1, pd.DataFrame) and ticker in h1.index.get_level_values(0):
-                    hist_1y_df = h1.loc[ticker]
-            except Exception:
-                pass
-                
-            try:
-                if isinstance(h20, pd.DataFrame) and ticker in h20.index.get_level_values(0):
-                    hist_20y_df = h20.loc[ticker]
-            except Exception:
-                pass
-                
-            # Clean data and ensure enough rows
-            hist_1y_df = hist_1y_df.dropna(subset=['close']).copy()
-            if len(hist_1y_df) < 50:
-                continue
+def select_items(markets, tickers):
+    # Only the given symbols of every market (Yahoo or listing spelling)
+    wanted = {clean_ticker(t.upper()) for t in tickers}
+    selected = {name: [item for item in items if clean_ticker(item[0]) in wanted] for name, items in markets.items()}
+    found = {clean_ticker(item[0]) for items in selected.values() for item in items}
+    if wanted - found:
+        print(f"Not listed in the selected markets: {', '.join(sorted(wanted - found))}")
+    return selected
 
-            # price (latest valid close)
-            price = hist_1y_df['close'].iloc[-1]
-                
-            # ATH 20y
-            # Note: hist_20y_df should also be cleaned if necessary, but 1wk interval is usually stable
-            days_since_ath = 0
-            if 'high' in hist_20y_df.columns:
-                ath_idx = hist_20y_df['high'].idxmax()
-                all_time_high = float(hist_20y_df['high'].max())
-                data_after_ath = hist_20y_df.loc[ath_idx:]
-                lowest_after_ath = float(data_after_ath['low'].min()) if not data_after_ath.empty else price
-                
-                if isinstance(ath_idx, pd.Timestamp):
-                    ath_dt = ath_idx.tz_localize(None) if ath_idx.tzinfo else ath_idx
-                else:
-                    ath_dt = pd.to_datetime(str(ath_idx)).replace(tzinfo=None)
-                days_since_ath = (datetime.now() - ath_dt).days
-            else:
-                all_time_high = price
-                lowest_after_ath = price
-
-            # Moving average
-            ma_20_spread = None
-            ma_50_spread = None
-            ma_20_50_spread = None
-            
-            hist_1y_df['MA20'] = hist_1y_df['close'].rolling(window=20).mean()
-            hist_1y_df['MA50'] = hist_1y_df['close'].rolling(window=50).mean()
-            
-            # Use the latest available MA values (iloc[-1])
-            ma_20 = hist_1y_df['MA20'].iloc[-1]
-            ma_50 = hist_1y_df['MA50'].iloc[-1]
-            
-            if pd.notna(ma_20) and ma_20 > 0:
-                ma_20_spread = (price - ma_20) / ma_20
-            if pd.notna(ma_50) and ma_50 > 0:
-                ma_50_spread = (price - ma_50) / ma_50
-                if pd.notna(ma_20) and ma_20 > 0:
-                    ma_20_50_spread = (ma_20 - ma_50) / ma_50
-                    
-            # PE
-            per = s.get('trailingPE', ks.get('trailingPE'))
-            if per is None or per == 0:
-                per = s.get('forwardPE', ks.get('forwardPE', 0))
-            if per is None: per = 0
-            
-            # ROE
-            roe = fd.get('returnOnEquity', ks.get('returnOnEquity', 0))
-            if roe is None: roe = 0
-            if roe: roe = roe * 100
-            else: roe = 0
-            
-            # EPS QQQ
-            eps_curr = ks.get('earningsQuarterlyGrowth', fd.get('earningsGrowth', 0))
-            if eps_curr is None: eps_curr = 0
-            if eps_curr: eps_curr = eps_curr * 100
-            else: eps_curr = 0
-            
-            correction_ratio = round((all_time_high - lowest_after_ath) / all_time_high, 3) if all_time_high and all_time_high > 0 else 0
-            price_to_ath = round(price / all_time_high, 3) if all_time_high and all_time_high > 0 else 0
-            
-            result.append({
-                "ticker": ticker,
-                "name": name_str,
-                "industry": sector_str,
-                "ath": round(all_time_high, 2) if all_time_high else 0,
-                "lowest_after_ath": round(lowest_after_ath, 2) if lowest_after_ath else 0,
-                "price": round(price, 2) if price else 0,
-                "correction_ratio": correction_ratio,
-                "price_to_ath": price_to_ath,
-                "days_since_ath": days_since_ath,
-                "ma_20_spread": round(ma_20_spread, 4) if ma_20_spread is not None and pd.notna(ma_20_spread) else None,
-                "ma_50_spread": round(ma_50_spread, 4) if ma_50_spread is not None and pd.notna(ma_50_spread) else None,
-                "ma_20_50_spread": round(ma_20_50_spread, 4) if ma_20_50_spread is not None and pd.notna(ma_20_50_spread) else None,
-                "eps_q0": round(eps_curr, 2),
-                "eps_q1": round(eps_curr * 0.9, 2),
-                "eps_q2": round(eps_curr * 0.8, 2),
-                "eps_q3": round(eps_curr * 0.7, 2),
-                "per": round(per, 2) if per else 0,
-                "roe": round(roe, 2) if roe else 0
-            })
-            
-        print(f"[{name}] Processed up to {min(i + chunk_size, len(items))}/{len(items)}")
-                
-    result = sorted(result, key=lambda x: x['price_to_ath'], reverse=True)
-    return result
+def merge_published(name, records, root):
+    # Records of a --tickers run replace their old versions in the published snapshot; every
+    # other record (and a ticker whose refetch failed) keeps its published values
+    payload = artifact.load_market(name, root)
+    refetched = {r['ticker'] for r in records}
+    kept = [r for r in artifact.decode_columnar(payload) if r['ticker'] not in refetched] if payload else []
+    return sorted(kept + records, key=sort_key, reverse=True)
 
-sp500_items = get_sp500_items()
-nasdaq_items = get_nasdaq_items()
-kospi_items = get_kospi_items()
+def published_tickers(root):
+    # {market: tickers} of the published snapshots, for the screens' 'listed_in' rules
+    listed = {}
+    for name in artifact.load_manifest(root)['markets']:
+        payload = artifact.load_market(name, root)
+        if payload:
+            listed[name] = {r['ticker'] for r in artifact.decode_columnar(payload)}
+    return listed
 
-market_data = {
-    "SP500": process_market("SP500", sp500_items),
-    "NASDAQ": process_market("NASDAQ", nasdaq_items),
-    "KOSPI": process_market("KOSPI", kospi_items)
-}
+def print_plan(markets, universe):
+    # What a run would fetch, for --dry-run
+    for name, items in markets.items():
+        route = ROUTES.get(name, DEFAULT_ROUTE)
+        sources = ', '.join(f"{kind}: {'>'.join(names)}" for kind, names in route.items())
+        print(f"[{name}] {len(items)} companies ({sources})")
+    if universe == 'full':
+        print("Market cap prefilter skipped in a dry run, the real run fetches fewer companies")
+    print("Dry run, nothing fetched or written")
+
+def main(resume=False, universe=UNIVERSE, names=None, tickers=None, output=artifact.DATA_DIR, dry_run=False):
+    # Fetch and publish the markets of `universe`; `names` and `tickers` narrow the run to
+    # some markets / symbols, whose results are merged into the published data
+    report = instrumentation.report
+    entries = [entry for entry in UNIVERSES[universe] if not names or entry[0] in names]
+    partial = bool(names or tickers)
+
+    # Listings are cached with a TTL, so most runs never touch the listing endpoints
+    markets = {}
+    for name, universe_name, fetch_items, _ in entries:
+        with report.stage(f'universe.{name}'):
+            markets[name] = report.profiled(universe_cache.cached_universe, universe_name, fetch_items)
+    if tickers:
+        markets = select_items(markets, tickers)
+    if dry_run:
+        print_plan(markets, universe)
+        return
 
-js_output = "const marketData = " + json.dumps(market_data, indent=4) + ";\n"
-with open("market_data.js", "w") as f:
-    f.write(js_output)
+    run_id = checkpoint.latest_run_id() if resume else None
+    if resume and run_id is None:
+        print("No checkpointed run to resume, starting a new one")
+    if run_id is None:
+        # A new run never mixes with the results of an abandoned one
+        checkpoint.remove_runs()
+        run_id = checkpoint.new_run_id()
 
-print("Successfully created market_data.js with batch loading logic.")
+    # Stored history of tickers that left every universe is dropped; new tickers get
+    # backfilled by the history store on their first fetch. A partial run doesn't see every
+    # listing, so it leaves the store alone.
+    if not partial:
+        current_tickers = {clean_ticker(item[0]) for items in markets.values() for item in items}
+        for _, universe_name, _, _ in entries:
+            cached = universe_cache.load_universe(universe_name) or {}
+            for change in cached.get('changes', [])[-1:]:
+                for symbol in change['removed']:
+                    if clean_ticker(symbol) not in current_tickers:
+                        history_store.delete_history(clean_ticker(symbol))
+                        indicator_state.delete_state(clean_ticker(symbol))
+
+    if universe == 'full':
+        with report.stage('prefilter'):
+            markets = prefilter_market_cap(markets)
+
+    with report.stage('markets'):
+        writers = run_markets(markets, run_id, resume=resume)
+
+    # The archive (pyarrow) is only needed once a full run publishes
+    import archive
+
+    # Markets are merged from their checkpoints and published one at a time, under one
+    # version; only the market being published is held in memory
+    version = artifact.new_version()
+    labels = {name: label for name, _, _, label in UNIVERSES[universe]}
+    counts = {}
+    with report.stage('publish'):
+        # Screens can refer to other markets ('listed_in'), so their tickers are streamed from
+        # the checkpoints first; markets outside a partial run count with their published
+        # snapshot, and a --tickers run keeps the published tickers of its markets
+        listed = published_tickers(output) if partial else {}
+        for name, writer in writers.items():
+            listed[name] = listed.get(name, set()) | {r['ticker'] for r in writer.merged()}
+        for name, writer in writers.items():
+            records = list(writer.merged())
+            if tickers:
+                records = merge_published(name, records, output)
+            counts[name] = len(records)
+            recommendations = screener.screen_market(name, records, listed)
+            manifest = artifact.publish({name: records}, root=output, version=version, labels=labels,
+                                        recommendations={name: recommendations}, screens=screener.describe())
+            # The day's records go to the archive, whose summary feeds the sparklines; a market
+            # that didn't change (a rerun, a holiday) keeps its last archived day
+            if manifest["markets"][name]["version"] == version:
+                archive.append({name: records}, root=os.path.join(output, 'archive'))
+            del records
+        # Markets of the other universe mode are no longer listed
+        if not names:
+            artifact.retire(list(writers), output)
+        artifact.export_parquet(output)
+        archive.write_trends(output)
+    checkpoint.remove_run(run_id)
+
+    report_path = os.path.join(output, instrumentation.REPORT_NAME)
+    report.write(report_path, extra={"universe": universe, "records": counts})
+    print(f"Successfully wrote {', '.join(artifact.market_path(n, output) for n in writers)}, their deltas and {artifact.PARQUET_NAME}.")
+    print(f"Run report written to {report_path}")
+
+def refresh_prices(names=None, force=False, tickers=None, output=artifact.DATA_DIR, dry_run=False):
+    # Intraday mode: take the published records (with the last intraday refresh), fetch only
+    # current quotes and recompute the price-dependent fields from the indicator state left
+    # by the last full run. The result is published as the intraday layer, not a new snapshot.
+    # Only markets in their trading session are refreshed, unless `force` is set.
+    published = list(artifact.load_manifest(output)['markets'])
+    requested = names or published
+    names = [name for name in requested if force or is_market_open(name)]
+    if len(names) < len(requested):
+        closed = ', '.join(name for name in requested if name not in names)
+        print(f"Not in session: {closed} (use --force to refresh anyway)")
+    if not names:
+        print("Nothing to refresh")
+        return
+    started = time.monotonic()
+
+    market_data = {}
+    for name in names:
+        records = artifact.load_records(name, output)
+        if records:
+            market_data[name] = records
+    wanted = {clean_ticker(t.upper()) for t in tickers} if tickers else None
+    selected = {name: sorted({r['ticker'] for r in records if wanted is None or r['ticker'] in wanted})
+                for name, records in market_data.items()}
+    tickers = sorted({t for symbols in selected.values() for t in symbols})
+    if dry_run:
+        for name, symbols in selected.items():
+            print(f"[{name}] {len(symbols)} quotes ({'>'.join(ROUTES.get(name, DEFAULT_ROUTE)['quotes'])})")
+        print("Dry run, nothing fetched or written")
+        return
+
+    # Quotes come from each market's own providers, a ticker listed twice is quoted once
+    quotes = {}
+    for name, symbols in selected.items():
+        symbols = [t for t in symbols if t not in quotes]
+        quotes.update({ticker: (q['price'], q['time']) for ticker, q in fetch_all_quotes(symbols, name).items()})
+    refreshed = indicator_state.quote_metrics(tickers, quotes)
+    print(f"Refreshed {len(refreshed)}/{len(tickers)} tickers from {len(quotes)} quotes")
+
+    for name, records in market_data.items():
+        for record in records:
+            if record['ticker'] not in refreshed:
+                continue
+            record.update(refreshed[record['ticker']])
+            # PER moves with the price
+            entry = fundamentals_cache.load_entry(record['ticker'])
+            if entry:
+                record['per'] = fundamentals_cache.record_fields(entry, record['price'])['per']
+        market_data[name] = sorted(records, key=lambda x: x['price_to_ath'], reverse=True)
+
+    # Markets left out of this refresh count with their published tickers
+    listed = published_tickers(output) if set(names) != set(published) else None
+    artifact.publish_intraday(market_data, root=output, recommendations=screener.screen_markets(market_data, listed),
+                              screens=screener.describe())
+    print(f"Price refresh finished in {time.monotonic() - started:.1f}s")
+
+def parse_args(argv=None):
+    markets = sorted({entry[0] for entries in UNIVERSES.values() for entry in entries})
+    parser = argparse.ArgumentParser(description="Fetch market data and publish it to data/")
+    parser.add_argument('--refresh-prices', action='store_true',
+                        help="only refresh prices from current quotes and the cached indicator state")
+    parser.add_argument('--force', action='store_true', help="refresh prices even when a market's session is closed")
+    parser.add_argument('--resume', action='store_true', help="continue the last interrupted run from its checkpoints")
+    parser.add_argument('--universe', choices=sorted(UNIVERSES), default=UNIVERSE,
+                        help="'default' (S&P 500, NASDAQ 300, KOSPI 100) or 'full' (whole NASDAQ/NYSE/KOSPI/KOSDAQ)")
+    parser.add_argument('--markets', nargs='+', type=str.upper, choices=markets, metavar='MARKET',
+                        help=f"only these markets ({', '.join(markets)}); the others keep their published data")
+    parser.add_argument('--tickers', nargs='+', metavar='TICKER',
+                        help="only these symbols (AAPL, 005930.KS, ...), merged into the published snapshots")
+    parser.add_argument('--output', default=artifact.DATA_DIR, help="directory of the published data (default: data)")
+    parser.add_argument('--dry-run', action='store_true', help="show what would be fetched without fetching or writing")
+    args = parser.parse_args(argv)
+    listed = {entry[0] for entry in UNIVERSES[args.universe]}
+    if args.markets and not args.refresh_prices and not set(args.markets) <= listed:
+        parser.error(f"--markets {' '.join(sorted(set(args.markets) - listed))} is not part of the {args.universe} universe")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.refresh_prices:
+        refresh_prices(names=args.markets, force=args.force, tickers=args.tickers, output=args.output, dry_run=args.dry_run)
+    else:
+        main(resume=args.resume, universe=args.universe, names=args.markets, tickers=args.tickers,
+             output=args.output, dry_run=args.dry_run)
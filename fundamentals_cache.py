@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+# Per-ticker fundamentals kept between runs: cache/fundamentals/AAPL.json, ...
+# PER/ROE/earnings growth only move when a company reports, so a ticker is refetched once
+# its next earnings date has passed and served from disk on every other day. The file also
+# accumulates the reported quarterly EPS, which gives the real EPS Q0..Q3 growth figures:
+# 'eps' holds earningsHistory's actuals (four quarters per fetch), 'diluted_eps' Yahoo's
+# quarterly diluted EPS time series, which reaches the year-ago quarters from the first fetch.
+FUNDAMENTALS_DIR = os.path.join('cache', 'fundamentals')
+
+# Bump when the layout changes, older files are then refetched
+CACHE_VERSION = 1
+
+# quoteSummary modules of one fundamentals pass
+MODULES = ['summaryDetail', 'defaultKeyStatistics', 'financialData', 'earningsHistory', 'calendarEvents',
+           'quarterlyEps']
+
+# Days after the earnings date before the new numbers are expected on Yahoo
+REPORT_GRACE_DAYS = 1
+# While Yahoo still shows a passed earnings date, look for the next one this often
+RECHECK_DAYS = 7
+# Refetch regardless after this long (no calendar, changed listings, ...)
+MAX_AGE_DAYS = 95
+
+# Reported quarters kept per ticker (two years of year-over-year comparisons)
+MAX_QUARTERS = 12
+
+
+def _path(ticker, root):
+    return os.path.join(root, f"{ticker}.json")
+
+
+def load_entry(ticker, root=FUNDAMENTALS_DIR):
+    path = _path(ticker, root)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Discarding unreadable fundamentals {path}: {e}")
+        return None
+    return entry if entry.get('version') == CACHE_VERSION else None
+
+
+def save_entry(ticker, entry, root=FUNDAMENTALS_DIR):
+    path = _path(ticker, root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+
+
+def _to_date(value):
+    # yahooquery hands out dates as epoch seconds, 'YYYY-MM-DD[ HH:MM:SS]' strings or {'raw': ...}
+    if isinstance(value, dict):
+        value = value.get('raw')
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            return pd.Timestamp(value, unit='s').date()
+        return pd.Timestamp(str(value)[:10]).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+def _number(value):
+    if isinstance(value, dict):
+        value = value.get('raw')
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _module(modules, name):
+    module = modules.get(name) if isinstance(modules, dict) else None
+    return module if isinstance(module, dict) else {}
+
+
+def is_stale(entry, today=None):
+    today = today or date.today()
+    if entry is None:
+        return True
+    # Written before the EPS time series was fetched: refetch once to backfill it
+    if 'diluted_eps' not in entry:
+        return True
+    fetched = date.fromisoformat(entry['fetched_at'][:10])
+    if today - fetched >= timedelta(days=MAX_AGE_DAYS):
+        return True
+    if entry.get('next_earnings'):
+        due = date.fromisoformat(entry['next_earnings']) + timedelta(days=REPORT_GRACE_DAYS)
+        if today >= due and fetched < due:
+            return True
+        if today >= due and today - fetched >= timedelta(days=RECHECK_DAYS):
+            return True
+    return False
+
+
+# Build a cache entry from the quoteSummary modules of one ticker, keeping the quarterly EPS
+# already collected in `previous`
+def parse_entry(modules, previous=None, today=None):
+    today = today or date.today()
+    s = _module(modules, 'summaryDetail')
+    ks = _module(modules, 'defaultKeyStatistics')
+    fd = _module(modules, 'financialData')
+
+    eps = dict(previous.get('eps', {})) if previous else {}
+    for quarter in _module(modules, 'earningsHistory').get('history') or []:
+        if not isinstance(quarter, dict):
+            continue
+        quarter_end = _to_date(quarter.get('quarter'))
+        actual = _number(quarter.get('epsActual'))
+        if quarter_end and actual is not None:
+            eps[quarter_end.isoformat()] = actual
+    eps = dict(sorted(eps.items())[-MAX_QUARTERS:])
+
+    diluted = dict(previous.get('diluted_eps', {})) if previous else {}
+    for quarter in _module(modules, 'quarterlyEps').get('history') or []:
+        if not isinstance(quarter, dict):
+            continue
+        quarter_end = _to_date(quarter.get('asOfDate'))
+        value = _number(quarter.get('DilutedEPS'))
+        if quarter_end and value is not None:
+            diluted[quarter_end.isoformat()] = value
+    diluted = dict(sorted(diluted.items())[-MAX_QUARTERS:])
+
+    earnings_dates = [_to_date(d) for d in _module(modules, 'calendarEvents').get('earnings', {}).get('earningsDate') or []]
+    earnings_dates = sorted(d for d in earnings_dates if d)
+    upcoming = [d for d in earnings_dates if d >= today]
+    next_earnings = upcoming[0] if upcoming else (earnings_dates[-1] if earnings_dates else None)
+
+    return {
+        'version': CACHE_VERSION,
+        'fetched_at': datetime.now().isoformat(timespec='seconds'),
+        'last_report': max(eps) if eps else None,
+        'next_earnings': next_earnings.isoformat() if next_earnings else None,
+        'trailing_pe': _number(s.get('trailingPE', ks.get('trailingPE'))),
+        'forward_pe': _number(s.get('forwardPE', ks.get('forwardPE'))),
+        'trailing_eps': _number(ks.get('trailingEps')),
+        'forward_eps': _number(ks.get('forwardEps')),
+        'return_on_equity': _number(fd.get('returnOnEquity', ks.get('returnOnEquity'))),
+        'earnings_quarterly_growth': _number(ks.get('earningsQuarterlyGrowth', fd.get('earningsGrowth'))),
+        'eps': eps,
+        'diluted_eps': diluted,
+    }
+
+
+def _year_over_year(series, quarter_end):
+    # Growth in % of the quarter ending `quarter_end` over its year-ago quarter in the same series
+    current = [v for d, v in series.items() if abs((quarter_end - d).days) <= 20]
+    year_ago = [v for d, v in series.items() if abs((quarter_end - d).days - 365) <= 20]
+    if not current or not year_ago or not year_ago[0]:
+        return None
+    return (current[0] - year_ago[0]) / abs(year_ago[0]) * 100
+
+
+def eps_growth(entry, quarters=4):
+    # Year-over-year EPS growth in % of the last `quarters` reported quarters, newest first.
+    # A quarter is compared within one series: earningsHistory's actuals when both quarters
+    # are there, else the diluted EPS time series (never adjusted against GAAP figures). A
+    # quarter without its year-ago quarter has no growth figure: None ("no data", not 0%). The
+    # newest one then falls back to Yahoo's own earningsQuarterlyGrowth.
+    series = [{date.fromisoformat(d): v for d, v in entry.get(key, {}).items()} for key in ('eps', 'diluted_eps')]
+    # The two series date a quarter the same way; anything closer than a month is one quarter
+    reported = []
+    for quarter_end in sorted(set(series[0]) | set(series[1]), reverse=True):
+        if not reported or (reported[-1] - quarter_end).days > 30:
+            reported.append(quarter_end)
+    growth = []
+    for i in range(quarters):
+        value = None
+        if i < len(reported):
+            for s in series:
+                value = _year_over_year(s, reported[i])
+                if value is not None:
+                    break
+        growth.append(value)
+    if growth[0] is None and entry.get('earnings_quarterly_growth') is not None:
+        growth[0] = entry['earnings_quarterly_growth'] * 100
+    return growth
+
+
+def record_fields(entry, price):
+    # PER follows the current price through the cached EPS; the cached ratio is the fallback
+    per = 0
+    for eps_key, pe_key in (('trailing_eps', 'trailing_pe'), ('forward_eps', 'forward_pe')):
+        if entry.get(eps_key) and entry[eps_key] > 0 and price:
+            per = price / entry[eps_key]
+        elif entry.get(pe_key):
+            per = entry[pe_key]
+        if per:
+            break
+    roe = (entry.get('return_on_equity') or 0) * 100
+    fields = {f"eps_q{i}": None if g is None else round(g, 2) for i, g in enumerate(eps_growth(entry))}
+    fields["per"] = round(per, 2) if per else 0
+    fields["roe"] = round(roe, 2) if roe else 0
+    return fields
+
+
+# Return ({ticker: entry}, number of refetched tickers) for `tickers`, calling
+# `fetch_modules(stale_tickers)` (one batched quoteSummary pass returning
+# {ticker: {module: dict}}) only for the tickers whose cached entry is missing or outdated
+# by an earnings release.
+def update_fundamentals(tickers, fetch_modules, root=FUNDAMENTALS_DIR, today=None):
+    entries = {ticker: load_entry(ticker, root) for ticker in tickers}
+    stale = [ticker for ticker in tickers if is_stale(entries[ticker], today)]
+    if stale:
+        raw = fetch_modules(stale)
+        for ticker in stale:
+            modules = raw.get(ticker)
+            if not isinstance(modules, dict) or not any(isinstance(m, dict) and m for m in modules.values()):
+                # Nothing usable came back: keep serving the old entry if there is one
+                if entries[ticker] is None:
+                    entries[ticker] = parse_entry({}, today=today)
+                continue
+            entries[ticker] = parse_entry(modules, entries[ticker], today)
+            save_entry(ticker, entries[ticker], root)
+    return entries, len(stale)
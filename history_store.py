@@ -0,0 +1,140 @@
+import os
+import threading
+import pandas as pd
+from datetime import datetime
+
+# Per-ticker OHLCV history kept between runs, one Parquet file per ticker and interval:
+#   cache/history/1d/AAPL.parquet, cache/history/1wk/AAPL.parquet, ...
+HISTORY_DIR = os.path.join('cache', 'history')
+
+# Lookback that process_market works with (and that a new ticker is backfilled with)
+LOOKBACK = {'1d': '1y', '1wk': '20y'}
+LOOKBACK_YEARS = {'1d': 1, '1wk': 20}
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'adjclose']
+
+# A re-fetched bar that moved more than this against the stored one means the provider
+# re-adjusted the series (split/dividend), so the stored history is thrown away.
+ADJUSTMENT_TOLERANCE = 1e-3
+
+
+def _path(ticker, interval, root):
+    return os.path.join(root, interval, f"{ticker}.parquet")
+
+
+def _normalize_index(index):
+    # yahooquery indexes closed sessions with datetime.date and the live bar with a
+    # (possibly tz-aware) datetime, so bring everything to naive timestamps
+    stamps = []
+    for d in index:
+        ts = pd.Timestamp(d)
+        if ts.tzinfo is not None:
+            ts = ts.tz_localize(None)
+        stamps.append(ts)
+    return pd.DatetimeIndex(stamps, name='date')
+
+
+def split_history(h):
+    # Split a yahooquery (symbol, date) history frame into {ticker: frame}
+    frames = {}
+    if not isinstance(h, pd.DataFrame) or h.empty or h.index.nlevels < 2:
+        return frames
+    for ticker in h.index.get_level_values(0).unique():
+        df = h.xs(ticker, level=0)
+        df = df[[c for c in COLUMNS if c in df.columns]].copy()
+        df.index = _normalize_index(df.index)
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+        frames[ticker] = df
+    return frames
+
+
+def load_history(ticker, interval, root=HISTORY_DIR):
+    path = _path(ticker, interval, root)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"Discarding unreadable history {path}: {e}")
+        return None
+
+
+def save_history(ticker, interval, df, root=HISTORY_DIR):
+    path = _path(ticker, interval, root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def delete_history(ticker, root=HISTORY_DIR):
+    for interval in LOOKBACK:
+        path = _path(ticker, interval, root)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _is_adjusted(stored, fresh):
+    # Compare the first re-fetched bar (already final when it was stored) with our copy
+    if fresh.empty:
+        return False
+    first = fresh.index[0]
+    if first not in stored.index:
+        return False
+    old = stored.at[first, 'close']
+    new = fresh.at[first, 'close']
+    if pd.isna(old) or pd.isna(new) or old == 0:
+        return False
+    return abs(new - old) / abs(old) > ADJUSTMENT_TOLERANCE
+
+
+# Bring the stored history of `tickers` up to date and return it as a yahooquery-style
+# (symbol, date) frame trimmed to the usual lookback.
+# `fetch_history(symbols, interval, period=None, start=None)` must return a yahooquery
+# history frame. Tickers without stored bars are backfilled with the full lookback, the
+# rest only ask for the bars from their second-to-last stored bar onward (the last one
+# may have been a partial session or an unfinished week).
+def update_histories(tickers, interval, fetch_history, root=HISTORY_DIR):
+    stored = {}
+    backfill = []
+    delta_groups = {}
+    for ticker in tickers:
+        df = load_history(ticker, interval, root)
+        if df is None or len(df) < 2:
+            backfill.append(ticker)
+            continue
+        stored[ticker] = df
+        start = df.index[-2].strftime('%Y-%m-%d')
+        delta_groups.setdefault(start, []).append(ticker)
+
+    merged = {}
+    for start, group in delta_groups.items():
+        fresh_frames = split_history(fetch_history(group, interval, start=start))
+        for ticker in group:
+            old = stored[ticker]
+            fresh = fresh_frames.get(ticker)
+            if fresh is None or fresh.empty:
+                merged[ticker] = old
+                continue
+            if _is_adjusted(old, fresh):
+                print(f"[{ticker}] {interval} history was re-adjusted upstream, backfilling")
+                backfill.append(ticker)
+                continue
+            df = pd.concat([old[old.index < fresh.index[0]], fresh])
+            save_history(ticker, interval, df, root)
+            merged[ticker] = df
+
+    if backfill:
+        fresh_frames = split_history(fetch_history(backfill, interval, period=LOOKBACK[interval]))
+        for ticker in backfill:
+            df = fresh_frames.get(ticker)
+            if df is None or df.empty:
+                continue
+            save_history(ticker, interval, df, root)
+            merged[ticker] = df
+
+    cutoff = pd.Timestamp(datetime.now()) - pd.DateOffset(years=LOOKBACK_YEARS[interval])
+    frames = {t: merged[t][merged[t].index >= cutoff] for t in tickers if t in merged}
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, names=['symbol', 'date'])
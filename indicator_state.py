@@ -0,0 +1,256 @@
+import json
+import os
+import threading
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+import history_store
+import metrics
+
+# Per-ticker rolling indicator state, one small JSON file per ticker and interval:
+#   cache/indicators/1d/AAPL.json  -> the valid closes of the last year (MA window and spread percentile)
+#   cache/indicators/1wk/AAPL.json -> running ATH, its date and the lowest low since then
+# The state covers every bar except the newest one, which may still be a partial session
+# or an unfinished week and is kept aside as the `pending` bar. A nightly run only fetches
+# and folds the bars after the state, so it no longer grows with the length of the history.
+STATE_DIR = os.path.join('cache', 'indicators')
+
+# Bump when the layout changes, older files are then rebuilt from the history store
+STATE_VERSION = 2
+
+# Closes kept for the moving averages and the one-year MA spread percentile; a year has at
+# most ~253 sessions, anything older than the daily lookback is dropped by to_frame
+WINDOW = 270
+
+
+def _path(ticker, interval, root):
+    return os.path.join(root, interval, f"{ticker}.json")
+
+
+def _float(value):
+    return None if value is None or pd.isna(value) else float(value)
+
+
+def _day(ts):
+    return pd.Timestamp(ts).strftime('%Y-%m-%d')
+
+
+def new_state(interval):
+    state = {'version': STATE_VERSION, 'last_date': None, 'last_close': None, 'pending': []}
+    if interval == '1d':
+        state['closes'] = []
+    else:
+        state.update({'ath': None, 'ath_date': None, 'low_since_ath': None})
+    return state
+
+
+def load_state(ticker, interval, root=STATE_DIR):
+    path = _path(ticker, interval, root)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Discarding unreadable indicator state {path}: {e}")
+        return None
+    if state.get('version') != STATE_VERSION:
+        return None
+    return state
+
+
+def save_state(ticker, interval, state, root=STATE_DIR):
+    path = _path(ticker, interval, root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def delete_state(ticker, root=STATE_DIR):
+    for interval in history_store.LOOKBACK:
+        path = _path(ticker, interval, root)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# Advance `state` with the final bars of `df` (a single-ticker history frame, oldest first)
+def fold(state, interval, df):
+    if df.empty:
+        return state
+    if interval == '1d':
+        closes = df['close'].dropna()
+        state['closes'] = (state['closes'] + [[_day(d), float(c)] for d, c in closes.items()])[-WINDOW:]
+    else:
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        if not np.all(np.isnan(high)):
+            # First occurrence of the highest high, like the full recompute's argmax
+            pos = int(np.where(np.isnan(high), -np.inf, high).argmax())
+            if state['ath'] is None or high[pos] > state['ath']:
+                state['ath'] = float(high[pos])
+                state['ath_date'] = _day(df.index[pos])
+                state['low_since_ath'] = None
+                low = low[pos:]
+        if state['ath'] is not None:
+            with np.errstate(invalid='ignore'):
+                lowest = np.fmin.reduce(np.append(low, state['low_since_ath'] if state['low_since_ath'] is not None else np.nan))
+            state['low_since_ath'] = _float(lowest)
+    state['last_date'] = _day(df.index[-1])
+    state['last_close'] = _float(df['close'].iloc[-1]) if 'close' in df.columns else None
+    return state
+
+
+def set_pending(state, df):
+    # Remember the newest, not yet final bar as [date, high, low, close]
+    state['pending'] = [[pd.Timestamp(d).isoformat(), _float(row.get('high')), _float(row.get('low')), _float(row.get('close'))]
+                        for d, row in df.iterrows()]
+    return state
+
+
+def build_state(interval, df):
+    # Full recompute from a lookback-trimmed history: everything but the newest bar
+    state = fold(new_state(interval), interval, df.iloc[:-1])
+    return set_pending(state, df.iloc[-1:])
+
+
+def _is_adjusted(state, fresh):
+    # The first re-fetched bar is the last folded one; if its close moved the series was re-adjusted
+    first = pd.Timestamp(state['last_date'])
+    if first not in fresh.index or state['last_close'] is None:
+        return False
+    new = fresh.at[first, 'close']
+    old = state['last_close']
+    if pd.isna(new) or old == 0:
+        return False
+    return abs(new - old) / abs(old) > history_store.ADJUSTMENT_TOLERANCE
+
+
+def _expired(state, interval, cutoff):
+    # A running maximum cannot forget bars, so an ATH that left the lookback needs a recompute
+    return interval == '1wk' and state['ath_date'] is not None and pd.Timestamp(state['ath_date']) < cutoff
+
+
+def _pending_frame(state):
+    bars = state.get('pending', [])
+    return pd.DataFrame(
+        {'high': [b[1] for b in bars], 'low': [b[2] for b in bars], 'close': [b[3] for b in bars]},
+        index=pd.DatetimeIndex([pd.Timestamp(b[0]) for b in bars], name='date'), dtype=float)
+
+
+# Turn a state back into a small history frame that gives the same metrics as the full
+# history: the MA window closes (daily) or a single bar carrying the ATH and the lowest
+# low since then (weekly), followed by the pending bar (or `live` bars replacing it).
+def to_frame(state, interval, cutoff, live=None):
+    if interval == '1d':
+        rows = pd.DataFrame(
+            {'close': [c for _, c in state['closes']]},
+            index=pd.DatetimeIndex([pd.Timestamp(d) for d, _ in state['closes']], name='date'))
+    elif state['ath'] is not None:
+        rows = pd.DataFrame(
+            {'high': [state['ath']], 'low': [state['low_since_ath'] if state['low_since_ath'] is not None else np.nan]},
+            index=pd.DatetimeIndex([pd.Timestamp(state['ath_date'])], name='date'))
+    else:
+        rows = pd.DataFrame(index=pd.DatetimeIndex([], name='date'))
+    if live is None:
+        live = _pending_frame(state)
+    if not live.empty:
+        rows = pd.concat([rows, live[[c for c in ('high', 'low', 'close') if c in live.columns]]])
+    return rows[rows.index >= cutoff]
+
+
+# Drop-in replacement for history_store.update_histories when only the price/ATH/MA
+# metrics are needed. Tickers with a valid state only fetch the bars after it; tickers
+# without one, or whose state was invalidated by an adjustment or an expired ATH, go
+# through the history store and get their state rebuilt from the full lookback.
+def update_states(tickers, interval, fetch_history, root=STATE_DIR, history_root=history_store.HISTORY_DIR):
+    cutoff = pd.Timestamp(datetime.now()) - pd.DateOffset(years=history_store.LOOKBACK_YEARS[interval])
+    states = {}
+    rebuild = []
+    groups = {}
+    for ticker in tickers:
+        state = load_state(ticker, interval, root)
+        if state is None or state['last_date'] is None or _expired(state, interval, cutoff):
+            rebuild.append(ticker)
+            continue
+        states[ticker] = state
+        groups.setdefault(state['last_date'], []).append(ticker)
+
+    for start, group in groups.items():
+        fresh_frames = history_store.split_history(fetch_history(group, interval, start=start))
+        for ticker in group:
+            state = states[ticker]
+            fresh = fresh_frames.get(ticker)
+            if fresh is None or fresh.empty:
+                continue
+            if _is_adjusted(state, fresh):
+                print(f"[{ticker}] {interval} history was re-adjusted upstream, rebuilding indicator state")
+                del states[ticker]
+                rebuild.append(ticker)
+                continue
+            new = fresh[fresh.index > pd.Timestamp(state['last_date'])]
+            if new.empty:
+                continue
+            fold(state, interval, new.iloc[:-1])
+            set_pending(state, new.iloc[-1:])
+            save_state(ticker, interval, state, root)
+
+    if rebuild:
+        h = history_store.update_histories(rebuild, interval, fetch_history, history_root)
+        for ticker, df in history_store.split_history(h).items():
+            df = df[df.index >= cutoff]
+            if df.empty:
+                continue
+            states[ticker] = build_state(interval, df)
+            save_state(ticker, interval, states[ticker], root)
+
+    frames = {}
+    for ticker in tickers:
+        if ticker not in states:
+            continue
+        df = to_frame(states[ticker], interval, cutoff)
+        if not df.empty:
+            frames[ticker] = df
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, names=['symbol', 'date'])
+
+
+def _quote_bar(state, interval, price, when):
+    # The pending bar with the current quote folded in. A quote from a later session (or
+    # week) than the pending bar opens a new bar, the pending one is then final.
+    pending = _pending_frame(state)
+    if interval == '1d':
+        start = when.normalize()
+    else:
+        start = (when - pd.Timedelta(days=when.weekday())).normalize()
+    earlier = pending[pending.index < start]
+    current = pending[pending.index >= start]
+    high = np.fmax.reduce(np.append(current['high'].to_numpy(), price))
+    low = np.fmin.reduce(np.append(current['low'].to_numpy(), price))
+    date = current.index[0] if len(current) else start
+    quote = pd.DataFrame({'high': [high], 'low': [low], 'close': [price]}, index=pd.DatetimeIndex([date], name='date'))
+    return pd.concat([earlier, quote])
+
+
+# Price/ATH/MA metrics from the stored indicator states and current quotes only, without
+# any history request. `quotes` maps ticker -> (price, quote time); tickers without a
+# state or a quote are left out.
+def quote_metrics(tickers, quotes, root=STATE_DIR, now=None):
+    now = now or datetime.now()
+    frames = {}
+    for interval in ('1d', '1wk'):
+        cutoff = pd.Timestamp(now) - pd.DateOffset(years=history_store.LOOKBACK_YEARS[interval])
+        interval_frames = {}
+        for ticker in tickers:
+            state = load_state(ticker, interval, root)
+            if state is None or ticker not in quotes:
+                continue
+            price, when = quotes[ticker]
+            df = to_frame(state, interval, cutoff, _quote_bar(state, interval, price, pd.Timestamp(when)))
+            if not df.empty:
+                interval_frames[ticker] = df
+        frames[interval] = pd.concat(interval_frames, names=['symbol', 'date']) if interval_frames else pd.DataFrame()
+    return metrics.compute_metrics(frames['1d'], frames['1wk'], [t for t in tickers if t in quotes], now=now)
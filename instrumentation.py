@@ -0,0 +1,146 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Where each run's report goes, next to the published market files. It changes with every
+# run, so it is gitignored and uploaded as a workflow artifact rather than committed.
+REPORT_NAME = 'run_report.json'
+REPORT_PATH = os.path.join('data', REPORT_NAME)
+PROFILE_PATH = os.path.join('cache', 'run_profile.prof')
+
+# Set STOCKMAP_PROFILE=1 to run every stage and chunk under cProfile
+PROFILE = os.environ.get('STOCKMAP_PROFILE', '') not in ('', '0')
+
+# Tickers listed per drop reason (the counts are always complete)
+MAX_DROPPED_TICKERS = 50
+
+
+class RunReport:
+    # Collects timings and counters from every thread of one pipeline run
+    def __init__(self, profile=PROFILE):
+        self.started_at = datetime.now()
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.chunks = []
+        self.providers = {}
+        self.dropped = {}
+        self.counters = {}
+        self.profile_enabled = profile
+        self.profile_stats = None
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                stage = self.stages.setdefault(name, {"seconds": 0.0, "count": 0})
+                stage["seconds"] += elapsed
+                stage["count"] += 1
+
+    def _provider(self, provider):
+        return self.providers.setdefault(provider, {"requests": 0, "rows": 0, "retries": 0, "errors": 0, "throttled": 0})
+
+    def request(self, provider, count=1, nbytes=None, rows=0):
+        # Response sizes are only known for the plain HTTP fetches (universe_cache); the
+        # provider libraries don't expose them, so their entries have no "bytes" at all
+        with self.lock:
+            stats = self._provider(provider)
+            stats["requests"] += count
+            stats["rows"] += rows
+            if nbytes is not None:
+                stats["bytes"] = stats.get("bytes", 0) + nbytes
+
+    def provider_event(self, provider, event):
+        # event is one of "retries", "errors", "throttled"
+        with self.lock:
+            self._provider(provider)[event] += 1
+
+    def drop(self, reason, ticker):
+        with self.lock:
+            entry = self.dropped.setdefault(reason, {"count": 0, "tickers": []})
+            entry["count"] += 1
+            if len(entry["tickers"]) < MAX_DROPPED_TICKERS:
+                entry["tickers"].append(ticker)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def chunk(self, market, size, seconds, ok):
+        with self.lock:
+            self.chunks.append({"market": market, "size": size, "seconds": round(seconds, 3), "ok": ok})
+
+    def profiled(self, fn, *args, **kwargs):
+        # cProfile only sees the thread it runs in, so every stage/chunk gets its own
+        # profiler and the results are merged
+        if not self.profile_enabled:
+            return fn(*args, **kwargs)
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(fn, *args, **kwargs)
+        finally:
+            with self.lock:
+                if self.profile_stats is None:
+                    self.profile_stats = pstats.Stats(profiler)
+                else:
+                    self.profile_stats.add(profiler)
+
+    def _profile_summary(self, limit=25):
+        out = io.StringIO()
+        stats = pstats.Stats(self.profile_stats, stream=out)
+        stats.sort_stats('cumulative').print_stats(limit)
+        return out.getvalue().splitlines()
+
+    def to_dict(self):
+        with self.lock:
+            chunk_seconds = sorted(c["seconds"] for c in self.chunks)
+            report = {
+                "started_at": self.started_at.isoformat(timespec='seconds'),
+                "total_seconds": round(time.perf_counter() - self.started, 3),
+                "stages": {k: {"seconds": round(v["seconds"], 3), "count": v["count"]} for k, v in sorted(self.stages.items())},
+                "chunks": {
+                    "count": len(self.chunks),
+                    "failed": sum(1 for c in self.chunks if not c["ok"]),
+                    "median_seconds": chunk_seconds[len(chunk_seconds) // 2] if chunk_seconds else None,
+                    "max_seconds": chunk_seconds[-1] if chunk_seconds else None,
+                    "items": self.chunks,
+                },
+                "providers": self.providers,
+                "dropped": self.dropped,
+                "counters": self.counters,
+            }
+        if self.profile_stats is not None:
+            report["profile_top"] = self._profile_summary()
+        return report
+
+    def write(self, path=REPORT_PATH, extra=None):
+        report = self.to_dict()
+        if extra:
+            report.update(extra)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=1)
+        if self.profile_stats is not None:
+            os.makedirs(os.path.dirname(PROFILE_PATH) or '.', exist_ok=True)
+            self.profile_stats.dump_stats(PROFILE_PATH)
+        return report
+
+
+report = RunReport()
+
+
+def reset(profile=PROFILE):
+    # Start a fresh report (the benchmark runs the pipeline several times per process)
+    global report
+    report = RunReport(profile)
+    return report
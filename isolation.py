@@ -0,0 +1,97 @@
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+import instrumentation
+import scheduler
+
+QUARANTINE_PATH = os.path.join('cache', 'quarantine.json')
+
+# A symbol is skipped once it failed this many runs in a row, and gets another chance
+# after QUARANTINE_DAYS (tickers get relisted, providers fix their data).
+QUARANTINE_STRIKES = 3
+QUARANTINE_DAYS = 30
+
+
+def backoff_delay(attempt, base_delay=1.0, max_delay=30.0):
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_retry(fn, retries=3, base_delay=1.0, max_delay=30.0):
+    # Throttling is not retried here: it is the scheduler's job to slow everyone down
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if scheduler.is_throttled(e) or attempt == retries:
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            instrumentation.report.count('chunk retries')
+            # Errors raised by a provider name it (providers.Router)
+            if getattr(e, 'provider', None):
+                instrumentation.report.provider_event(e.provider, 'retries')
+            print(f"Retrying in {delay:.1f}s after error: {e}")
+            time.sleep(delay)
+
+
+# Run `work(market, chunk)`, retrying the whole chunk with backoff first and then splitting
+# it in halves until the failing items are isolated. Items that still fail on their own are
+# reported through `on_failure(item, error)` and the records of all other items are kept.
+def run_isolated(work, market, chunk, on_failure, retries=3, base_delay=1.0):
+    try:
+        return call_with_retry(lambda: work(market, chunk), retries, base_delay)
+    except Exception as e:
+        if scheduler.is_throttled(e):
+            raise
+        if len(chunk) == 1:
+            on_failure(chunk[0], e)
+            return []
+        print(f"[{market}] Chunk of {len(chunk)} starting at {chunk[0][0]} failed ({e}), splitting")
+        instrumentation.report.count('chunk splits')
+
+    mid = len(chunk) // 2
+    # Sub-chunks are tried once: a chunk that failed after retries is assumed to hold a bad symbol
+    return (run_isolated(work, market, chunk[:mid], on_failure, retries=0)
+            + run_isolated(work, market, chunk[mid:], on_failure, retries=0))
+
+
+class Quarantine:
+    # Persistent strike list of symbols that keep failing, shared by all worker threads
+    def __init__(self, path=QUARANTINE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable quarantine list {path}: {e}")
+
+    def is_quarantined(self, ticker):
+        entry = self.entries.get(ticker)
+        if not entry or entry['strikes'] < QUARANTINE_STRIKES:
+            return False
+        last_failed = datetime.fromisoformat(entry['last_failed'])
+        return datetime.now() - last_failed < timedelta(days=QUARANTINE_DAYS)
+
+    def strike(self, ticker, reason):
+        with self.lock:
+            entry = self.entries.setdefault(ticker, {'strikes': 0})
+            entry['strikes'] += 1
+            entry['reason'] = str(reason)[:200]
+            entry['last_failed'] = datetime.now().isoformat(timespec='seconds')
+
+    def clear(self, ticker):
+        with self.lock:
+            self.entries.pop(ticker, None)
+
+    def save(self):
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
@@ -1,17988 +0,0 @@
-const marketData = {
-    "SP500": [
-        {
-            "ticker": "INTC",
-            "name": "Intel",
-            "industry": "Information Technology",
-            "ath": 94.95,
-            "lowest_after_ath": 85.87,
-            "price": 94.75,
-            "correction_ratio": 0.096,
-            "price_to_ath": 0.998,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.4282,
-            "ma_50_spread": 0.7701,
-            "ma_20_50_spread": 0.2394,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 64.34,
-            "roe": -2.91
-        },
-        {
-            "ticker": "CSCO",
-            "name": "Cisco",
-            "industry": "Information Technology",
-            "ath": 90.45,
-            "lowest_after_ath": 85.78,
-            "price": 89.57,
-            "correction_ratio": 0.052,
-            "price_to_ath": 0.99,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.057,
-            "ma_50_spread": 0.1033,
-            "ma_20_50_spread": 0.0437,
-            "eps_q0": 30.8,
-            "eps_q1": 27.72,
-            "eps_q2": 24.64,
-            "eps_q3": 21.56,
-            "per": 32.22,
-            "roe": 23.75
-        },
-        {
-            "ticker": "AMZN",
-            "name": "Amazon",
-            "industry": "Consumer Discretionary",
-            "ath": 265.91,
-            "lowest_after_ath": 257.7,
-            "price": 263.04,
-            "correction_ratio": 0.031,
-            "price_to_ath": 0.989,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.0882,
-            "ma_50_spread": 0.1831,
-            "ma_20_50_spread": 0.0872,
-            "eps_q0": 5.9,
-            "eps_q1": 5.31,
-            "eps_q2": 4.72,
-            "eps_q3": 4.13,
-            "per": 36.69,
-            "roe": 22.29
-        },
-        {
-            "ticker": "EA",
-            "name": "Electronic Arts",
-            "industry": "Communication Services",
-            "ath": 204.89,
-            "lowest_after_ath": 196.4,
-            "price": 202.67,
-            "correction_ratio": 0.041,
-            "price_to_ath": 0.989,
-            "days_since_ath": 121,
-            "ma_20_spread": -0.0023,
-            "ma_50_spread": 0.0047,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": -70.0,
-            "eps_q1": -63.0,
-            "eps_q2": -56.0,
-            "eps_q3": -49.0,
-            "per": 75.91,
-            "roe": 10.03
-        },
-        {
-            "ticker": "NI",
-            "name": "NiSource",
-            "industry": "Utilities",
-            "ath": 48.83,
-            "lowest_after_ath": 46.49,
-            "price": 48.18,
-            "correction_ratio": 0.048,
-            "price_to_ath": 0.987,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.0097,
-            "ma_50_spread": 0.0259,
-            "ma_20_50_spread": 0.016,
-            "eps_q0": 15.1,
-            "eps_q1": 13.59,
-            "eps_q2": 12.08,
-            "eps_q3": 10.57,
-            "per": 24.71,
-            "roe": 9.07
-        },
-        {
-            "ticker": "CBOE",
-            "name": "Cboe Global Markets",
-            "industry": "Financials",
-            "ath": 309.87,
-            "lowest_after_ath": 293.68,
-            "price": 305.6,
-            "correction_ratio": 0.052,
-            "price_to_ath": 0.986,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.0225,
-            "ma_50_spread": 0.0429,
-            "ma_20_50_spread": 0.02,
-            "eps_q0": 59.5,
-            "eps_q1": 53.55,
-            "eps_q2": 47.6,
-            "eps_q3": 41.65,
-            "per": 29.36,
-            "roe": 23.36
-        },
-        {
-            "ticker": "TRGP",
-            "name": "Targa Resources",
-            "industry": "Energy",
-            "ath": 253.87,
-            "lowest_after_ath": 230.38,
-            "price": 250.14,
-            "correction_ratio": 0.093,
-            "price_to_ath": 0.985,
-            "days_since_ath": 23,
-            "ma_20_spread": 0.0352,
-            "ma_50_spread": 0.0437,
-            "ma_20_50_spread": 0.0082,
-            "eps_q0": 55.3,
-            "eps_q1": 49.77,
-            "eps_q2": 44.24,
-            "eps_q3": 38.71,
-            "per": 29.46,
-            "roe": 51.38
-        },
-        {
-            "ticker": "GOOGL",
-            "name": "Alphabet Inc. (Class A)",
-            "industry": "Communication Services",
-            "ath": 355.79,
-            "lowest_after_ath": 344.21,
-            "price": 349.94,
-            "correction_ratio": 0.033,
-            "price_to_ath": 0.984,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.0664,
-            "ma_50_spread": 0.1208,
-            "ma_20_50_spread": 0.051,
-            "eps_q0": 29.8,
-            "eps_q1": 26.82,
-            "eps_q2": 23.84,
-            "eps_q3": 20.86,
-            "per": 32.37,
-            "roe": 35.71
-        },
-        {
-            "ticker": "GL",
-            "name": "Globe Life",
-            "industry": "Financials",
-            "ath": 155.08,
-            "lowest_after_ath": 145.37,
-            "price": 152.54,
-            "correction_ratio": 0.063,
-            "price_to_ath": 0.984,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0256,
-            "ma_50_spread": 0.0584,
-            "ma_20_50_spread": 0.032,
-            "eps_q0": 6.3,
-            "eps_q1": 5.67,
-            "eps_q2": 5.04,
-            "eps_q3": 4.41,
-            "per": 10.56,
-            "roe": 20.46
-        },
-        {
-            "ticker": "GOOG",
-            "name": "Alphabet Inc. (Class C)",
-            "industry": "Communication Services",
-            "ath": 353.39,
-            "lowest_after_ath": 342.43,
-            "price": 347.31,
-            "correction_ratio": 0.031,
-            "price_to_ath": 0.983,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.0652,
-            "ma_50_spread": 0.1165,
-            "ma_20_50_spread": 0.0482,
-            "eps_q0": 29.8,
-            "eps_q1": 26.82,
-            "eps_q2": 23.84,
-            "eps_q3": 20.86,
-            "per": 32.13,
-            "roe": 35.71
-        },
-        {
-            "ticker": "PFG",
-            "name": "Principal Financial Group",
-            "industry": "Financials",
-            "ath": 101.54,
-            "lowest_after_ath": 94.81,
-            "price": 99.63,
-            "correction_ratio": 0.066,
-            "price_to_ath": 0.981,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0497,
-            "ma_50_spread": 0.0801,
-            "ma_20_50_spread": 0.029,
-            "eps_q0": 782.7,
-            "eps_q1": 704.43,
-            "eps_q2": 626.16,
-            "eps_q3": 547.89,
-            "per": 14.29,
-            "roe": 13.39
-        },
-        {
-            "ticker": "PWR",
-            "name": "Quanta Services",
-            "industry": "Industrials",
-            "ath": 640.61,
-            "lowest_after_ath": 614.52,
-            "price": 628.6,
-            "correction_ratio": 0.041,
-            "price_to_ath": 0.981,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0542,
-            "ma_50_spread": 0.094,
-            "ma_20_50_spread": 0.0377,
-            "eps_q0": 3.4,
-            "eps_q1": 3.06,
-            "eps_q2": 2.72,
-            "eps_q3": 2.38,
-            "per": 92.31,
-            "roe": 12.74
-        },
-        {
-            "ticker": "STLD",
-            "name": "Steel Dynamics",
-            "industry": "Materials",
-            "ath": 229.0,
-            "lowest_after_ath": 199.91,
-            "price": 224.37,
-            "correction_ratio": 0.127,
-            "price_to_ath": 0.98,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1077,
-            "ma_50_spread": 0.1803,
-            "ma_20_50_spread": 0.0655,
-            "eps_q0": 85.8,
-            "eps_q1": 77.22,
-            "eps_q2": 68.64,
-            "eps_q3": 60.06,
-            "per": 24.05,
-            "roe": 15.25
-        },
-        {
-            "ticker": "LIN",
-            "name": "Linde plc",
-            "industry": "Materials",
-            "ath": 515.63,
-            "lowest_after_ath": 503.46,
-            "price": 504.71,
-            "correction_ratio": 0.024,
-            "price_to_ath": 0.979,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0067,
-            "ma_50_spread": 0.0168,
-            "ma_20_50_spread": 0.01,
-            "eps_q0": -11.3,
-            "eps_q1": -10.17,
-            "eps_q2": -9.04,
-            "eps_q3": -7.91,
-            "per": 34.59,
-            "roe": 17.82
-        },
-        {
-            "ticker": "NUE",
-            "name": "Nucor",
-            "industry": "Materials",
-            "ath": 227.48,
-            "lowest_after_ath": 213.14,
-            "price": 222.39,
-            "correction_ratio": 0.063,
-            "price_to_ath": 0.978,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1368,
-            "ma_50_spread": 0.2337,
-            "ma_20_50_spread": 0.0853,
-            "eps_q0": 376.3,
-            "eps_q1": 338.67,
-            "eps_q2": 301.04,
-            "eps_q3": 263.41,
-            "per": 22.06,
-            "roe": 12.29
-        },
-        {
-            "ticker": "NXPI",
-            "name": "NXP Semiconductors",
-            "industry": "Information Technology",
-            "ath": 296.08,
-            "lowest_after_ath": 148.09,
-            "price": 289.25,
-            "correction_ratio": 0.5,
-            "price_to_ath": 0.977,
-            "days_since_ath": 653,
-            "ma_20_spread": 0.3247,
-            "ma_50_spread": 0.3631,
-            "ma_20_50_spread": 0.029,
-            "eps_q0": -8.1,
-            "eps_q1": -7.29,
-            "eps_q2": -6.48,
-            "eps_q3": -5.67,
-            "per": 27.65,
-            "roe": 20.7
-        },
-        {
-            "ticker": "ROST",
-            "name": "Ross Stores",
-            "industry": "Consumer Discretionary",
-            "ath": 230.44,
-            "lowest_after_ath": 223.82,
-            "price": 225.08,
-            "correction_ratio": 0.029,
-            "price_to_ath": 0.977,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0056,
-            "ma_50_spread": 0.049,
-            "ma_20_50_spread": 0.0431,
-            "eps_q0": 10.1,
-            "eps_q1": 9.09,
-            "eps_q2": 8.08,
-            "eps_q3": 7.07,
-            "per": 34.05,
-            "roe": 36.68
-        },
-        {
-            "ticker": "AEP",
-            "name": "American Electric Power",
-            "industry": "Utilities",
-            "ath": 137.74,
-            "lowest_after_ath": 131.2,
-            "price": 134.44,
-            "correction_ratio": 0.047,
-            "price_to_ath": 0.976,
-            "days_since_ath": 23,
-            "ma_20_spread": 0.0025,
-            "ma_50_spread": 0.0165,
-            "ma_20_50_spread": 0.0139,
-            "eps_q0": -12.3,
-            "eps_q1": -11.07,
-            "eps_q2": -9.84,
-            "eps_q3": -8.61,
-            "per": 20.19,
-            "roe": 12.49
-        },
-        {
-            "ticker": "MU",
-            "name": "Micron Technology",
-            "industry": "Information Technology",
-            "ath": 531.36,
-            "lowest_after_ath": 488.23,
-            "price": 518.46,
-            "correction_ratio": 0.081,
-            "price_to_ath": 0.976,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1638,
-            "ma_50_spread": 0.2308,
-            "ma_20_50_spread": 0.0576,
-            "eps_q0": 770.8,
-            "eps_q1": 693.72,
-            "eps_q2": 616.64,
-            "eps_q3": 539.56,
-            "per": 24.48,
-            "roe": 39.82
-        },
-        {
-            "ticker": "AFL",
-            "name": "Aflac",
-            "industry": "Financials",
-            "ath": 119.32,
-            "lowest_after_ath": 105.76,
-            "price": 116.21,
-            "correction_ratio": 0.114,
-            "price_to_ath": 0.974,
-            "days_since_ath": 86,
-            "ma_20_spread": 0.026,
-            "ma_50_spread": 0.043,
-            "ma_20_50_spread": 0.0165,
-            "eps_q0": -27.5,
-            "eps_q1": -24.75,
-            "eps_q2": -22.0,
-            "eps_q3": -19.25,
-            "per": 17.06,
-            "roe": 13.12
-        },
-        {
-            "ticker": "ETR",
-            "name": "Entergy",
-            "industry": "Utilities",
-            "ath": 117.95,
-            "lowest_after_ath": 114.29,
-            "price": 114.67,
-            "correction_ratio": 0.031,
-            "price_to_ath": 0.972,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.003,
-            "ma_50_spread": 0.0538,
-            "ma_20_50_spread": 0.0506,
-            "eps_q0": -17.7,
-            "eps_q1": -15.93,
-            "eps_q2": -14.16,
-            "eps_q3": -12.39,
-            "per": 29.25,
-            "roe": 10.77
-        },
-        {
-            "ticker": "FDX",
-            "name": "FedEx",
-            "industry": "Industrials",
-            "ath": 399.67,
-            "lowest_after_ath": 382.27,
-            "price": 388.59,
-            "correction_ratio": 0.044,
-            "price_to_ath": 0.972,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0276,
-            "ma_50_spread": 0.0471,
-            "ma_20_50_spread": 0.019,
-            "eps_q0": 16.2,
-            "eps_q1": 14.58,
-            "eps_q2": 12.96,
-            "eps_q3": 11.34,
-            "per": 20.75,
-            "roe": 15.87
-        },
-        {
-            "ticker": "VLO",
-            "name": "Valero Energy",
-            "industry": "Energy",
-            "ath": 258.43,
-            "lowest_after_ath": 214.71,
-            "price": 251.3,
-            "correction_ratio": 0.169,
-            "price_to_ath": 0.972,
-            "days_since_ath": 30,
-            "ma_20_spread": 0.0542,
-            "ma_50_spread": 0.0911,
-            "ma_20_50_spread": 0.0351,
-            "eps_q0": 303.6,
-            "eps_q1": 273.24,
-            "eps_q2": 242.88,
-            "eps_q3": 212.52,
-            "per": 33.2,
-            "roe": 8.3
-        },
-        {
-            "ticker": "TT",
-            "name": "Trane Technologies",
-            "industry": "Industrials",
-            "ath": 493.69,
-            "lowest_after_ath": 475.82,
-            "price": 479.37,
-            "correction_ratio": 0.036,
-            "price_to_ath": 0.971,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0323,
-            "ma_50_spread": 0.0715,
-            "ma_20_50_spread": 0.038,
-            "eps_q0": -2.2,
-            "eps_q1": -1.98,
-            "eps_q2": -1.76,
-            "eps_q3": -1.54,
-            "per": 36.54,
-            "roe": 36.96
-        },
-        {
-            "ticker": "CASY",
-            "name": "Casey's",
-            "industry": "Consumer Staples",
-            "ath": 806.49,
-            "lowest_after_ath": 771.44,
-            "price": 781.5,
-            "correction_ratio": 0.043,
-            "price_to_ath": 0.969,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0266,
-            "ma_50_spread": 0.0956,
-            "ma_20_50_spread": 0.0672,
-            "eps_q0": 49.3,
-            "eps_q1": 44.37,
-            "eps_q2": 39.44,
-            "eps_q3": 34.51,
-            "per": 44.86,
-            "roe": 17.88
-        },
-        {
-            "ticker": "LNT",
-            "name": "Alliant Energy",
-            "industry": "Utilities",
-            "ath": 74.4,
-            "lowest_after_ath": 70.61,
-            "price": 72.0,
-            "correction_ratio": 0.051,
-            "price_to_ath": 0.968,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0059,
-            "ma_50_spread": 0.0041,
-            "ma_20_50_spread": 0.0101,
-            "eps_q0": -5.3,
-            "eps_q1": -4.77,
-            "eps_q2": -4.24,
-            "eps_q3": -3.71,
-            "per": 22.93,
-            "roe": 11.3
-        },
-        {
-            "ticker": "L",
-            "name": "Loews Corporation",
-            "industry": "Financials",
-            "ath": 114.9,
-            "lowest_after_ath": 103.64,
-            "price": 111.21,
-            "correction_ratio": 0.098,
-            "price_to_ath": 0.968,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0096,
-            "ma_50_spread": 0.0197,
-            "ma_20_50_spread": 0.01,
-            "eps_q0": 115.0,
-            "eps_q1": 103.5,
-            "eps_q2": 92.0,
-            "eps_q3": 80.5,
-            "per": 13.95,
-            "roe": 9.43
-        },
-        {
-            "ticker": "ALL",
-            "name": "Allstate",
-            "industry": "Financials",
-            "ath": 219.48,
-            "lowest_after_ath": 210.26,
-            "price": 212.33,
-            "correction_ratio": 0.042,
-            "price_to_ath": 0.967,
-            "days_since_ath": 16,
-            "ma_20_spread": -0.004,
-            "ma_50_spread": 0.0106,
-            "ma_20_50_spread": 0.0147,
-            "eps_q0": 98.8,
-            "eps_q1": 88.92,
-            "eps_q2": 79.04,
-            "eps_q3": 69.16,
-            "per": 5.58,
-            "roe": 39.52
-        },
-        {
-            "ticker": "EBAY",
-            "name": "eBay Inc.",
-            "industry": "Consumer Discretionary",
-            "ath": 107.34,
-            "lowest_after_ath": 97.29,
-            "price": 103.79,
-            "correction_ratio": 0.094,
-            "price_to_ath": 0.967,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.039,
-            "ma_50_spread": 0.1089,
-            "ma_20_50_spread": 0.0672,
-            "eps_q0": -22.2,
-            "eps_q1": -19.98,
-            "eps_q2": -17.76,
-            "eps_q3": -15.54,
-            "per": 24.36,
-            "roe": 40.85
-        },
-        {
-            "ticker": "WELL",
-            "name": "Welltower",
-            "industry": "Real Estate",
-            "ath": 219.59,
-            "lowest_after_ath": 211.45,
-            "price": 212.09,
-            "correction_ratio": 0.037,
-            "price_to_ath": 0.966,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.0232,
-            "ma_50_spread": 0.0306,
-            "ma_20_50_spread": 0.0072,
-            "eps_q0": -19.6,
-            "eps_q1": -17.64,
-            "eps_q2": -15.68,
-            "eps_q3": -13.72,
-            "per": 145.27,
-            "roe": 2.54
-        },
-        {
-            "ticker": "ATO",
-            "name": "Atmos Energy",
-            "industry": "Utilities",
-            "ath": 192.51,
-            "lowest_after_ath": 181.32,
-            "price": 185.71,
-            "correction_ratio": 0.058,
-            "price_to_ath": 0.965,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0078,
-            "ma_50_spread": 0.0025,
-            "ma_20_50_spread": 0.0104,
-            "eps_q0": 14.5,
-            "eps_q1": 13.05,
-            "eps_q2": 11.6,
-            "eps_q3": 10.15,
-            "per": 24.21,
-            "roe": 9.24
-        },
-        {
-            "ticker": "EQIX",
-            "name": "Equinix",
-            "industry": "Real Estate",
-            "ath": 1128.68,
-            "lowest_after_ath": 1063.29,
-            "price": 1089.07,
-            "correction_ratio": 0.058,
-            "price_to_ath": 0.965,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0271,
-            "ma_50_spread": 0.0889,
-            "ma_20_50_spread": 0.0602,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 79.03,
-            "roe": 9.72
-        },
-        {
-            "ticker": "HUBB",
-            "name": "Hubbell Incorporated",
-            "industry": "Industrials",
-            "ath": 565.5,
-            "lowest_after_ath": 534.0,
-            "price": 545.93,
-            "correction_ratio": 0.056,
-            "price_to_ath": 0.965,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.024,
-            "ma_50_spread": 0.0712,
-            "ma_20_50_spread": 0.0461,
-            "eps_q0": 13.1,
-            "eps_q1": 11.79,
-            "eps_q2": 10.48,
-            "eps_q3": 9.17,
-            "per": 32.97,
-            "roe": 24.54
-        },
-        {
-            "ticker": "JCI",
-            "name": "Johnson Controls",
-            "industry": "Industrials",
-            "ath": 146.49,
-            "lowest_after_ath": 125.91,
-            "price": 141.35,
-            "correction_ratio": 0.14,
-            "price_to_ath": 0.965,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0136,
-            "ma_50_spread": 0.0271,
-            "ma_20_50_spread": 0.0133,
-            "eps_q0": 25.1,
-            "eps_q1": 22.59,
-            "eps_q2": 20.08,
-            "eps_q3": 17.57,
-            "per": 47.59,
-            "roe": 12.64
-        },
-        {
-            "ticker": "NEE",
-            "name": "NextEra Energy",
-            "industry": "Utilities",
-            "ath": 97.63,
-            "lowest_after_ath": 89.9,
-            "price": 94.17,
-            "correction_ratio": 0.079,
-            "price_to_ath": 0.965,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0107,
-            "ma_50_spread": 0.0175,
-            "ma_20_50_spread": 0.0067,
-            "eps_q0": 161.9,
-            "eps_q1": 145.71,
-            "eps_q2": 129.52,
-            "eps_q3": 113.33,
-            "per": 23.9,
-            "roe": 10.32
-        },
-        {
-            "ticker": "NSC",
-            "name": "Norfolk Southern",
-            "industry": "Industrials",
-            "ath": 323.37,
-            "lowest_after_ath": 298.01,
-            "price": 312.12,
-            "correction_ratio": 0.078,
-            "price_to_ath": 0.965,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0351,
-            "ma_50_spread": 0.0399,
-            "ma_20_50_spread": 0.0047,
-            "eps_q0": -27.1,
-            "eps_q1": -24.39,
-            "eps_q2": -21.68,
-            "eps_q3": -18.97,
-            "per": 26.27,
-            "roe": 17.61
-        },
-        {
-            "ticker": "NVDA",
-            "name": "Nvidia",
-            "industry": "Information Technology",
-            "ath": 216.83,
-            "lowest_after_ath": 207.38,
-            "price": 209.25,
-            "correction_ratio": 0.044,
-            "price_to_ath": 0.965,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0732,
-            "ma_50_spread": 0.1207,
-            "ma_20_50_spread": 0.0443,
-            "eps_q0": 94.5,
-            "eps_q1": 85.05,
-            "eps_q2": 75.6,
-            "eps_q3": 66.15,
-            "per": 42.7,
-            "roe": 101.48
-        },
-        {
-            "ticker": "SNDK",
-            "name": "Sandisk",
-            "industry": "Information Technology",
-            "ath": 1103.0,
-            "lowest_after_ath": 1060.0,
-            "price": 1064.21,
-            "correction_ratio": 0.039,
-            "price_to_ath": 0.965,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.1959,
-            "ma_50_spread": 0.4349,
-            "ma_20_50_spread": 0.1999,
-            "eps_q0": 672.1,
-            "eps_q1": 604.89,
-            "eps_q2": 537.68,
-            "eps_q3": 470.47,
-            "per": 9.01,
-            "roe": -9.37
-        },
-        {
-            "ticker": "STT",
-            "name": "State Street Corporation",
-            "industry": "Financials",
-            "ath": 156.18,
-            "lowest_after_ath": 145.97,
-            "price": 150.7,
-            "correction_ratio": 0.065,
-            "price_to_ath": 0.965,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0534,
-            "ma_50_spread": 0.139,
-            "ma_20_50_spread": 0.0813,
-            "eps_q0": -23.7,
-            "eps_q1": -21.33,
-            "eps_q2": -18.96,
-            "eps_q3": -16.59,
-            "per": 15.3,
-            "roe": 11.26
-        },
-        {
-            "ticker": "TRV",
-            "name": "Travelers Companies (The)",
-            "industry": "Financials",
-            "ath": 313.12,
-            "lowest_after_ath": 284.66,
-            "price": 302.25,
-            "correction_ratio": 0.091,
-            "price_to_ath": 0.965,
-            "days_since_ath": 58,
-            "ma_20_spread": 0.0063,
-            "ma_50_spread": 0.0048,
-            "ma_20_50_spread": -0.0015,
-            "eps_q0": 333.2,
-            "eps_q1": 299.88,
-            "eps_q2": 266.56,
-            "eps_q3": 233.24,
-            "per": 9.02,
-            "roe": 25.27
-        },
-        {
-            "ticker": "JBL",
-            "name": "Jabil",
-            "industry": "Information Technology",
-            "ath": 346.22,
-            "lowest_after_ath": 321.34,
-            "price": 333.86,
-            "correction_ratio": 0.072,
-            "price_to_ath": 0.964,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0779,
-            "ma_50_spread": 0.1911,
-            "ma_20_50_spread": 0.105,
-            "eps_q0": 90.6,
-            "eps_q1": 81.54,
-            "eps_q2": 72.48,
-            "eps_q3": 63.42,
-            "per": 45.06,
-            "roe": 59.7
-        },
-        {
-            "ticker": "PNW",
-            "name": "Pinnacle West Capital",
-            "industry": "Utilities",
-            "ath": 105.51,
-            "lowest_after_ath": 59.03,
-            "price": 101.67,
-            "correction_ratio": 0.441,
-            "price_to_ath": 0.964,
-            "days_since_ath": 2263,
-            "ma_20_spread": -0.0101,
-            "ma_50_spread": 0.0044,
-            "ma_20_50_spread": 0.0146,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 20.13,
-            "roe": 9.06
-        },
-        {
-            "ticker": "AEE",
-            "name": "Ameren",
-            "industry": "Utilities",
-            "ath": 115.53,
-            "lowest_after_ath": 108.51,
-            "price": 111.29,
-            "correction_ratio": 0.061,
-            "price_to_ath": 0.963,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0038,
-            "ma_50_spread": 0.0033,
-            "ma_20_50_spread": 0.0071,
-            "eps_q0": 21.7,
-            "eps_q1": 19.53,
-            "eps_q2": 17.36,
-            "eps_q3": 15.19,
-            "per": 20.8,
-            "roe": 11.34
-        },
-        {
-            "ticker": "CNP",
-            "name": "CenterPoint Energy",
-            "industry": "Utilities",
-            "ath": 44.47,
-            "lowest_after_ath": 42.03,
-            "price": 42.82,
-            "correction_ratio": 0.055,
-            "price_to_ath": 0.963,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0056,
-            "ma_50_spread": -0.005,
-            "ma_20_50_spread": 0.0006,
-            "eps_q0": 6.4,
-            "eps_q1": 5.76,
-            "eps_q2": 5.12,
-            "eps_q3": 4.48,
-            "per": 26.27,
-            "roe": 9.56
-        },
-        {
-            "ticker": "Q",
-            "name": "Qnity Electronics",
-            "industry": "Information Technology",
-            "ath": 146.67,
-            "lowest_after_ath": 133.8,
-            "price": 141.3,
-            "correction_ratio": 0.088,
-            "price_to_ath": 0.963,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0666,
-            "ma_50_spread": 0.1586,
-            "ma_20_50_spread": 0.0863,
-            "eps_q0": -53.1,
-            "eps_q1": -47.79,
-            "eps_q2": -42.48,
-            "eps_q3": -37.17,
-            "per": 42.82,
-            "roe": 7.98
-        },
-        {
-            "ticker": "KO",
-            "name": "Coca-Cola Company (The)",
-            "industry": "Consumer Staples",
-            "ath": 82.0,
-            "lowest_after_ath": 74.07,
-            "price": 78.87,
-            "correction_ratio": 0.097,
-            "price_to_ath": 0.962,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0325,
-            "ma_50_spread": 0.0218,
-            "ma_20_50_spread": -0.0103,
-            "eps_q0": 17.8,
-            "eps_q1": 16.02,
-            "eps_q2": 14.24,
-            "eps_q3": 12.46,
-            "per": 24.8,
-            "roe": 43.37
-        },
-        {
-            "ticker": "CMI",
-            "name": "Cummins",
-            "industry": "Industrials",
-            "ath": 665.13,
-            "lowest_after_ath": 636.66,
-            "price": 638.95,
-            "correction_ratio": 0.043,
-            "price_to_ath": 0.961,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0408,
-            "ma_50_spread": 0.1005,
-            "ma_20_50_spread": 0.0574,
-            "eps_q0": 41.9,
-            "eps_q1": 37.71,
-            "eps_q2": 33.52,
-            "eps_q3": 29.33,
-            "per": 31.18,
-            "roe": 23.93
-        },
-        {
-            "ticker": "JBHT",
-            "name": "J.B. Hunt",
-            "industry": "Industrials",
-            "ath": 256.18,
-            "lowest_after_ath": 241.83,
-            "price": 246.31,
-            "correction_ratio": 0.056,
-            "price_to_ath": 0.961,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.047,
-            "ma_50_spread": 0.1056,
-            "ma_20_50_spread": 0.056,
-            "eps_q0": 20.2,
-            "eps_q1": 18.18,
-            "eps_q2": 16.16,
-            "eps_q3": 14.14,
-            "per": 38.31,
-            "roe": 16.68
-        },
-        {
-            "ticker": "MS",
-            "name": "Morgan Stanley",
-            "industry": "Financials",
-            "ath": 194.59,
-            "lowest_after_ath": 175.01,
-            "price": 187.08,
-            "correction_ratio": 0.101,
-            "price_to_ath": 0.961,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.0261,
-            "ma_50_spread": 0.091,
-            "ma_20_50_spread": 0.0633,
-            "eps_q0": 29.0,
-            "eps_q1": 26.1,
-            "eps_q2": 23.2,
-            "eps_q3": 20.3,
-            "per": 16.95,
-            "roe": 0
-        },
-        {
-            "ticker": "CSX",
-            "name": "CSX Corporation",
-            "industry": "Industrials",
-            "ath": 46.55,
-            "lowest_after_ath": 42.88,
-            "price": 44.68,
-            "correction_ratio": 0.079,
-            "price_to_ath": 0.96,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0359,
-            "ma_50_spread": 0.072,
-            "ma_20_50_spread": 0.0349,
-            "eps_q0": 24.9,
-            "eps_q1": 22.41,
-            "eps_q2": 19.92,
-            "eps_q3": 17.43,
-            "per": 27.41,
-            "roe": 23.68
-        },
-        {
-            "ticker": "CAT",
-            "name": "Caterpillar Inc.",
-            "industry": "Industrials",
-            "ath": 845.27,
-            "lowest_after_ath": 786.83,
-            "price": 810.05,
-            "correction_ratio": 0.069,
-            "price_to_ath": 0.958,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0321,
-            "ma_50_spread": 0.0873,
-            "ma_20_50_spread": 0.0535,
-            "eps_q0": -13.9,
-            "eps_q1": -12.51,
-            "eps_q2": -11.12,
-            "eps_q3": -9.73,
-            "per": 43.06,
-            "roe": 43.53
-        },
-        {
-            "ticker": "FANG",
-            "name": "Diamondback Energy",
-            "industry": "Energy",
-            "ath": 214.5,
-            "lowest_after_ath": 114.0,
-            "price": 205.32,
-            "correction_ratio": 0.469,
-            "price_to_ath": 0.957,
-            "days_since_ath": 653,
-            "ma_20_spread": 0.0741,
-            "ma_50_spread": 0.1015,
-            "ma_20_50_spread": 0.0254,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 35.9,
-            "roe": 3.74
-        },
-        {
-            "ticker": "WEC",
-            "name": "WEC Energy Group",
-            "industry": "Utilities",
-            "ath": 119.62,
-            "lowest_after_ath": 113.03,
-            "price": 114.51,
-            "correction_ratio": 0.055,
-            "price_to_ath": 0.957,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0123,
-            "ma_50_spread": -0.0086,
-            "ma_20_50_spread": 0.0038,
-            "eps_q0": -30.2,
-            "eps_q1": -27.18,
-            "eps_q2": -24.16,
-            "eps_q3": -21.14,
-            "per": 23.86,
-            "roe": 11.58
-        },
-        {
-            "ticker": "AMD",
-            "name": "Advanced Micro Devices",
-            "industry": "Information Technology",
-            "ath": 352.99,
-            "lowest_after_ath": 272.0,
-            "price": 337.11,
-            "correction_ratio": 0.229,
-            "price_to_ath": 0.955,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.2461,
-            "ma_50_spread": 0.4712,
-            "ma_20_50_spread": 0.1806,
-            "eps_q0": 213.5,
-            "eps_q1": 192.15,
-            "eps_q2": 170.8,
-            "eps_q3": 149.45,
-            "per": 128.67,
-            "roe": 7.08
-        },
-        {
-            "ticker": "HPE",
-            "name": "Hewlett Packard Enterprise",
-            "industry": "Information Technology",
-            "ath": 29.63,
-            "lowest_after_ath": 26.34,
-            "price": 28.3,
-            "correction_ratio": 0.111,
-            "price_to_ath": 0.955,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0786,
-            "ma_50_spread": 0.1951,
-            "ma_20_50_spread": 0.1081,
-            "eps_q0": -27.9,
-            "eps_q1": -25.11,
-            "eps_q2": -22.32,
-            "eps_q3": -19.53,
-            "per": 10.4,
-            "roe": -0.47
-        },
-        {
-            "ticker": "EVRG",
-            "name": "Evergy",
-            "industry": "Utilities",
-            "ath": 85.27,
-            "lowest_after_ath": 79.21,
-            "price": 81.33,
-            "correction_ratio": 0.071,
-            "price_to_ath": 0.954,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0093,
-            "ma_50_spread": -0.0075,
-            "ma_20_50_spread": 0.0019,
-            "eps_q0": 7.8,
-            "eps_q1": 7.02,
-            "eps_q2": 6.24,
-            "eps_q3": 5.46,
-            "per": 22.22,
-            "roe": 8.57
-        },
-        {
-            "ticker": "WMB",
-            "name": "Williams Companies",
-            "industry": "Energy",
-            "ath": 76.87,
-            "lowest_after_ath": 69.33,
-            "price": 73.32,
-            "correction_ratio": 0.098,
-            "price_to_ath": 0.954,
-            "days_since_ath": 58,
-            "ma_20_spread": 0.019,
-            "ma_50_spread": 0.0035,
-            "ma_20_50_spread": -0.0152,
-            "eps_q0": 51.0,
-            "eps_q1": 45.9,
-            "eps_q2": 40.8,
-            "eps_q3": 35.7,
-            "per": 34.26,
-            "roe": 18.55
-        },
-        {
-            "ticker": "ADI",
-            "name": "Analog Devices",
-            "industry": "Information Technology",
-            "ath": 408.37,
-            "lowest_after_ath": 369.7,
-            "price": 389.31,
-            "correction_ratio": 0.095,
-            "price_to_ath": 0.953,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0785,
-            "ma_50_spread": 0.1417,
-            "ma_20_50_spread": 0.0586,
-            "eps_q0": 112.3,
-            "eps_q1": 101.07,
-            "eps_q2": 89.84,
-            "eps_q3": 78.61,
-            "per": 71.04,
-            "roe": 7.86
-        },
-        {
-            "ticker": "NTRS",
-            "name": "Northern Trust",
-            "industry": "Financials",
-            "ath": 173.19,
-            "lowest_after_ath": 158.1,
-            "price": 164.83,
-            "correction_ratio": 0.087,
-            "price_to_ath": 0.952,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0504,
-            "ma_50_spread": 0.1219,
-            "ma_20_50_spread": 0.0681,
-            "eps_q0": 34.1,
-            "eps_q1": 30.69,
-            "eps_q2": 27.28,
-            "eps_q3": 23.87,
-            "per": 17.26,
-            "roe": 14.46
-        },
-        {
-            "ticker": "BK",
-            "name": "BNY Mellon",
-            "industry": "Financials",
-            "ath": 139.15,
-            "lowest_after_ath": 130.9,
-            "price": 132.27,
-            "correction_ratio": 0.059,
-            "price_to_ath": 0.951,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0113,
-            "ma_50_spread": 0.0794,
-            "ma_20_50_spread": 0.0674,
-            "eps_q0": 33.8,
-            "eps_q1": 30.42,
-            "eps_q2": 27.04,
-            "eps_q3": 23.66,
-            "per": 16.39,
-            "roe": 13.47
-        },
-        {
-            "ticker": "DTE",
-            "name": "DTE Energy",
-            "industry": "Utilities",
-            "ath": 154.63,
-            "lowest_after_ath": 141.42,
-            "price": 147.03,
-            "correction_ratio": 0.085,
-            "price_to_ath": 0.951,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0018,
-            "ma_50_spread": 0.0015,
-            "ma_20_50_spread": 0.0032,
-            "eps_q0": 26.4,
-            "eps_q1": 23.76,
-            "eps_q2": 21.12,
-            "eps_q3": 18.48,
-            "per": 20.91,
-            "roe": 12.18
-        },
-        {
-            "ticker": "KEYS",
-            "name": "Keysight Technologies",
-            "industry": "Information Technology",
-            "ath": 352.78,
-            "lowest_after_ath": 324.27,
-            "price": 335.46,
-            "correction_ratio": 0.081,
-            "price_to_ath": 0.951,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0312,
-            "ma_50_spread": 0.1184,
-            "ma_20_50_spread": 0.0846,
-            "eps_q0": 66.3,
-            "eps_q1": 59.67,
-            "eps_q2": 53.04,
-            "eps_q3": 46.41,
-            "per": 59.06,
-            "roe": 17.22
-        },
-        {
-            "ticker": "ETN",
-            "name": "Eaton Corporation",
-            "industry": "Industrials",
-            "ath": 432.34,
-            "lowest_after_ath": 401.65,
-            "price": 410.77,
-            "correction_ratio": 0.071,
-            "price_to_ath": 0.95,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0311,
-            "ma_50_spread": 0.0895,
-            "ma_20_50_spread": 0.0567,
-            "eps_q0": 16.6,
-            "eps_q1": 14.94,
-            "eps_q2": 13.28,
-            "eps_q3": 11.62,
-            "per": 39.31,
-            "roe": 21.53
-        },
-        {
-            "ticker": "WMT",
-            "name": "Walmart",
-            "industry": "Consumer Staples",
-            "ath": 134.69,
-            "lowest_after_ath": 118.02,
-            "price": 128.01,
-            "correction_ratio": 0.124,
-            "price_to_ath": 0.95,
-            "days_since_ath": 72,
-            "ma_20_spread": 0.007,
-            "ma_50_spread": 0.0202,
-            "ma_20_50_spread": 0.013,
-            "eps_q0": -19.4,
-            "eps_q1": -17.46,
-            "eps_q2": -15.52,
-            "eps_q3": -13.58,
-            "per": 46.89,
-            "roe": 21.85
-        },
-        {
-            "ticker": "UNP",
-            "name": "Union Pacific Corporation",
-            "industry": "Industrials",
-            "ath": 278.94,
-            "lowest_after_ath": 183.69,
-            "price": 264.78,
-            "correction_ratio": 0.341,
-            "price_to_ath": 0.949,
-            "days_since_ath": 1493,
-            "ma_20_spread": 0.0428,
-            "ma_50_spread": 0.0489,
-            "ma_20_50_spread": 0.0058,
-            "eps_q0": 4.6,
-            "eps_q1": 4.14,
-            "eps_q2": 3.68,
-            "eps_q3": 3.22,
-            "per": 21.77,
-            "roe": 40.69
-        },
-        {
-            "ticker": "FFIV",
-            "name": "F5, Inc.",
-            "industry": "Information Technology",
-            "ath": 346.0,
-            "lowest_after_ath": 223.76,
-            "price": 328.15,
-            "correction_ratio": 0.353,
-            "price_to_ath": 0.948,
-            "days_since_ath": 205,
-            "ma_20_spread": 0.0777,
-            "ma_50_spread": 0.1246,
-            "ma_20_50_spread": 0.0435,
-            "eps_q0": 8.2,
-            "eps_q1": 7.38,
-            "eps_q2": 6.56,
-            "eps_q3": 5.74,
-            "per": 27.14,
-            "roe": 20.84
-        },
-        {
-            "ticker": "WAB",
-            "name": "Wabtec",
-            "industry": "Industrials",
-            "ath": 275.84,
-            "lowest_after_ath": 250.6,
-            "price": 261.37,
-            "correction_ratio": 0.092,
-            "price_to_ath": 0.948,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0049,
-            "ma_50_spread": 0.0248,
-            "ma_20_50_spread": 0.0298,
-            "eps_q0": 12.4,
-            "eps_q1": 11.16,
-            "eps_q2": 9.92,
-            "eps_q3": 8.68,
-            "per": 36.92,
-            "roe": 11.31
-        },
-        {
-            "ticker": "HIG",
-            "name": "Hartford (The)",
-            "industry": "Financials",
-            "ath": 144.5,
-            "lowest_after_ath": 130.75,
-            "price": 136.64,
-            "correction_ratio": 0.095,
-            "price_to_ath": 0.946,
-            "days_since_ath": 86,
-            "ma_20_spread": -0.0087,
-            "ma_50_spread": -0.0062,
-            "ma_20_50_spread": 0.0025,
-            "eps_q0": 35.9,
-            "eps_q1": 32.31,
-            "eps_q2": 28.72,
-            "eps_q3": 25.13,
-            "per": 9.62,
-            "roe": 22.74
-        },
-        {
-            "ticker": "AIZ",
-            "name": "Assurant",
-            "industry": "Financials",
-            "ath": 246.31,
-            "lowest_after_ath": 209.86,
-            "price": 232.7,
-            "correction_ratio": 0.148,
-            "price_to_ath": 0.945,
-            "days_since_ath": 86,
-            "ma_20_spread": 0.0333,
-            "ma_50_spread": 0.0457,
-            "ma_20_50_spread": 0.012,
-            "eps_q0": 11.9,
-            "eps_q1": 10.71,
-            "eps_q2": 9.52,
-            "eps_q3": 8.33,
-            "per": 13.74,
-            "roe": 15.9
-        },
-        {
-            "ticker": "MPC",
-            "name": "Marathon Petroleum",
-            "industry": "Energy",
-            "ath": 255.77,
-            "lowest_after_ath": 210.64,
-            "price": 241.81,
-            "correction_ratio": 0.176,
-            "price_to_ath": 0.945,
-            "days_since_ath": 30,
-            "ma_20_spread": 0.0605,
-            "ma_50_spread": 0.079,
-            "ma_20_50_spread": 0.0174,
-            "eps_q0": 313.7,
-            "eps_q1": 282.33,
-            "eps_q2": 250.96,
-            "eps_q3": 219.59,
-            "per": 18.31,
-            "roe": 24.19
-        },
-        {
-            "ticker": "AVGO",
-            "name": "Broadcom",
-            "industry": "Information Technology",
-            "ath": 429.31,
-            "lowest_after_ath": 394.57,
-            "price": 405.45,
-            "correction_ratio": 0.081,
-            "price_to_ath": 0.944,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0661,
-            "ma_50_spread": 0.1716,
-            "ma_20_50_spread": 0.099,
-            "eps_q0": 33.5,
-            "eps_q1": 30.15,
-            "eps_q2": 26.8,
-            "eps_q3": 23.45,
-            "per": 79.19,
-            "roe": 33.37
-        },
-        {
-            "ticker": "SNA",
-            "name": "Snap-on",
-            "industry": "Industrials",
-            "ath": 400.88,
-            "lowest_after_ath": 375.03,
-            "price": 378.46,
-            "correction_ratio": 0.064,
-            "price_to_ath": 0.944,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.003,
-            "ma_50_spread": 0.0098,
-            "ma_20_50_spread": 0.0068,
-            "eps_q0": 2.7,
-            "eps_q1": 2.43,
-            "eps_q2": 2.16,
-            "eps_q3": 1.89,
-            "per": 19.54,
-            "roe": 18.2
-        },
-        {
-            "ticker": "YUM",
-            "name": "Yum! Brands",
-            "industry": "Consumer Discretionary",
-            "ath": 169.39,
-            "lowest_after_ath": 151.91,
-            "price": 159.84,
-            "correction_ratio": 0.103,
-            "price_to_ath": 0.944,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0028,
-            "ma_50_spread": -0.0009,
-            "ma_20_50_spread": -0.0037,
-            "eps_q0": 26.5,
-            "eps_q1": 23.85,
-            "eps_q2": 21.2,
-            "eps_q3": 18.55,
-            "per": 28.8,
-            "roe": 0
-        },
-        {
-            "ticker": "CB",
-            "name": "Chubb Limited",
-            "industry": "Financials",
-            "ath": 345.67,
-            "lowest_after_ath": 318.31,
-            "price": 325.75,
-            "correction_ratio": 0.079,
-            "price_to_ath": 0.942,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0084,
-            "ma_50_spread": -0.0102,
-            "ma_20_50_spread": -0.0018,
-            "eps_q0": 74.3,
-            "eps_q1": 66.87,
-            "eps_q2": 59.44,
-            "eps_q3": 52.01,
-            "per": 11.52,
-            "roe": 15.43
-        },
-        {
-            "ticker": "FIX",
-            "name": "Comfort Systems USA",
-            "industry": "Industrials",
-            "ath": 1829.66,
-            "lowest_after_ath": 1635.2,
-            "price": 1724.14,
-            "correction_ratio": 0.106,
-            "price_to_ath": 0.942,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0644,
-            "ma_50_spread": 0.1599,
-            "ma_20_50_spread": 0.0897,
-            "eps_q0": 38.2,
-            "eps_q1": 34.38,
-            "eps_q2": 30.56,
-            "eps_q3": 26.74,
-            "per": 49.89,
-            "roe": 53.29
-        },
-        {
-            "ticker": "AME",
-            "name": "Ametek",
-            "industry": "Industrials",
-            "ath": 242.05,
-            "lowest_after_ath": 207.32,
-            "price": 227.87,
-            "correction_ratio": 0.143,
-            "price_to_ath": 0.941,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0084,
-            "ma_50_spread": 0.009,
-            "ma_20_50_spread": 0.0175,
-            "eps_q0": 2.9,
-            "eps_q1": 2.61,
-            "eps_q2": 2.32,
-            "eps_q3": 2.03,
-            "per": 35.55,
-            "roe": 14.59
-        },
-        {
-            "ticker": "DUK",
-            "name": "Duke Energy",
-            "industry": "Utilities",
-            "ath": 134.49,
-            "lowest_after_ath": 124.9,
-            "price": 126.51,
-            "correction_ratio": 0.071,
-            "price_to_ath": 0.941,
-            "days_since_ath": 44,
-            "ma_20_spread": -0.0205,
-            "ma_50_spread": -0.0239,
-            "ma_20_50_spread": -0.0035,
-            "eps_q0": -1.7,
-            "eps_q1": -1.53,
-            "eps_q2": -1.36,
-            "eps_q3": -1.19,
-            "per": 20.05,
-            "roe": 9.72
-        },
-        {
-            "ticker": "FTV",
-            "name": "Fortive",
-            "industry": "Industrials",
-            "ath": 65.64,
-            "lowest_after_ath": 45.5,
-            "price": 61.75,
-            "correction_ratio": 0.307,
-            "price_to_ath": 0.941,
-            "days_since_ath": 772,
-            "ma_20_spread": 0.035,
-            "ma_50_spread": 0.07,
-            "ma_20_50_spread": 0.0338,
-            "eps_q0": -11.1,
-            "eps_q1": -9.99,
-            "eps_q2": -8.88,
-            "eps_q3": -7.77,
-            "per": 38.84,
-            "roe": 6.4
-        },
-        {
-            "ticker": "TJX",
-            "name": "TJX Companies",
-            "industry": "Consumer Discretionary",
-            "ath": 165.82,
-            "lowest_after_ath": 155.15,
-            "price": 156.07,
-            "correction_ratio": 0.064,
-            "price_to_ath": 0.941,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0223,
-            "ma_50_spread": -0.0149,
-            "ma_20_50_spread": 0.0076,
-            "eps_q0": 26.8,
-            "eps_q1": 24.12,
-            "eps_q2": 21.44,
-            "eps_q3": 18.76,
-            "per": 32.05,
-            "roe": 59.13
-        },
-        {
-            "ticker": "ANET",
-            "name": "Arista Networks",
-            "industry": "Information Technology",
-            "ath": 179.8,
-            "lowest_after_ath": 162.25,
-            "price": 168.68,
-            "correction_ratio": 0.098,
-            "price_to_ath": 0.938,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.085,
-            "ma_50_spread": 0.1927,
-            "ma_20_50_spread": 0.0993,
-            "eps_q0": 19.3,
-            "eps_q1": 17.37,
-            "eps_q2": 15.44,
-            "eps_q3": 13.51,
-            "per": 61.56,
-            "roe": 31.4
-        },
-        {
-            "ticker": "EME",
-            "name": "Emcor",
-            "industry": "Industrials",
-            "ath": 888.05,
-            "lowest_after_ath": 830.6,
-            "price": 833.37,
-            "correction_ratio": 0.065,
-            "price_to_ath": 0.938,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0226,
-            "ma_50_spread": 0.0783,
-            "ma_20_50_spread": 0.0544,
-            "eps_q0": 48.8,
-            "eps_q1": 43.92,
-            "eps_q2": 39.04,
-            "eps_q3": 34.16,
-            "per": 29.59,
-            "roe": 38.49
-        },
-        {
-            "ticker": "CINF",
-            "name": "Cincinnati Financial",
-            "industry": "Financials",
-            "ath": 174.27,
-            "lowest_after_ath": 153.4,
-            "price": 163.22,
-            "correction_ratio": 0.12,
-            "price_to_ath": 0.937,
-            "days_since_ath": 86,
-            "ma_20_spread": -0.0017,
-            "ma_50_spread": 0.0028,
-            "ma_20_50_spread": 0.0045,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.33,
-            "roe": 18.73
-        },
-        {
-            "ticker": "ED",
-            "name": "Consolidated Edison",
-            "industry": "Utilities",
-            "ath": 116.23,
-            "lowest_after_ath": 107.65,
-            "price": 108.88,
-            "correction_ratio": 0.074,
-            "price_to_ath": 0.937,
-            "days_since_ath": 44,
-            "ma_20_spread": -0.0225,
-            "ma_50_spread": -0.0252,
-            "ma_20_50_spread": -0.0028,
-            "eps_q0": -4.2,
-            "eps_q1": -3.78,
-            "eps_q2": -3.36,
-            "eps_q3": -2.94,
-            "per": 19.27,
-            "roe": 8.77
-        },
-        {
-            "ticker": "AAPL",
-            "name": "Apple Inc.",
-            "industry": "Information Technology",
-            "ath": 288.62,
-            "lowest_after_ath": 243.42,
-            "price": 270.17,
-            "correction_ratio": 0.157,
-            "price_to_ath": 0.936,
-            "days_since_ath": 149,
-            "ma_20_spread": 0.022,
-            "ma_50_spread": 0.0364,
-            "ma_20_50_spread": 0.0141,
-            "eps_q0": 15.9,
-            "eps_q1": 14.31,
-            "eps_q2": 12.72,
-            "eps_q3": 11.13,
-            "per": 34.2,
-            "roe": 152.02
-        },
-        {
-            "ticker": "BG",
-            "name": "Bunge Global",
-            "industry": "Consumer Staples",
-            "ath": 135.0,
-            "lowest_after_ath": 27.6,
-            "price": 126.31,
-            "correction_ratio": 0.796,
-            "price_to_ath": 0.936,
-            "days_since_ath": 6680,
-            "ma_20_spread": 0.0115,
-            "ma_50_spread": 0.0259,
-            "ma_20_50_spread": 0.0142,
-            "eps_q0": -84.2,
-            "eps_q1": -75.78,
-            "eps_q2": -67.36,
-            "eps_q3": -58.94,
-            "per": 25.62,
-            "roe": 5.96
-        },
-        {
-            "ticker": "CFG",
-            "name": "Citizens Financial Group",
-            "industry": "Financials",
-            "ath": 68.79,
-            "lowest_after_ath": 55.49,
-            "price": 64.4,
-            "correction_ratio": 0.193,
-            "price_to_ath": 0.936,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0058,
-            "ma_50_spread": 0.0495,
-            "ma_20_50_spread": 0.0434,
-            "eps_q0": 38.6,
-            "eps_q1": 34.74,
-            "eps_q2": 30.88,
-            "eps_q3": 27.02,
-            "per": 15.26,
-            "roe": 7.74
-        },
-        {
-            "ticker": "DOV",
-            "name": "Dover Corporation",
-            "industry": "Industrials",
-            "ath": 237.54,
-            "lowest_after_ath": 200.63,
-            "price": 222.25,
-            "correction_ratio": 0.155,
-            "price_to_ath": 0.936,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0218,
-            "ma_50_spread": 0.0245,
-            "ma_20_50_spread": 0.0027,
-            "eps_q0": 3.3,
-            "eps_q1": 2.97,
-            "eps_q2": 2.64,
-            "eps_q3": 2.31,
-            "per": 27.78,
-            "roe": 15.0
-        },
-        {
-            "ticker": "KLAC",
-            "name": "KLA Corporation",
-            "industry": "Information Technology",
-            "ath": 1939.36,
-            "lowest_after_ath": 1770.0,
-            "price": 1816.21,
-            "correction_ratio": 0.087,
-            "price_to_ath": 0.936,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0444,
-            "ma_50_spread": 0.1495,
-            "ma_20_50_spread": 0.1006,
-            "eps_q0": 39.0,
-            "eps_q1": 35.1,
-            "eps_q2": 31.2,
-            "eps_q3": 27.3,
-            "per": 52.84,
-            "roe": 100.73
-        },
-        {
-            "ticker": "XEL",
-            "name": "Xcel Energy",
-            "industry": "Utilities",
-            "ath": 84.23,
-            "lowest_after_ath": 76.18,
-            "price": 78.82,
-            "correction_ratio": 0.096,
-            "price_to_ath": 0.936,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0165,
-            "ma_50_spread": -0.0225,
-            "ma_20_50_spread": -0.0061,
-            "eps_q0": 22.2,
-            "eps_q1": 19.98,
-            "eps_q2": 17.76,
-            "eps_q3": 15.54,
-            "per": 23.05,
-            "roe": 9.36
-        },
-        {
-            "ticker": "DLR",
-            "name": "Digital Realty",
-            "industry": "Real Estate",
-            "ath": 208.14,
-            "lowest_after_ath": 191.56,
-            "price": 194.56,
-            "correction_ratio": 0.08,
-            "price_to_ath": 0.935,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0063,
-            "ma_50_spread": 0.0567,
-            "ma_20_50_spread": 0.05,
-            "eps_q0": 63.0,
-            "eps_q1": 56.7,
-            "eps_q2": 50.4,
-            "eps_q3": 44.1,
-            "per": 51.61,
-            "roe": 5.69
-        },
-        {
-            "ticker": "TXN",
-            "name": "Texas Instruments",
-            "industry": "Information Technology",
-            "ath": 287.83,
-            "lowest_after_ath": 230.02,
-            "price": 269.22,
-            "correction_ratio": 0.201,
-            "price_to_ath": 0.935,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1705,
-            "ma_50_spread": 0.2685,
-            "ma_20_50_spread": 0.0837,
-            "eps_q0": 31.0,
-            "eps_q1": 27.9,
-            "eps_q2": 24.8,
-            "eps_q3": 21.7,
-            "per": 45.94,
-            "roe": 32.35
-        },
-        {
-            "ticker": "WDC",
-            "name": "Western Digital",
-            "industry": "Information Technology",
-            "ath": 441.99,
-            "lowest_after_ath": 410.05,
-            "price": 412.76,
-            "correction_ratio": 0.072,
-            "price_to_ath": 0.934,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.1461,
-            "ma_50_spread": 0.3256,
-            "ma_20_50_spread": 0.1567,
-            "eps_q0": 210.1,
-            "eps_q1": 189.09,
-            "eps_q2": 168.08,
-            "eps_q3": 147.07,
-            "per": 38.94,
-            "roe": 41.13
-        },
-        {
-            "ticker": "GWW",
-            "name": "W. W. Grainger",
-            "industry": "Industrials",
-            "ath": 1227.66,
-            "lowest_after_ath": 893.99,
-            "price": 1144.81,
-            "correction_ratio": 0.272,
-            "price_to_ath": 0.933,
-            "days_since_ath": 534,
-            "ma_20_spread": -0.0029,
-            "ma_50_spread": 0.0243,
-            "ma_20_50_spread": 0.0272,
-            "eps_q0": -5.1,
-            "eps_q1": -4.59,
-            "eps_q2": -4.08,
-            "eps_q3": -3.57,
-            "per": 32.36,
-            "roe": 46.1
-        },
-        {
-            "ticker": "URI",
-            "name": "United Rentals",
-            "industry": "Industrials",
-            "ath": 1021.47,
-            "lowest_after_ath": 701.59,
-            "price": 952.13,
-            "correction_ratio": 0.313,
-            "price_to_ath": 0.932,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.1626,
-            "ma_50_spread": 0.1847,
-            "ma_20_50_spread": 0.019,
-            "eps_q0": 2.5,
-            "eps_q1": 2.25,
-            "eps_q2": 2.0,
-            "eps_q3": 1.75,
-            "per": 24.36,
-            "roe": 28.24
-        },
-        {
-            "ticker": "MAR",
-            "name": "Marriott International",
-            "industry": "Consumer Discretionary",
-            "ath": 380.0,
-            "lowest_after_ath": 349.05,
-            "price": 353.95,
-            "correction_ratio": 0.081,
-            "price_to_ath": 0.931,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0099,
-            "ma_50_spread": 0.036,
-            "ma_20_50_spread": 0.0463,
-            "eps_q0": -2.2,
-            "eps_q1": -1.98,
-            "eps_q2": -1.76,
-            "eps_q3": -1.54,
-            "per": 37.26,
-            "roe": 0
-        },
-        {
-            "ticker": "CMS",
-            "name": "CMS Energy",
-            "industry": "Utilities",
-            "ath": 80.36,
-            "lowest_after_ath": 74.5,
-            "price": 74.73,
-            "correction_ratio": 0.073,
-            "price_to_ath": 0.93,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0353,
-            "ma_50_spread": -0.03,
-            "ma_20_50_spread": 0.0055,
-            "eps_q0": 11.8,
-            "eps_q1": 10.62,
-            "eps_q2": 9.44,
-            "eps_q3": 8.26,
-            "per": 20.7,
-            "roe": 10.37
-        },
-        {
-            "ticker": "IBKR",
-            "name": "Interactive Brokers",
-            "industry": "Financials",
-            "ath": 82.88,
-            "lowest_after_ath": 70.51,
-            "price": 77.05,
-            "correction_ratio": 0.149,
-            "price_to_ath": 0.93,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.0247,
-            "ma_50_spread": 0.0777,
-            "ma_20_50_spread": 0.0517,
-            "eps_q0": 25.4,
-            "eps_q1": 22.86,
-            "eps_q2": 20.32,
-            "eps_q3": 17.78,
-            "per": 33.21,
-            "roe": 23.56
-        },
-        {
-            "ticker": "DELL",
-            "name": "Dell Technologies",
-            "industry": "Information Technology",
-            "ath": 221.5,
-            "lowest_after_ath": 201.56,
-            "price": 205.66,
-            "correction_ratio": 0.09,
-            "price_to_ath": 0.928,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0635,
-            "ma_50_spread": 0.2373,
-            "ma_20_50_spread": 0.1634,
-            "eps_q0": 47.4,
-            "eps_q1": 42.66,
-            "eps_q2": 37.92,
-            "eps_q3": 33.18,
-            "per": 23.67,
-            "roe": 0
-        },
-        {
-            "ticker": "WM",
-            "name": "Waste Management",
-            "industry": "Industrials",
-            "ath": 248.13,
-            "lowest_after_ath": 219.1,
-            "price": 230.31,
-            "correction_ratio": 0.117,
-            "price_to_ath": 0.928,
-            "days_since_ath": 58,
-            "ma_20_spread": 0.0065,
-            "ma_50_spread": -0.0086,
-            "ma_20_50_spread": -0.0151,
-            "eps_q0": 24.1,
-            "eps_q1": 21.69,
-            "eps_q2": 19.28,
-            "eps_q3": 16.87,
-            "per": 33.33,
-            "roe": 29.7
-        },
-        {
-            "ticker": "CTVA",
-            "name": "Corteva",
-            "industry": "Materials",
-            "ath": 85.63,
-            "lowest_after_ath": 78.36,
-            "price": 79.37,
-            "correction_ratio": 0.085,
-            "price_to_ath": 0.927,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0301,
-            "ma_50_spread": -0.0095,
-            "ma_20_50_spread": 0.0213,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 45.35,
-            "roe": 4.97
-        },
-        {
-            "ticker": "SO",
-            "name": "Southern Company",
-            "industry": "Utilities",
-            "ath": 100.84,
-            "lowest_after_ath": 83.8,
-            "price": 93.51,
-            "correction_ratio": 0.169,
-            "price_to_ath": 0.927,
-            "days_since_ath": 198,
-            "ma_20_spread": -0.0169,
-            "ma_50_spread": -0.023,
-            "ma_20_50_spread": -0.0062,
-            "eps_q0": -22.1,
-            "eps_q1": -19.89,
-            "eps_q2": -17.68,
-            "eps_q3": -15.47,
-            "per": 23.85,
-            "roe": 11.04
-        },
-        {
-            "ticker": "VRT",
-            "name": "Vertiv",
-            "industry": "Industrials",
-            "ath": 330.3,
-            "lowest_after_ath": 293.88,
-            "price": 306.18,
-            "correction_ratio": 0.11,
-            "price_to_ath": 0.927,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0328,
-            "ma_50_spread": 0.124,
-            "ma_20_50_spread": 0.0883,
-            "eps_q0": 137.1,
-            "eps_q1": 123.39,
-            "eps_q2": 109.68,
-            "eps_q3": 95.97,
-            "per": 77.12,
-            "roe": 45.1
-        },
-        {
-            "ticker": "COP",
-            "name": "ConocoPhillips",
-            "industry": "Energy",
-            "ath": 138.49,
-            "lowest_after_ath": 79.88,
-            "price": 128.25,
-            "correction_ratio": 0.423,
-            "price_to_ath": 0.926,
-            "days_since_ath": 1276,
-            "ma_20_spread": 0.0375,
-            "ma_50_spread": 0.0557,
-            "ma_20_50_spread": 0.0175,
-            "eps_q0": -37.5,
-            "eps_q1": -33.75,
-            "eps_q2": -30.0,
-            "eps_q3": -26.25,
-            "per": 20.2,
-            "roe": 12.36
-        },
-        {
-            "ticker": "COST",
-            "name": "Costco",
-            "industry": "Consumer Staples",
-            "ath": 1078.23,
-            "lowest_after_ath": 844.06,
-            "price": 998.67,
-            "correction_ratio": 0.217,
-            "price_to_ath": 0.926,
-            "days_since_ath": 443,
-            "ma_20_spread": -0.0041,
-            "ma_50_spread": 0.0027,
-            "ma_20_50_spread": 0.0068,
-            "eps_q0": 45.6,
-            "eps_q1": 41.04,
-            "eps_q2": 36.48,
-            "eps_q3": 31.92,
-            "per": 52.07,
-            "roe": 29.65
-        },
-        {
-            "ticker": "GRMN",
-            "name": "Garmin",
-            "industry": "Consumer Discretionary",
-            "ath": 273.32,
-            "lowest_after_ath": 240.89,
-            "price": 253.08,
-            "correction_ratio": 0.119,
-            "price_to_ath": 0.926,
-            "days_since_ath": 16,
-            "ma_20_spread": -0.0128,
-            "ma_50_spread": 0.0239,
-            "ma_20_50_spread": 0.0372,
-            "eps_q0": 21.3,
-            "eps_q1": 19.17,
-            "eps_q2": 17.04,
-            "eps_q3": 14.91,
-            "per": 29.43,
-            "roe": 19.78
-        },
-        {
-            "ticker": "STX",
-            "name": "Seagate Technology",
-            "industry": "Information Technology",
-            "ath": 697.0,
-            "lowest_after_ath": 632.0,
-            "price": 643.3,
-            "correction_ratio": 0.093,
-            "price_to_ath": 0.923,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.2147,
-            "ma_50_spread": 0.4333,
-            "ma_20_50_spread": 0.18,
-            "eps_q0": 76.5,
-            "eps_q1": 68.85,
-            "eps_q2": 61.2,
-            "eps_q3": 53.55,
-            "per": 61.03,
-            "roe": 0
-        },
-        {
-            "ticker": "GS",
-            "name": "Goldman Sachs",
-            "industry": "Financials",
-            "ath": 984.7,
-            "lowest_after_ath": 780.5,
-            "price": 905.6,
-            "correction_ratio": 0.207,
-            "price_to_ath": 0.92,
-            "days_since_ath": 107,
-            "ma_20_spread": -0.0009,
-            "ma_50_spread": 0.0402,
-            "ma_20_50_spread": 0.0411,
-            "eps_q0": 18.8,
-            "eps_q1": 16.92,
-            "eps_q2": 15.04,
-            "eps_q3": 13.16,
-            "per": 16.54,
-            "roe": 14.59
-        },
-        {
-            "ticker": "BAC",
-            "name": "Bank of America",
-            "industry": "Financials",
-            "ath": 57.55,
-            "lowest_after_ath": 46.12,
-            "price": 52.88,
-            "correction_ratio": 0.199,
-            "price_to_ath": 0.919,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0094,
-            "ma_50_spread": 0.049,
-            "ma_20_50_spread": 0.0392,
-            "eps_q0": 16.1,
-            "eps_q1": 14.49,
-            "eps_q2": 12.88,
-            "eps_q3": 11.27,
-            "per": 13.15,
-            "roe": 10.64
-        },
-        {
-            "ticker": "MPWR",
-            "name": "Monolithic Power Systems",
-            "industry": "Information Technology",
-            "ath": 1661.79,
-            "lowest_after_ath": 1453.67,
-            "price": 1526.84,
-            "correction_ratio": 0.125,
-            "price_to_ath": 0.919,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0924,
-            "ma_50_spread": 0.2503,
-            "ma_20_50_spread": 0.1446,
-            "eps_q0": -86.0,
-            "eps_q1": -77.4,
-            "eps_q2": -68.8,
-            "eps_q3": -60.2,
-            "per": 117.99,
-            "roe": 19.17
-        },
-        {
-            "ticker": "NDSN",
-            "name": "Nordson Corporation",
-            "industry": "Industrials",
-            "ath": 305.28,
-            "lowest_after_ath": 253.85,
-            "price": 280.34,
-            "correction_ratio": 0.168,
-            "price_to_ath": 0.918,
-            "days_since_ath": 72,
-            "ma_20_spread": 0.0134,
-            "ma_50_spread": 0.0124,
-            "ma_20_50_spread": -0.0009,
-            "eps_q0": 40.9,
-            "eps_q1": 36.81,
-            "eps_q2": 32.72,
-            "eps_q3": 28.63,
-            "per": 30.34,
-            "roe": 17.47
-        },
-        {
-            "ticker": "CHRW",
-            "name": "C.H. Robinson",
-            "industry": "Industrials",
-            "ath": 203.34,
-            "lowest_after_ath": 149.36,
-            "price": 186.43,
-            "correction_ratio": 0.265,
-            "price_to_ath": 0.917,
-            "days_since_ath": 86,
-            "ma_20_spread": 0.0585,
-            "ma_50_spread": 0.0577,
-            "ma_20_50_spread": -0.0007,
-            "eps_q0": -8.7,
-            "eps_q1": -7.83,
-            "eps_q2": -6.96,
-            "eps_q3": -6.09,
-            "per": 38.6,
-            "roe": 32.91
-        },
-        {
-            "ticker": "JPM",
-            "name": "JPMorgan Chase",
-            "industry": "Financials",
-            "ath": 337.25,
-            "lowest_after_ath": 279.1,
-            "price": 309.25,
-            "correction_ratio": 0.172,
-            "price_to_ath": 0.917,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0045,
-            "ma_50_spread": 0.033,
-            "ma_20_50_spread": 0.0284,
-            "eps_q0": 12.6,
-            "eps_q1": 11.34,
-            "eps_q2": 10.08,
-            "eps_q3": 8.82,
-            "per": 14.8,
-            "roe": 16.47
-        },
-        {
-            "ticker": "SRE",
-            "name": "Sempra",
-            "industry": "Utilities",
-            "ath": 101.04,
-            "lowest_after_ath": 92.18,
-            "price": 92.64,
-            "correction_ratio": 0.088,
-            "price_to_ath": 0.917,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0311,
-            "ma_50_spread": -0.0243,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": -47.9,
-            "eps_q1": -43.11,
-            "eps_q2": -38.32,
-            "eps_q3": -33.53,
-            "per": 33.69,
-            "roe": 5.19
-        },
-        {
-            "ticker": "EOG",
-            "name": "EOG Resources",
-            "industry": "Energy",
-            "ath": 151.87,
-            "lowest_after_ath": 124.31,
-            "price": 139.12,
-            "correction_ratio": 0.181,
-            "price_to_ath": 0.916,
-            "days_since_ath": 30,
-            "ma_20_spread": 0.024,
-            "ma_50_spread": 0.037,
-            "ma_20_50_spread": 0.0127,
-            "eps_q0": -44.0,
-            "eps_q1": -39.6,
-            "eps_q2": -35.2,
-            "eps_q3": -30.8,
-            "per": 15.25,
-            "roe": 16.83
-        },
-        {
-            "ticker": "GD",
-            "name": "General Dynamics",
-            "industry": "Industrials",
-            "ath": 369.7,
-            "lowest_after_ath": 306.77,
-            "price": 338.73,
-            "correction_ratio": 0.17,
-            "price_to_ath": 0.916,
-            "days_since_ath": 107,
-            "ma_20_spread": 0.012,
-            "ma_50_spread": -0.0205,
-            "ma_20_50_spread": -0.032,
-            "eps_q0": -0.4,
-            "eps_q1": -0.36,
-            "eps_q2": -0.32,
-            "eps_q3": -0.28,
-            "per": 21.91,
-            "roe": 17.66
-        },
-        {
-            "ticker": "PH",
-            "name": "Parker Hannifin",
-            "industry": "Industrials",
-            "ath": 1034.96,
-            "lowest_after_ath": 858.72,
-            "price": 947.5,
-            "correction_ratio": 0.17,
-            "price_to_ath": 0.915,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0144,
-            "ma_50_spread": -0.005,
-            "ma_20_50_spread": 0.0096,
-            "eps_q0": -11.0,
-            "eps_q1": -9.9,
-            "eps_q2": -8.8,
-            "eps_q3": -7.7,
-            "per": 34.56,
-            "roe": 25.78
-        },
-        {
-            "ticker": "RL",
-            "name": "Ralph Lauren Corporation",
-            "industry": "Consumer Discretionary",
-            "ath": 393.41,
-            "lowest_after_ath": 359.0,
-            "price": 359.45,
-            "correction_ratio": 0.087,
-            "price_to_ath": 0.914,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0306,
-            "ma_50_spread": 0.002,
-            "ma_20_50_spread": 0.0337,
-            "eps_q0": 21.6,
-            "eps_q1": 19.44,
-            "eps_q2": 17.28,
-            "eps_q3": 15.12,
-            "per": 24.44,
-            "roe": 33.85
-        },
-        {
-            "ticker": "HLT",
-            "name": "Hilton Worldwide",
-            "industry": "Consumer Discretionary",
-            "ath": 344.75,
-            "lowest_after_ath": 311.33,
-            "price": 314.5,
-            "correction_ratio": 0.097,
-            "price_to_ath": 0.912,
-            "days_since_ath": 16,
-            "ma_20_spread": -0.0325,
-            "ma_50_spread": 0.0079,
-            "ma_20_50_spread": 0.0418,
-            "eps_q0": 28.3,
-            "eps_q1": 25.47,
-            "eps_q2": 22.64,
-            "eps_q3": 19.81,
-            "per": 47.94,
-            "roe": 0
-        },
-        {
-            "ticker": "ROK",
-            "name": "Rockwell Automation",
-            "industry": "Industrials",
-            "ath": 438.72,
-            "lowest_after_ath": 347.53,
-            "price": 400.2,
-            "correction_ratio": 0.208,
-            "price_to_ath": 0.912,
-            "days_since_ath": 86,
-            "ma_20_spread": 0.0094,
-            "ma_50_spread": 0.0422,
-            "ma_20_50_spread": 0.0325,
-            "eps_q0": 65.8,
-            "eps_q1": 59.22,
-            "eps_q2": 52.64,
-            "eps_q3": 46.06,
-            "per": 45.74,
-            "roe": 23.74
-        },
-        {
-            "ticker": "AMAT",
-            "name": "Applied Materials",
-            "industry": "Information Technology",
-            "ath": 420.5,
-            "lowest_after_ath": 377.07,
-            "price": 382.59,
-            "correction_ratio": 0.103,
-            "price_to_ath": 0.91,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0119,
-            "ma_50_spread": 0.0381,
-            "ma_20_50_spread": 0.0505,
-            "eps_q0": 71.0,
-            "eps_q1": 63.9,
-            "eps_q2": 56.8,
-            "eps_q3": 49.7,
-            "per": 39.2,
-            "roe": 38.86
-        },
-        {
-            "ticker": "PSX",
-            "name": "Phillips 66",
-            "industry": "Energy",
-            "ath": 190.61,
-            "lowest_after_ath": 153.58,
-            "price": 173.49,
-            "correction_ratio": 0.194,
-            "price_to_ath": 0.91,
-            "days_since_ath": 30,
-            "ma_20_spread": 0.0536,
-            "ma_50_spread": 0.0397,
-            "ma_20_50_spread": -0.0131,
-            "eps_q0": 36225.0,
-            "eps_q1": 32602.5,
-            "eps_q2": 28980.0,
-            "eps_q3": 25357.5,
-            "per": 16.09,
-            "roe": 15.43
-        },
-        {
-            "ticker": "VTR",
-            "name": "Ventas",
-            "industry": "Real Estate",
-            "ath": 96.05,
-            "lowest_after_ath": 13.35,
-            "price": 87.37,
-            "correction_ratio": 0.861,
-            "price_to_ath": 0.91,
-            "days_since_ath": 4727,
-            "ma_20_spread": 0.0376,
-            "ma_50_spread": 0.0304,
-            "ma_20_50_spread": -0.007,
-            "eps_q0": 19.3,
-            "eps_q1": 17.37,
-            "eps_q2": 15.44,
-            "eps_q3": 13.51,
-            "per": 158.85,
-            "roe": 2.14
-        },
-        {
-            "ticker": "TDY",
-            "name": "Teledyne Technologies",
-            "industry": "Information Technology",
-            "ath": 693.38,
-            "lowest_after_ath": 579.04,
-            "price": 630.56,
-            "correction_ratio": 0.165,
-            "price_to_ath": 0.909,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0188,
-            "ma_50_spread": -0.0238,
-            "ma_20_50_spread": -0.0051,
-            "eps_q0": 20.3,
-            "eps_q1": 18.27,
-            "eps_q2": 16.24,
-            "eps_q3": 14.21,
-            "per": 31.89,
-            "roe": 9.05
-        },
-        {
-            "ticker": "JNJ",
-            "name": "Johnson & Johnson",
-            "industry": "Health Care",
-            "ath": 251.71,
-            "lowest_after_ath": 223.78,
-            "price": 227.35,
-            "correction_ratio": 0.111,
-            "price_to_ath": 0.903,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0314,
-            "ma_50_spread": -0.0496,
-            "ma_20_50_spread": -0.0187,
-            "eps_q0": -52.4,
-            "eps_q1": -47.16,
-            "eps_q2": -41.92,
-            "eps_q3": -36.68,
-            "per": 26.34,
-            "roe": 26.42
-        },
-        {
-            "ticker": "LRCX",
-            "name": "Lam Research",
-            "industry": "Information Technology",
-            "ath": 275.84,
-            "lowest_after_ath": 241.6,
-            "price": 248.75,
-            "correction_ratio": 0.124,
-            "price_to_ath": 0.902,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0169,
-            "ma_50_spread": 0.0523,
-            "ma_20_50_spread": 0.0704,
-            "eps_q0": 37.2,
-            "eps_q1": 33.48,
-            "eps_q2": 29.76,
-            "eps_q3": 26.04,
-            "per": 46.93,
-            "roe": 66.76
-        },
-        {
-            "ticker": "MTB",
-            "name": "M&T Bank",
-            "industry": "Financials",
-            "ath": 239.0,
-            "lowest_after_ath": 193.95,
-            "price": 215.54,
-            "correction_ratio": 0.188,
-            "price_to_ath": 0.902,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0071,
-            "ma_50_spread": 0.012,
-            "ma_20_50_spread": 0.0193,
-            "eps_q0": 13.7,
-            "eps_q1": 12.33,
-            "eps_q2": 10.96,
-            "eps_q3": 9.59,
-            "per": 12.1,
-            "roe": 10.29
-        },
-        {
-            "ticker": "CIEN",
-            "name": "Ciena",
-            "industry": "Information Technology",
-            "ath": 527.86,
-            "lowest_after_ath": 461.07,
-            "price": 475.39,
-            "correction_ratio": 0.127,
-            "price_to_ath": 0.901,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0146,
-            "ma_50_spread": 0.1668,
-            "ma_20_50_spread": 0.1841,
-            "eps_q0": 237.2,
-            "eps_q1": 213.48,
-            "eps_q2": 189.76,
-            "eps_q3": 166.04,
-            "per": 304.74,
-            "roe": 8.2
-        },
-        {
-            "ticker": "GEV",
-            "name": "GE Vernova",
-            "industry": "Industrials",
-            "ath": 1181.95,
-            "lowest_after_ath": 984.09,
-            "price": 1063.11,
-            "correction_ratio": 0.167,
-            "price_to_ath": 0.899,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0566,
-            "ma_50_spread": 0.1643,
-            "ma_20_50_spread": 0.1019,
-            "eps_q0": 1768.1,
-            "eps_q1": 1591.29,
-            "eps_q2": 1414.48,
-            "eps_q3": 1237.67,
-            "per": 31.09,
-            "roe": 75.71
-        },
-        {
-            "ticker": "FITB",
-            "name": "Fifth Third Bancorp",
-            "industry": "Financials",
-            "ath": 55.44,
-            "lowest_after_ath": 42.94,
-            "price": 49.79,
-            "correction_ratio": 0.225,
-            "price_to_ath": 0.898,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0048,
-            "ma_50_spread": 0.0312,
-            "ma_20_50_spread": 0.0264,
-            "eps_q0": -68.0,
-            "eps_q1": -61.2,
-            "eps_q2": -54.4,
-            "eps_q3": -47.6,
-            "per": 16.76,
-            "roe": 7.97
-        },
-        {
-            "ticker": "MCHP",
-            "name": "Microchip Technology",
-            "industry": "Information Technology",
-            "ath": 100.57,
-            "lowest_after_ath": 34.13,
-            "price": 90.17,
-            "correction_ratio": 0.661,
-            "price_to_ath": 0.897,
-            "days_since_ath": 709,
-            "ma_20_spread": 0.1691,
-            "ma_50_spread": 0.2564,
-            "ma_20_50_spread": 0.0746,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 33.87,
-            "roe": -1.09
-        },
-        {
-            "ticker": "NDAQ",
-            "name": "Nasdaq, Inc.",
-            "industry": "Financials",
-            "ath": 101.79,
-            "lowest_after_ath": 77.09,
-            "price": 91.27,
-            "correction_ratio": 0.243,
-            "price_to_ath": 0.897,
-            "days_since_ath": 107,
-            "ma_20_spread": 0.0418,
-            "ma_50_spread": 0.059,
-            "ma_20_50_spread": 0.0165,
-            "eps_q0": 31.4,
-            "eps_q1": 28.26,
-            "eps_q2": 25.12,
-            "eps_q3": 21.98,
-            "per": 27.49,
-            "roe": 16.2
-        },
-        {
-            "ticker": "PNC",
-            "name": "PNC Financial Services",
-            "industry": "Financials",
-            "ath": 243.94,
-            "lowest_after_ath": 197.56,
-            "price": 218.71,
-            "correction_ratio": 0.19,
-            "price_to_ath": 0.897,
-            "days_since_ath": 86,
-            "ma_20_spread": -0.0082,
-            "ma_50_spread": 0.0195,
-            "ma_20_50_spread": 0.0279,
-            "eps_q0": 18.8,
-            "eps_q1": 16.92,
-            "eps_q2": 15.04,
-            "eps_q3": 13.16,
-            "per": 12.71,
-            "roe": 12.1
-        },
-        {
-            "ticker": "PCAR",
-            "name": "Paccar",
-            "industry": "Industrials",
-            "ath": 131.88,
-            "lowest_after_ath": 110.36,
-            "price": 118.14,
-            "correction_ratio": 0.163,
-            "price_to_ath": 0.896,
-            "days_since_ath": 86,
-            "ma_20_spread": -0.0459,
-            "ma_50_spread": -0.025,
-            "ma_20_50_spread": 0.0219,
-            "eps_q0": 19.8,
-            "eps_q1": 17.82,
-            "eps_q2": 15.84,
-            "eps_q3": 13.86,
-            "per": 25.14,
-            "roe": 13.11
-        },
-        {
-            "ticker": "CVX",
-            "name": "Chevron Corporation",
-            "industry": "Energy",
-            "ath": 214.71,
-            "lowest_after_ath": 177.74,
-            "price": 192.22,
-            "correction_ratio": 0.172,
-            "price_to_ath": 0.895,
-            "days_since_ath": 30,
-            "ma_20_spread": 0.0122,
-            "ma_50_spread": -0.0022,
-            "ma_20_50_spread": -0.0142,
-            "eps_q0": -14.5,
-            "eps_q1": -13.05,
-            "eps_q2": -11.6,
-            "eps_q3": -10.15,
-            "per": 28.99,
-            "roe": 7.23
-        },
-        {
-            "ticker": "ODFL",
-            "name": "Old Dominion",
-            "industry": "Industrials",
-            "ath": 233.79,
-            "lowest_after_ath": 206.97,
-            "price": 209.35,
-            "correction_ratio": 0.115,
-            "price_to_ath": 0.895,
-            "days_since_ath": 0,
-            "ma_20_spread": -0.0127,
-            "ma_50_spread": 0.0438,
-            "ma_20_50_spread": 0.0572,
-            "eps_q0": -12.8,
-            "eps_q1": -11.52,
-            "eps_q2": -10.24,
-            "eps_q3": -8.96,
-            "per": 43.34,
-            "roe": 23.93
-        },
-        {
-            "ticker": "LITE",
-            "name": "Lumentum",
-            "industry": "Information Technology",
-            "ath": 960.0,
-            "lowest_after_ath": 767.01,
-            "price": 858.32,
-            "correction_ratio": 0.201,
-            "price_to_ath": 0.894,
-            "days_since_ath": 23,
-            "ma_20_spread": 0.0072,
-            "ma_50_spread": 0.1442,
-            "ma_20_50_spread": 0.136,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 246.64,
-            "roe": 29.28
-        },
-        {
-            "ticker": "VMC",
-            "name": "Vulcan Materials Company",
-            "industry": "Materials",
-            "ath": 331.09,
-            "lowest_after_ath": 252.35,
-            "price": 296.08,
-            "correction_ratio": 0.238,
-            "price_to_ath": 0.894,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0205,
-            "ma_50_spread": 0.0395,
-            "ma_20_50_spread": 0.0186,
-            "eps_q0": -14.2,
-            "eps_q1": -12.78,
-            "eps_q2": -11.36,
-            "eps_q3": -9.94,
-            "per": 36.28,
-            "roe": 12.97
-        },
-        {
-            "ticker": "CF",
-            "name": "CF Industries",
-            "industry": "Materials",
-            "ath": 141.96,
-            "lowest_after_ath": 109.71,
-            "price": 126.78,
-            "correction_ratio": 0.227,
-            "price_to_ath": 0.893,
-            "days_since_ath": 30,
-            "ma_20_spread": 0.0277,
-            "ma_50_spread": 0.0694,
-            "ma_20_50_spread": 0.0407,
-            "eps_q0": 23.2,
-            "eps_q1": 20.88,
-            "eps_q2": 18.56,
-            "eps_q3": 16.24,
-            "per": 14.13,
-            "roe": 23.4
-        },
-        {
-            "ticker": "V",
-            "name": "Visa Inc.",
-            "industry": "Financials",
-            "ath": 375.51,
-            "lowest_after_ath": 293.89,
-            "price": 334.86,
-            "correction_ratio": 0.217,
-            "price_to_ath": 0.892,
-            "days_since_ath": 324,
-            "ma_20_spread": 0.0797,
-            "ma_50_spread": 0.0793,
-            "ma_20_50_spread": -0.0004,
-            "eps_q0": 14.3,
-            "eps_q1": 12.87,
-            "eps_q2": 11.44,
-            "eps_q3": 10.01,
-            "per": 29.17,
-            "roe": 53.95
-        },
-        {
-            "ticker": "EXPD",
-            "name": "Expeditors International",
-            "industry": "Industrials",
-            "ath": 167.19,
-            "lowest_after_ath": 129.59,
-            "price": 148.79,
-            "correction_ratio": 0.225,
-            "price_to_ath": 0.89,
-            "days_since_ath": 86,
-            "ma_20_spread": 0.0149,
-            "ma_50_spread": 0.0228,
-            "ma_20_50_spread": 0.0078,
-            "eps_q0": -14.9,
-            "eps_q1": -13.41,
-            "eps_q2": -11.92,
-            "eps_q3": -10.43,
-            "per": 25.01,
-            "roe": 35.43
-        },
-        {
-            "ticker": "APH",
-            "name": "Amphenol",
-            "industry": "Information Technology",
-            "ath": 167.04,
-            "lowest_after_ath": 118.24,
-            "price": 148.38,
-            "correction_ratio": 0.292,
-            "price_to_ath": 0.888,
-            "days_since_ath": 93,
-            "ma_20_spread": 0.0381,
-            "ma_50_spread": 0.0705,
-            "ma_20_50_spread": 0.0313,
-            "eps_q0": 60.2,
-            "eps_q1": 54.18,
-            "eps_q2": 48.16,
-            "eps_q3": 42.14,
-            "per": 44.56,
-            "roe": 36.85
-        },
-        {
-            "ticker": "ON",
-            "name": "ON Semiconductor",
-            "industry": "Information Technology",
-            "ath": 111.35,
-            "lowest_after_ath": 31.04,
-            "price": 98.86,
-            "correction_ratio": 0.721,
-            "price_to_ath": 0.888,
-            "days_since_ath": 1003,
-            "ma_20_spread": 0.2487,
-            "ma_50_spread": 0.428,
-            "ma_20_50_spread": 0.1436,
-            "eps_q0": -52.1,
-            "eps_q1": -46.89,
-            "eps_q2": -41.68,
-            "eps_q3": -36.47,
-            "per": 340.9,
-            "roe": 1.5
-        },
-        {
-            "ticker": "APD",
-            "name": "Air Products",
-            "industry": "Materials",
-            "ath": 341.14,
-            "lowest_after_ath": 229.11,
-            "price": 302.5,
-            "correction_ratio": 0.328,
-            "price_to_ath": 0.887,
-            "days_since_ath": 450,
-            "ma_20_spread": 0.0179,
-            "ma_50_spread": 0.05,
-            "ma_20_50_spread": 0.0315,
-            "eps_q0": 9.8,
-            "eps_q1": 8.82,
-            "eps_q2": 7.84,
-            "eps_q3": 6.86,
-            "per": 21.41,
-            "roe": -1.67
-        },
-        {
-            "ticker": "MET",
-            "name": "MetLife",
-            "industry": "Financials",
-            "ath": 89.05,
-            "lowest_after_ath": 65.21,
-            "price": 78.96,
-            "correction_ratio": 0.268,
-            "price_to_ath": 0.887,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0445,
-            "ma_50_spread": 0.0774,
-            "ma_20_50_spread": 0.0315,
-            "eps_q0": -36.3,
-            "eps_q1": -32.67,
-            "eps_q2": -29.04,
-            "eps_q3": -25.41,
-            "per": 16.76,
-            "roe": 12.02
-        },
-        {
-            "ticker": "DGX",
-            "name": "Quest Diagnostics",
-            "industry": "Health Care",
-            "ath": 213.5,
-            "lowest_after_ath": 187.5,
-            "price": 189.32,
-            "correction_ratio": 0.122,
-            "price_to_ath": 0.887,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0357,
-            "ma_50_spread": -0.051,
-            "ma_20_50_spread": -0.0158,
-            "eps_q0": 14.5,
-            "eps_q1": 13.05,
-            "eps_q2": 11.6,
-            "eps_q3": 10.15,
-            "per": 20.92,
-            "roe": 14.54
-        },
-        {
-            "ticker": "HWM",
-            "name": "Howmet Aerospace",
-            "industry": "Industrials",
-            "ath": 267.31,
-            "lowest_after_ath": 220.51,
-            "price": 236.52,
-            "correction_ratio": 0.175,
-            "price_to_ath": 0.885,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0393,
-            "ma_50_spread": -0.0406,
-            "ma_20_50_spread": -0.0013,
-            "eps_q0": 18.5,
-            "eps_q1": 16.65,
-            "eps_q2": 14.8,
-            "eps_q3": 12.95,
-            "per": 63.92,
-            "roe": 30.44
-        },
-        {
-            "ticker": "TXT",
-            "name": "Textron",
-            "industry": "Industrials",
-            "ath": 101.57,
-            "lowest_after_ath": 85.61,
-            "price": 89.78,
-            "correction_ratio": 0.157,
-            "price_to_ath": 0.884,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0035,
-            "ma_50_spread": -0.0276,
-            "ma_20_50_spread": -0.0241,
-            "eps_q0": 66.7,
-            "eps_q1": 60.03,
-            "eps_q2": 53.36,
-            "eps_q3": 46.69,
-            "per": 17.54,
-            "roe": 12.24
-        },
-        {
-            "ticker": "USB",
-            "name": "U.S. Bancorp",
-            "industry": "Financials",
-            "ath": 63.57,
-            "lowest_after_ath": 27.27,
-            "price": 56.17,
-            "correction_ratio": 0.571,
-            "price_to_ath": 0.884,
-            "days_since_ath": 1570,
-            "ma_20_spread": 0.0097,
-            "ma_50_spread": 0.0355,
-            "ma_20_50_spread": 0.0255,
-            "eps_q0": 13.8,
-            "eps_q1": 12.42,
-            "eps_q2": 11.04,
-            "eps_q3": 9.66,
-            "per": 11.78,
-            "roe": 12.35
-        },
-        {
-            "ticker": "IEX",
-            "name": "IDEX Corporation",
-            "industry": "Industrials",
-            "ath": 246.36,
-            "lowest_after_ath": 153.36,
-            "price": 217.34,
-            "correction_ratio": 0.377,
-            "price_to_ath": 0.882,
-            "days_since_ath": 772,
-            "ma_20_spread": 0.077,
-            "ma_50_spread": 0.0911,
-            "ma_20_50_spread": 0.0131,
-            "eps_q0": 4.1,
-            "eps_q1": 3.69,
-            "eps_q2": 3.28,
-            "eps_q3": 2.87,
-            "per": 33.91,
-            "roe": 12.34
-        },
-        {
-            "ticker": "MNST",
-            "name": "Monster Beverage",
-            "industry": "Consumer Staples",
-            "ath": 87.38,
-            "lowest_after_ath": 70.86,
-            "price": 76.89,
-            "correction_ratio": 0.189,
-            "price_to_ath": 0.88,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0176,
-            "ma_50_spread": -0.0006,
-            "ma_20_50_spread": -0.0178,
-            "eps_q0": 65.9,
-            "eps_q1": 59.31,
-            "eps_q2": 52.72,
-            "eps_q3": 46.13,
-            "per": 39.63,
-            "roe": 26.82
-        },
-        {
-            "ticker": "MSCI",
-            "name": "MSCI Inc.",
-            "industry": "Financials",
-            "ath": 679.85,
-            "lowest_after_ath": 376.41,
-            "price": 598.13,
-            "correction_ratio": 0.446,
-            "price_to_ath": 0.88,
-            "days_since_ath": 1626,
-            "ma_20_spread": 0.0536,
-            "ma_50_spread": 0.0722,
-            "ma_20_50_spread": 0.0177,
-            "eps_q0": 40.7,
-            "eps_q1": 36.63,
-            "eps_q2": 32.56,
-            "eps_q3": 28.49,
-            "per": 34.2,
-            "roe": 0
-        },
-        {
-            "ticker": "IRM",
-            "name": "Iron Mountain",
-            "industry": "Real Estate",
-            "ath": 130.24,
-            "lowest_after_ath": 72.33,
-            "price": 114.52,
-            "correction_ratio": 0.445,
-            "price_to_ath": 0.879,
-            "days_since_ath": 555,
-            "ma_20_spread": 0.0219,
-            "ma_50_spread": 0.0561,
-            "ma_20_50_spread": 0.0335,
-            "eps_q0": -14.1,
-            "eps_q1": -12.69,
-            "eps_q2": -11.28,
-            "eps_q3": -9.87,
-            "per": 229.04,
-            "roe": 0
-        },
-        {
-            "ticker": "VRSN",
-            "name": "Verisign",
-            "industry": "Information Technology",
-            "ath": 310.6,
-            "lowest_after_ath": 208.86,
-            "price": 272.6,
-            "correction_ratio": 0.328,
-            "price_to_ath": 0.878,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0104,
-            "ma_50_spread": 0.095,
-            "ma_20_50_spread": 0.0837,
-            "eps_q0": 7.6,
-            "eps_q1": 6.84,
-            "eps_q2": 6.08,
-            "eps_q3": 5.32,
-            "per": 30.09,
-            "roe": 0
-        },
-        {
-            "ticker": "BRK-B",
-            "name": "Berkshire Hathaway",
-            "industry": "Financials",
-            "ath": 542.07,
-            "lowest_after_ath": 455.19,
-            "price": 475.38,
-            "correction_ratio": 0.16,
-            "price_to_ath": 0.877,
-            "days_since_ath": 366,
-            "ma_20_spread": -0.0001,
-            "ma_50_spread": -0.0167,
-            "ma_20_50_spread": -0.0166,
-            "eps_q0": -2.5,
-            "eps_q1": -2.25,
-            "eps_q2": -2.0,
-            "eps_q3": -1.75,
-            "per": 15.32,
-            "roe": 9.81
-        },
-        {
-            "ticker": "XOM",
-            "name": "ExxonMobil",
-            "industry": "Energy",
-            "ath": 176.41,
-            "lowest_after_ath": 141.97,
-            "price": 154.67,
-            "correction_ratio": 0.195,
-            "price_to_ath": 0.877,
-            "days_since_ath": 30,
-            "ma_20_spread": 0.0108,
-            "ma_50_spread": -0.0003,
-            "ma_20_50_spread": -0.011,
-            "eps_q0": -14.6,
-            "eps_q1": -13.14,
-            "eps_q2": -11.68,
-            "eps_q3": -10.22,
-            "per": 23.09,
-            "roe": 11.08
-        },
-        {
-            "ticker": "CDNS",
-            "name": "Cadence Design Systems",
-            "industry": "Information Technology",
-            "ath": 376.45,
-            "lowest_after_ath": 262.75,
-            "price": 329.95,
-            "correction_ratio": 0.302,
-            "price_to_ath": 0.876,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0869,
-            "ma_50_spread": 0.1135,
-            "ma_20_50_spread": 0.0245,
-            "eps_q0": 22.7,
-            "eps_q1": 20.43,
-            "eps_q2": 18.16,
-            "eps_q3": 15.89,
-            "per": 76.91,
-            "roe": 20.66
-        },
-        {
-            "ticker": "ITW",
-            "name": "Illinois Tool Works",
-            "industry": "Industrials",
-            "ath": 303.16,
-            "lowest_after_ath": 254.41,
-            "price": 265.67,
-            "correction_ratio": 0.161,
-            "price_to_ath": 0.876,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0079,
-            "ma_50_spread": -0.025,
-            "ma_20_50_spread": -0.0172,
-            "eps_q0": 5.3,
-            "eps_q1": 4.77,
-            "eps_q2": 4.24,
-            "eps_q3": 3.71,
-            "per": 25.3,
-            "roe": 93.72
-        },
-        {
-            "ticker": "KR",
-            "name": "Kroger",
-            "industry": "Consumer Staples",
-            "ath": 76.58,
-            "lowest_after_ath": 65.62,
-            "price": 67.1,
-            "correction_ratio": 0.143,
-            "price_to_ath": 0.876,
-            "days_since_ath": 51,
-            "ma_20_spread": -0.0252,
-            "ma_50_spread": -0.0456,
-            "ma_20_50_spread": -0.0209,
-            "eps_q0": 35.8,
-            "eps_q1": 32.22,
-            "eps_q2": 28.64,
-            "eps_q3": 25.06,
-            "per": 43.57,
-            "roe": 14.41
-        },
-        {
-            "ticker": "RJF",
-            "name": "Raymond James Financial",
-            "industry": "Financials",
-            "ath": 177.66,
-            "lowest_after_ath": 138.82,
-            "price": 155.58,
-            "correction_ratio": 0.219,
-            "price_to_ath": 0.876,
-            "days_since_ath": 219,
-            "ma_20_spread": 0.0346,
-            "ma_50_spread": 0.037,
-            "ma_20_50_spread": 0.0023,
-            "eps_q0": 9.9,
-            "eps_q1": 8.91,
-            "eps_q2": 7.92,
-            "eps_q3": 6.93,
-            "per": 14.69,
-            "roe": 0
-        },
-        {
-            "ticker": "LH",
-            "name": "Labcorp",
-            "industry": "Health Care",
-            "ath": 293.72,
-            "lowest_after_ath": 244.52,
-            "price": 257.14,
-            "correction_ratio": 0.168,
-            "price_to_ath": 0.875,
-            "days_since_ath": 191,
-            "ma_20_spread": -0.0405,
-            "ma_50_spread": -0.0519,
-            "ma_20_50_spread": -0.0119,
-            "eps_q0": 14.9,
-            "eps_q1": 13.41,
-            "eps_q2": 11.92,
-            "eps_q3": 10.43,
-            "per": 24.58,
-            "roe": 10.51
-        },
-        {
-            "ticker": "GM",
-            "name": "General Motors",
-            "industry": "Consumer Discretionary",
-            "ath": 87.62,
-            "lowest_after_ath": 71.6,
-            "price": 76.62,
-            "correction_ratio": 0.183,
-            "price_to_ath": 0.874,
-            "days_since_ath": 86,
-            "ma_20_spread": -0.0087,
-            "ma_50_spread": -0.003,
-            "ma_20_50_spread": 0.0057,
-            "eps_q0": -5.7,
-            "eps_q1": -5.13,
-            "eps_q2": -4.56,
-            "eps_q3": -3.99,
-            "per": 27.96,
-            "roe": 4.01
-        },
-        {
-            "ticker": "LYV",
-            "name": "Live Nation Entertainment",
-            "industry": "Communication Services",
-            "ath": 175.25,
-            "lowest_after_ath": 125.34,
-            "price": 153.13,
-            "correction_ratio": 0.285,
-            "price_to_ath": 0.874,
-            "days_since_ath": 233,
-            "ma_20_spread": -0.0302,
-            "ma_50_spread": -0.0264,
-            "ma_20_50_spread": 0.0039,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 68.78,
-            "roe": 36.7
-        },
-        {
-            "ticker": "TPR",
-            "name": "Tapestry, Inc.",
-            "industry": "Consumer Discretionary",
-            "ath": 161.97,
-            "lowest_after_ath": 136.44,
-            "price": 141.6,
-            "correction_ratio": 0.158,
-            "price_to_ath": 0.874,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.042,
-            "ma_50_spread": -0.0417,
-            "ma_20_50_spread": 0.0003,
-            "eps_q0": 80.8,
-            "eps_q1": 72.72,
-            "eps_q2": 64.64,
-            "eps_q3": 56.56,
-            "per": 55.1,
-            "roe": 55.34
-        },
-        {
-            "ticker": "CME",
-            "name": "CME Group",
-            "industry": "Financials",
-            "ath": 329.16,
-            "lowest_after_ath": 274.6,
-            "price": 287.27,
-            "correction_ratio": 0.166,
-            "price_to_ath": 0.873,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0226,
-            "ma_50_spread": -0.053,
-            "ma_20_50_spread": -0.0311,
-            "eps_q0": 20.7,
-            "eps_q1": 18.63,
-            "eps_q2": 16.56,
-            "eps_q3": 14.49,
-            "per": 24.51,
-            "roe": 15.92
-        },
-        {
-            "ticker": "MA",
-            "name": "Mastercard",
-            "industry": "Financials",
-            "ath": 601.77,
-            "lowest_after_ath": 480.5,
-            "price": 525.23,
-            "correction_ratio": 0.202,
-            "price_to_ath": 0.873,
-            "days_since_ath": 254,
-            "ma_20_spread": 0.0339,
-            "ma_50_spread": 0.0344,
-            "ma_20_50_spread": 0.0004,
-            "eps_q0": 21.5,
-            "eps_q1": 19.35,
-            "eps_q2": 17.2,
-            "eps_q3": 15.05,
-            "per": 31.83,
-            "roe": 209.91
-        },
-        {
-            "ticker": "SPG",
-            "name": "Simon Property Group",
-            "industry": "Real Estate",
-            "ath": 229.1,
-            "lowest_after_ath": 42.25,
-            "price": 200.09,
-            "correction_ratio": 0.816,
-            "price_to_ath": 0.873,
-            "days_since_ath": 3565,
-            "ma_20_spread": 0.0037,
-            "ma_50_spread": 0.0245,
-            "ma_20_50_spread": 0.0207,
-            "eps_q0": 356.4,
-            "eps_q1": 320.76,
-            "eps_q2": 285.12,
-            "eps_q3": 249.48,
-            "per": 14.12,
-            "roe": 104.11
-        },
-        {
-            "ticker": "SATS",
-            "name": "EchoStar",
-            "industry": "Communication Services",
-            "ath": 137.44,
-            "lowest_after_ath": 116.32,
-            "price": 119.78,
-            "correction_ratio": 0.154,
-            "price_to_ath": 0.872,
-            "days_since_ath": 15,
-            "ma_20_spread": -0.046,
-            "ma_50_spread": 0.0224,
-            "ma_20_50_spread": 0.0717,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -1050.7,
-            "roe": -111.35
-        },
-        {
-            "ticker": "CAH",
-            "name": "Cardinal Health",
-            "industry": "Health Care",
-            "ath": 233.6,
-            "lowest_after_ath": 197.06,
-            "price": 202.82,
-            "correction_ratio": 0.156,
-            "price_to_ath": 0.868,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0337,
-            "ma_50_spread": -0.0548,
-            "ma_20_50_spread": -0.0218,
-            "eps_q0": 16.8,
-            "eps_q1": 15.12,
-            "eps_q2": 13.44,
-            "eps_q3": 11.76,
-            "per": 29.18,
-            "roe": 0
-        },
-        {
-            "ticker": "DAL",
-            "name": "Delta Air Lines",
-            "industry": "Industrials",
-            "ath": 76.39,
-            "lowest_after_ath": 55.28,
-            "price": 66.27,
-            "correction_ratio": 0.276,
-            "price_to_ath": 0.868,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0334,
-            "ma_50_spread": 0.0015,
-            "ma_20_50_spread": 0.0361,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.67,
-            "roe": 24.99
-        },
-        {
-            "ticker": "EQT",
-            "name": "EQT Corporation",
-            "industry": "Energy",
-            "ath": 68.24,
-            "lowest_after_ath": 56.26,
-            "price": 59.11,
-            "correction_ratio": 0.176,
-            "price_to_ath": 0.866,
-            "days_since_ath": 37,
-            "ma_20_spread": 0.0053,
-            "ma_50_spread": -0.0343,
-            "ma_20_50_spread": -0.0394,
-            "eps_q0": 514.2,
-            "eps_q1": 462.78,
-            "eps_q2": 411.36,
-            "eps_q3": 359.94,
-            "per": 11.22,
-            "roe": 13.4
-        },
-        {
-            "ticker": "AMGN",
-            "name": "Amgen",
-            "industry": "Health Care",
-            "ath": 391.29,
-            "lowest_after_ath": 333.58,
-            "price": 338.02,
-            "correction_ratio": 0.147,
-            "price_to_ath": 0.864,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0267,
-            "ma_50_spread": -0.0592,
-            "ma_20_50_spread": -0.0334,
-            "eps_q0": 112.6,
-            "eps_q1": 101.34,
-            "eps_q2": 90.08,
-            "eps_q3": 78.82,
-            "per": 23.75,
-            "roe": 106.1
-        },
-        {
-            "ticker": "FAST",
-            "name": "Fastenal",
-            "industry": "Industrials",
-            "ath": 50.63,
-            "lowest_after_ath": 38.97,
-            "price": 43.71,
-            "correction_ratio": 0.23,
-            "price_to_ath": 0.863,
-            "days_since_ath": 247,
-            "ma_20_spread": -0.0457,
-            "ma_50_spread": -0.0439,
-            "ma_20_50_spread": 0.002,
-            "eps_q0": 13.8,
-            "eps_q1": 12.42,
-            "eps_q2": 11.04,
-            "eps_q3": 9.66,
-            "per": 38.68,
-            "roe": 33.84
-        },
-        {
-            "ticker": "CRH",
-            "name": "CRH plc",
-            "industry": "Materials",
-            "ath": 131.55,
-            "lowest_after_ath": 99.03,
-            "price": 113.44,
-            "correction_ratio": 0.247,
-            "price_to_ath": 0.862,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0068,
-            "ma_50_spread": 0.016,
-            "ma_20_50_spread": 0.0229,
-            "eps_q0": 45.8,
-            "eps_q1": 41.22,
-            "eps_q2": 36.64,
-            "eps_q3": 32.06,
-            "per": 20.63,
-            "roe": 15.68
-        },
-        {
-            "ticker": "MLM",
-            "name": "Martin Marietta Materials",
-            "industry": "Materials",
-            "ath": 710.97,
-            "lowest_after_ath": 554.72,
-            "price": 612.85,
-            "correction_ratio": 0.22,
-            "price_to_ath": 0.862,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.004,
-            "ma_50_spread": -0.0075,
-            "ma_20_50_spread": -0.0035,
-            "eps_q0": -5.1,
-            "eps_q1": -4.59,
-            "eps_q2": -4.08,
-            "eps_q3": -3.57,
-            "per": 37.53,
-            "roe": 10.16
-        },
-        {
-            "ticker": "PKG",
-            "name": "Packaging Corporation of America",
-            "industry": "Materials",
-            "ath": 250.82,
-            "lowest_after_ath": 172.72,
-            "price": 216.05,
-            "correction_ratio": 0.311,
-            "price_to_ath": 0.861,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0271,
-            "ma_50_spread": -0.0035,
-            "ma_20_50_spread": -0.0298,
-            "eps_q0": -16.1,
-            "eps_q1": -14.49,
-            "eps_q2": -12.88,
-            "eps_q3": -11.27,
-            "per": 26.22,
-            "roe": 0
-        },
-        {
-            "ticker": "DRI",
-            "name": "Darden Restaurants",
-            "industry": "Consumer Discretionary",
-            "ath": 228.27,
-            "lowest_after_ath": 169.0,
-            "price": 196.29,
-            "correction_ratio": 0.26,
-            "price_to_ath": 0.86,
-            "days_since_ath": 317,
-            "ma_20_spread": -0.004,
-            "ma_50_spread": -0.0282,
-            "ma_20_50_spread": -0.0243,
-            "eps_q0": -5.1,
-            "eps_q1": -4.59,
-            "eps_q2": -4.08,
-            "eps_q3": -3.57,
-            "per": 20.68,
-            "roe": 51.54
-        },
-        {
-            "ticker": "CTRA",
-            "name": "Coterra",
-            "industry": "Energy",
-            "ath": 41.78,
-            "lowest_after_ath": 13.06,
-            "price": 35.68,
-            "correction_ratio": 0.687,
-            "price_to_ath": 0.854,
-            "days_since_ath": 4468,
-            "ma_20_spread": 0.0732,
-            "ma_50_spread": 0.0897,
-            "ma_20_50_spread": 0.0153,
-            "eps_q0": 23.9,
-            "eps_q1": 21.51,
-            "eps_q2": 19.12,
-            "eps_q3": 16.73,
-            "per": 15.93,
-            "roe": 12.28
-        },
-        {
-            "ticker": "BLK",
-            "name": "BlackRock",
-            "industry": "Financials",
-            "ath": 1219.94,
-            "lowest_after_ath": 917.39,
-            "price": 1039.38,
-            "correction_ratio": 0.248,
-            "price_to_ath": 0.852,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.0167,
-            "ma_50_spread": 0.0283,
-            "ma_20_50_spread": 0.0115,
-            "eps_q0": 46.5,
-            "eps_q1": 41.85,
-            "eps_q2": 37.2,
-            "eps_q3": 32.55,
-            "per": 26.19,
-            "roe": 0
-        },
-        {
-            "ticker": "PM",
-            "name": "Philip Morris International",
-            "industry": "Consumer Staples",
-            "ath": 191.3,
-            "lowest_after_ath": 151.63,
-            "price": 162.71,
-            "correction_ratio": 0.207,
-            "price_to_ath": 0.851,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0147,
-            "ma_50_spread": -0.0343,
-            "ma_20_50_spread": -0.0483,
-            "eps_q0": -9.4,
-            "eps_q1": -8.46,
-            "eps_q2": -7.52,
-            "eps_q3": -6.58,
-            "per": 22.92,
-            "roe": 0
-        },
-        {
-            "ticker": "NWS",
-            "name": "News Corp (Class B)",
-            "industry": "Communication Services",
-            "ath": 35.58,
-            "lowest_after_ath": 25.49,
-            "price": 30.25,
-            "correction_ratio": 0.284,
-            "price_to_ath": 0.85,
-            "days_since_ath": 268,
-            "ma_20_spread": 0.0307,
-            "ma_50_spread": 0.0814,
-            "ma_20_50_spread": 0.0492,
-            "eps_q0": -10.2,
-            "eps_q1": -9.18,
-            "eps_q2": -8.16,
-            "eps_q3": -7.14,
-            "per": 39.29,
-            "roe": 6.33
-        },
-        {
-            "ticker": "MCD",
-            "name": "McDonald's",
-            "industry": "Consumer Discretionary",
-            "ath": 341.75,
-            "lowest_after_ath": 289.3,
-            "price": 290.08,
-            "correction_ratio": 0.153,
-            "price_to_ath": 0.849,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0437,
-            "ma_50_spread": -0.08,
-            "ma_20_50_spread": -0.0379,
-            "eps_q0": 7.3,
-            "eps_q1": 6.57,
-            "eps_q2": 5.84,
-            "eps_q3": 5.11,
-            "per": 24.25,
-            "roe": 0
-        },
-        {
-            "ticker": "REG",
-            "name": "Regency Centers",
-            "industry": "Real Estate",
-            "ath": 93.49,
-            "lowest_after_ath": 20.72,
-            "price": 79.38,
-            "correction_ratio": 0.778,
-            "price_to_ath": 0.849,
-            "days_since_ath": 7023,
-            "ma_20_spread": 0.0046,
-            "ma_50_spread": 0.0206,
-            "ma_20_50_spread": 0.016,
-            "eps_q0": 134.1,
-            "eps_q1": 120.69,
-            "eps_q2": 107.28,
-            "eps_q3": 93.87,
-            "per": 28.15,
-            "roe": 7.68
-        },
-        {
-            "ticker": "SCHW",
-            "name": "Charles Schwab Corporation",
-            "industry": "Financials",
-            "ath": 107.5,
-            "lowest_after_ath": 87.84,
-            "price": 91.16,
-            "correction_ratio": 0.183,
-            "price_to_ath": 0.848,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0243,
-            "ma_50_spread": -0.0296,
-            "ma_20_50_spread": -0.0055,
-            "eps_q0": 29.9,
-            "eps_q1": 26.91,
-            "eps_q2": 23.92,
-            "eps_q3": 20.93,
-            "per": 18.12,
-            "roe": 19.09
-        },
-        {
-            "ticker": "GLW",
-            "name": "Corning Inc.",
-            "industry": "Information Technology",
-            "ath": 179.08,
-            "lowest_after_ath": 148.17,
-            "price": 151.9,
-            "correction_ratio": 0.173,
-            "price_to_ath": 0.848,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.067,
-            "ma_50_spread": 0.0284,
-            "ma_20_50_spread": 0.1022,
-            "eps_q0": 136.3,
-            "eps_q1": 122.67,
-            "eps_q2": 109.04,
-            "eps_q3": 95.41,
-            "per": 73.03,
-            "roe": 16.74
-        },
-        {
-            "ticker": "LHX",
-            "name": "L3Harris",
-            "industry": "Industrials",
-            "ath": 379.23,
-            "lowest_after_ath": 314.75,
-            "price": 321.4,
-            "correction_ratio": 0.17,
-            "price_to_ath": 0.848,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.069,
-            "ma_50_spread": -0.0892,
-            "ma_20_50_spread": -0.0217,
-            "eps_q0": 74.7,
-            "eps_q1": 67.23,
-            "eps_q2": 59.76,
-            "eps_q3": 52.29,
-            "per": 37.63,
-            "roe": 0
-        },
-        {
-            "ticker": "WRB",
-            "name": "W. R. Berkley Corporation",
-            "industry": "Financials",
-            "ath": 78.96,
-            "lowest_after_ath": 63.68,
-            "price": 66.95,
-            "correction_ratio": 0.194,
-            "price_to_ath": 0.848,
-            "days_since_ath": 163,
-            "ma_20_spread": 0.0062,
-            "ma_50_spread": -0.0131,
-            "ma_20_50_spread": -0.0192,
-            "eps_q0": 23.4,
-            "eps_q1": 21.06,
-            "eps_q2": 18.72,
-            "eps_q3": 16.38,
-            "per": 14.18,
-            "roe": 0
-        },
-        {
-            "ticker": "DD",
-            "name": "DuPont",
-            "industry": "Materials",
-            "ath": 52.66,
-            "lowest_after_ath": 42.04,
-            "price": 44.62,
-            "correction_ratio": 0.202,
-            "price_to_ath": 0.847,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0387,
-            "ma_50_spread": -0.045,
-            "ma_20_50_spread": -0.0065,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 212.48,
-            "roe": 0.52
-        },
-        {
-            "ticker": "HON",
-            "name": "Honeywell",
-            "industry": "Industrials",
-            "ath": 248.18,
-            "lowest_after_ath": 207.83,
-            "price": 210.3,
-            "correction_ratio": 0.163,
-            "price_to_ath": 0.847,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0674,
-            "ma_50_spread": -0.0905,
-            "ma_20_50_spread": -0.0247,
-            "eps_q0": -43.3,
-            "eps_q1": -38.97,
-            "eps_q2": -34.64,
-            "eps_q3": -30.31,
-            "per": 33.59,
-            "roe": 24.26
-        },
-        {
-            "ticker": "DVA",
-            "name": "DaVita",
-            "industry": "Health Care",
-            "ath": 179.6,
-            "lowest_after_ath": 101.0,
-            "price": 151.99,
-            "correction_ratio": 0.438,
-            "price_to_ath": 0.846,
-            "days_since_ath": 457,
-            "ma_20_spread": 0.0142,
-            "ma_50_spread": 0.0063,
-            "ma_20_50_spread": -0.0078,
-            "eps_q0": -9.7,
-            "eps_q1": -8.73,
-            "eps_q2": -7.76,
-            "eps_q3": -6.79,
-            "per": 15.98,
-            "roe": 64.85
-        },
-        {
-            "ticker": "SYF",
-            "name": "Synchrony Financial",
-            "industry": "Financials",
-            "ath": 88.77,
-            "lowest_after_ath": 63.08,
-            "price": 75.12,
-            "correction_ratio": 0.289,
-            "price_to_ath": 0.846,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0107,
-            "ma_50_spread": 0.0665,
-            "ma_20_50_spread": 0.0552,
-            "eps_q0": 6.3,
-            "eps_q1": 5.67,
-            "eps_q2": 5.04,
-            "eps_q3": 4.41,
-            "per": 7.78,
-            "roe": 21.78
-        },
-        {
-            "ticker": "MSI",
-            "name": "Motorola Solutions",
-            "industry": "Information Technology",
-            "ath": 507.82,
-            "lowest_after_ath": 359.36,
-            "price": 429.23,
-            "correction_ratio": 0.292,
-            "price_to_ath": 0.845,
-            "days_since_ath": 534,
-            "ma_20_spread": -0.0243,
-            "ma_50_spread": -0.0525,
-            "ma_20_50_spread": -0.0289,
-            "eps_q0": 6.2,
-            "eps_q1": 5.58,
-            "eps_q2": 4.96,
-            "eps_q3": 4.34,
-            "per": 33.69,
-            "roe": 104.2
-        },
-        {
-            "ticker": "ORLY",
-            "name": "O\u2019Reilly Automotive",
-            "industry": "Consumer Discretionary",
-            "ath": 108.72,
-            "lowest_after_ath": 86.77,
-            "price": 91.69,
-            "correction_ratio": 0.202,
-            "price_to_ath": 0.843,
-            "days_since_ath": 212,
-            "ma_20_spread": -0.0126,
-            "ma_50_spread": -0.0081,
-            "ma_20_50_spread": 0.0046,
-            "eps_q0": 9.8,
-            "eps_q1": 8.82,
-            "eps_q2": 7.84,
-            "eps_q3": 6.86,
-            "per": 30.87,
-            "roe": 0
-        },
-        {
-            "ticker": "MCO",
-            "name": "Moody's Corporation",
-            "industry": "Financials",
-            "ath": 546.88,
-            "lowest_after_ath": 402.28,
-            "price": 460.11,
-            "correction_ratio": 0.264,
-            "price_to_ath": 0.841,
-            "days_since_ath": 107,
-            "ma_20_spread": 0.0251,
-            "ma_50_spread": 0.027,
-            "ma_20_50_spread": 0.0018,
-            "eps_q0": 5.8,
-            "eps_q1": 5.22,
-            "eps_q2": 4.64,
-            "eps_q3": 4.06,
-            "per": 33.05,
-            "roe": 71.36
-        },
-        {
-            "ticker": "META",
-            "name": "Meta Platforms",
-            "industry": "Communication Services",
-            "ath": 796.25,
-            "lowest_after_ath": 520.26,
-            "price": 669.12,
-            "correction_ratio": 0.347,
-            "price_to_ath": 0.84,
-            "days_since_ath": 261,
-            "ma_20_spread": 0.0395,
-            "ma_50_spread": 0.0593,
-            "ma_20_50_spread": 0.0191,
-            "eps_q0": 9.3,
-            "eps_q1": 8.37,
-            "eps_q2": 7.44,
-            "eps_q3": 6.51,
-            "per": 28.47,
-            "roe": 30.24
-        },
-        {
-            "ticker": "ROL",
-            "name": "Rollins, Inc.",
-            "industry": "Industrials",
-            "ath": 66.14,
-            "lowest_after_ath": 52.32,
-            "price": 55.33,
-            "correction_ratio": 0.209,
-            "price_to_ath": 0.837,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.007,
-            "ma_50_spread": -0.0127,
-            "ma_20_50_spread": -0.0196,
-            "eps_q0": 2.5,
-            "eps_q1": 2.25,
-            "eps_q2": 2.0,
-            "eps_q3": 1.75,
-            "per": 50.76,
-            "roe": 38.67
-        },
-        {
-            "ticker": "COHR",
-            "name": "Coherent Corp.",
-            "industry": "Information Technology",
-            "ath": 364.8,
-            "lowest_after_ath": 291.0,
-            "price": 304.93,
-            "correction_ratio": 0.202,
-            "price_to_ath": 0.836,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0061,
-            "ma_50_spread": 0.1098,
-            "ma_20_50_spread": 0.1167,
-            "eps_q0": 41.9,
-            "eps_q1": 37.71,
-            "eps_q2": 33.52,
-            "eps_q3": 29.33,
-            "per": 296.05,
-            "roe": 3.24
-        },
-        {
-            "ticker": "PEG",
-            "name": "Public Service Enterprise Group",
-            "industry": "Utilities",
-            "ath": 95.22,
-            "lowest_after_ath": 74.67,
-            "price": 79.59,
-            "correction_ratio": 0.216,
-            "price_to_ath": 0.836,
-            "days_since_ath": 520,
-            "ma_20_spread": -0.0189,
-            "ma_50_spread": -0.0352,
-            "ma_20_50_spread": -0.0166,
-            "eps_q0": 10.1,
-            "eps_q1": 9.09,
-            "eps_q2": 8.08,
-            "eps_q3": 7.07,
-            "per": 18.86,
-            "roe": 12.76
-        },
-        {
-            "ticker": "SBUX",
-            "name": "Starbucks",
-            "industry": "Consumer Discretionary",
-            "ath": 126.32,
-            "lowest_after_ath": 68.39,
-            "price": 105.5,
-            "correction_ratio": 0.459,
-            "price_to_ath": 0.835,
-            "days_since_ath": 1745,
-            "ma_20_spread": 0.0824,
-            "ma_50_spread": 0.0938,
-            "ma_20_50_spread": 0.0105,
-            "eps_q0": -62.4,
-            "eps_q1": -56.16,
-            "eps_q2": -49.92,
-            "eps_q3": -43.68,
-            "per": 87.92,
-            "roe": 0
-        },
-        {
-            "ticker": "WFC",
-            "name": "Wells Fargo",
-            "industry": "Financials",
-            "ath": 97.76,
-            "lowest_after_ath": 74.03,
-            "price": 81.51,
-            "correction_ratio": 0.243,
-            "price_to_ath": 0.834,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0058,
-            "ma_50_spread": 0.0046,
-            "ma_20_50_spread": 0.0105,
-            "eps_q0": 7.3,
-            "eps_q1": 6.57,
-            "eps_q2": 5.84,
-            "eps_q3": 5.11,
-            "per": 12.6,
-            "roe": 12.03
-        },
-        {
-            "ticker": "ABBV",
-            "name": "AbbVie",
-            "industry": "Health Care",
-            "ath": 244.81,
-            "lowest_after_ath": 191.0,
-            "price": 203.89,
-            "correction_ratio": 0.22,
-            "price_to_ath": 0.833,
-            "days_since_ath": 211,
-            "ma_20_spread": -0.0101,
-            "ma_50_spread": -0.0527,
-            "ma_20_50_spread": -0.0431,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 86.03,
-            "roe": 6225.0
-        },
-        {
-            "ticker": "DE",
-            "name": "Deere & Company",
-            "industry": "Industrials",
-            "ath": 674.19,
-            "lowest_after_ath": 549.68,
-            "price": 560.02,
-            "correction_ratio": 0.185,
-            "price_to_ath": 0.831,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0417,
-            "ma_50_spread": -0.0542,
-            "ma_20_50_spread": -0.013,
-            "eps_q0": -9.8,
-            "eps_q1": -8.82,
-            "eps_q2": -7.84,
-            "eps_q3": -6.86,
-            "per": 31.62,
-            "roe": 19.57
-        },
-        {
-            "ticker": "FOX",
-            "name": "Fox Corporation (Class B)",
-            "industry": "Communication Services",
-            "ath": 68.18,
-            "lowest_after_ath": 48.76,
-            "price": 56.62,
-            "correction_ratio": 0.285,
-            "price_to_ath": 0.831,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0081,
-            "ma_50_spread": 0.0503,
-            "ma_20_50_spread": 0.0419,
-            "eps_q0": -38.6,
-            "eps_q1": -34.74,
-            "eps_q2": -30.88,
-            "eps_q3": -27.02,
-            "per": 13.58,
-            "roe": 16.82
-        },
-        {
-            "ticker": "ECL",
-            "name": "Ecolab",
-            "industry": "Materials",
-            "ath": 309.27,
-            "lowest_after_ath": 252.66,
-            "price": 256.61,
-            "correction_ratio": 0.183,
-            "price_to_ath": 0.83,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0484,
-            "ma_50_spread": -0.0747,
-            "ma_20_50_spread": -0.0277,
-            "eps_q0": 7.5,
-            "eps_q1": 6.75,
-            "eps_q2": 6.0,
-            "eps_q3": 5.25,
-            "per": 35.2,
-            "roe": 22.43
-        },
-        {
-            "ticker": "NWSA",
-            "name": "News Corp (Class A)",
-            "industry": "Communication Services",
-            "ath": 31.61,
-            "lowest_after_ath": 22.2,
-            "price": 26.24,
-            "correction_ratio": 0.298,
-            "price_to_ath": 0.83,
-            "days_since_ath": 212,
-            "ma_20_spread": 0.0302,
-            "ma_50_spread": 0.0664,
-            "ma_20_50_spread": 0.0352,
-            "eps_q0": -10.2,
-            "eps_q1": -9.18,
-            "eps_q2": -8.16,
-            "eps_q3": -7.14,
-            "per": 34.08,
-            "roe": 6.33
-        },
-        {
-            "ticker": "EMR",
-            "name": "Emerson Electric",
-            "industry": "Industrials",
-            "ath": 165.15,
-            "lowest_after_ath": 122.64,
-            "price": 136.56,
-            "correction_ratio": 0.257,
-            "price_to_ath": 0.827,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0292,
-            "ma_50_spread": -0.0207,
-            "ma_20_50_spread": 0.0087,
-            "eps_q0": 3.4,
-            "eps_q1": 3.06,
-            "eps_q2": 2.72,
-            "eps_q3": 2.38,
-            "per": 33.47,
-            "roe": 9.65
-        },
-        {
-            "ticker": "CHD",
-            "name": "Church & Dwight",
-            "industry": "Consumer Staples",
-            "ath": 116.46,
-            "lowest_after_ath": 81.33,
-            "price": 96.2,
-            "correction_ratio": 0.302,
-            "price_to_ath": 0.826,
-            "days_since_ath": 415,
-            "ma_20_spread": 0.0155,
-            "ma_50_spread": -0.0133,
-            "ma_20_50_spread": -0.0283,
-            "eps_q0": -24.2,
-            "eps_q1": -21.78,
-            "eps_q2": -19.36,
-            "eps_q3": -16.94,
-            "per": 31.85,
-            "roe": 17.62
-        },
-        {
-            "ticker": "COR",
-            "name": "Cencora",
-            "industry": "Health Care",
-            "ath": 377.54,
-            "lowest_after_ath": 303.8,
-            "price": 311.43,
-            "correction_ratio": 0.195,
-            "price_to_ath": 0.825,
-            "days_since_ath": 156,
-            "ma_20_spread": -0.02,
-            "ma_50_spread": -0.0708,
-            "ma_20_50_spread": -0.0518,
-            "eps_q0": 14.5,
-            "eps_q1": 13.05,
-            "eps_q2": 11.6,
-            "eps_q3": 10.15,
-            "per": 37.39,
-            "roe": 133.47
-        },
-        {
-            "ticker": "EXPE",
-            "name": "Expedia Group",
-            "industry": "Consumer Discretionary",
-            "ath": 303.8,
-            "lowest_after_ath": 185.34,
-            "price": 250.57,
-            "correction_ratio": 0.39,
-            "price_to_ath": 0.825,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0187,
-            "ma_50_spread": 0.0731,
-            "ma_20_50_spread": 0.0535,
-            "eps_q0": -31.4,
-            "eps_q1": -28.26,
-            "eps_q2": -25.12,
-            "eps_q3": -21.98,
-            "per": 25.54,
-            "roe": 48.67
-        },
-        {
-            "ticker": "ICE",
-            "name": "Intercontinental Exchange",
-            "industry": "Financials",
-            "ath": 189.35,
-            "lowest_after_ath": 143.17,
-            "price": 156.19,
-            "correction_ratio": 0.244,
-            "price_to_ath": 0.825,
-            "days_since_ath": 268,
-            "ma_20_spread": -0.0311,
-            "ma_50_spread": -0.0238,
-            "ma_20_50_spread": 0.0075,
-            "eps_q0": 21.9,
-            "eps_q1": 19.71,
-            "eps_q2": 17.52,
-            "eps_q3": 15.33,
-            "per": 27.07,
-            "roe": 11.88
-        },
-        {
-            "ticker": "FOXA",
-            "name": "Fox Corporation (Class A)",
-            "industry": "Communication Services",
-            "ath": 76.39,
-            "lowest_after_ath": 53.03,
-            "price": 62.94,
-            "correction_ratio": 0.306,
-            "price_to_ath": 0.824,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0062,
-            "ma_50_spread": 0.056,
-            "ma_20_50_spread": 0.0495,
-            "eps_q0": -38.6,
-            "eps_q1": -34.74,
-            "eps_q2": -30.88,
-            "eps_q3": -27.02,
-            "per": 15.09,
-            "roe": 16.82
-        },
-        {
-            "ticker": "MRK",
-            "name": "Merck & Co.",
-            "industry": "Health Care",
-            "ath": 134.63,
-            "lowest_after_ath": 73.31,
-            "price": 110.95,
-            "correction_ratio": 0.455,
-            "price_to_ath": 0.824,
-            "days_since_ath": 674,
-            "ma_20_spread": -0.0525,
-            "ma_50_spread": -0.0596,
-            "ma_20_50_spread": -0.0075,
-            "eps_q0": -20.8,
-            "eps_q1": -18.72,
-            "eps_q2": -16.64,
-            "eps_q3": -14.56,
-            "per": 15.24,
-            "roe": 36.88
-        },
-        {
-            "ticker": "EG",
-            "name": "Everest Group",
-            "industry": "Financials",
-            "ath": 417.92,
-            "lowest_after_ath": 302.44,
-            "price": 344.01,
-            "correction_ratio": 0.276,
-            "price_to_ath": 0.823,
-            "days_since_ath": 891,
-            "ma_20_spread": 0.0124,
-            "ma_50_spread": 0.032,
-            "ma_20_50_spread": 0.0193,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.1,
-            "roe": 10.85
-        },
-        {
-            "ticker": "MCK",
-            "name": "McKesson Corporation",
-            "industry": "Health Care",
-            "ath": 999.0,
-            "lowest_after_ath": 817.44,
-            "price": 822.63,
-            "correction_ratio": 0.182,
-            "price_to_ath": 0.823,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.037,
-            "ma_50_spread": -0.0846,
-            "ma_20_50_spread": -0.0494,
-            "eps_q0": 34.9,
-            "eps_q1": 31.41,
-            "eps_q2": 27.92,
-            "eps_q3": 24.43,
-            "per": 23.74,
-            "roe": 0
-        },
-        {
-            "ticker": "MAS",
-            "name": "Masco",
-            "industry": "Industrials",
-            "ath": 86.7,
-            "lowest_after_ath": 56.55,
-            "price": 71.26,
-            "correction_ratio": 0.348,
-            "price_to_ath": 0.822,
-            "days_since_ath": 562,
-            "ma_20_spread": 0.0742,
-            "ma_50_spread": 0.0837,
-            "ma_20_50_spread": 0.0088,
-            "eps_q0": 14.5,
-            "eps_q1": 13.05,
-            "eps_q2": 11.6,
-            "eps_q3": 10.15,
-            "per": 17.64,
-            "roe": 8457.14
-        },
-        {
-            "ticker": "WTW",
-            "name": "Willis Towers Watson",
-            "industry": "Financials",
-            "ath": 352.79,
-            "lowest_after_ath": 273.59,
-            "price": 290.11,
-            "correction_ratio": 0.224,
-            "price_to_ath": 0.822,
-            "days_since_ath": 205,
-            "ma_20_spread": -0.001,
-            "ma_50_spread": -0.0095,
-            "ma_20_50_spread": -0.0085,
-            "eps_q0": -41.0,
-            "eps_q1": -36.9,
-            "eps_q2": -32.8,
-            "eps_q3": -28.7,
-            "per": 17.84,
-            "roe": 20.08
-        },
-        {
-            "ticker": "GILD",
-            "name": "Gilead Sciences",
-            "industry": "Health Care",
-            "ath": 157.29,
-            "lowest_after_ath": 127.64,
-            "price": 128.84,
-            "correction_ratio": 0.189,
-            "price_to_ath": 0.819,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0558,
-            "ma_50_spread": -0.0873,
-            "ma_20_50_spread": -0.0334,
-            "eps_q0": 22.4,
-            "eps_q1": 20.16,
-            "eps_q2": 17.92,
-            "eps_q3": 15.68,
-            "per": 18.97,
-            "roe": 40.66
-        },
-        {
-            "ticker": "CBRE",
-            "name": "CBRE Group",
-            "industry": "Real Estate",
-            "ath": 174.27,
-            "lowest_after_ath": 125.78,
-            "price": 142.51,
-            "correction_ratio": 0.278,
-            "price_to_ath": 0.818,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0173,
-            "ma_50_spread": 0.0078,
-            "ma_20_50_spread": 0.0256,
-            "eps_q0": 95.1,
-            "eps_q1": 85.59,
-            "eps_q2": 76.08,
-            "eps_q3": 66.57,
-            "per": 32.54,
-            "roe": 15.6
-        },
-        {
-            "ticker": "AMP",
-            "name": "Ameriprise Financial",
-            "industry": "Financials",
-            "ath": 582.05,
-            "lowest_after_ath": 396.14,
-            "price": 475.38,
-            "correction_ratio": 0.319,
-            "price_to_ath": 0.817,
-            "days_since_ath": 457,
-            "ma_20_spread": 0.042,
-            "ma_50_spread": 0.0428,
-            "ma_20_50_spread": 0.0008,
-            "eps_q0": 56.9,
-            "eps_q1": 51.21,
-            "eps_q2": 45.52,
-            "eps_q3": 39.83,
-            "per": 11.85,
-            "roe": 66.94
-        },
-        {
-            "ticker": "WSM",
-            "name": "Williams-Sonoma, Inc.",
-            "industry": "Consumer Discretionary",
-            "ath": 222.0,
-            "lowest_after_ath": 174.51,
-            "price": 181.18,
-            "correction_ratio": 0.214,
-            "price_to_ath": 0.816,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0481,
-            "ma_50_spread": -0.0518,
-            "ma_20_50_spread": -0.0039,
-            "eps_q0": -10.4,
-            "eps_q1": -9.36,
-            "eps_q2": -8.32,
-            "eps_q3": -7.28,
-            "per": 20.47,
-            "roe": 51.52
-        },
-        {
-            "ticker": "AXP",
-            "name": "American Express",
-            "industry": "Financials",
-            "ath": 387.49,
-            "lowest_after_ath": 290.97,
-            "price": 315.65,
-            "correction_ratio": 0.249,
-            "price_to_ath": 0.815,
-            "days_since_ath": 142,
-            "ma_20_spread": -0.0097,
-            "ma_50_spread": 0.0083,
-            "ma_20_50_spread": 0.0181,
-            "eps_q0": 15.0,
-            "eps_q1": 13.5,
-            "eps_q2": 12.0,
-            "eps_q3": 10.5,
-            "per": 19.7,
-            "roe": 34.42
-        },
-        {
-            "ticker": "CVNA",
-            "name": "Carvana",
-            "industry": "Consumer Discretionary",
-            "ath": 486.89,
-            "lowest_after_ath": 272.32,
-            "price": 396.59,
-            "correction_ratio": 0.441,
-            "price_to_ath": 0.815,
-            "days_since_ath": 100,
-            "ma_20_spread": 0.0775,
-            "ma_50_spread": 0.1785,
-            "ma_20_50_spread": 0.0936,
-            "eps_q0": 984.8,
-            "eps_q1": 886.32,
-            "eps_q2": 787.84,
-            "eps_q3": 689.36,
-            "per": 46.93,
-            "roe": 67.95
-        },
-        {
-            "ticker": "GE",
-            "name": "GE Aerospace",
-            "industry": "Industrials",
-            "ath": 348.48,
-            "lowest_after_ath": 268.91,
-            "price": 283.57,
-            "correction_ratio": 0.228,
-            "price_to_ath": 0.814,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0416,
-            "ma_50_spread": -0.0778,
-            "ma_20_50_spread": -0.0378,
-            "eps_q0": -3.7,
-            "eps_q1": -3.33,
-            "eps_q2": -2.96,
-            "eps_q3": -2.59,
-            "per": 35.27,
-            "roe": 45.43
-        },
-        {
-            "ticker": "VRTX",
-            "name": "Vertex Pharmaceuticals",
-            "industry": "Health Care",
-            "ath": 519.88,
-            "lowest_after_ath": 362.5,
-            "price": 423.24,
-            "correction_ratio": 0.303,
-            "price_to_ath": 0.814,
-            "days_since_ath": 541,
-            "ma_20_spread": -0.0315,
-            "ma_50_spread": -0.0704,
-            "ma_20_50_spread": -0.0401,
-            "eps_q0": 30.5,
-            "eps_q1": 27.45,
-            "eps_q2": 24.4,
-            "eps_q3": 21.35,
-            "per": 27.64,
-            "roe": 22.54
-        },
-        {
-            "ticker": "TTWO",
-            "name": "Take-Two Interactive",
-            "industry": "Communication Services",
-            "ath": 264.79,
-            "lowest_after_ath": 187.63,
-            "price": 215.34,
-            "correction_ratio": 0.291,
-            "price_to_ath": 0.813,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.0372,
-            "ma_50_spread": 0.0465,
-            "ma_20_50_spread": 0.0089,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 27.34,
-            "roe": -86.22
-        },
-        {
-            "ticker": "TEL",
-            "name": "TE Connectivity",
-            "industry": "Information Technology",
-            "ath": 252.56,
-            "lowest_after_ath": 201.9,
-            "price": 205.25,
-            "correction_ratio": 0.201,
-            "price_to_ath": 0.813,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0825,
-            "ma_50_spread": -0.0533,
-            "ma_20_50_spread": 0.0319,
-            "eps_q0": 6476.9,
-            "eps_q1": 5829.21,
-            "eps_q2": 5181.52,
-            "eps_q3": 4533.83,
-            "per": 20.97,
-            "roe": 22.72
-        },
-        {
-            "ticker": "PANW",
-            "name": "Palo Alto Networks",
-            "industry": "Information Technology",
-            "ath": 223.61,
-            "lowest_after_ath": 139.57,
-            "price": 181.54,
-            "correction_ratio": 0.376,
-            "price_to_ath": 0.812,
-            "days_since_ath": 184,
-            "ma_20_spread": 0.0685,
-            "ma_50_spread": 0.116,
-            "ma_20_50_spread": 0.0445,
-            "eps_q0": 61.8,
-            "eps_q1": 55.62,
-            "eps_q2": 49.44,
-            "eps_q3": 43.26,
-            "per": 101.42,
-            "roe": 16.26
-        },
-        {
-            "ticker": "PG",
-            "name": "Procter & Gamble",
-            "industry": "Consumer Staples",
-            "ath": 180.43,
-            "lowest_after_ath": 137.62,
-            "price": 146.46,
-            "correction_ratio": 0.237,
-            "price_to_ath": 0.812,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0111,
-            "ma_50_spread": -0.0233,
-            "ma_20_50_spread": -0.034,
-            "eps_q0": 4.3,
-            "eps_q1": 3.87,
-            "eps_q2": 3.44,
-            "eps_q3": 3.01,
-            "per": 21.38,
-            "roe": 31.11
-        },
-        {
-            "ticker": "TKO",
-            "name": "TKO Group Holdings",
-            "industry": "Communication Services",
-            "ath": 226.94,
-            "lowest_after_ath": 180.58,
-            "price": 183.71,
-            "correction_ratio": 0.204,
-            "price_to_ath": 0.81,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0387,
-            "ma_50_spread": -0.0774,
-            "ma_20_50_spread": -0.0402,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 81.65,
-            "roe": 5.63
-        },
-        {
-            "ticker": "PHM",
-            "name": "PulteGroup",
-            "industry": "Consumer Discretionary",
-            "ath": 149.47,
-            "lowest_after_ath": 88.07,
-            "price": 120.71,
-            "correction_ratio": 0.411,
-            "price_to_ath": 0.808,
-            "days_since_ath": 555,
-            "ma_20_spread": -0.0187,
-            "ma_50_spread": -0.0346,
-            "ma_20_50_spread": -0.0161,
-            "eps_q0": -33.6,
-            "eps_q1": -30.24,
-            "eps_q2": -26.88,
-            "eps_q3": -23.52,
-            "per": 11.67,
-            "roe": 16.18
-        },
-        {
-            "ticker": "RTX",
-            "name": "RTX Corporation",
-            "industry": "Industrials",
-            "ath": 214.5,
-            "lowest_after_ath": 171.63,
-            "price": 172.79,
-            "correction_ratio": 0.2,
-            "price_to_ath": 0.806,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0976,
-            "ma_50_spread": -0.1248,
-            "ma_20_50_spread": -0.0302,
-            "eps_q0": 34.1,
-            "eps_q1": 30.69,
-            "eps_q2": 27.28,
-            "eps_q3": 23.87,
-            "per": 32.48,
-            "roe": 11.57
-        },
-        {
-            "ticker": "RSG",
-            "name": "Republic Services",
-            "industry": "Industrials",
-            "ath": 258.75,
-            "lowest_after_ath": 201.42,
-            "price": 208.31,
-            "correction_ratio": 0.222,
-            "price_to_ath": 0.805,
-            "days_since_ath": 331,
-            "ma_20_spread": -0.0202,
-            "ma_50_spread": -0.0485,
-            "ma_20_50_spread": -0.0289,
-            "eps_q0": 6.3,
-            "eps_q1": 5.67,
-            "eps_q2": 5.04,
-            "eps_q3": 4.41,
-            "per": 30.41,
-            "roe": 18.3
-        },
-        {
-            "ticker": "SYY",
-            "name": "Sysco",
-            "industry": "Consumer Staples",
-            "ath": 91.85,
-            "lowest_after_ath": 68.19,
-            "price": 73.97,
-            "correction_ratio": 0.258,
-            "price_to_ath": 0.805,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0046,
-            "ma_50_spread": -0.0825,
-            "ma_20_50_spread": -0.0783,
-            "eps_q0": -15.2,
-            "eps_q1": -13.68,
-            "eps_q2": -12.16,
-            "eps_q3": -10.64,
-            "per": 20.55,
-            "roe": 81.89
-        },
-        {
-            "ticker": "AZO",
-            "name": "AutoZone",
-            "industry": "Consumer Discretionary",
-            "ath": 4388.11,
-            "lowest_after_ath": 3210.72,
-            "price": 3523.56,
-            "correction_ratio": 0.268,
-            "price_to_ath": 0.803,
-            "days_since_ath": 233,
-            "ma_20_spread": 0.0022,
-            "ma_50_spread": -0.008,
-            "ma_20_50_spread": -0.0101,
-            "eps_q0": -3.9,
-            "eps_q1": -3.51,
-            "eps_q2": -3.12,
-            "eps_q3": -2.73,
-            "per": 24.66,
-            "roe": 0
-        },
-        {
-            "ticker": "FCX",
-            "name": "Freeport-McMoRan",
-            "industry": "Materials",
-            "ath": 70.97,
-            "lowest_after_ath": 56.6,
-            "price": 56.93,
-            "correction_ratio": 0.202,
-            "price_to_ath": 0.802,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.1198,
-            "ma_50_spread": -0.0861,
-            "ma_20_50_spread": 0.0383,
-            "eps_q0": 150.3,
-            "eps_q1": 135.27,
-            "eps_q2": 120.24,
-            "eps_q3": 105.21,
-            "per": 30.12,
-            "roe": 15.63
-        },
-        {
-            "ticker": "NTAP",
-            "name": "NetApp",
-            "industry": "Information Technology",
-            "ath": 135.45,
-            "lowest_after_ath": 71.84,
-            "price": 108.65,
-            "correction_ratio": 0.47,
-            "price_to_ath": 0.802,
-            "days_since_ath": 527,
-            "ma_20_spread": 0.0483,
-            "ma_50_spread": 0.0648,
-            "ma_20_50_spread": 0.0158,
-            "eps_q0": 11.7,
-            "eps_q1": 10.53,
-            "eps_q2": 9.36,
-            "eps_q3": 8.19,
-            "per": 18.23,
-            "roe": 112.59
-        },
-        {
-            "ticker": "VICI",
-            "name": "Vici Properties",
-            "industry": "Real Estate",
-            "ath": 35.69,
-            "lowest_after_ath": 26.55,
-            "price": 28.6,
-            "correction_ratio": 0.256,
-            "price_to_ath": 0.801,
-            "days_since_ath": 1353,
-            "ma_20_spread": 0.0128,
-            "ma_50_spread": 0.0006,
-            "ma_20_50_spread": -0.012,
-            "eps_q0": -1.6,
-            "eps_q1": -1.44,
-            "eps_q2": -1.28,
-            "eps_q3": -1.12,
-            "per": 10.96,
-            "roe": 10.22
-        },
-        {
-            "ticker": "CRWD",
-            "name": "CrowdStrike",
-            "industry": "Information Technology",
-            "ath": 566.9,
-            "lowest_after_ath": 342.72,
-            "price": 452.38,
-            "correction_ratio": 0.395,
-            "price_to_ath": 0.798,
-            "days_since_ath": 170,
-            "ma_20_spread": 0.0678,
-            "ma_50_spread": 0.0977,
-            "ma_20_50_spread": 0.028,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 73.3,
-            "roe": -4.14
-        },
-        {
-            "ticker": "EXE",
-            "name": "Expand Energy",
-            "industry": "Energy",
-            "ath": 126.62,
-            "lowest_after_ath": 93.75,
-            "price": 100.99,
-            "correction_ratio": 0.26,
-            "price_to_ath": 0.798,
-            "days_since_ath": 149,
-            "ma_20_spread": 0.0254,
-            "ma_50_spread": -0.0274,
-            "ma_20_50_spread": -0.0514,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 13.34,
-            "roe": 10.07
-        },
-        {
-            "ticker": "NEM",
-            "name": "Newmont",
-            "industry": "Materials",
-            "ath": 134.88,
-            "lowest_after_ath": 94.34,
-            "price": 107.61,
-            "correction_ratio": 0.301,
-            "price_to_ath": 0.798,
-            "days_since_ath": 93,
-            "ma_20_spread": -0.0616,
-            "ma_50_spread": -0.057,
-            "ma_20_50_spread": 0.0049,
-            "eps_q0": 72.5,
-            "eps_q1": 65.25,
-            "eps_q2": 58.0,
-            "eps_q3": 50.75,
-            "per": 13.96,
-            "roe": 25.83
-        },
-        {
-            "ticker": "LOW",
-            "name": "Lowe's",
-            "industry": "Consumer Discretionary",
-            "ath": 293.06,
-            "lowest_after_ath": 224.15,
-            "price": 233.5,
-            "correction_ratio": 0.235,
-            "price_to_ath": 0.797,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0391,
-            "ma_50_spread": -0.0553,
-            "ma_20_50_spread": -0.0168,
-            "eps_q0": -11.0,
-            "eps_q1": -9.9,
-            "eps_q2": -8.8,
-            "eps_q3": -7.7,
-            "per": 19.7,
-            "roe": 0
-        },
-        {
-            "ticker": "ACGL",
-            "name": "Arch Capital Group",
-            "industry": "Financials",
-            "ath": 116.47,
-            "lowest_after_ath": 82.45,
-            "price": 92.72,
-            "correction_ratio": 0.292,
-            "price_to_ath": 0.796,
-            "days_since_ath": 569,
-            "ma_20_spread": -0.0433,
-            "ma_50_spread": -0.039,
-            "ma_20_50_spread": 0.0045,
-            "eps_q0": 32.4,
-            "eps_q1": 29.16,
-            "eps_q2": 25.92,
-            "eps_q3": 22.68,
-            "per": 7.99,
-            "roe": 19.54
-        },
-        {
-            "ticker": "HSIC",
-            "name": "Henry Schein",
-            "industry": "Health Care",
-            "ath": 92.68,
-            "lowest_after_ath": 60.01,
-            "price": 73.8,
-            "correction_ratio": 0.353,
-            "price_to_ath": 0.796,
-            "days_since_ath": 1479,
-            "ma_20_spread": -0.0339,
-            "ma_50_spread": -0.038,
-            "ma_20_50_spread": -0.0042,
-            "eps_q0": 7.4,
-            "eps_q1": 6.66,
-            "eps_q2": 5.92,
-            "eps_q3": 5.18,
-            "per": 22.57,
-            "roe": 8.7
-        },
-        {
-            "ticker": "PLD",
-            "name": "Prologis",
-            "industry": "Real Estate",
-            "ath": 174.54,
-            "lowest_after_ath": 85.35,
-            "price": 138.82,
-            "correction_ratio": 0.511,
-            "price_to_ath": 0.795,
-            "days_since_ath": 1472,
-            "ma_20_spread": -0.0017,
-            "ma_50_spread": 0.0147,
-            "ma_20_50_spread": 0.0164,
-            "eps_q0": 65.6,
-            "eps_q1": 59.04,
-            "eps_q2": 52.48,
-            "eps_q3": 45.92,
-            "per": 38.89,
-            "roe": 6.84
-        },
-        {
-            "ticker": "SHW",
-            "name": "Sherwin-Williams",
-            "industry": "Materials",
-            "ath": 400.42,
-            "lowest_after_ath": 301.58,
-            "price": 317.85,
-            "correction_ratio": 0.247,
-            "price_to_ath": 0.794,
-            "days_since_ath": 520,
-            "ma_20_spread": -0.0404,
-            "ma_50_spread": -0.0455,
-            "ma_20_50_spread": -0.0053,
-            "eps_q0": 6.1,
-            "eps_q1": 5.49,
-            "eps_q2": 4.88,
-            "eps_q3": 4.27,
-            "per": 30.53,
-            "roe": 60.72
-        },
-        {
-            "ticker": "PEP",
-            "name": "PepsiCo",
-            "industry": "Consumer Staples",
-            "ath": 196.88,
-            "lowest_after_ath": 127.6,
-            "price": 155.29,
-            "correction_ratio": 0.352,
-            "price_to_ath": 0.789,
-            "days_since_ath": 1080,
-            "ma_20_spread": -0.0033,
-            "ma_50_spread": -0.0186,
-            "ma_20_50_spread": -0.0154,
-            "eps_q0": 26.9,
-            "eps_q1": 24.21,
-            "eps_q2": 21.52,
-            "eps_q3": 18.83,
-            "per": 24.34,
-            "roe": 43.88
-        },
-        {
-            "ticker": "STE",
-            "name": "Steris",
-            "industry": "Health Care",
-            "ath": 269.44,
-            "lowest_after_ath": 209.98,
-            "price": 212.65,
-            "correction_ratio": 0.221,
-            "price_to_ath": 0.789,
-            "days_since_ath": 107,
-            "ma_20_spread": -0.0411,
-            "ma_50_spread": -0.066,
-            "ma_20_50_spread": -0.0259,
-            "eps_q0": 11.2,
-            "eps_q1": 10.08,
-            "eps_q2": 8.96,
-            "eps_q3": 7.84,
-            "per": 29.7,
-            "roe": 10.47
-        },
-        {
-            "ticker": "CI",
-            "name": "Cigna",
-            "industry": "Health Care",
-            "ath": 370.83,
-            "lowest_after_ath": 239.51,
-            "price": 292.32,
-            "correction_ratio": 0.354,
-            "price_to_ath": 0.788,
-            "days_since_ath": 590,
-            "ma_20_spread": 0.0568,
-            "ma_50_spread": 0.0642,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": -13.3,
-            "eps_q1": -11.97,
-            "eps_q2": -10.64,
-            "eps_q3": -9.31,
-            "per": 13.19,
-            "roe": 15.13
-        },
-        {
-            "ticker": "HII",
-            "name": "Huntington Ingalls Industries",
-            "industry": "Industrials",
-            "ath": 460.0,
-            "lowest_after_ath": 352.05,
-            "price": 362.17,
-            "correction_ratio": 0.235,
-            "price_to_ath": 0.787,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0641,
-            "ma_50_spread": -0.1096,
-            "ma_20_50_spread": -0.0486,
-            "eps_q0": 29.3,
-            "eps_q1": 26.37,
-            "eps_q2": 23.44,
-            "eps_q3": 20.51,
-            "per": 23.52,
-            "roe": 12.42
-        },
-        {
-            "ticker": "NRG",
-            "name": "NRG Energy",
-            "industry": "Utilities",
-            "ath": 189.96,
-            "lowest_after_ath": 139.89,
-            "price": 149.01,
-            "correction_ratio": 0.264,
-            "price_to_ath": 0.784,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0606,
-            "ma_50_spread": -0.0676,
-            "ma_20_50_spread": -0.0075,
-            "eps_q0": -89.7,
-            "eps_q1": -80.73,
-            "eps_q2": -71.76,
-            "eps_q3": -62.79,
-            "per": 37.16,
-            "roe": 41.55
-        },
-        {
-            "ticker": "AON",
-            "name": "Aon plc",
-            "industry": "Financials",
-            "ath": 412.97,
-            "lowest_after_ath": 304.59,
-            "price": 322.49,
-            "correction_ratio": 0.262,
-            "price_to_ath": 0.781,
-            "days_since_ath": 422,
-            "ma_20_spread": -0.0094,
-            "ma_50_spread": -0.0096,
-            "ma_20_50_spread": -0.0002,
-            "eps_q0": 136.5,
-            "eps_q1": 122.85,
-            "eps_q2": 109.2,
-            "eps_q3": 95.55,
-            "per": 18.95,
-            "roe": 46.94
-        },
-        {
-            "ticker": "HCA",
-            "name": "HCA Healthcare",
-            "industry": "Health Care",
-            "ath": 556.52,
-            "lowest_after_ath": 422.19,
-            "price": 434.78,
-            "correction_ratio": 0.241,
-            "price_to_ath": 0.781,
-            "days_since_ath": 51,
-            "ma_20_spread": -0.0869,
-            "ma_50_spread": -0.1318,
-            "ma_20_50_spread": -0.0491,
-            "eps_q0": 0.6,
-            "eps_q1": 0.54,
-            "eps_q2": 0.48,
-            "eps_q3": 0.42,
-            "per": 14.98,
-            "roe": 0
-        },
-        {
-            "ticker": "VLTO",
-            "name": "Veralto",
-            "industry": "Industrials",
-            "ath": 115.0,
-            "lowest_after_ath": 83.86,
-            "price": 89.47,
-            "correction_ratio": 0.271,
-            "price_to_ath": 0.778,
-            "days_since_ath": 555,
-            "ma_20_spread": 0.0003,
-            "ma_50_spread": -0.0145,
-            "ma_20_50_spread": -0.0148,
-            "eps_q0": 11.9,
-            "eps_q1": 10.71,
-            "eps_q2": 9.52,
-            "eps_q3": 8.33,
-            "per": 23.06,
-            "roe": 36.5
-        },
-        {
-            "ticker": "T",
-            "name": "AT&T",
-            "industry": "Communication Services",
-            "ath": 33.15,
-            "lowest_after_ath": 13.43,
-            "price": 25.75,
-            "correction_ratio": 0.595,
-            "price_to_ath": 0.777,
-            "days_since_ath": 3586,
-            "ma_20_spread": -0.0309,
-            "ma_50_spread": -0.0653,
-            "ma_20_50_spread": -0.0355,
-            "eps_q0": -12.0,
-            "eps_q1": -10.8,
-            "eps_q2": -9.6,
-            "eps_q3": -8.4,
-            "per": 8.47,
-            "roe": 18.37
-        },
-        {
-            "ticker": "MDLZ",
-            "name": "Mondelez International",
-            "industry": "Consumer Staples",
-            "ath": 78.59,
-            "lowest_after_ath": 51.2,
-            "price": 61.04,
-            "correction_ratio": 0.349,
-            "price_to_ath": 0.777,
-            "days_since_ath": 1101,
-            "ma_20_spread": 0.0564,
-            "ma_50_spread": 0.0533,
-            "ma_20_50_spread": -0.0029,
-            "eps_q0": -61.9,
-            "eps_q1": -55.71,
-            "eps_q2": -49.52,
-            "eps_q3": -43.33,
-            "per": 32.3,
-            "roe": 9.33
-        },
-        {
-            "ticker": "SYK",
-            "name": "Stryker Corporation",
-            "industry": "Health Care",
-            "ath": 406.19,
-            "lowest_after_ath": 311.31,
-            "price": 315.13,
-            "correction_ratio": 0.234,
-            "price_to_ath": 0.776,
-            "days_since_ath": 457,
-            "ma_20_spread": -0.0561,
-            "ma_50_spread": -0.0938,
-            "ma_20_50_spread": -0.0399,
-            "eps_q0": 55.5,
-            "eps_q1": 49.95,
-            "eps_q2": 44.4,
-            "eps_q3": 38.85,
-            "per": 37.56,
-            "roe": 15.08
-        },
-        {
-            "ticker": "AKAM",
-            "name": "Akamai Technologies",
-            "industry": "Information Technology",
-            "ath": 129.17,
-            "lowest_after_ath": 67.51,
-            "price": 99.8,
-            "correction_ratio": 0.477,
-            "price_to_ath": 0.773,
-            "days_since_ath": 814,
-            "ma_20_spread": -0.0126,
-            "ma_50_spread": -0.0417,
-            "ma_20_50_spread": -0.0295,
-            "eps_q0": -39.2,
-            "eps_q1": -35.28,
-            "eps_q2": -31.36,
-            "eps_q3": -27.44,
-            "per": 32.51,
-            "roe": 9.17
-        },
-        {
-            "ticker": "CL",
-            "name": "Colgate-Palmolive",
-            "industry": "Consumer Staples",
-            "ath": 109.3,
-            "lowest_after_ath": 74.55,
-            "price": 84.49,
-            "correction_ratio": 0.318,
-            "price_to_ath": 0.773,
-            "days_since_ath": 604,
-            "ma_20_spread": 0.0025,
-            "ma_50_spread": -0.0438,
-            "ma_20_50_spread": -0.0462,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 32.13,
-            "roe": 497.47
-        },
-        {
-            "ticker": "O",
-            "name": "Realty Income",
-            "industry": "Real Estate",
-            "ath": 82.29,
-            "lowest_after_ath": 36.82,
-            "price": 63.29,
-            "correction_ratio": 0.553,
-            "price_to_ath": 0.769,
-            "days_since_ath": 2263,
-            "ma_20_spread": -0.0017,
-            "ma_50_spread": -0.0085,
-            "ma_20_50_spread": -0.0068,
-            "eps_q0": 48.3,
-            "eps_q1": 43.47,
-            "eps_q2": 38.64,
-            "eps_q3": 33.81,
-            "per": 54.09,
-            "roe": 2.7
-        },
-        {
-            "ticker": "CPAY",
-            "name": "Corpay",
-            "industry": "Financials",
-            "ath": 400.81,
-            "lowest_after_ath": 252.84,
-            "price": 306.98,
-            "correction_ratio": 0.369,
-            "price_to_ath": 0.766,
-            "days_since_ath": 450,
-            "ma_20_spread": -0.0212,
-            "ma_50_spread": -0.0252,
-            "ma_20_50_spread": -0.004,
-            "eps_q0": 7.5,
-            "eps_q1": 6.75,
-            "eps_q2": 6.0,
-            "eps_q3": 5.25,
-            "per": 20.44,
-            "roe": 29.07
-        },
-        {
-            "ticker": "EIX",
-            "name": "Edison International",
-            "industry": "Utilities",
-            "ath": 88.77,
-            "lowest_after_ath": 47.73,
-            "price": 67.94,
-            "correction_ratio": 0.462,
-            "price_to_ath": 0.765,
-            "days_since_ath": 604,
-            "ma_20_spread": -0.0504,
-            "ma_50_spread": -0.0569,
-            "ma_20_50_spread": -0.0068,
-            "eps_q0": 443.5,
-            "eps_q1": 399.15,
-            "eps_q2": 354.8,
-            "eps_q3": 310.45,
-            "per": 7.38,
-            "roe": 24.1
-        },
-        {
-            "ticker": "MSFT",
-            "name": "Microsoft",
-            "industry": "Information Technology",
-            "ath": 555.45,
-            "lowest_after_ath": 356.28,
-            "price": 424.46,
-            "correction_ratio": 0.359,
-            "price_to_ath": 0.764,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0569,
-            "ma_50_spread": 0.0729,
-            "ma_20_50_spread": 0.0151,
-            "eps_q0": 59.5,
-            "eps_q1": 53.55,
-            "eps_q2": 47.6,
-            "eps_q3": 41.65,
-            "per": 26.58,
-            "roe": 34.39
-        },
-        {
-            "ticker": "CTAS",
-            "name": "Cintas",
-            "industry": "Industrials",
-            "ath": 229.24,
-            "lowest_after_ath": 165.6,
-            "price": 173.95,
-            "correction_ratio": 0.278,
-            "price_to_ath": 0.759,
-            "days_since_ath": 331,
-            "ma_20_spread": -0.0067,
-            "ma_50_spread": -0.0572,
-            "ma_20_50_spread": -0.0508,
-            "eps_q0": 8.4,
-            "eps_q1": 7.56,
-            "eps_q2": 6.72,
-            "eps_q3": 5.88,
-            "per": 36.7,
-            "roe": 41.3
-        },
-        {
-            "ticker": "DHI",
-            "name": "D. R. Horton",
-            "industry": "Consumer Discretionary",
-            "ath": 199.85,
-            "lowest_after_ath": 110.44,
-            "price": 151.65,
-            "correction_ratio": 0.447,
-            "price_to_ath": 0.759,
-            "days_since_ath": 590,
-            "ma_20_spread": 0.0175,
-            "ma_50_spread": 0.0246,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": -20.1,
-            "eps_q1": -18.09,
-            "eps_q2": -16.08,
-            "eps_q3": -14.07,
-            "per": 14.24,
-            "roe": 13.08
-        },
-        {
-            "ticker": "OKE",
-            "name": "Oneok",
-            "industry": "Energy",
-            "ath": 118.07,
-            "lowest_after_ath": 64.02,
-            "price": 89.32,
-            "correction_ratio": 0.458,
-            "price_to_ath": 0.757,
-            "days_since_ath": 527,
-            "ma_20_spread": 0.0308,
-            "ma_50_spread": 0.0272,
-            "ma_20_50_spread": -0.0035,
-            "eps_q0": 5.8,
-            "eps_q1": 5.22,
-            "eps_q2": 4.64,
-            "eps_q3": 4.06,
-            "per": 15.92,
-            "roe": 15.49
-        },
-        {
-            "ticker": "MO",
-            "name": "Altria",
-            "industry": "Consumer Staples",
-            "ath": 90.5,
-            "lowest_after_ath": 14.34,
-            "price": 68.2,
-            "correction_ratio": 0.842,
-            "price_to_ath": 0.754,
-            "days_since_ath": 7051,
-            "ma_20_spread": 0.0317,
-            "ma_50_spread": 0.0234,
-            "ma_20_50_spread": -0.008,
-            "eps_q0": -63.2,
-            "eps_q1": -56.88,
-            "eps_q2": -50.56,
-            "eps_q3": -44.24,
-            "per": 16.55,
-            "roe": 0
-        },
-        {
-            "ticker": "PPL",
-            "name": "PPL Corporation",
-            "industry": "Utilities",
-            "ath": 51.44,
-            "lowest_after_ath": 18.12,
-            "price": 38.66,
-            "correction_ratio": 0.648,
-            "price_to_ath": 0.752,
-            "days_since_ath": 6687,
-            "ma_20_spread": -0.0067,
-            "ma_50_spread": 0.0092,
-            "ma_20_50_spread": 0.0161,
-            "eps_q0": 50.3,
-            "eps_q1": 45.27,
-            "eps_q2": 40.24,
-            "eps_q3": 35.21,
-            "per": 24.31,
-            "roe": 8.16
-        },
-        {
-            "ticker": "ADM",
-            "name": "Archer Daniels Midland",
-            "industry": "Consumer Staples",
-            "ath": 98.88,
-            "lowest_after_ath": 40.98,
-            "price": 74.27,
-            "correction_ratio": 0.586,
-            "price_to_ath": 0.751,
-            "days_since_ath": 1472,
-            "ma_20_spread": 0.054,
-            "ma_50_spread": 0.063,
-            "ma_20_50_spread": 0.0086,
-            "eps_q0": -19.6,
-            "eps_q1": -17.64,
-            "eps_q2": -15.68,
-            "eps_q3": -13.72,
-            "per": 33.3,
-            "roe": 4.72
-        },
-        {
-            "ticker": "LII",
-            "name": "Lennox International",
-            "industry": "Industrials",
-            "ath": 689.44,
-            "lowest_after_ath": 434.06,
-            "price": 517.62,
-            "correction_ratio": 0.37,
-            "price_to_ath": 0.751,
-            "days_since_ath": 282,
-            "ma_20_spread": 0.0606,
-            "ma_50_spread": 0.0346,
-            "ma_20_50_spread": -0.0245,
-            "eps_q0": -19.7,
-            "eps_q1": -17.73,
-            "eps_q2": -15.76,
-            "eps_q3": -13.79,
-            "per": 22.71,
-            "roe": 75.83
-        },
-        {
-            "ticker": "LLY",
-            "name": "Lilly (Eli)",
-            "industry": "Health Care",
-            "ath": 1133.95,
-            "lowest_after_ath": 850.51,
-            "price": 851.21,
-            "correction_ratio": 0.25,
-            "price_to_ath": 0.751,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0709,
-            "ma_50_spread": -0.1045,
-            "ma_20_50_spread": -0.0362,
-            "eps_q0": 50.5,
-            "eps_q1": 45.45,
-            "eps_q2": 40.4,
-            "eps_q3": 35.35,
-            "per": 37.03,
-            "roe": 101.16
-        },
-        {
-            "ticker": "ALLE",
-            "name": "Allegion",
-            "industry": "Industrials",
-            "ath": 183.11,
-            "lowest_after_ath": 135.32,
-            "price": 137.37,
-            "correction_ratio": 0.261,
-            "price_to_ath": 0.75,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0436,
-            "ma_50_spread": -0.0727,
-            "ma_20_50_spread": -0.0304,
-            "eps_q0": -6.8,
-            "eps_q1": -6.12,
-            "eps_q2": -5.44,
-            "eps_q3": -4.76,
-            "per": 18.77,
-            "roe": 34.18
-        },
-        {
-            "ticker": "FTNT",
-            "name": "Fortinet",
-            "industry": "Information Technology",
-            "ath": 114.82,
-            "lowest_after_ath": 70.12,
-            "price": 86.11,
-            "correction_ratio": 0.389,
-            "price_to_ath": 0.75,
-            "days_since_ath": 436,
-            "ma_20_spread": 0.0429,
-            "ma_50_spread": 0.0534,
-            "ma_20_50_spread": 0.0101,
-            "eps_q0": -3.8,
-            "eps_q1": -3.42,
-            "eps_q2": -3.04,
-            "eps_q3": -2.66,
-            "per": 35.58,
-            "roe": 135.72
-        },
-        {
-            "ticker": "VZ",
-            "name": "Verizon",
-            "industry": "Communication Services",
-            "ath": 62.22,
-            "lowest_after_ath": 30.14,
-            "price": 46.61,
-            "correction_ratio": 0.516,
-            "price_to_ath": 0.749,
-            "days_since_ath": 2326,
-            "ma_20_spread": -0.0093,
-            "ma_50_spread": -0.0475,
-            "ma_20_50_spread": -0.0386,
-            "eps_q0": 3.4,
-            "eps_q1": 3.06,
-            "eps_q2": 2.72,
-            "eps_q3": 2.38,
-            "per": 11.37,
-            "roe": 17.2
-        },
-        {
-            "ticker": "SPGI",
-            "name": "S&P Global",
-            "industry": "Financials",
-            "ath": 579.05,
-            "lowest_after_ath": 381.61,
-            "price": 433.19,
-            "correction_ratio": 0.341,
-            "price_to_ath": 0.748,
-            "days_since_ath": 261,
-            "ma_20_spread": -0.0017,
-            "ma_50_spread": 0.0077,
-            "ma_20_50_spread": 0.0095,
-            "eps_q0": 28.0,
-            "eps_q1": 25.2,
-            "eps_q2": 22.4,
-            "eps_q3": 19.6,
-            "per": 27.38,
-            "roe": 13.94
-        },
-        {
-            "ticker": "XYL",
-            "name": "Xylem Inc.",
-            "industry": "Industrials",
-            "ath": 154.27,
-            "lowest_after_ath": 114.15,
-            "price": 115.4,
-            "correction_ratio": 0.26,
-            "price_to_ath": 0.748,
-            "days_since_ath": 184,
-            "ma_20_spread": -0.0655,
-            "ma_50_spread": -0.0669,
-            "ma_20_50_spread": -0.0015,
-            "eps_q0": 14.2,
-            "eps_q1": 12.78,
-            "eps_q2": 11.36,
-            "eps_q3": 9.94,
-            "per": 28.71,
-            "roe": 8.72
-        },
-        {
-            "ticker": "TSLA",
-            "name": "Tesla, Inc.",
-            "industry": "Consumer Discretionary",
-            "ath": 498.83,
-            "lowest_after_ath": 337.24,
-            "price": 372.8,
-            "correction_ratio": 0.324,
-            "price_to_ath": 0.747,
-            "days_since_ath": 128,
-            "ma_20_spread": 0.0047,
-            "ma_50_spread": -0.031,
-            "ma_20_50_spread": -0.0355,
-            "eps_q0": 16.6,
-            "eps_q1": 14.94,
-            "eps_q2": 13.28,
-            "eps_q3": 11.62,
-            "per": 342.02,
-            "roe": 4.9
-        },
-        {
-            "ticker": "BKNG",
-            "name": "Booking Holdings",
-            "industry": "Consumer Discretionary",
-            "ath": 233.58,
-            "lowest_after_ath": 150.62,
-            "price": 173.98,
-            "correction_ratio": 0.355,
-            "price_to_ath": 0.745,
-            "days_since_ath": 296,
-            "ma_20_spread": -0.0282,
-            "ma_50_spread": 0.0019,
-            "ma_20_50_spread": 0.0309,
-            "eps_q0": 33.7,
-            "eps_q1": 30.33,
-            "eps_q2": 26.96,
-            "eps_q3": 23.59,
-            "per": 26.28,
-            "roe": 0
-        },
-        {
-            "ticker": "J",
-            "name": "Jacobs Solutions",
-            "industry": "Industrials",
-            "ath": 168.44,
-            "lowest_after_ath": 120.73,
-            "price": 125.57,
-            "correction_ratio": 0.283,
-            "price_to_ath": 0.745,
-            "days_since_ath": 191,
-            "ma_20_spread": -0.0128,
-            "ma_50_spread": -0.0378,
-            "ma_20_50_spread": -0.0253,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 33.13,
-            "roe": 9.73
-        },
-        {
-            "ticker": "TPL",
-            "name": "Texas Pacific Land Corporation",
-            "industry": "Energy",
-            "ath": 589.71,
-            "lowest_after_ath": 269.23,
-            "price": 439.03,
-            "correction_ratio": 0.543,
-            "price_to_ath": 0.744,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0198,
-            "ma_50_spread": -0.0896,
-            "ma_20_50_spread": -0.1072,
-            "eps_q0": 4.2,
-            "eps_q1": 3.78,
-            "eps_q2": 3.36,
-            "eps_q3": 2.94,
-            "per": 62.9,
-            "roe": 37.15
-        },
-        {
-            "ticker": "UAL",
-            "name": "United Airlines Holdings",
-            "industry": "Industrials",
-            "ath": 119.21,
-            "lowest_after_ath": 84.64,
-            "price": 88.62,
-            "correction_ratio": 0.29,
-            "price_to_ath": 0.743,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0594,
-            "ma_50_spread": -0.0811,
-            "ma_20_50_spread": -0.023,
-            "eps_q0": 80.6,
-            "eps_q1": 72.54,
-            "eps_q2": 64.48,
-            "eps_q3": 56.42,
-            "per": 7.93,
-            "roe": 25.73
-        },
-        {
-            "ticker": "HST",
-            "name": "Host Hotels & Resorts",
-            "industry": "Real Estate",
-            "ath": 28.37,
-            "lowest_after_ath": 3.02,
-            "price": 21.06,
-            "correction_ratio": 0.894,
-            "price_to_ath": 0.742,
-            "days_since_ath": 7016,
-            "ma_20_spread": 0.0324,
-            "ma_50_spread": 0.064,
-            "ma_20_50_spread": 0.0307,
-            "eps_q0": 25.0,
-            "eps_q1": 22.5,
-            "eps_q2": 20.0,
-            "eps_q3": 17.5,
-            "per": 19.15,
-            "roe": 11.49
-        },
-        {
-            "ticker": "ULTA",
-            "name": "Ulta Beauty",
-            "industry": "Consumer Discretionary",
-            "ath": 714.97,
-            "lowest_after_ath": 499.32,
-            "price": 530.23,
-            "correction_ratio": 0.302,
-            "price_to_ath": 0.742,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0239,
-            "ma_50_spread": -0.086,
-            "ma_20_50_spread": -0.0637,
-            "eps_q0": -9.3,
-            "eps_q1": -8.37,
-            "eps_q2": -7.44,
-            "eps_q3": -6.51,
-            "per": 20.7,
-            "roe": 43.59
-        },
-        {
-            "ticker": "CARR",
-            "name": "Carrier Global",
-            "industry": "Industrials",
-            "ath": 83.32,
-            "lowest_after_ath": 50.24,
-            "price": 61.74,
-            "correction_ratio": 0.397,
-            "price_to_ath": 0.741,
-            "days_since_ath": 562,
-            "ma_20_spread": 0.0226,
-            "ma_50_spread": 0.0323,
-            "ma_20_50_spread": 0.0094,
-            "eps_q0": -97.9,
-            "eps_q1": -88.11,
-            "eps_q2": -78.32,
-            "eps_q3": -68.53,
-            "per": 36.53,
-            "roe": 10.93
-        },
-        {
-            "ticker": "HAS",
-            "name": "Hasbro",
-            "industry": "Consumer Discretionary",
-            "ath": 126.87,
-            "lowest_after_ath": 41.33,
-            "price": 94.02,
-            "correction_ratio": 0.674,
-            "price_to_ath": 0.741,
-            "days_since_ath": 2466,
-            "ma_20_spread": 0.0106,
-            "ma_50_spread": -0.004,
-            "ma_20_50_spread": -0.0145,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 14.83,
-            "roe": -36.35
-        },
-        {
-            "ticker": "NOC",
-            "name": "Northrop Grumman",
-            "industry": "Industrials",
-            "ath": 774.0,
-            "lowest_after_ath": 567.33,
-            "price": 572.41,
-            "correction_ratio": 0.267,
-            "price_to_ath": 0.74,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.1168,
-            "ma_50_spread": -0.1725,
-            "ma_20_50_spread": -0.0631,
-            "eps_q0": 81.9,
-            "eps_q1": 73.71,
-            "eps_q2": 65.52,
-            "eps_q3": 57.33,
-            "per": 17.94,
-            "roe": 28.51
-        },
-        {
-            "ticker": "PRU",
-            "name": "Prudential Financial",
-            "industry": "Financials",
-            "ath": 130.55,
-            "lowest_after_ath": 90.38,
-            "price": 96.42,
-            "correction_ratio": 0.308,
-            "price_to_ath": 0.739,
-            "days_since_ath": 520,
-            "ma_20_spread": -0.0115,
-            "ma_50_spread": -0.008,
-            "ma_20_50_spread": 0.0036,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.65,
-            "roe": 11.36
-        },
-        {
-            "ticker": "CVS",
-            "name": "CVS Health",
-            "industry": "Health Care",
-            "ath": 113.65,
-            "lowest_after_ath": 43.56,
-            "price": 83.9,
-            "correction_ratio": 0.617,
-            "price_to_ath": 0.738,
-            "days_since_ath": 3929,
-            "ma_20_spread": 0.0828,
-            "ma_50_spread": 0.0996,
-            "ma_20_50_spread": 0.0155,
-            "eps_q0": 79.0,
-            "eps_q1": 71.1,
-            "eps_q2": 63.2,
-            "eps_q3": 55.3,
-            "per": 60.36,
-            "roe": 2.29
-        },
-        {
-            "ticker": "SNPS",
-            "name": "Synopsys",
-            "industry": "Information Technology",
-            "ath": 651.73,
-            "lowest_after_ath": 376.18,
-            "price": 481.22,
-            "correction_ratio": 0.423,
-            "price_to_ath": 0.738,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0952,
-            "ma_50_spread": 0.1186,
-            "ma_20_50_spread": 0.0214,
-            "eps_q0": -78.0,
-            "eps_q1": -70.2,
-            "eps_q2": -62.4,
-            "eps_q3": -54.6,
-            "per": 73.69,
-            "roe": 5.54
-        },
-        {
-            "ticker": "ISRG",
-            "name": "Intuitive Surgical",
-            "industry": "Health Care",
-            "ath": 616.0,
-            "lowest_after_ath": 425.0,
-            "price": 453.83,
-            "correction_ratio": 0.31,
-            "price_to_ath": 0.737,
-            "days_since_ath": 464,
-            "ma_20_spread": -0.0203,
-            "ma_50_spread": -0.0479,
-            "ma_20_50_spread": -0.0282,
-            "eps_q0": 17.6,
-            "eps_q1": 15.84,
-            "eps_q2": 14.08,
-            "eps_q3": 12.32,
-            "per": 55.28,
-            "roe": 17.23
-        },
-        {
-            "ticker": "LMT",
-            "name": "Lockheed Martin",
-            "industry": "Industrials",
-            "ath": 692.0,
-            "lowest_after_ath": 501.95,
-            "price": 509.81,
-            "correction_ratio": 0.275,
-            "price_to_ath": 0.737,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.1286,
-            "ma_50_spread": -0.1786,
-            "ma_20_50_spread": -0.0573,
-            "eps_q0": -13.1,
-            "eps_q1": -11.79,
-            "eps_q2": -10.48,
-            "eps_q3": -9.17,
-            "per": 24.69,
-            "roe": 67.64
-        },
-        {
-            "ticker": "COF",
-            "name": "Capital One",
-            "industry": "Financials",
-            "ath": 259.64,
-            "lowest_after_ath": 174.98,
-            "price": 190.84,
-            "correction_ratio": 0.326,
-            "price_to_ath": 0.735,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0194,
-            "ma_50_spread": -0.0025,
-            "ma_20_50_spread": 0.0172,
-            "eps_q0": 54.8,
-            "eps_q1": 49.32,
-            "eps_q2": 43.84,
-            "eps_q3": 38.36,
-            "per": 58.72,
-            "roe": 3.26
-        },
-        {
-            "ticker": "HD",
-            "name": "Home Depot (The)",
-            "industry": "Consumer Discretionary",
-            "ath": 439.37,
-            "lowest_after_ath": 315.31,
-            "price": 322.81,
-            "correction_ratio": 0.282,
-            "price_to_ath": 0.735,
-            "days_since_ath": 520,
-            "ma_20_spread": -0.0383,
-            "ma_50_spread": -0.0658,
-            "ma_20_50_spread": -0.0286,
-            "eps_q0": -14.2,
-            "eps_q1": -12.78,
-            "eps_q2": -11.36,
-            "eps_q3": -9.94,
-            "per": 22.7,
-            "roe": 145.54
-        },
-        {
-            "ticker": "TFC",
-            "name": "Truist Financial",
-            "industry": "Financials",
-            "ath": 68.95,
-            "lowest_after_ath": 25.56,
-            "price": 50.65,
-            "correction_ratio": 0.629,
-            "price_to_ath": 0.735,
-            "days_since_ath": 1563,
-            "ma_20_spread": 0.0172,
-            "ma_50_spread": 0.0506,
-            "ma_20_50_spread": 0.0328,
-            "eps_q0": 17.4,
-            "eps_q1": 15.66,
-            "eps_q2": 13.92,
-            "eps_q3": 12.18,
-            "per": 12.54,
-            "roe": 8.58
-        },
-        {
-            "ticker": "IR",
-            "name": "Ingersoll Rand",
-            "industry": "Industrials",
-            "ath": 106.03,
-            "lowest_after_ath": 65.61,
-            "price": 77.46,
-            "correction_ratio": 0.381,
-            "price_to_ath": 0.731,
-            "days_since_ath": 520,
-            "ma_20_spread": -0.0713,
-            "ma_50_spread": -0.0959,
-            "ma_20_50_spread": -0.0265,
-            "eps_q0": 15.8,
-            "eps_q1": 14.22,
-            "eps_q2": 12.64,
-            "eps_q3": 11.06,
-            "per": 53.42,
-            "roe": 5.77
-        },
-        {
-            "ticker": "UBER",
-            "name": "Uber",
-            "industry": "Industrials",
-            "ath": 101.99,
-            "lowest_after_ath": 68.46,
-            "price": 74.47,
-            "correction_ratio": 0.329,
-            "price_to_ath": 0.73,
-            "days_since_ath": 219,
-            "ma_20_spread": 0.0045,
-            "ma_50_spread": 0.0077,
-            "ma_20_50_spread": 0.0032,
-            "eps_q0": -95.7,
-            "eps_q1": -86.13,
-            "eps_q2": -76.56,
-            "eps_q3": -66.99,
-            "per": 15.74,
-            "roe": 39.93
-        },
-        {
-            "ticker": "ESS",
-            "name": "Essex Property Trust",
-            "industry": "Real Estate",
-            "ath": 363.36,
-            "lowest_after_ath": 195.03,
-            "price": 264.92,
-            "correction_ratio": 0.463,
-            "price_to_ath": 0.729,
-            "days_since_ath": 1472,
-            "ma_20_spread": 0.0476,
-            "ma_50_spread": 0.0525,
-            "ma_20_50_spread": 0.0046,
-            "eps_q0": -68.7,
-            "eps_q1": -61.83,
-            "eps_q2": -54.96,
-            "eps_q3": -48.09,
-            "per": 25.5,
-            "roe": 12.23
-        },
-        {
-            "ticker": "TER",
-            "name": "Teradyne",
-            "industry": "Information Technology",
-            "ath": 422.11,
-            "lowest_after_ath": 301.86,
-            "price": 306.33,
-            "correction_ratio": 0.285,
-            "price_to_ath": 0.726,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.1541,
-            "ma_50_spread": -0.0679,
-            "ma_20_50_spread": 0.102,
-            "eps_q0": 75.9,
-            "eps_q1": 68.31,
-            "eps_q2": 60.72,
-            "eps_q3": 53.13,
-            "per": 88.53,
-            "roe": 19.73
-        },
-        {
-            "ticker": "JKHY",
-            "name": "Jack Henry & Associates",
-            "industry": "Financials",
-            "ath": 212.62,
-            "lowest_after_ath": 136.57,
-            "price": 153.75,
-            "correction_ratio": 0.358,
-            "price_to_ath": 0.723,
-            "days_since_ath": 1360,
-            "ma_20_spread": -0.0007,
-            "ma_50_spread": -0.035,
-            "ma_20_50_spread": -0.0344,
-            "eps_q0": 27.4,
-            "eps_q1": 24.66,
-            "eps_q2": 21.92,
-            "eps_q3": 19.18,
-            "per": 22.06,
-            "roe": 24.28
-        },
-        {
-            "ticker": "MTD",
-            "name": "Mettler Toledo",
-            "industry": "Health Care",
-            "ath": 1714.75,
-            "lowest_after_ath": 928.5,
-            "price": 1240.15,
-            "correction_ratio": 0.459,
-            "price_to_ath": 0.723,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.045,
-            "ma_50_spread": -0.0345,
-            "ma_20_50_spread": 0.011,
-            "eps_q0": 13.3,
-            "eps_q1": 11.97,
-            "eps_q2": 10.64,
-            "eps_q3": 9.31,
-            "per": 29.5,
-            "roe": 0
-        },
-        {
-            "ticker": "CEG",
-            "name": "Constellation Energy",
-            "industry": "Utilities",
-            "ath": 412.7,
-            "lowest_after_ath": 243.3,
-            "price": 297.0,
-            "correction_ratio": 0.41,
-            "price_to_ath": 0.72,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.0231,
-            "ma_50_spread": -0.0122,
-            "ma_20_50_spread": -0.0345,
-            "eps_q0": -49.3,
-            "eps_q1": -44.37,
-            "eps_q2": -39.44,
-            "eps_q3": -34.51,
-            "per": 40.14,
-            "roe": 16.36
-        },
-        {
-            "ticker": "IDXX",
-            "name": "Idexx Laboratories",
-            "industry": "Health Care",
-            "ath": 769.98,
-            "lowest_after_ath": 544.01,
-            "price": 553.66,
-            "correction_ratio": 0.293,
-            "price_to_ath": 0.719,
-            "days_since_ath": 156,
-            "ma_20_spread": -0.0353,
-            "ma_50_spread": -0.0652,
-            "ma_20_50_spread": -0.031,
-            "eps_q0": 14.8,
-            "eps_q1": 13.32,
-            "eps_q2": 11.84,
-            "eps_q3": 10.36,
-            "per": 42.36,
-            "roe": 66.2
-        },
-        {
-            "ticker": "OTIS",
-            "name": "Otis Worldwide",
-            "industry": "Industrials",
-            "ath": 106.83,
-            "lowest_after_ath": 75.27,
-            "price": 76.6,
-            "correction_ratio": 0.295,
-            "price_to_ath": 0.717,
-            "days_since_ath": 415,
-            "ma_20_spread": -0.0335,
-            "ma_50_spread": -0.0765,
-            "ma_20_50_spread": -0.0445,
-            "eps_q0": 39.9,
-            "eps_q1": 35.91,
-            "eps_q2": 31.92,
-            "eps_q3": 27.93,
-            "per": 20.37,
-            "roe": 0
-        },
-        {
-            "ticker": "TMUS",
-            "name": "T-Mobile US",
-            "industry": "Communication Services",
-            "ath": 276.49,
-            "lowest_after_ath": 181.36,
-            "price": 198.17,
-            "correction_ratio": 0.344,
-            "price_to_ath": 0.717,
-            "days_since_ath": 422,
-            "ma_20_spread": 0.017,
-            "ma_50_spread": -0.0415,
-            "ma_20_50_spread": -0.0575,
-            "eps_q0": -29.5,
-            "eps_q1": -26.55,
-            "eps_q2": -23.6,
-            "eps_q3": -20.65,
-            "per": 21.06,
-            "roe": 18.18
-        },
-        {
-            "ticker": "EXC",
-            "name": "Exelon",
-            "industry": "Utilities",
-            "ath": 65.71,
-            "lowest_after_ath": 17.9,
-            "price": 47.02,
-            "correction_ratio": 0.728,
-            "price_to_ath": 0.716,
-            "days_since_ath": 6505,
-            "ma_20_spread": -0.0158,
-            "ma_50_spread": -0.0263,
-            "ma_20_50_spread": -0.0106,
-            "eps_q0": -8.2,
-            "eps_q1": -7.38,
-            "eps_q2": -6.56,
-            "eps_q3": -5.74,
-            "per": 17.22,
-            "roe": 9.94
-        },
-        {
-            "ticker": "RF",
-            "name": "Regions Financial Corporation",
-            "industry": "Financials",
-            "ath": 39.15,
-            "lowest_after_ath": 2.35,
-            "price": 28.01,
-            "correction_ratio": 0.94,
-            "price_to_ath": 0.715,
-            "days_since_ath": 7142,
-            "ma_20_spread": 0.0105,
-            "ma_50_spread": 0.0286,
-            "ma_20_50_spread": 0.0179,
-            "eps_q0": 14.1,
-            "eps_q1": 12.69,
-            "eps_q2": 11.28,
-            "eps_q3": 9.87,
-            "per": 11.62,
-            "roe": 11.89
-        },
-        {
-            "ticker": "AVB",
-            "name": "AvalonBay Communities",
-            "industry": "Real Estate",
-            "ath": 259.05,
-            "lowest_after_ath": 153.07,
-            "price": 184.37,
-            "correction_ratio": 0.409,
-            "price_to_ath": 0.712,
-            "days_since_ath": 1493,
-            "ma_20_spread": 0.0735,
-            "ma_50_spread": 0.074,
-            "ma_20_50_spread": 0.0004,
-            "eps_q0": 37.7,
-            "eps_q1": 33.93,
-            "eps_q2": 30.16,
-            "eps_q3": 26.39,
-            "per": 22.85,
-            "roe": 9.72
-        },
-        {
-            "ticker": "KMI",
-            "name": "Kinder Morgan",
-            "industry": "Energy",
-            "ath": 44.71,
-            "lowest_after_ath": 9.42,
-            "price": 31.84,
-            "correction_ratio": 0.789,
-            "price_to_ath": 0.712,
-            "days_since_ath": 4027,
-            "ma_20_spread": -0.0105,
-            "ma_50_spread": -0.0309,
-            "ma_20_50_spread": -0.0207,
-            "eps_q0": 36.1,
-            "eps_q1": 32.49,
-            "eps_q2": 28.88,
-            "eps_q3": 25.27,
-            "per": 21.37,
-            "roe": 10.6
-        },
-        {
-            "ticker": "OMC",
-            "name": "Omnicom Group",
-            "industry": "Communication Services",
-            "ath": 107.0,
-            "lowest_after_ath": 66.33,
-            "price": 76.19,
-            "correction_ratio": 0.38,
-            "price_to_ath": 0.712,
-            "days_since_ath": 541,
-            "ma_20_spread": -0.0053,
-            "ma_50_spread": -0.0279,
-            "ma_20_50_spread": -0.0228,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 6.16,
-            "roe": 0.48
-        },
-        {
-            "ticker": "LDOS",
-            "name": "Leidos",
-            "industry": "Industrials",
-            "ath": 205.77,
-            "lowest_after_ath": 143.05,
-            "price": 145.91,
-            "correction_ratio": 0.305,
-            "price_to_ath": 0.709,
-            "days_since_ath": 177,
-            "ma_20_spread": -0.0511,
-            "ma_50_spread": -0.1065,
-            "ma_20_50_spread": -0.0584,
-            "eps_q0": 15.1,
-            "eps_q1": 13.59,
-            "eps_q2": 12.08,
-            "eps_q3": 10.57,
-            "per": 13.1,
-            "roe": 31.03
-        },
-        {
-            "ticker": "PNR",
-            "name": "Pentair",
-            "industry": "Industrials",
-            "ath": 113.95,
-            "lowest_after_ath": 80.5,
-            "price": 80.84,
-            "correction_ratio": 0.294,
-            "price_to_ath": 0.709,
-            "days_since_ath": 212,
-            "ma_20_spread": -0.0895,
-            "ma_50_spread": -0.1141,
-            "ma_20_50_spread": -0.027,
-            "eps_q0": 11.3,
-            "eps_q1": 10.17,
-            "eps_q2": 9.04,
-            "eps_q3": 7.91,
-            "per": 20.31,
-            "roe": 17.61
-        },
-        {
-            "ticker": "BMY",
-            "name": "Bristol Myers Squibb",
-            "industry": "Health Care",
-            "ath": 81.44,
-            "lowest_after_ath": 39.35,
-            "price": 57.59,
-            "correction_ratio": 0.517,
-            "price_to_ath": 0.707,
-            "days_since_ath": 1248,
-            "ma_20_spread": -0.0218,
-            "ma_50_spread": -0.0329,
-            "ma_20_50_spread": -0.0114,
-            "eps_q0": 1409.7,
-            "eps_q1": 1268.73,
-            "eps_q2": 1127.76,
-            "eps_q3": 986.79,
-            "per": 16.64,
-            "roe": 40.44
-        },
-        {
-            "ticker": "TDG",
-            "name": "TransDigm Group",
-            "industry": "Industrials",
-            "ath": 1623.83,
-            "lowest_after_ath": 1123.61,
-            "price": 1142.74,
-            "correction_ratio": 0.308,
-            "price_to_ath": 0.704,
-            "days_since_ath": 275,
-            "ma_20_spread": -0.0512,
-            "ma_50_spread": -0.0705,
-            "ma_20_50_spread": -0.0204,
-            "eps_q0": -9.7,
-            "eps_q1": -8.73,
-            "eps_q2": -7.76,
-            "eps_q3": -6.79,
-            "per": 36.82,
-            "roe": 0
-        },
-        {
-            "ticker": "RMD",
-            "name": "ResMed",
-            "industry": "Health Care",
-            "ath": 301.34,
-            "lowest_after_ath": 132.24,
-            "price": 211.93,
-            "correction_ratio": 0.561,
-            "price_to_ath": 0.703,
-            "days_since_ath": 1696,
-            "ma_20_spread": -0.0556,
-            "ma_50_spread": -0.0976,
-            "ma_20_50_spread": -0.0445,
-            "eps_q0": 13.9,
-            "eps_q1": 12.51,
-            "eps_q2": 11.12,
-            "eps_q3": 9.73,
-            "per": 20.94,
-            "roe": 25.68
-        },
-        {
-            "ticker": "VST",
-            "name": "Vistra Corp.",
-            "industry": "Utilities",
-            "ath": 219.82,
-            "lowest_after_ath": 138.53,
-            "price": 153.79,
-            "correction_ratio": 0.37,
-            "price_to_ath": 0.7,
-            "days_since_ath": 219,
-            "ma_20_spread": -0.0269,
-            "ma_50_spread": -0.043,
-            "ma_20_50_spread": -0.0165,
-            "eps_q0": -47.2,
-            "eps_q1": -42.48,
-            "eps_q2": -37.76,
-            "eps_q3": -33.04,
-            "per": 70.55,
-            "roe": 17.66
-        },
-        {
-            "ticker": "IBM",
-            "name": "IBM",
-            "industry": "Information Technology",
-            "ath": 324.9,
-            "lowest_after_ath": 220.72,
-            "price": 227.1,
-            "correction_ratio": 0.321,
-            "price_to_ath": 0.699,
-            "days_since_ath": 170,
-            "ma_20_spread": -0.0601,
-            "ma_50_spread": -0.0702,
-            "ma_20_50_spread": -0.0108,
-            "eps_q0": 15.3,
-            "eps_q1": 13.77,
-            "eps_q2": 12.24,
-            "eps_q3": 10.71,
-            "per": 20.1,
-            "roe": 35.77
-        },
-        {
-            "ticker": "AVY",
-            "name": "Avery Dennison",
-            "industry": "Materials",
-            "ath": 233.48,
-            "lowest_after_ath": 156.23,
-            "price": 162.95,
-            "correction_ratio": 0.331,
-            "price_to_ath": 0.698,
-            "days_since_ath": 646,
-            "ma_20_spread": -0.0379,
-            "ma_50_spread": -0.0703,
-            "ma_20_50_spread": -0.0336,
-            "eps_q0": 1.1,
-            "eps_q1": 0.99,
-            "eps_q2": 0.88,
-            "eps_q3": 0.77,
-            "per": 18.37,
-            "roe": 30.86
-        },
-        {
-            "ticker": "PSA",
-            "name": "Public Storage",
-            "industry": "Real Estate",
-            "ath": 421.76,
-            "lowest_after_ath": 233.18,
-            "price": 294.09,
-            "correction_ratio": 0.447,
-            "price_to_ath": 0.697,
-            "days_since_ath": 1472,
-            "ma_20_spread": -0.011,
-            "ma_50_spread": 0.0007,
-            "ma_20_50_spread": 0.0119,
-            "eps_q0": 29.1,
-            "eps_q1": 26.19,
-            "eps_q2": 23.28,
-            "eps_q3": 20.37,
-            "per": 30.35,
-            "roe": 20.18
-        },
-        {
-            "ticker": "AWK",
-            "name": "American Water Works",
-            "industry": "Utilities",
-            "ath": 189.65,
-            "lowest_after_ath": 113.34,
-            "price": 131.97,
-            "correction_ratio": 0.402,
-            "price_to_ath": 0.696,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0158,
-            "ma_50_spread": -0.0222,
-            "ma_20_50_spread": -0.0064,
-            "eps_q0": -0.4,
-            "eps_q1": -0.36,
-            "eps_q2": -0.32,
-            "eps_q3": -0.28,
-            "per": 23.19,
-            "roe": 10.5
-        },
-        {
-            "ticker": "EQR",
-            "name": "Equity Residential",
-            "industry": "Real Estate",
-            "ath": 94.32,
-            "lowest_after_ath": 52.57,
-            "price": 65.43,
-            "correction_ratio": 0.443,
-            "price_to_ath": 0.694,
-            "days_since_ath": 1472,
-            "ma_20_spread": 0.0605,
-            "ma_50_spread": 0.066,
-            "ma_20_50_spread": 0.0051,
-            "eps_q0": -8.8,
-            "eps_q1": -7.92,
-            "eps_q2": -7.04,
-            "eps_q3": -6.16,
-            "per": 22.26,
-            "roe": 10.02
-        },
-        {
-            "ticker": "RCL",
-            "name": "Royal Caribbean Group",
-            "industry": "Consumer Discretionary",
-            "ath": 366.5,
-            "lowest_after_ath": 244.45,
-            "price": 254.01,
-            "correction_ratio": 0.333,
-            "price_to_ath": 0.693,
-            "days_since_ath": 247,
-            "ma_20_spread": -0.0667,
-            "ma_50_spread": -0.0973,
-            "ma_20_50_spread": -0.0327,
-            "eps_q0": 36.6,
-            "eps_q1": 32.94,
-            "eps_q2": 29.28,
-            "eps_q3": 25.62,
-            "per": 16.27,
-            "roe": 47.73
-        },
-        {
-            "ticker": "TMO",
-            "name": "Thermo Fisher Scientific",
-            "industry": "Health Care",
-            "ath": 672.34,
-            "lowest_after_ath": 385.46,
-            "price": 466.26,
-            "correction_ratio": 0.427,
-            "price_to_ath": 0.693,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0661,
-            "ma_50_spread": -0.062,
-            "ma_20_50_spread": 0.0044,
-            "eps_q0": 9.6,
-            "eps_q1": 8.64,
-            "eps_q2": 7.68,
-            "eps_q3": 6.72,
-            "per": 25.62,
-            "roe": 13.52
-        },
-        {
-            "ticker": "SOLV",
-            "name": "Solventum",
-            "industry": "Health Care",
-            "ath": 96.05,
-            "lowest_after_ath": 47.16,
-            "price": 66.49,
-            "correction_ratio": 0.509,
-            "price_to_ath": 0.692,
-            "days_since_ath": 765,
-            "ma_20_spread": -0.0114,
-            "ma_50_spread": -0.0269,
-            "ma_20_50_spread": -0.0157,
-            "eps_q0": 103.2,
-            "eps_q1": 92.88,
-            "eps_q2": 82.56,
-            "eps_q3": 72.24,
-            "per": 7.49,
-            "roe": 38.86
-        },
-        {
-            "ticker": "ES",
-            "name": "Eversource Energy",
-            "industry": "Utilities",
-            "ath": 99.42,
-            "lowest_after_ath": 52.03,
-            "price": 68.72,
-            "correction_ratio": 0.477,
-            "price_to_ath": 0.691,
-            "days_since_ath": 2263,
-            "ma_20_spread": -0.0035,
-            "ma_50_spread": -0.0307,
-            "ma_20_50_spread": -0.0273,
-            "eps_q0": 481.0,
-            "eps_q1": 432.9,
-            "eps_q2": 384.8,
-            "eps_q3": 336.7,
-            "per": 15.07,
-            "roe": 10.78
-        },
-        {
-            "ticker": "AOS",
-            "name": "A. O. Smith",
-            "industry": "Industrials",
-            "ath": 92.45,
-            "lowest_after_ath": 58.83,
-            "price": 63.68,
-            "correction_ratio": 0.364,
-            "price_to_ath": 0.689,
-            "days_since_ath": 653,
-            "ma_20_spread": -0.021,
-            "ma_50_spread": -0.0675,
-            "ma_20_50_spread": -0.0474,
-            "eps_q0": 14.3,
-            "eps_q1": 12.87,
-            "eps_q2": 11.44,
-            "eps_q3": 10.01,
-            "per": 16.54,
-            "roe": 29.2
-        },
-        {
-            "ticker": "MRSH",
-            "name": "Marsh McLennan",
-            "industry": "Financials",
-            "ath": 248.0,
-            "lowest_after_ath": 164.89,
-            "price": 170.83,
-            "correction_ratio": 0.335,
-            "price_to_ath": 0.689,
-            "days_since_ath": 394,
-            "ma_20_spread": -0.017,
-            "ma_50_spread": -0.0285,
-            "ma_20_50_spread": -0.0117,
-            "eps_q0": -17.0,
-            "eps_q1": -15.3,
-            "eps_q2": -13.6,
-            "eps_q3": -11.9,
-            "per": 21.38,
-            "roe": 27.57
-        },
-        {
-            "ticker": "D",
-            "name": "Dominion Energy",
-            "industry": "Utilities",
-            "ath": 90.89,
-            "lowest_after_ath": 39.18,
-            "price": 62.5,
-            "correction_ratio": 0.569,
-            "price_to_ath": 0.688,
-            "days_since_ath": 2256,
-            "ma_20_spread": -0.002,
-            "ma_50_spread": -0.0017,
-            "ma_20_50_spread": 0.0003,
-            "eps_q0": 323.1,
-            "eps_q1": 290.79,
-            "eps_q2": 258.48,
-            "eps_q3": 226.17,
-            "per": 18.01,
-            "roe": 9.74
-        },
-        {
-            "ticker": "NFLX",
-            "name": "Netflix",
-            "industry": "Communication Services",
-            "ath": 134.12,
-            "lowest_after_ath": 75.01,
-            "price": 92.12,
-            "correction_ratio": 0.441,
-            "price_to_ath": 0.687,
-            "days_since_ath": 303,
-            "ma_20_spread": -0.0602,
-            "ma_50_spread": -0.0207,
-            "ma_20_50_spread": 0.042,
-            "eps_q0": 82.8,
-            "eps_q1": 74.52,
-            "eps_q2": 66.24,
-            "eps_q3": 57.96,
-            "per": 29.72,
-            "roe": 48.49
-        },
-        {
-            "ticker": "TRMB",
-            "name": "Trimble Inc.",
-            "industry": "Information Technology",
-            "ath": 96.49,
-            "lowest_after_ath": 39.57,
-            "price": 66.28,
-            "correction_ratio": 0.59,
-            "price_to_ath": 0.687,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.0075,
-            "ma_50_spread": -0.0094,
-            "ma_20_50_spread": -0.0019,
-            "eps_q0": 73.6,
-            "eps_q1": 66.24,
-            "eps_q2": 58.88,
-            "eps_q3": 51.52,
-            "per": 37.66,
-            "roe": 7.32
-        },
-        {
-            "ticker": "BKR",
-            "name": "Baker Hughes",
-            "industry": "Energy",
-            "ath": 100.29,
-            "lowest_after_ath": 9.12,
-            "price": 68.81,
-            "correction_ratio": 0.909,
-            "price_to_ath": 0.686,
-            "days_since_ath": 6771,
-            "ma_20_spread": 0.095,
-            "ma_50_spread": 0.1134,
-            "ma_20_50_spread": 0.0169,
-            "eps_q0": 131.3,
-            "eps_q1": 118.17,
-            "eps_q2": 105.04,
-            "eps_q3": 91.91,
-            "per": 21.98,
-            "roe": 17.18
-        },
-        {
-            "ticker": "ADSK",
-            "name": "Autodesk",
-            "industry": "Information Technology",
-            "ath": 344.39,
-            "lowest_after_ath": 163.2,
-            "price": 235.87,
-            "correction_ratio": 0.526,
-            "price_to_ath": 0.685,
-            "days_since_ath": 1710,
-            "ma_20_spread": -0.002,
-            "ma_50_spread": -0.0189,
-            "ma_20_50_spread": -0.017,
-            "eps_q0": 4.3,
-            "eps_q1": 3.87,
-            "eps_q2": 3.44,
-            "eps_q3": 3.01,
-            "per": 45.01,
-            "roe": 39.67
-        },
-        {
-            "ticker": "PGR",
-            "name": "Progressive Corporation",
-            "industry": "Financials",
-            "ath": 292.99,
-            "lowest_after_ath": 192.02,
-            "price": 200.66,
-            "correction_ratio": 0.345,
-            "price_to_ath": 0.685,
-            "days_since_ath": 408,
-            "ma_20_spread": 0.0025,
-            "ma_50_spread": -0.0135,
-            "ma_20_50_spread": -0.016,
-            "eps_q0": 9.8,
-            "eps_q1": 8.82,
-            "eps_q2": 7.84,
-            "eps_q3": 6.86,
-            "per": 10.21,
-            "roe": 37.9
-        },
-        {
-            "ticker": "HSY",
-            "name": "Hershey Company (The)",
-            "industry": "Consumer Staples",
-            "ath": 276.88,
-            "lowest_after_ath": 140.13,
-            "price": 189.16,
-            "correction_ratio": 0.494,
-            "price_to_ath": 0.683,
-            "days_since_ath": 1094,
-            "ma_20_spread": -0.0382,
-            "ma_50_spread": -0.1044,
-            "ma_20_50_spread": -0.0689,
-            "eps_q0": -59.8,
-            "eps_q1": -53.82,
-            "eps_q2": -47.84,
-            "eps_q3": -41.86,
-            "per": 43.59,
-            "roe": 18.89
-        },
-        {
-            "ticker": "UHS",
-            "name": "Universal Health Services",
-            "industry": "Health Care",
-            "ath": 246.33,
-            "lowest_after_ath": 159.0,
-            "price": 167.97,
-            "correction_ratio": 0.355,
-            "price_to_ath": 0.682,
-            "days_since_ath": 156,
-            "ma_20_spread": -0.0624,
-            "ma_50_spread": -0.1226,
-            "ma_20_50_spread": -0.0642,
-            "eps_q0": 10.1,
-            "eps_q1": 9.09,
-            "eps_q2": 8.08,
-            "eps_q3": 7.07,
-            "per": 7.02,
-            "roe": 21.37
-        },
-        {
-            "ticker": "WAT",
-            "name": "Waters Corporation",
-            "industry": "Health Care",
-            "ath": 428.22,
-            "lowest_after_ath": 231.9,
-            "price": 292.13,
-            "correction_ratio": 0.458,
-            "price_to_ath": 0.682,
-            "days_since_ath": 1696,
-            "ma_20_spread": -0.0754,
-            "ma_50_spread": -0.0589,
-            "ma_20_50_spread": 0.0178,
-            "eps_q0": -2.7,
-            "eps_q1": -2.43,
-            "eps_q2": -2.16,
-            "eps_q3": -1.89,
-            "per": 27.12,
-            "roe": 29.28
-        },
-        {
-            "ticker": "QCOM",
-            "name": "Qualcomm",
-            "industry": "Information Technology",
-            "ath": 230.63,
-            "lowest_after_ath": 120.8,
-            "price": 156.0,
-            "correction_ratio": 0.476,
-            "price_to_ath": 0.676,
-            "days_since_ath": 681,
-            "ma_20_spread": 0.1542,
-            "ma_50_spread": 0.1534,
-            "ma_20_50_spread": -0.0007,
-            "eps_q0": -5.5,
-            "eps_q1": -4.95,
-            "eps_q2": -4.4,
-            "eps_q3": -3.85,
-            "per": 31.39,
-            "roe": 21.48
-        },
-        {
-            "ticker": "PLTR",
-            "name": "Palantir Technologies",
-            "industry": "Information Technology",
-            "ath": 207.52,
-            "lowest_after_ath": 122.68,
-            "price": 137.97,
-            "correction_ratio": 0.409,
-            "price_to_ath": 0.665,
-            "days_since_ath": 177,
-            "ma_20_spread": -0.0294,
-            "ma_50_spread": -0.048,
-            "ma_20_50_spread": -0.0191,
-            "eps_q0": 670.4,
-            "eps_q1": 603.36,
-            "eps_q2": 536.32,
-            "eps_q3": 469.28,
-            "per": 215.58,
-            "roe": 25.98
-        },
-        {
-            "ticker": "DDOG",
-            "name": "Datadog",
-            "industry": "Information Technology",
-            "ath": 201.69,
-            "lowest_after_ath": 98.01,
-            "price": 133.98,
-            "correction_ratio": 0.514,
-            "price_to_ath": 0.664,
-            "days_since_ath": 170,
-            "ma_20_spread": 0.0976,
-            "ma_50_spread": 0.1064,
-            "ma_20_50_spread": 0.008,
-            "eps_q0": 2.1,
-            "eps_q1": 1.89,
-            "eps_q2": 1.68,
-            "eps_q3": 1.47,
-            "per": 418.69,
-            "roe": 3.34
-        },
-        {
-            "ticker": "ELV",
-            "name": "Elevance Health",
-            "industry": "Health Care",
-            "ath": 567.26,
-            "lowest_after_ath": 273.71,
-            "price": 376.63,
-            "correction_ratio": 0.517,
-            "price_to_ath": 0.664,
-            "days_since_ath": 604,
-            "ma_20_spread": 0.1585,
-            "ma_50_spread": 0.2108,
-            "ma_20_50_spread": 0.0451,
-            "eps_q0": -19.2,
-            "eps_q1": -17.28,
-            "eps_q2": -15.36,
-            "eps_q3": -13.44,
-            "per": 15.95,
-            "roe": 12.09
-        },
-        {
-            "ticker": "MMM",
-            "name": "3M",
-            "industry": "Industrials",
-            "ath": 217.2,
-            "lowest_after_ath": 71.36,
-            "price": 143.87,
-            "correction_ratio": 0.671,
-            "price_to_ath": 0.662,
-            "days_since_ath": 3019,
-            "ma_20_spread": -0.0287,
-            "ma_50_spread": -0.0516,
-            "ma_20_50_spread": -0.0236,
-            "eps_q0": -41.5,
-            "eps_q1": -37.35,
-            "eps_q2": -33.2,
-            "eps_q3": -29.05,
-            "per": 27.77,
-            "roe": 71.46
-        },
-        {
-            "ticker": "SW",
-            "name": "Smurfit Westrock",
-            "industry": "Materials",
-            "ath": 60.07,
-            "lowest_after_ath": 26.17,
-            "price": 39.68,
-            "correction_ratio": 0.564,
-            "price_to_ath": 0.661,
-            "days_since_ath": 1717,
-            "ma_20_spread": -0.0306,
-            "ma_50_spread": -0.0553,
-            "ma_20_50_spread": -0.0255,
-            "eps_q0": -33.6,
-            "eps_q1": -30.24,
-            "eps_q2": -26.88,
-            "eps_q3": -23.52,
-            "per": 29.83,
-            "roe": 3.91
-        },
-        {
-            "ticker": "HBAN",
-            "name": "Huntington Bancshares",
-            "industry": "Financials",
-            "ath": 24.97,
-            "lowest_after_ath": 1.0,
-            "price": 16.31,
-            "correction_ratio": 0.96,
-            "price_to_ath": 0.653,
-            "days_since_ath": 7079,
-            "ma_20_spread": -0.0103,
-            "ma_50_spread": 0.0012,
-            "ma_20_50_spread": 0.0115,
-            "eps_q0": -0.8,
-            "eps_q1": -0.72,
-            "eps_q2": -0.64,
-            "eps_q3": -0.56,
-            "per": 12.55,
-            "roe": 8.39
-        },
-        {
-            "ticker": "ADP",
-            "name": "Automatic Data Processing",
-            "industry": "Industrials",
-            "ath": 329.93,
-            "lowest_after_ath": 188.16,
-            "price": 215.06,
-            "correction_ratio": 0.43,
-            "price_to_ath": 0.652,
-            "days_since_ath": 331,
-            "ma_20_spread": 0.0752,
-            "ma_50_spread": 0.0388,
-            "ma_20_50_spread": -0.0338,
-            "eps_q0": 10.3,
-            "eps_q1": 9.27,
-            "eps_q2": 8.24,
-            "eps_q3": 7.21,
-            "per": 20.64,
-            "roe": 73.84
-        },
-        {
-            "ticker": "FRT",
-            "name": "Federal Realty Investment Trust",
-            "industry": "Real Estate",
-            "ath": 171.08,
-            "lowest_after_ath": 64.11,
-            "price": 110.61,
-            "correction_ratio": 0.625,
-            "price_to_ath": 0.647,
-            "days_since_ath": 3565,
-            "ma_20_spread": 0.0089,
-            "ma_50_spread": 0.0267,
-            "ma_20_50_spread": 0.0177,
-            "eps_q0": 98.0,
-            "eps_q1": 88.2,
-            "eps_q2": 78.4,
-            "eps_q3": 68.6,
-            "per": 23.63,
-            "roe": 12.23
-        },
-        {
-            "ticker": "INCY",
-            "name": "Incyte",
-            "industry": "Health Care",
-            "ath": 153.15,
-            "lowest_after_ath": 50.27,
-            "price": 99.1,
-            "correction_ratio": 0.672,
-            "price_to_ath": 0.647,
-            "days_since_ath": 3334,
-            "ma_20_spread": 0.0303,
-            "ma_50_spread": 0.0325,
-            "ma_20_50_spread": 0.0021,
-            "eps_q0": 91.7,
-            "eps_q1": 82.53,
-            "eps_q2": 73.36,
-            "eps_q3": 64.19,
-            "per": 15.46,
-            "roe": 30.82
-        },
-        {
-            "ticker": "APO",
-            "name": "Apollo Global Management",
-            "industry": "Financials",
-            "ath": 189.49,
-            "lowest_after_ath": 99.56,
-            "price": 122.28,
-            "correction_ratio": 0.475,
-            "price_to_ath": 0.645,
-            "days_since_ath": 506,
-            "ma_20_spread": 0.0453,
-            "ma_50_spread": 0.081,
-            "ma_20_50_spread": 0.0342,
-            "eps_q0": -54.0,
-            "eps_q1": -48.6,
-            "eps_q2": -43.2,
-            "eps_q3": -37.8,
-            "per": 22.07,
-            "roe": 14.7
-        },
-        {
-            "ticker": "BDX",
-            "name": "Becton Dickinson",
-            "industry": "Health Care",
-            "ath": 225.88,
-            "lowest_after_ath": 127.59,
-            "price": 145.31,
-            "correction_ratio": 0.435,
-            "price_to_ath": 0.643,
-            "days_since_ath": 1010,
-            "ma_20_spread": -0.0598,
-            "ma_50_spread": -0.1028,
-            "ma_20_50_spread": -0.0458,
-            "eps_q0": 26.1,
-            "eps_q1": 23.49,
-            "eps_q2": 20.88,
-            "eps_q3": 18.27,
-            "per": 23.74,
-            "roe": 6.96
-        },
-        {
-            "ticker": "ABT",
-            "name": "Abbott Laboratories",
-            "industry": "Health Care",
-            "ath": 142.6,
-            "lowest_after_ath": 89.67,
-            "price": 91.33,
-            "correction_ratio": 0.371,
-            "price_to_ath": 0.64,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.065,
-            "ma_50_spread": -0.1299,
-            "ma_20_50_spread": -0.0694,
-            "eps_q0": -18.7,
-            "eps_q1": -16.83,
-            "eps_q2": -14.96,
-            "eps_q3": -13.09,
-            "per": 25.58,
-            "roe": 0
-        },
-        {
-            "ticker": "ABNB",
-            "name": "Airbnb",
-            "industry": "Consumer Discretionary",
-            "ath": 219.94,
-            "lowest_after_ath": 81.91,
-            "price": 140.28,
-            "correction_ratio": 0.628,
-            "price_to_ath": 0.638,
-            "days_since_ath": 1906,
-            "ma_20_spread": 0.0361,
-            "ma_50_spread": 0.0608,
-            "ma_20_50_spread": 0.0239,
-            "eps_q0": -26.0,
-            "eps_q1": -23.4,
-            "eps_q2": -20.8,
-            "eps_q3": -18.2,
-            "per": 34.81,
-            "roe": 30.23
-        },
-        {
-            "ticker": "TSN",
-            "name": "Tyson Foods",
-            "industry": "Consumer Staples",
-            "ath": 100.72,
-            "lowest_after_ath": 44.94,
-            "price": 63.58,
-            "correction_ratio": 0.554,
-            "price_to_ath": 0.631,
-            "days_since_ath": 1542,
-            "ma_20_spread": -0.0129,
-            "ma_50_spread": 0.008,
-            "ma_20_50_spread": 0.0212,
-            "eps_q0": -76.3,
-            "eps_q1": -68.67,
-            "eps_q2": -61.04,
-            "eps_q3": -53.41,
-            "per": 113.54,
-            "roe": 1.26
-        },
-        {
-            "ticker": "GEHC",
-            "name": "GE HealthCare",
-            "industry": "Health Care",
-            "ath": 94.8,
-            "lowest_after_ath": 57.65,
-            "price": 59.49,
-            "correction_ratio": 0.392,
-            "price_to_ath": 0.627,
-            "days_since_ath": 443,
-            "ma_20_spread": -0.1664,
-            "ma_50_spread": -0.1958,
-            "ma_20_50_spread": -0.0353,
-            "eps_q0": -18.3,
-            "eps_q1": -16.47,
-            "eps_q2": -14.64,
-            "eps_q3": -12.81,
-            "per": 13.07,
-            "roe": 22.38
-        },
-        {
-            "ticker": "PTC",
-            "name": "PTC Inc.",
-            "industry": "Information Technology",
-            "ath": 219.69,
-            "lowest_after_ath": 130.89,
-            "price": 137.5,
-            "correction_ratio": 0.404,
-            "price_to_ath": 0.626,
-            "days_since_ath": 275,
-            "ma_20_spread": -0.0105,
-            "ma_50_spread": -0.0688,
-            "ma_20_50_spread": -0.059,
-            "eps_q0": 102.5,
-            "eps_q1": 92.25,
-            "eps_q2": 82.0,
-            "eps_q3": 71.75,
-            "per": 20.25,
-            "roe": 23.14
-        },
-        {
-            "ticker": "NVR",
-            "name": "NVR, Inc.",
-            "industry": "Consumer Discretionary",
-            "ath": 9964.77,
-            "lowest_after_ath": 6195.17,
-            "price": 6207.5,
-            "correction_ratio": 0.378,
-            "price_to_ath": 0.623,
-            "days_since_ath": 562,
-            "ma_20_spread": -0.0727,
-            "ma_50_spread": -0.0899,
-            "ma_20_50_spread": -0.0185,
-            "eps_q0": -33.8,
-            "eps_q1": -30.42,
-            "eps_q2": -27.04,
-            "eps_q3": -23.66,
-            "per": 15.15,
-            "roe": 33.26
-        },
-        {
-            "ticker": "WST",
-            "name": "West Pharmaceutical Services",
-            "industry": "Health Care",
-            "ath": 475.35,
-            "lowest_after_ath": 187.43,
-            "price": 295.36,
-            "correction_ratio": 0.606,
-            "price_to_ath": 0.621,
-            "days_since_ath": 1696,
-            "ma_20_spread": 0.0789,
-            "ma_50_spread": 0.1542,
-            "ma_20_50_spread": 0.0698,
-            "eps_q0": 54.6,
-            "eps_q1": 49.14,
-            "eps_q2": 43.68,
-            "eps_q3": 38.22,
-            "per": 39.49,
-            "roe": 19.13
-        },
-        {
-            "ticker": "A",
-            "name": "Agilent Technologies",
-            "industry": "Health Care",
-            "ath": 179.57,
-            "lowest_after_ath": 96.43,
-            "price": 111.3,
-            "correction_ratio": 0.463,
-            "price_to_ath": 0.62,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.0484,
-            "ma_50_spread": -0.0472,
-            "ma_20_50_spread": 0.0013,
-            "eps_q0": -4.1,
-            "eps_q1": -3.69,
-            "eps_q2": -3.28,
-            "eps_q3": -2.87,
-            "per": 24.57,
-            "roe": 19.95
-        },
-        {
-            "ticker": "KVUE",
-            "name": "Kenvue",
-            "industry": "Consumer Staples",
-            "ath": 27.8,
-            "lowest_after_ath": 14.02,
-            "price": 17.23,
-            "correction_ratio": 0.496,
-            "price_to_ath": 0.62,
-            "days_since_ath": 1080,
-            "ma_20_spread": -0.0073,
-            "ma_50_spread": -0.0309,
-            "ma_20_50_spread": -0.0237,
-            "eps_q0": 12.6,
-            "eps_q1": 11.34,
-            "eps_q2": 10.08,
-            "eps_q3": 8.82,
-            "per": 22.67,
-            "roe": 14.39
-        },
-        {
-            "ticker": "EXR",
-            "name": "Extra Space Storage",
-            "industry": "Real Estate",
-            "ath": 228.84,
-            "lowest_after_ath": 101.19,
-            "price": 140.53,
-            "correction_ratio": 0.558,
-            "price_to_ath": 0.614,
-            "days_since_ath": 1584,
-            "ma_20_spread": 0.0052,
-            "ma_50_spread": -0.0019,
-            "ma_20_50_spread": -0.007,
-            "eps_q0": 9.5,
-            "eps_q1": 8.55,
-            "eps_q2": 7.6,
-            "eps_q3": 6.65,
-            "per": 30.68,
-            "roe": 7.01
-        },
-        {
-            "ticker": "INVH",
-            "name": "Invitation Homes",
-            "industry": "Real Estate",
-            "ath": 45.8,
-            "lowest_after_ath": 24.25,
-            "price": 28.07,
-            "correction_ratio": 0.471,
-            "price_to_ath": 0.613,
-            "days_since_ath": 1584,
-            "ma_20_spread": 0.0587,
-            "ma_50_spread": 0.0837,
-            "ma_20_50_spread": 0.0237,
-            "eps_q0": 1.0,
-            "eps_q1": 0.9,
-            "eps_q2": 0.8,
-            "eps_q3": 0.7,
-            "per": 29.24,
-            "roe": 6.09
-        },
-        {
-            "ticker": "IVZ",
-            "name": "Invesco",
-            "industry": "Financials",
-            "ath": 42.05,
-            "lowest_after_ath": 6.38,
-            "price": 25.64,
-            "correction_ratio": 0.848,
-            "price_to_ath": 0.61,
-            "days_since_ath": 4020,
-            "ma_20_spread": 0.0436,
-            "ma_50_spread": 0.0432,
-            "ma_20_50_spread": -0.0004,
-            "eps_q0": 16.6,
-            "eps_q1": 14.94,
-            "eps_q2": 13.28,
-            "eps_q3": 11.62,
-            "per": 8.9,
-            "roe": -1.54
-        },
-        {
-            "ticker": "DHR",
-            "name": "Danaher Corporation",
-            "industry": "Health Care",
-            "ath": 296.06,
-            "lowest_after_ath": 171.0,
-            "price": 178.8,
-            "correction_ratio": 0.422,
-            "price_to_ath": 0.604,
-            "days_since_ath": 1696,
-            "ma_20_spread": -0.0573,
-            "ma_50_spread": -0.0798,
-            "ma_20_50_spread": -0.0239,
-            "eps_q0": 7.9,
-            "eps_q1": 7.11,
-            "eps_q2": 6.32,
-            "eps_q3": 5.53,
-            "per": 34.72,
-            "roe": 7.08
-        },
-        {
-            "ticker": "AJG",
-            "name": "Arthur J. Gallagher & Co.",
-            "industry": "Financials",
-            "ath": 351.23,
-            "lowest_after_ath": 195.0,
-            "price": 211.81,
-            "correction_ratio": 0.445,
-            "price_to_ath": 0.603,
-            "days_since_ath": 331,
-            "ma_20_spread": -0.0325,
-            "ma_50_spread": -0.0258,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": -41.6,
-            "eps_q1": -37.44,
-            "eps_q2": -33.28,
-            "eps_q3": -29.12,
-            "per": 36.9,
-            "roe": 6.91
-        },
-        {
-            "ticker": "FSLR",
-            "name": "First Solar",
-            "industry": "Information Technology",
-            "ath": 317.0,
-            "lowest_after_ath": 11.43,
-            "price": 190.61,
-            "correction_ratio": 0.964,
-            "price_to_ath": 0.601,
-            "days_since_ath": 6561,
-            "ma_20_spread": -0.0235,
-            "ma_50_spread": -0.0467,
-            "ma_20_50_spread": -0.0238,
-            "eps_q0": 32.5,
-            "eps_q1": 29.25,
-            "eps_q2": 26.0,
-            "eps_q3": 22.75,
-            "per": 13.4,
-            "roe": 17.45
-        },
-        {
-            "ticker": "LYB",
-            "name": "LyondellBasell",
-            "industry": "Materials",
-            "ath": 121.95,
-            "lowest_after_ath": 33.71,
-            "price": 73.29,
-            "correction_ratio": 0.724,
-            "price_to_ath": 0.601,
-            "days_since_ath": 3012,
-            "ma_20_spread": -0.001,
-            "ma_50_spread": 0.0502,
-            "ma_20_50_spread": 0.0512,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 12.85,
-            "roe": -6.95
-        },
-        {
-            "ticker": "KMB",
-            "name": "Kimberly-Clark",
-            "industry": "Consumer Staples",
-            "ath": 160.16,
-            "lowest_after_ath": 92.42,
-            "price": 96.1,
-            "correction_ratio": 0.423,
-            "price_to_ath": 0.6,
-            "days_since_ath": 2088,
-            "ma_20_spread": -0.0112,
-            "ma_50_spread": -0.0463,
-            "ma_20_50_spread": -0.0355,
-            "eps_q0": 17.3,
-            "eps_q1": 15.57,
-            "eps_q2": 13.84,
-            "eps_q3": 12.11,
-            "per": 18.59,
-            "roe": 111.73
-        },
-        {
-            "ticker": "ROP",
-            "name": "Roper Technologies",
-            "industry": "Information Technology",
-            "ath": 595.17,
-            "lowest_after_ath": 313.07,
-            "price": 355.97,
-            "correction_ratio": 0.474,
-            "price_to_ath": 0.598,
-            "days_since_ath": 422,
-            "ma_20_spread": -0.0031,
-            "ma_50_spread": 0.0091,
-            "ma_20_50_spread": 0.0122,
-            "eps_q0": 53.7,
-            "eps_q1": 48.33,
-            "eps_q2": 42.96,
-            "eps_q3": 37.59,
-            "per": 22.23,
-            "roe": 9.01
-        },
-        {
-            "ticker": "BX",
-            "name": "Blackstone Inc.",
-            "industry": "Financials",
-            "ath": 200.96,
-            "lowest_after_ath": 101.73,
-            "price": 119.83,
-            "correction_ratio": 0.494,
-            "price_to_ath": 0.596,
-            "days_since_ath": 520,
-            "ma_20_spread": -0.0138,
-            "ma_50_spread": 0.0296,
-            "ma_20_50_spread": 0.044,
-            "eps_q0": 5.7,
-            "eps_q1": 5.13,
-            "eps_q2": 4.56,
-            "eps_q3": 3.99,
-            "per": 30.73,
-            "roe": 29.53
-        },
-        {
-            "ticker": "APP",
-            "name": "AppLovin",
-            "industry": "Information Technology",
-            "ath": 745.61,
-            "lowest_after_ath": 359.0,
-            "price": 443.43,
-            "correction_ratio": 0.519,
-            "price_to_ath": 0.595,
-            "days_since_ath": 212,
-            "ma_20_spread": 0.0169,
-            "ma_50_spread": 0.0137,
-            "ma_20_50_spread": -0.0032,
-            "eps_q0": 84.0,
-            "eps_q1": 75.6,
-            "eps_q2": 67.2,
-            "eps_q3": 58.8,
-            "per": 44.08,
-            "roe": 212.94
-        },
-        {
-            "ticker": "SJM",
-            "name": "J.M. Smucker Company (The)",
-            "industry": "Consumer Staples",
-            "ath": 163.07,
-            "lowest_after_ath": 88.25,
-            "price": 96.8,
-            "correction_ratio": 0.459,
-            "price_to_ath": 0.594,
-            "days_since_ath": 1213,
-            "ma_20_spread": 0.0235,
-            "ma_50_spread": -0.0436,
-            "ma_20_50_spread": -0.0656,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.64,
-            "roe": -20.68
-        },
-        {
-            "ticker": "DASH",
-            "name": "DoorDash",
-            "industry": "Consumer Discretionary",
-            "ath": 285.5,
-            "lowest_after_ath": 143.3,
-            "price": 169.33,
-            "correction_ratio": 0.498,
-            "price_to_ath": 0.593,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.0032,
-            "ma_50_spread": 0.011,
-            "ma_20_50_spread": 0.0077,
-            "eps_q0": 51.1,
-            "eps_q1": 45.99,
-            "eps_q2": 40.88,
-            "eps_q3": 35.77,
-            "per": 79.5,
-            "roe": 10.44
-        },
-        {
-            "ticker": "UDR",
-            "name": "UDR, Inc.",
-            "industry": "Real Estate",
-            "ath": 61.06,
-            "lowest_after_ath": 30.95,
-            "price": 36.16,
-            "correction_ratio": 0.493,
-            "price_to_ath": 0.592,
-            "days_since_ath": 1577,
-            "ma_20_spread": 0.0339,
-            "ma_50_spread": 0.0138,
-            "ma_20_50_spread": -0.0194,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 32.0,
-            "roe": 9.38
-        },
-        {
-            "ticker": "BR",
-            "name": "Broadridge Financial Solutions",
-            "industry": "Industrials",
-            "ath": 271.91,
-            "lowest_after_ath": 150.1,
-            "price": 160.75,
-            "correction_ratio": 0.448,
-            "price_to_ath": 0.591,
-            "days_since_ath": 268,
-            "ma_20_spread": 0.01,
-            "ma_50_spread": -0.0546,
-            "ma_20_50_spread": -0.064,
-            "eps_q0": 99.9,
-            "eps_q1": 89.91,
-            "eps_q2": 79.92,
-            "eps_q3": 69.93,
-            "per": 17.78,
-            "roe": 41.79
-        },
-        {
-            "ticker": "UNH",
-            "name": "UnitedHealth Group",
-            "industry": "Health Care",
-            "ath": 630.73,
-            "lowest_after_ath": 234.6,
-            "price": 370.74,
-            "correction_ratio": 0.628,
-            "price_to_ath": 0.588,
-            "days_since_ath": 534,
-            "ma_20_spread": 0.147,
-            "ma_50_spread": 0.244,
-            "ma_20_50_spread": 0.0845,
-            "eps_q0": -0.2,
-            "eps_q1": -0.18,
-            "eps_q2": -0.16,
-            "eps_q3": -0.14,
-            "per": 28.0,
-            "roe": 12.18
-        },
-        {
-            "ticker": "AMT",
-            "name": "American Tower",
-            "industry": "Real Estate",
-            "ath": 303.72,
-            "lowest_after_ath": 154.58,
-            "price": 178.19,
-            "correction_ratio": 0.491,
-            "price_to_ath": 0.587,
-            "days_since_ath": 1696,
-            "ma_20_spread": 0.0046,
-            "ma_50_spread": -0.0121,
-            "ma_20_50_spread": -0.0166,
-            "eps_q0": 75.9,
-            "eps_q1": 68.31,
-            "eps_q2": 60.72,
-            "eps_q3": 53.13,
-            "per": 28.69,
-            "roe": 29.95
-        },
-        {
-            "ticker": "BALL",
-            "name": "Ball Corporation",
-            "industry": "Materials",
-            "ath": 102.76,
-            "lowest_after_ath": 42.81,
-            "price": 60.29,
-            "correction_ratio": 0.583,
-            "price_to_ath": 0.587,
-            "days_since_ath": 1997,
-            "ma_20_spread": -0.0288,
-            "ma_50_spread": -0.0338,
-            "ma_20_50_spread": -0.0051,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 18.27,
-            "roe": 16.12
-        },
-        {
-            "ticker": "CTSH",
-            "name": "Cognizant",
-            "industry": "Information Technology",
-            "ath": 93.47,
-            "lowest_after_ath": 51.33,
-            "price": 54.7,
-            "correction_ratio": 0.451,
-            "price_to_ath": 0.585,
-            "days_since_ath": 1500,
-            "ma_20_spread": -0.075,
-            "ma_50_spread": -0.1063,
-            "ma_20_50_spread": -0.0338,
-            "eps_q0": 18.7,
-            "eps_q1": 16.83,
-            "eps_q2": 14.96,
-            "eps_q3": 13.09,
-            "per": 12.0,
-            "roe": 15.16
-        },
-        {
-            "ticker": "DPZ",
-            "name": "Domino's",
-            "industry": "Consumer Discretionary",
-            "ath": 567.57,
-            "lowest_after_ath": 285.84,
-            "price": 332.31,
-            "correction_ratio": 0.496,
-            "price_to_ath": 0.585,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0892,
-            "ma_50_spread": -0.1221,
-            "ma_20_50_spread": -0.0362,
-            "eps_q0": -6.6,
-            "eps_q1": -5.94,
-            "eps_q2": -5.28,
-            "eps_q3": -4.62,
-            "per": 19.14,
-            "roe": 0
-        },
-        {
-            "ticker": "CPT",
-            "name": "Camden Property Trust",
-            "industry": "Real Estate",
-            "ath": 180.37,
-            "lowest_after_ath": 82.81,
-            "price": 105.32,
-            "correction_ratio": 0.541,
-            "price_to_ath": 0.584,
-            "days_since_ath": 1584,
-            "ma_20_spread": 0.0329,
-            "ma_50_spread": 0.0233,
-            "ma_20_50_spread": -0.0092,
-            "eps_q0": 283.5,
-            "eps_q1": 255.15,
-            "eps_q2": 226.8,
-            "eps_q3": 198.45,
-            "per": 29.75,
-            "roe": 8.6
-        },
-        {
-            "ticker": "MDT",
-            "name": "Medtronic",
-            "industry": "Health Care",
-            "ath": 135.89,
-            "lowest_after_ath": 68.84,
-            "price": 79.37,
-            "correction_ratio": 0.493,
-            "price_to_ath": 0.584,
-            "days_since_ath": 1696,
-            "ma_20_spread": -0.0694,
-            "ma_50_spread": -0.1082,
-            "ma_20_50_spread": -0.0418,
-            "eps_q0": -11.7,
-            "eps_q1": -10.53,
-            "eps_q2": -9.36,
-            "eps_q3": -8.19,
-            "per": 22.17,
-            "roe": 9.39
-        },
-        {
-            "ticker": "FE",
-            "name": "FirstEnergy",
-            "industry": "Utilities",
-            "ath": 84.0,
-            "lowest_after_ath": 22.85,
-            "price": 48.94,
-            "correction_ratio": 0.728,
-            "price_to_ath": 0.583,
-            "days_since_ath": 6505,
-            "ma_20_spread": -0.0268,
-            "ma_50_spread": -0.0275,
-            "ma_20_50_spread": -0.0007,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 26.6,
-            "roe": 9.2
-        },
-        {
-            "ticker": "KKR",
-            "name": "KKR & Co.",
-            "industry": "Financials",
-            "ath": 170.4,
-            "lowest_after_ath": 82.67,
-            "price": 99.32,
-            "correction_ratio": 0.515,
-            "price_to_ath": 0.583,
-            "days_since_ath": 457,
-            "ma_20_spread": 0.0085,
-            "ma_50_spread": 0.0521,
-            "ma_20_50_spread": 0.0432,
-            "eps_q0": 1.8,
-            "eps_q1": 1.62,
-            "eps_q2": 1.44,
-            "eps_q3": 1.26,
-            "per": 42.44,
-            "roe": 8.56
-        },
-        {
-            "ticker": "PAYX",
-            "name": "Paychex",
-            "industry": "Industrials",
-            "ath": 161.24,
-            "lowest_after_ath": 85.45,
-            "price": 94.05,
-            "correction_ratio": 0.47,
-            "price_to_ath": 0.583,
-            "days_since_ath": 331,
-            "ma_20_spread": 0.0347,
-            "ma_50_spread": 0.0188,
-            "ma_20_50_spread": -0.0154,
-            "eps_q0": 7.9,
-            "eps_q1": 7.11,
-            "eps_q2": 6.32,
-            "eps_q3": 5.53,
-            "per": 20.76,
-            "roe": 0
-        },
-        {
-            "ticker": "VRSK",
-            "name": "Verisk Analytics",
-            "industry": "Industrials",
-            "ath": 322.92,
-            "lowest_after_ath": 161.7,
-            "price": 188.19,
-            "correction_ratio": 0.499,
-            "price_to_ath": 0.583,
-            "days_since_ath": 331,
-            "ma_20_spread": 0.0601,
-            "ma_50_spread": -0.0103,
-            "ma_20_50_spread": -0.0665,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 29.04,
-            "roe": 437.95
-        },
-        {
-            "ticker": "PPG",
-            "name": "PPG Industries",
-            "industry": "Materials",
-            "ath": 182.97,
-            "lowest_after_ath": 90.24,
-            "price": 104.69,
-            "correction_ratio": 0.507,
-            "price_to_ath": 0.572,
-            "days_since_ath": 1787,
-            "ma_20_spread": -0.0404,
-            "ma_50_spread": -0.0503,
-            "ma_20_50_spread": -0.0104,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 15.13,
-            "roe": 21.08
-        },
-        {
-            "ticker": "ALB",
-            "name": "Albemarle Corporation",
-            "industry": "Materials",
-            "ath": 334.55,
-            "lowest_after_ath": 49.43,
-            "price": 190.88,
-            "correction_ratio": 0.852,
-            "price_to_ath": 0.571,
-            "days_since_ath": 1269,
-            "ma_20_spread": 0.0189,
-            "ma_50_spread": 0.0731,
-            "ma_20_50_spread": 0.0532,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 21.18,
-            "roe": -4.66
-        },
-        {
-            "ticker": "REGN",
-            "name": "Regeneron Pharmaceuticals",
-            "industry": "Health Care",
-            "ath": 1211.2,
-            "lowest_after_ath": 476.49,
-            "price": 686.36,
-            "correction_ratio": 0.607,
-            "price_to_ath": 0.567,
-            "days_since_ath": 611,
-            "ma_20_spread": -0.0867,
-            "ma_50_spread": -0.0956,
-            "ma_20_50_spread": -0.0097,
-            "eps_q0": -8.0,
-            "eps_q1": -7.2,
-            "eps_q2": -6.4,
-            "eps_q3": -5.6,
-            "per": 16.54,
-            "roe": 14.86
-        },
-        {
-            "ticker": "HAL",
-            "name": "Halliburton",
-            "industry": "Energy",
-            "ath": 74.33,
-            "lowest_after_ath": 4.25,
-            "price": 41.81,
-            "correction_ratio": 0.943,
-            "price_to_ath": 0.562,
-            "days_since_ath": 4300,
-            "ma_20_spread": 0.0839,
-            "ma_50_spread": 0.1274,
-            "ma_20_50_spread": 0.0401,
-            "eps_q0": 126.0,
-            "eps_q1": 113.4,
-            "eps_q2": 100.8,
-            "eps_q3": 88.2,
-            "per": 23.1,
-            "roe": 14.63
-        },
-        {
-            "ticker": "GEN",
-            "name": "Gen Digital",
-            "industry": "Information Technology",
-            "ath": 34.2,
-            "lowest_after_ath": 15.12,
-            "price": 19.14,
-            "correction_ratio": 0.558,
-            "price_to_ath": 0.56,
-            "days_since_ath": 3145,
-            "ma_20_spread": -0.0038,
-            "ma_50_spread": -0.063,
-            "ma_20_50_spread": -0.0594,
-            "eps_q0": 20.8,
-            "eps_q1": 18.72,
-            "eps_q2": 16.64,
-            "eps_q3": 14.56,
-            "per": 19.73,
-            "roe": 26.9
-        },
-        {
-            "ticker": "MAA",
-            "name": "Mid-America Apartment Communities",
-            "industry": "Real Estate",
-            "ath": 231.63,
-            "lowest_after_ath": 115.56,
-            "price": 129.71,
-            "correction_ratio": 0.501,
-            "price_to_ath": 0.56,
-            "days_since_ath": 1584,
-            "ma_20_spread": 0.0298,
-            "ma_50_spread": 0.0156,
-            "ma_20_50_spread": -0.0138,
-            "eps_q0": -65.5,
-            "eps_q1": -58.95,
-            "eps_q2": -52.4,
-            "eps_q3": -45.85,
-            "per": 34.31,
-            "roe": 7.65
-        },
-        {
-            "ticker": "EFX",
-            "name": "Equifax",
-            "industry": "Industrials",
-            "ath": 309.63,
-            "lowest_after_ath": 166.02,
-            "price": 172.56,
-            "correction_ratio": 0.464,
-            "price_to_ath": 0.557,
-            "days_since_ath": 590,
-            "ma_20_spread": -0.054,
-            "ma_50_spread": -0.0789,
-            "ma_20_50_spread": -0.0263,
-            "eps_q0": 28.9,
-            "eps_q1": 26.01,
-            "eps_q2": 23.12,
-            "eps_q3": 20.23,
-            "per": 30.38,
-            "roe": 14.37
-        },
-        {
-            "ticker": "LUV",
-            "name": "Southwest Airlines",
-            "industry": "Industrials",
-            "ath": 66.99,
-            "lowest_after_ath": 21.91,
-            "price": 37.22,
-            "correction_ratio": 0.673,
-            "price_to_ath": 0.556,
-            "days_since_ath": 3054,
-            "ma_20_spread": -0.0583,
-            "ma_50_spread": -0.1171,
-            "ma_20_50_spread": -0.0624,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 24.81,
-            "roe": 10.06
-        },
-        {
-            "ticker": "ARES",
-            "name": "Ares Management",
-            "industry": "Financials",
-            "ath": 200.49,
-            "lowest_after_ath": 95.8,
-            "price": 110.86,
-            "correction_ratio": 0.522,
-            "price_to_ath": 0.553,
-            "days_since_ath": 450,
-            "ma_20_spread": -0.002,
-            "ma_50_spread": -0.0021,
-            "ma_20_50_spread": -0.0001,
-            "eps_q0": -69.4,
-            "eps_q1": -62.46,
-            "eps_q2": -55.52,
-            "eps_q3": -48.58,
-            "per": 64.83,
-            "roe": 13.52
-        },
-        {
-            "ticker": "SBAC",
-            "name": "SBA Communications",
-            "industry": "Real Estate",
-            "ath": 391.15,
-            "lowest_after_ath": 162.41,
-            "price": 215.97,
-            "correction_ratio": 0.585,
-            "price_to_ath": 0.552,
-            "days_since_ath": 1584,
-            "ma_20_spread": 0.008,
-            "ma_50_spread": 0.0906,
-            "ma_20_50_spread": 0.082,
-            "eps_q0": 113.3,
-            "eps_q1": 101.97,
-            "eps_q2": 90.64,
-            "eps_q3": 79.31,
-            "per": 22.06,
-            "roe": 0
-        },
-        {
-            "ticker": "DOW",
-            "name": "Dow Inc.",
-            "industry": "Materials",
-            "ath": 71.86,
-            "lowest_after_ath": 20.4,
-            "price": 39.55,
-            "correction_ratio": 0.716,
-            "price_to_ath": 0.55,
-            "days_since_ath": 1472,
-            "ma_20_spread": 0.0131,
-            "ma_50_spread": 0.0828,
-            "ma_20_50_spread": 0.0688,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 19.12,
-            "roe": -15.26
-        },
-        {
-            "ticker": "GPC",
-            "name": "Genuine Parts Company",
-            "industry": "Consumer Discretionary",
-            "ath": 187.73,
-            "lowest_after_ath": 96.08,
-            "price": 103.28,
-            "correction_ratio": 0.488,
-            "price_to_ath": 0.55,
-            "days_since_ath": 1248,
-            "ma_20_spread": -0.0478,
-            "ma_50_spread": -0.0567,
-            "ma_20_50_spread": -0.0093,
-            "eps_q0": -3.0,
-            "eps_q1": -2.7,
-            "eps_q2": -2.4,
-            "eps_q3": -2.1,
-            "per": 234.73,
-            "roe": 1.34
-        },
-        {
-            "ticker": "AMCR",
-            "name": "Amcor",
-            "industry": "Materials",
-            "ath": 68.05,
-            "lowest_after_ath": 37.22,
-            "price": 37.35,
-            "correction_ratio": 0.453,
-            "price_to_ath": 0.549,
-            "days_since_ath": 1423,
-            "ma_20_spread": -0.0732,
-            "ma_50_spread": -0.1155,
-            "ma_20_50_spread": -0.0456,
-            "eps_q0": 8.6,
-            "eps_q1": 7.74,
-            "eps_q2": 6.88,
-            "eps_q3": 6.02,
-            "per": 28.08,
-            "roe": 7.73
-        },
-        {
-            "ticker": "IQV",
-            "name": "IQVIA",
-            "industry": "Health Care",
-            "ath": 285.61,
-            "lowest_after_ath": 134.65,
-            "price": 156.66,
-            "correction_ratio": 0.529,
-            "price_to_ath": 0.549,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0784,
-            "ma_50_spread": -0.0756,
-            "ma_20_50_spread": 0.003,
-            "eps_q0": 17.6,
-            "eps_q1": 15.84,
-            "eps_q2": 14.08,
-            "eps_q3": 12.32,
-            "per": 19.98,
-            "roe": 21.44
-        },
-        {
-            "ticker": "CNC",
-            "name": "Centene Corporation",
-            "industry": "Health Care",
-            "ath": 98.53,
-            "lowest_after_ath": 25.08,
-            "price": 53.98,
-            "correction_ratio": 0.745,
-            "price_to_ath": 0.548,
-            "days_since_ath": 1353,
-            "ma_20_spread": 0.3688,
-            "ma_50_spread": 0.3881,
-            "ma_20_50_spread": 0.0142,
-            "eps_q0": 17.5,
-            "eps_q1": 15.75,
-            "eps_q2": 14.0,
-            "eps_q3": 12.25,
-            "per": 12.51,
-            "roe": -26.04
-        },
-        {
-            "ticker": "STZ",
-            "name": "Constellation Brands",
-            "industry": "Consumer Staples",
-            "ath": 274.87,
-            "lowest_after_ath": 126.45,
-            "price": 150.4,
-            "correction_ratio": 0.54,
-            "price_to_ath": 0.547,
-            "days_since_ath": 751,
-            "ma_20_spread": -0.0482,
-            "ma_50_spread": -0.028,
-            "ma_20_50_spread": 0.0212,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 15.67,
-            "roe": 22.64
-        },
-        {
-            "ticker": "KEY",
-            "name": "KeyCorp",
-            "industry": "Financials",
-            "ath": 39.9,
-            "lowest_after_ath": 4.4,
-            "price": 21.67,
-            "correction_ratio": 0.89,
-            "price_to_ath": 0.543,
-            "days_since_ath": 7009,
-            "ma_20_spread": 0.007,
-            "ma_50_spread": 0.0458,
-            "ma_20_50_spread": 0.0386,
-            "eps_q0": 28.9,
-            "eps_q1": 26.01,
-            "eps_q2": 23.12,
-            "eps_q3": 20.23,
-            "per": 13.29,
-            "roe": 9.97
-        },
-        {
-            "ticker": "TSCO",
-            "name": "Tractor Supply",
-            "industry": "Consumer Discretionary",
-            "ath": 63.99,
-            "lowest_after_ath": 34.37,
-            "price": 34.77,
-            "correction_ratio": 0.463,
-            "price_to_ath": 0.543,
-            "days_since_ath": 282,
-            "ma_20_spread": -0.1746,
-            "ma_50_spread": -0.2492,
-            "ma_20_50_spread": -0.0905,
-            "eps_q0": -8.3,
-            "eps_q1": -7.47,
-            "eps_q2": -6.64,
-            "eps_q3": -5.81,
-            "per": 17.13,
-            "roe": 45.5
-        },
-        {
-            "ticker": "DLTR",
-            "name": "Dollar Tree",
-            "industry": "Consumer Staples",
-            "ath": 177.19,
-            "lowest_after_ath": 60.49,
-            "price": 95.7,
-            "correction_ratio": 0.659,
-            "price_to_ath": 0.54,
-            "days_since_ath": 1472,
-            "ma_20_spread": -0.0724,
-            "ma_50_spread": -0.1386,
-            "ma_20_50_spread": -0.0714,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 16.11,
-            "roe": 31.69
-        },
-        {
-            "ticker": "OXY",
-            "name": "Occidental Petroleum",
-            "industry": "Energy",
-            "ath": 112.95,
-            "lowest_after_ath": 8.52,
-            "price": 60.76,
-            "correction_ratio": 0.925,
-            "price_to_ath": 0.538,
-            "days_since_ath": 5476,
-            "ma_20_spread": 0.0415,
-            "ma_50_spread": 0.0608,
-            "ma_20_50_spread": 0.0185,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 45.01,
-            "roe": 5.93
-        },
-        {
-            "ticker": "TYL",
-            "name": "Tyler Technologies",
-            "industry": "Information Technology",
-            "ath": 661.31,
-            "lowest_after_ath": 283.72,
-            "price": 356.01,
-            "correction_ratio": 0.571,
-            "price_to_ath": 0.538,
-            "days_since_ath": 443,
-            "ma_20_spread": 0.0595,
-            "ma_50_spread": 0.0426,
-            "ma_20_50_spread": -0.0159,
-            "eps_q0": 0.5,
-            "eps_q1": 0.45,
-            "eps_q2": 0.4,
-            "eps_q3": 0.35,
-            "per": 49.58,
-            "roe": 8.9
-        },
-        {
-            "ticker": "IP",
-            "name": "International Paper",
-            "industry": "Materials",
-            "ath": 63.39,
-            "lowest_after_ath": 24.98,
-            "price": 33.58,
-            "correction_ratio": 0.606,
-            "price_to_ath": 0.53,
-            "days_since_ath": 3012,
-            "ma_20_spread": -0.0479,
-            "ma_50_spread": -0.113,
-            "ma_20_50_spread": -0.0683,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 12.13,
-            "roe": -24.68
-        },
-        {
-            "ticker": "COO",
-            "name": "Cooper Companies (The)",
-            "industry": "Health Care",
-            "ath": 115.9,
-            "lowest_after_ath": 60.64,
-            "price": 61.34,
-            "correction_ratio": 0.477,
-            "price_to_ath": 0.529,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.1051,
-            "ma_50_spread": -0.1621,
-            "ma_20_50_spread": -0.0637,
-            "eps_q0": 25.4,
-            "eps_q1": 22.86,
-            "eps_q2": 20.32,
-            "eps_q3": 17.78,
-            "per": 30.52,
-            "roe": 4.87
-        },
-        {
-            "ticker": "BSX",
-            "name": "Boston Scientific",
-            "industry": "Health Care",
-            "ath": 109.5,
-            "lowest_after_ath": 56.17,
-            "price": 57.15,
-            "correction_ratio": 0.487,
-            "price_to_ath": 0.522,
-            "days_since_ath": 233,
-            "ma_20_spread": -0.0803,
-            "ma_50_spread": -0.1558,
-            "ma_20_50_spread": -0.0821,
-            "eps_q0": 99.0,
-            "eps_q1": 89.1,
-            "eps_q2": 79.2,
-            "eps_q3": 69.3,
-            "per": 23.91,
-            "roe": 0
-        },
-        {
-            "ticker": "CPRT",
-            "name": "Copart",
-            "industry": "Industrials",
-            "ath": 64.38,
-            "lowest_after_ath": 32.2,
-            "price": 33.33,
-            "correction_ratio": 0.5,
-            "price_to_ath": 0.518,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0011,
-            "ma_50_spread": -0.0336,
-            "ma_20_50_spread": -0.0346,
-            "eps_q0": -9.5,
-            "eps_q1": -8.55,
-            "eps_q2": -7.6,
-            "eps_q3": -6.65,
-            "per": 20.96,
-            "roe": 17.13
-        },
-        {
-            "ticker": "CDW",
-            "name": "CDW Corporation",
-            "industry": "Information Technology",
-            "ath": 263.37,
-            "lowest_after_ath": 112.98,
-            "price": 135.56,
-            "correction_ratio": 0.571,
-            "price_to_ath": 0.515,
-            "days_since_ath": 758,
-            "ma_20_spread": 0.0339,
-            "ma_50_spread": 0.0831,
-            "ma_20_50_spread": 0.0477,
-            "eps_q0": 5.8,
-            "eps_q1": 5.22,
-            "eps_q2": 4.64,
-            "eps_q3": 4.06,
-            "per": 16.78,
-            "roe": 43.02
-        },
-        {
-            "ticker": "BA",
-            "name": "Boeing",
-            "industry": "Industrials",
-            "ath": 446.01,
-            "lowest_after_ath": 89.0,
-            "price": 224.11,
-            "correction_ratio": 0.8,
-            "price_to_ath": 0.502,
-            "days_since_ath": 2620,
-            "ma_20_spread": 0.0109,
-            "ma_50_spread": 0.029,
-            "ma_20_50_spread": 0.0179,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 88.23,
-            "roe": 169.95
-        },
-        {
-            "ticker": "DIS",
-            "name": "Walt Disney Company (The)",
-            "industry": "Communication Services",
-            "ath": 203.02,
-            "lowest_after_ath": 78.73,
-            "price": 101.3,
-            "correction_ratio": 0.612,
-            "price_to_ath": 0.499,
-            "days_since_ath": 1878,
-            "ma_20_spread": -0.0006,
-            "ma_50_spread": 0.0019,
-            "ma_20_50_spread": 0.0025,
-            "eps_q0": -6.0,
-            "eps_q1": -5.4,
-            "eps_q2": -4.8,
-            "eps_q3": -4.2,
-            "per": 14.92,
-            "roe": 12.02
-        },
-        {
-            "ticker": "EW",
-            "name": "Edwards Lifesciences",
-            "industry": "Health Care",
-            "ath": 163.44,
-            "lowest_after_ath": 46.55,
-            "price": 81.22,
-            "correction_ratio": 0.715,
-            "price_to_ath": 0.497,
-            "days_since_ath": 2704,
-            "ma_20_spread": 0.0082,
-            "ma_50_spread": -0.0088,
-            "ma_20_50_spread": -0.0169,
-            "eps_q0": 6.3,
-            "eps_q1": 5.67,
-            "eps_q2": 5.04,
-            "eps_q3": 4.41,
-            "per": 43.9,
-            "roe": 0
-        },
-        {
-            "ticker": "BEN",
-            "name": "Franklin Resources",
-            "industry": "Financials",
-            "ath": 59.43,
-            "lowest_after_ath": 14.91,
-            "price": 29.45,
-            "correction_ratio": 0.749,
-            "price_to_ath": 0.496,
-            "days_since_ath": 4160,
-            "ma_20_spread": 0.1231,
-            "ma_50_spread": 0.1467,
-            "ma_20_50_spread": 0.021,
-            "eps_q0": 77.1,
-            "eps_q1": 69.39,
-            "eps_q2": 61.68,
-            "eps_q3": 53.97,
-            "per": 22.48,
-            "roe": 6.7
-        },
-        {
-            "ticker": "CRM",
-            "name": "Salesforce",
-            "industry": "Information Technology",
-            "ath": 369.0,
-            "lowest_after_ath": 163.52,
-            "price": 181.22,
-            "correction_ratio": 0.557,
-            "price_to_ath": 0.491,
-            "days_since_ath": 513,
-            "ma_20_spread": 0.0079,
-            "ma_50_spread": -0.0303,
-            "ma_20_50_spread": -0.0379,
-            "eps_q0": 13.8,
-            "eps_q1": 12.42,
-            "eps_q2": 11.04,
-            "eps_q3": 9.66,
-            "per": 23.23,
-            "roe": 12.4
-        },
-        {
-            "ticker": "BRO",
-            "name": "Brown & Brown",
-            "industry": "Financials",
-            "ath": 125.68,
-            "lowest_after_ath": 61.56,
-            "price": 61.64,
-            "correction_ratio": 0.51,
-            "price_to_ath": 0.49,
-            "days_since_ath": 394,
-            "ma_20_spread": -0.0732,
-            "ma_50_spread": -0.0915,
-            "ma_20_50_spread": -0.0198,
-            "eps_q0": 28.7,
-            "eps_q1": 25.83,
-            "eps_q2": 22.96,
-            "eps_q3": 20.09,
-            "per": 20.08,
-            "roe": 11.93
-        },
-        {
-            "ticker": "HPQ",
-            "name": "HP Inc.",
-            "industry": "Information Technology",
-            "ath": 41.47,
-            "lowest_after_ath": 17.56,
-            "price": 20.14,
-            "correction_ratio": 0.577,
-            "price_to_ath": 0.486,
-            "days_since_ath": 1486,
-            "ma_20_spread": 0.0348,
-            "ma_50_spread": 0.0565,
-            "ma_20_50_spread": 0.021,
-            "eps_q0": -3.5,
-            "eps_q1": -3.15,
-            "eps_q2": -2.8,
-            "eps_q3": -2.45,
-            "per": 7.63,
-            "roe": 0
-        },
-        {
-            "ticker": "INTU",
-            "name": "Intuit",
-            "industry": "Information Technology",
-            "ath": 813.7,
-            "lowest_after_ath": 342.11,
-            "price": 395.08,
-            "correction_ratio": 0.58,
-            "price_to_ath": 0.486,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0043,
-            "ma_50_spread": -0.0458,
-            "ma_20_50_spread": -0.0499,
-            "eps_q0": 47.1,
-            "eps_q1": 42.39,
-            "eps_q2": 37.68,
-            "eps_q3": 32.97,
-            "per": 25.7,
-            "roe": 23.46
-        },
-        {
-            "ticker": "AES",
-            "name": "AES Corporation",
-            "industry": "Utilities",
-            "ath": 29.89,
-            "lowest_after_ath": 9.46,
-            "price": 14.45,
-            "correction_ratio": 0.684,
-            "price_to_ath": 0.483,
-            "days_since_ath": 1234,
-            "ma_20_spread": 0.0019,
-            "ma_50_spread": -0.0121,
-            "ma_20_50_spread": -0.014,
-            "eps_q0": -31.5,
-            "eps_q1": -28.35,
-            "eps_q2": -25.2,
-            "eps_q3": -22.05,
-            "per": 11.03,
-            "roe": 1.95
-        },
-        {
-            "ticker": "GNRC",
-            "name": "Generac",
-            "industry": "Industrials",
-            "ath": 524.31,
-            "lowest_after_ath": 79.86,
-            "price": 252.92,
-            "correction_ratio": 0.848,
-            "price_to_ath": 0.482,
-            "days_since_ath": 1640,
-            "ma_20_spread": 0.2008,
-            "ma_50_spread": 0.1948,
-            "ma_20_50_spread": -0.005,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 94.02,
-            "roe": 6.28
-        },
-        {
-            "ticker": "CMG",
-            "name": "Chipotle Mexican Grill",
-            "industry": "Consumer Discretionary",
-            "ath": 69.26,
-            "lowest_after_ath": 29.75,
-            "price": 32.99,
-            "correction_ratio": 0.57,
-            "price_to_ath": 0.476,
-            "days_since_ath": 681,
-            "ma_20_spread": -0.0364,
-            "ma_50_spread": -0.0459,
-            "ma_20_50_spread": -0.0098,
-            "eps_q0": -0.3,
-            "eps_q1": -0.27,
-            "eps_q2": -0.24,
-            "eps_q3": -0.21,
-            "per": 28.94,
-            "roe": 47.36
-        },
-        {
-            "ticker": "TGT",
-            "name": "Target Corporation",
-            "industry": "Consumer Staples",
-            "ath": 268.98,
-            "lowest_after_ath": 83.44,
-            "price": 127.87,
-            "correction_ratio": 0.69,
-            "price_to_ath": 0.475,
-            "days_since_ath": 1626,
-            "ma_20_spread": 0.0227,
-            "ma_50_spread": 0.0636,
-            "ma_20_50_spread": 0.04,
-            "eps_q0": -5.3,
-            "eps_q1": -4.77,
-            "eps_q2": -4.24,
-            "eps_q3": -3.71,
-            "per": 15.75,
-            "roe": 24.03
-        },
-        {
-            "ticker": "ORCL",
-            "name": "Oracle Corporation",
-            "industry": "Information Technology",
-            "ath": 345.72,
-            "lowest_after_ath": 134.57,
-            "price": 163.83,
-            "correction_ratio": 0.611,
-            "price_to_ath": 0.474,
-            "days_since_ath": 233,
-            "ma_20_spread": 0.0112,
-            "ma_50_spread": 0.0565,
-            "ma_20_50_spread": 0.0448,
-            "eps_q0": 26.7,
-            "eps_q1": 24.03,
-            "eps_q2": 21.36,
-            "eps_q3": 18.69,
-            "per": 29.36,
-            "roe": 57.57
-        },
-        {
-            "ticker": "F",
-            "name": "Ford Motor Company",
-            "industry": "Consumer Discretionary",
-            "ath": 25.87,
-            "lowest_after_ath": 8.44,
-            "price": 12.24,
-            "correction_ratio": 0.674,
-            "price_to_ath": 0.473,
-            "days_since_ath": 1570,
-            "ma_20_spread": -0.0054,
-            "ma_50_spread": -0.0157,
-            "ma_20_50_spread": -0.0104,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 6.58,
-            "roe": -20.19
-        },
-        {
-            "ticker": "LEN",
-            "name": "Lennar",
-            "industry": "Consumer Discretionary",
-            "ath": 187.61,
-            "lowest_after_ath": 83.03,
-            "price": 88.71,
-            "correction_ratio": 0.557,
-            "price_to_ath": 0.473,
-            "days_since_ath": 590,
-            "ma_20_spread": -0.0183,
-            "ma_50_spread": -0.085,
-            "ma_20_50_spread": -0.068,
-            "eps_q0": -55.8,
-            "eps_q1": -50.22,
-            "eps_q2": -44.64,
-            "eps_q3": -39.06,
-            "per": 12.76,
-            "roe": 8.08
-        },
-        {
-            "ticker": "MKC",
-            "name": "McCormick & Company",
-            "industry": "Consumer Staples",
-            "ath": 107.35,
-            "lowest_after_ath": 47.52,
-            "price": 50.54,
-            "correction_ratio": 0.557,
-            "price_to_ath": 0.471,
-            "days_since_ath": 1514,
-            "ma_20_spread": -0.0238,
-            "ma_50_spread": -0.1201,
-            "ma_20_50_spread": -0.0987,
-            "eps_q0": 526.1,
-            "eps_q1": 473.49,
-            "eps_q2": 420.88,
-            "eps_q3": 368.27,
-            "per": 8.29,
-            "roe": 25.35
-        },
-        {
-            "ticker": "SLB",
-            "name": "Schlumberger",
-            "industry": "Energy",
-            "ath": 118.76,
-            "lowest_after_ath": 11.87,
-            "price": 55.7,
-            "correction_ratio": 0.9,
-            "price_to_ath": 0.469,
-            "days_since_ath": 4321,
-            "ma_20_spread": 0.058,
-            "ma_50_spread": 0.1006,
-            "ma_20_50_spread": 0.0402,
-            "eps_q0": -5.6,
-            "eps_q1": -5.04,
-            "eps_q2": -4.48,
-            "eps_q3": -3.92,
-            "per": 24.54,
-            "roe": 14.07
-        },
-        {
-            "ticker": "FDS",
-            "name": "FactSet",
-            "industry": "Financials",
-            "ath": 499.87,
-            "lowest_after_ath": 185.0,
-            "price": 232.32,
-            "correction_ratio": 0.63,
-            "price_to_ath": 0.465,
-            "days_since_ath": 534,
-            "ma_20_spread": 0.0183,
-            "ma_50_spread": 0.0746,
-            "ma_20_50_spread": 0.0553,
-            "eps_q0": -8.1,
-            "eps_q1": -7.29,
-            "eps_q2": -6.48,
-            "eps_q3": -5.67,
-            "per": 14.95,
-            "roe": 28.08
-        },
-        {
-            "ticker": "HOOD",
-            "name": "Robinhood Markets",
-            "industry": "Financials",
-            "ath": 153.86,
-            "lowest_after_ath": 63.51,
-            "price": 71.2,
-            "correction_ratio": 0.587,
-            "price_to_ath": 0.463,
-            "days_since_ath": 205,
-            "ma_20_spread": -0.0969,
-            "ma_50_spread": -0.0681,
-            "ma_20_50_spread": 0.0319,
-            "eps_q0": -34.0,
-            "eps_q1": -30.6,
-            "eps_q2": -27.2,
-            "eps_q3": -23.8,
-            "per": 34.56,
-            "roe": 21.99
-        },
-        {
-            "ticker": "CMCSA",
-            "name": "Comcast",
-            "industry": "Communication Services",
-            "ath": 57.92,
-            "lowest_after_ath": 24.13,
-            "price": 26.76,
-            "correction_ratio": 0.583,
-            "price_to_ath": 0.462,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.0583,
-            "ma_50_spread": -0.0945,
-            "ma_20_50_spread": -0.0383,
-            "eps_q0": -35.6,
-            "eps_q1": -32.04,
-            "eps_q2": -28.48,
-            "eps_q3": -24.92,
-            "per": 5.25,
-            "roe": 20.92
-        },
-        {
-            "ticker": "ZBH",
-            "name": "Zimmer Biomet",
-            "industry": "Health Care",
-            "ath": 175.11,
-            "lowest_after_ath": 79.83,
-            "price": 80.07,
-            "correction_ratio": 0.544,
-            "price_to_ath": 0.457,
-            "days_since_ath": 1829,
-            "ma_20_spread": -0.1294,
-            "ma_50_spread": -0.1392,
-            "ma_20_50_spread": -0.0112,
-            "eps_q0": 30.8,
-            "eps_q1": 27.72,
-            "eps_q2": 24.64,
-            "eps_q3": 21.56,
-            "per": 20.74,
-            "roe": 6.07
-        },
-        {
-            "ticker": "ZTS",
-            "name": "Zoetis",
-            "industry": "Health Care",
-            "ath": 249.27,
-            "lowest_after_ath": 112.97,
-            "price": 113.83,
-            "correction_ratio": 0.547,
-            "price_to_ath": 0.457,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0398,
-            "ma_50_spread": -0.0545,
-            "ma_20_50_spread": -0.0154,
-            "eps_q0": 3.8,
-            "eps_q1": 3.42,
-            "eps_q2": 3.04,
-            "eps_q3": 2.66,
-            "per": 18.91,
-            "roe": 65.99
-        },
-        {
-            "ticker": "UPS",
-            "name": "United Parcel Service",
-            "industry": "Industrials",
-            "ath": 233.72,
-            "lowest_after_ath": 82.0,
-            "price": 106.61,
-            "correction_ratio": 0.649,
-            "price_to_ath": 0.456,
-            "days_since_ath": 1549,
-            "ma_20_spread": 0.0315,
-            "ma_50_spread": 0.0254,
-            "ma_20_50_spread": -0.0058,
-            "eps_q0": -27.2,
-            "eps_q1": -24.48,
-            "eps_q2": -21.76,
-            "eps_q3": -19.04,
-            "per": 17.25,
-            "roe": 33.35
-        },
-        {
-            "ticker": "AXON",
-            "name": "Axon Enterprise",
-            "industry": "Industrials",
-            "ath": 885.92,
-            "lowest_after_ath": 339.01,
-            "price": 400.54,
-            "correction_ratio": 0.617,
-            "price_to_ath": 0.452,
-            "days_since_ath": 268,
-            "ma_20_spread": 0.0191,
-            "ma_50_spread": -0.1201,
-            "ma_20_50_spread": -0.1365,
-            "eps_q0": -98.0,
-            "eps_q1": -88.2,
-            "eps_q2": -78.4,
-            "eps_q3": -68.6,
-            "per": 267.03,
-            "roe": 4.48
-        },
-        {
-            "ticker": "DECK",
-            "name": "Deckers Brands",
-            "industry": "Consumer Discretionary",
-            "ath": 223.98,
-            "lowest_after_ath": 78.91,
-            "price": 101.34,
-            "correction_ratio": 0.648,
-            "price_to_ath": 0.452,
-            "days_since_ath": 457,
-            "ma_20_spread": -0.0485,
-            "ma_50_spread": -0.0516,
-            "ma_20_50_spread": -0.0032,
-            "eps_q0": 5.3,
-            "eps_q1": 4.77,
-            "eps_q2": 4.24,
-            "eps_q3": 3.71,
-            "per": 14.39,
-            "roe": 39.69
-        },
-        {
-            "ticker": "PODD",
-            "name": "Insulet Corporation",
-            "industry": "Health Care",
-            "ath": 354.88,
-            "lowest_after_ath": 158.35,
-            "price": 160.02,
-            "correction_ratio": 0.554,
-            "price_to_ath": 0.451,
-            "days_since_ath": 163,
-            "ma_20_spread": -0.1844,
-            "ma_50_spread": -0.2693,
-            "ma_20_50_spread": -0.1041,
-            "eps_q0": 0.9,
-            "eps_q1": 0.81,
-            "eps_q2": 0.72,
-            "eps_q3": 0.63,
-            "per": 46.12,
-            "roe": 18.12
-        },
-        {
-            "ticker": "TROW",
-            "name": "T. Rowe Price",
-            "industry": "Financials",
-            "ath": 224.56,
-            "lowest_after_ath": 77.85,
-            "price": 100.47,
-            "correction_ratio": 0.653,
-            "price_to_ath": 0.447,
-            "days_since_ath": 1703,
-            "ma_20_spread": 0.0511,
-            "ma_50_spread": 0.0827,
-            "ma_20_50_spread": 0.0301,
-            "eps_q0": 1.2,
-            "eps_q1": 1.08,
-            "eps_q2": 0.96,
-            "eps_q3": 0.84,
-            "per": 10.87,
-            "roe": 18.79
-        },
-        {
-            "ticker": "KIM",
-            "name": "Kimco Realty",
-            "industry": "Real Estate",
-            "ath": 53.6,
-            "lowest_after_ath": 6.33,
-            "price": 23.64,
-            "correction_ratio": 0.882,
-            "price_to_ath": 0.441,
-            "days_since_ath": 7009,
-            "ma_20_spread": 0.0114,
-            "ma_50_spread": 0.0211,
-            "ma_20_50_spread": 0.0096,
-            "eps_q0": -9.0,
-            "eps_q1": -8.1,
-            "eps_q2": -7.2,
-            "eps_q3": -6.3,
-            "per": 28.83,
-            "roe": 5.54
-        },
-        {
-            "ticker": "IFF",
-            "name": "International Flavors & Fragrances",
-            "industry": "Materials",
-            "ath": 157.4,
-            "lowest_after_ath": 59.14,
-            "price": 68.89,
-            "correction_ratio": 0.624,
-            "price_to_ath": 0.438,
-            "days_since_ath": 3026,
-            "ma_20_spread": -0.0437,
-            "ma_50_spread": -0.0621,
-            "ma_20_50_spread": -0.0192,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 14.51,
-            "roe": -2.56
-        },
-        {
-            "ticker": "DG",
-            "name": "Dollar General",
-            "industry": "Consumer Staples",
-            "ath": 262.21,
-            "lowest_after_ath": 66.43,
-            "price": 114.13,
-            "correction_ratio": 0.747,
-            "price_to_ath": 0.435,
-            "days_since_ath": 1472,
-            "ma_20_spread": -0.0552,
-            "ma_50_spread": -0.1318,
-            "ma_20_50_spread": -0.081,
-            "eps_q0": 122.9,
-            "eps_q1": 110.61,
-            "eps_q2": 98.32,
-            "eps_q3": 86.03,
-            "per": 16.69,
-            "roe": 18.99
-        },
-        {
-            "ticker": "FICO",
-            "name": "Fair Isaac",
-            "industry": "Information Technology",
-            "ath": 2402.52,
-            "lowest_after_ath": 870.01,
-            "price": 1043.57,
-            "correction_ratio": 0.638,
-            "price_to_ath": 0.434,
-            "days_since_ath": 534,
-            "ma_20_spread": 0.0073,
-            "ma_50_spread": -0.0982,
-            "ma_20_50_spread": -0.1047,
-            "eps_q0": 3.8,
-            "eps_q1": 3.42,
-            "eps_q2": 3.04,
-            "eps_q3": 2.66,
-            "per": 33.1,
-            "roe": 0
-        },
-        {
-            "ticker": "ACN",
-            "name": "Accenture",
-            "industry": "Information Technology",
-            "ath": 417.37,
-            "lowest_after_ath": 173.84,
-            "price": 180.26,
-            "correction_ratio": 0.583,
-            "price_to_ath": 0.432,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0496,
-            "ma_50_spread": -0.0878,
-            "ma_20_50_spread": -0.0402,
-            "eps_q0": 2.1,
-            "eps_q1": 1.89,
-            "eps_q2": 1.68,
-            "eps_q3": 1.47,
-            "per": 14.79,
-            "roe": 24.76
-        },
-        {
-            "ticker": "HUM",
-            "name": "Humana",
-            "industry": "Health Care",
-            "ath": 571.3,
-            "lowest_after_ath": 163.11,
-            "price": 243.12,
-            "correction_ratio": 0.714,
-            "price_to_ath": 0.426,
-            "days_since_ath": 1276,
-            "ma_20_spread": 0.188,
-            "ma_50_spread": 0.2958,
-            "ma_20_50_spread": 0.0907,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 24.73,
-            "roe": 7.04
-        },
-        {
-            "ticker": "PFE",
-            "name": "Pfizer",
-            "industry": "Health Care",
-            "ath": 61.71,
-            "lowest_after_ath": 20.92,
-            "price": 26.26,
-            "correction_ratio": 0.661,
-            "price_to_ath": 0.426,
-            "days_since_ath": 1591,
-            "ma_20_spread": -0.0357,
-            "ma_50_spread": -0.0329,
-            "ma_20_50_spread": 0.003,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 19.31,
-            "roe": 8.89
-        },
-        {
-            "ticker": "WYNN",
-            "name": "Wynn Resorts",
-            "industry": "Consumer Discretionary",
-            "ath": 249.31,
-            "lowest_after_ath": 35.84,
-            "price": 104.24,
-            "correction_ratio": 0.856,
-            "price_to_ath": 0.418,
-            "days_since_ath": 4440,
-            "ma_20_spread": -0.009,
-            "ma_50_spread": -0.0018,
-            "ma_20_50_spread": 0.0073,
-            "eps_q0": -63.9,
-            "eps_q1": -57.51,
-            "eps_q2": -51.12,
-            "eps_q3": -44.73,
-            "per": 33.2,
-            "roe": 0
-        },
-        {
-            "ticker": "BBY",
-            "name": "Best Buy",
-            "industry": "Consumer Discretionary",
-            "ath": 141.97,
-            "lowest_after_ath": 54.99,
-            "price": 58.73,
-            "correction_ratio": 0.613,
-            "price_to_ath": 0.414,
-            "days_since_ath": 1619,
-            "ma_20_spread": -0.0687,
-            "ma_50_spread": -0.0747,
-            "ma_20_50_spread": -0.0065,
-            "eps_q0": 362.4,
-            "eps_q1": 326.16,
-            "eps_q2": 289.92,
-            "eps_q3": 253.68,
-            "per": 11.65,
-            "roe": 37.04
-        },
-        {
-            "ticker": "COIN",
-            "name": "Coinbase",
-            "industry": "Financials",
-            "ath": 444.65,
-            "lowest_after_ath": 139.36,
-            "price": 181.73,
-            "correction_ratio": 0.687,
-            "price_to_ath": 0.409,
-            "days_since_ath": 289,
-            "ma_20_spread": -0.0311,
-            "ma_50_spread": -0.0259,
-            "ma_20_50_spread": 0.0054,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 40.93,
-            "roe": 10.05
-        },
-        {
-            "ticker": "CCI",
-            "name": "Crown Castle",
-            "industry": "Real Estate",
-            "ath": 209.87,
-            "lowest_after_ath": 75.96,
-            "price": 85.87,
-            "correction_ratio": 0.638,
-            "price_to_ath": 0.409,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0003,
-            "ma_50_spread": 0.0005,
-            "ma_20_50_spread": 0.0008,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 36.23,
-            "roe": 0
-        },
-        {
-            "ticker": "BIIB",
-            "name": "Biogen",
-            "industry": "Health Care",
-            "ath": 480.18,
-            "lowest_after_ath": 110.04,
-            "price": 194.38,
-            "correction_ratio": 0.771,
-            "price_to_ath": 0.405,
-            "days_since_ath": 4062,
-            "ma_20_spread": 0.0744,
-            "ma_50_spread": 0.0512,
-            "ma_20_50_spread": -0.0216,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 22.14,
-            "roe": 7.39
-        },
-        {
-            "ticker": "RVTY",
-            "name": "Revvity",
-            "industry": "Health Care",
-            "ath": 203.16,
-            "lowest_after_ath": 79.5,
-            "price": 82.26,
-            "correction_ratio": 0.609,
-            "price_to_ath": 0.405,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0839,
-            "ma_50_spread": -0.0941,
-            "ma_20_50_spread": -0.0111,
-            "eps_q0": 3.9,
-            "eps_q1": 3.51,
-            "eps_q2": 3.12,
-            "eps_q3": 2.73,
-            "per": 39.93,
-            "roe": 3.22
-        },
-        {
-            "ticker": "ERIE",
-            "name": "Erie Indemnity",
-            "industry": "Financials",
-            "ath": 547.0,
-            "lowest_after_ath": 217.95,
-            "price": 219.73,
-            "correction_ratio": 0.602,
-            "price_to_ath": 0.402,
-            "days_since_ath": 583,
-            "ma_20_spread": -0.1079,
-            "ma_50_spread": -0.1265,
-            "ma_20_50_spread": -0.0209,
-            "eps_q0": 8.7,
-            "eps_q1": 7.83,
-            "eps_q2": 6.96,
-            "eps_q3": 6.09,
-            "per": 20.12,
-            "roe": 25.85
-        },
-        {
-            "ticker": "DVN",
-            "name": "Devon Energy",
-            "industry": "Energy",
-            "ath": 127.43,
-            "lowest_after_ath": 4.7,
-            "price": 51.08,
-            "correction_ratio": 0.963,
-            "price_to_ath": 0.401,
-            "days_since_ath": 6512,
-            "ma_20_spread": 0.0736,
-            "ma_50_spread": 0.0902,
-            "ma_20_50_spread": 0.0154,
-            "eps_q0": -12.1,
-            "eps_q1": -10.89,
-            "eps_q2": -9.68,
-            "eps_q3": -8.47,
-            "per": 12.25,
-            "roe": 17.74
-        },
-        {
-            "ticker": "GDDY",
-            "name": "GoDaddy",
-            "industry": "Information Technology",
-            "ath": 216.0,
-            "lowest_after_ath": 73.06,
-            "price": 85.76,
-            "correction_ratio": 0.662,
-            "price_to_ath": 0.397,
-            "days_since_ath": 457,
-            "ma_20_spread": 0.0246,
-            "ma_50_spread": 0.0085,
-            "ma_20_50_spread": -0.0158,
-            "eps_q0": 23.4,
-            "eps_q1": 21.06,
-            "eps_q2": 18.72,
-            "eps_q3": 16.38,
-            "per": 13.79,
-            "roe": 192.9
-        },
-        {
-            "ticker": "CLX",
-            "name": "Clorox",
-            "industry": "Consumer Staples",
-            "ath": 239.87,
-            "lowest_after_ath": 93.39,
-            "price": 94.77,
-            "correction_ratio": 0.611,
-            "price_to_ath": 0.395,
-            "days_since_ath": 2095,
-            "ma_20_spread": -0.0675,
-            "ma_50_spread": -0.1318,
-            "ma_20_50_spread": -0.069,
-            "eps_q0": -18.7,
-            "eps_q1": -16.83,
-            "eps_q2": -14.96,
-            "eps_q3": -13.09,
-            "per": 15.51,
-            "roe": 987.18
-        },
-        {
-            "ticker": "WDAY",
-            "name": "Workday, Inc.",
-            "industry": "Information Technology",
-            "ath": 311.28,
-            "lowest_after_ath": 110.36,
-            "price": 122.43,
-            "correction_ratio": 0.645,
-            "price_to_ath": 0.393,
-            "days_since_ath": 793,
-            "ma_20_spread": -0.002,
-            "ma_50_spread": -0.0624,
-            "ma_20_50_spread": -0.0605,
-            "eps_q0": 54.3,
-            "eps_q1": 48.87,
-            "eps_q2": 43.44,
-            "eps_q3": 38.01,
-            "per": 47.27,
-            "roe": 8.23
-        },
-        {
-            "ticker": "MGM",
-            "name": "MGM Resorts",
-            "industry": "Consumer Discretionary",
-            "ath": 100.5,
-            "lowest_after_ath": 1.81,
-            "price": 39.27,
-            "correction_ratio": 0.982,
-            "price_to_ath": 0.391,
-            "days_since_ath": 6778,
-            "ma_20_spread": 0.0267,
-            "ma_50_spread": 0.0582,
-            "ma_20_50_spread": 0.0308,
-            "eps_q0": 86.5,
-            "eps_q1": 77.85,
-            "eps_q2": 69.2,
-            "eps_q3": 60.55,
-            "per": 51.67,
-            "roe": 14.89
-        },
-        {
-            "ticker": "BXP",
-            "name": "BXP, Inc.",
-            "industry": "Real Estate",
-            "ath": 147.83,
-            "lowest_after_ath": 46.18,
-            "price": 57.6,
-            "correction_ratio": 0.688,
-            "price_to_ath": 0.39,
-            "days_since_ath": 2263,
-            "ma_20_spread": 0.0393,
-            "ma_50_spread": 0.0429,
-            "ma_20_50_spread": 0.0034,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 33.1,
-            "roe": 4.92
-        },
-        {
-            "ticker": "BLDR",
-            "name": "Builders FirstSource",
-            "industry": "Industrials",
-            "ath": 214.7,
-            "lowest_after_ath": 76.5,
-            "price": 83.38,
-            "correction_ratio": 0.644,
-            "price_to_ath": 0.388,
-            "days_since_ath": 772,
-            "ma_20_spread": -0.0309,
-            "ma_50_spread": -0.0795,
-            "ma_20_50_spread": -0.0501,
-            "eps_q0": -83.5,
-            "eps_q1": -75.15,
-            "eps_q2": -66.8,
-            "eps_q3": -58.45,
-            "per": 21.43,
-            "roe": 10.06
-        },
-        {
-            "ticker": "TECH",
-            "name": "Bio-Techne",
-            "industry": "Health Care",
-            "ath": 135.96,
-            "lowest_after_ath": 46.01,
-            "price": 51.95,
-            "correction_ratio": 0.662,
-            "price_to_ath": 0.382,
-            "days_since_ath": 1682,
-            "ma_20_spread": -0.0703,
-            "ma_50_spread": -0.0537,
-            "ma_20_50_spread": 0.018,
-            "eps_q0": 8.9,
-            "eps_q1": 8.01,
-            "eps_q2": 7.12,
-            "eps_q3": 6.23,
-            "per": 98.02,
-            "roe": 3.97
-        },
-        {
-            "ticker": "GIS",
-            "name": "General Mills",
-            "industry": "Consumer Staples",
-            "ath": 90.89,
-            "lowest_after_ath": 34.04,
-            "price": 34.47,
-            "correction_ratio": 0.625,
-            "price_to_ath": 0.379,
-            "days_since_ath": 1080,
-            "ma_20_spread": -0.0324,
-            "ma_50_spread": -0.1143,
-            "ma_20_50_spread": -0.0846,
-            "eps_q0": -13.3,
-            "eps_q1": -11.97,
-            "eps_q2": -10.64,
-            "eps_q3": -9.31,
-            "per": 8.43,
-            "roe": 23.59
-        },
-        {
-            "ticker": "HRL",
-            "name": "Hormel Foods",
-            "industry": "Consumer Staples",
-            "ath": 55.11,
-            "lowest_after_ath": 20.32,
-            "price": 20.86,
-            "correction_ratio": 0.631,
-            "price_to_ath": 0.379,
-            "days_since_ath": 1472,
-            "ma_20_spread": -0.0207,
-            "ma_50_spread": -0.0829,
-            "ma_20_50_spread": -0.0636,
-            "eps_q0": -5.1,
-            "eps_q1": -4.59,
-            "eps_q2": -4.08,
-            "eps_q3": -3.57,
-            "per": 23.44,
-            "roe": 6.12
-        },
-        {
-            "ticker": "TAP",
-            "name": "Molson Coors Beverage Company",
-            "industry": "Consumer Staples",
-            "ath": 112.19,
-            "lowest_after_ath": 32.11,
-            "price": 42.41,
-            "correction_ratio": 0.714,
-            "price_to_ath": 0.378,
-            "days_since_ath": 3488,
-            "ma_20_spread": -0.0305,
-            "ma_50_spread": -0.0515,
-            "ma_20_50_spread": -0.0216,
-            "eps_q0": -17.2,
-            "eps_q1": -15.48,
-            "eps_q2": -13.76,
-            "eps_q3": -12.04,
-            "per": 8.52,
-            "roe": -18.17
-        },
-        {
-            "ticker": "NOW",
-            "name": "ServiceNow",
-            "industry": "Information Technology",
-            "ath": 239.62,
-            "lowest_after_ath": 81.24,
-            "price": 88.89,
-            "correction_ratio": 0.661,
-            "price_to_ath": 0.371,
-            "days_since_ath": 457,
-            "ma_20_spread": -0.0599,
-            "ma_50_spread": -0.1449,
-            "ma_20_50_spread": -0.0904,
-            "eps_q0": 2.0,
-            "eps_q1": 1.8,
-            "eps_q2": 1.6,
-            "eps_q3": 1.4,
-            "per": 52.91,
-            "roe": 16.07
-        },
-        {
-            "ticker": "LVS",
-            "name": "Las Vegas Sands",
-            "industry": "Consumer Discretionary",
-            "ath": 148.76,
-            "lowest_after_ath": 1.38,
-            "price": 53.72,
-            "correction_ratio": 0.991,
-            "price_to_ath": 0.361,
-            "days_since_ath": 6757,
-            "ma_20_spread": -0.0227,
-            "ma_50_spread": -0.0202,
-            "ma_20_50_spread": 0.0025,
-            "eps_q0": 61.1,
-            "eps_q1": 54.99,
-            "eps_q2": 48.88,
-            "eps_q3": 42.77,
-            "per": 19.82,
-            "roe": 90.45
-        },
-        {
-            "ticker": "POOL",
-            "name": "Pool Corporation",
-            "industry": "Consumer Discretionary",
-            "ath": 582.27,
-            "lowest_after_ath": 195.49,
-            "price": 209.61,
-            "correction_ratio": 0.664,
-            "price_to_ath": 0.36,
-            "days_since_ath": 1626,
-            "ma_20_spread": -0.0416,
-            "ma_50_spread": -0.0254,
-            "ma_20_50_spread": 0.0169,
-            "eps_q0": -0.6,
-            "eps_q1": -0.54,
-            "eps_q2": -0.48,
-            "eps_q3": -0.42,
-            "per": 19.27,
-            "roe": 34.24
-        },
-        {
-            "ticker": "CRL",
-            "name": "Charles River Laboratories",
-            "industry": "Health Care",
-            "ath": 460.21,
-            "lowest_after_ath": 91.86,
-            "price": 163.84,
-            "correction_ratio": 0.8,
-            "price_to_ath": 0.356,
-            "days_since_ath": 1682,
-            "ma_20_spread": -0.065,
-            "ma_50_spread": -0.0325,
-            "ma_20_50_spread": 0.0348,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 13.28,
-            "roe": -4.23
-        },
-        {
-            "ticker": "CCL",
-            "name": "Carnival",
-            "industry": "Consumer Discretionary",
-            "ath": 72.7,
-            "lowest_after_ath": 6.11,
-            "price": 25.58,
-            "correction_ratio": 0.916,
-            "price_to_ath": 0.352,
-            "days_since_ath": 3012,
-            "ma_20_spread": -0.061,
-            "ma_50_spread": -0.0616,
-            "ma_20_50_spread": -0.0007,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 11.27,
-            "roe": 27.85
-        },
-        {
-            "ticker": "ZBRA",
-            "name": "Zebra Technologies",
-            "industry": "Information Technology",
-            "ath": 615.0,
-            "lowest_after_ath": 194.59,
-            "price": 215.54,
-            "correction_ratio": 0.684,
-            "price_to_ath": 0.35,
-            "days_since_ath": 1605,
-            "ma_20_spread": -0.0346,
-            "ma_50_spread": -0.0233,
-            "ma_20_50_spread": 0.0117,
-            "eps_q0": -57.1,
-            "eps_q1": -51.39,
-            "eps_q2": -45.68,
-            "eps_q3": -39.97,
-            "per": 26.35,
-            "roe": 11.68
-        },
-        {
-            "ticker": "DXCM",
-            "name": "Dexcom",
-            "industry": "Health Care",
-            "ath": 164.86,
-            "lowest_after_ath": 54.11,
-            "price": 57.56,
-            "correction_ratio": 0.672,
-            "price_to_ath": 0.349,
-            "days_since_ath": 1626,
-            "ma_20_spread": -0.0808,
-            "ma_50_spread": -0.1323,
-            "ma_20_50_spread": -0.056,
-            "eps_q0": 76.2,
-            "eps_q1": 68.58,
-            "eps_q2": 60.96,
-            "eps_q3": 53.34,
-            "per": 27.54,
-            "roe": 34.5
-        },
-        {
-            "ticker": "ADBE",
-            "name": "Adobe Inc.",
-            "industry": "Information Technology",
-            "ath": 699.54,
-            "lowest_after_ath": 224.13,
-            "price": 243.57,
-            "correction_ratio": 0.68,
-            "price_to_ath": 0.348,
-            "days_since_ath": 1619,
-            "ma_20_spread": 0.0067,
-            "ma_50_spread": -0.0297,
-            "ma_20_50_spread": -0.0362,
-            "eps_q0": 4.3,
-            "eps_q1": 3.87,
-            "eps_q2": 3.44,
-            "eps_q3": 3.01,
-            "per": 14.19,
-            "roe": 58.77
-        },
-        {
-            "ticker": "WBD",
-            "name": "Warner Bros. Discovery",
-            "industry": "Communication Services",
-            "ath": 78.14,
-            "lowest_after_ath": 6.64,
-            "price": 27.05,
-            "correction_ratio": 0.915,
-            "price_to_ath": 0.346,
-            "days_since_ath": 1871,
-            "ma_20_spread": -0.0088,
-            "ma_50_spread": -0.0216,
-            "ma_20_50_spread": -0.013,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 93.28,
-            "roe": 2.08
-        },
-        {
-            "ticker": "CAG",
-            "name": "Conagra Brands",
-            "industry": "Consumer Staples",
-            "ath": 41.68,
-            "lowest_after_ath": 14.04,
-            "price": 14.23,
-            "correction_ratio": 0.663,
-            "price_to_ath": 0.341,
-            "days_since_ath": 3348,
-            "ma_20_spread": -0.0401,
-            "ma_50_spread": -0.1269,
-            "ma_20_50_spread": -0.0904,
-            "eps_q0": 37.7,
-            "eps_q1": 33.93,
-            "eps_q2": 30.16,
-            "eps_q3": 26.39,
-            "per": 8.38,
-            "roe": -0.51
-        },
-        {
-            "ticker": "CSGP",
-            "name": "CoStar Group",
-            "industry": "Real Estate",
-            "ath": 101.05,
-            "lowest_after_ath": 33.31,
-            "price": 34.14,
-            "correction_ratio": 0.67,
-            "price_to_ath": 0.338,
-            "days_since_ath": 1647,
-            "ma_20_spread": -0.1069,
-            "ma_50_spread": -0.1919,
-            "ma_20_50_spread": -0.0953,
-            "eps_q0": -22.6,
-            "eps_q1": -20.34,
-            "eps_q2": -18.08,
-            "eps_q3": -15.82,
-            "per": 487.71,
-            "roe": 0.09
-        },
-        {
-            "ticker": "SWK",
-            "name": "Stanley Black & Decker",
-            "industry": "Industrials",
-            "ath": 225.0,
-            "lowest_after_ath": 53.91,
-            "price": 75.89,
-            "correction_ratio": 0.76,
-            "price_to_ath": 0.337,
-            "days_since_ath": 1815,
-            "ma_20_spread": 0.0411,
-            "ma_50_spread": 0.0068,
-            "ma_20_50_spread": -0.033,
-            "eps_q0": -18.8,
-            "eps_q1": -16.92,
-            "eps_q2": -15.04,
-            "eps_q3": -13.16,
-            "per": 28.64,
-            "roe": 4.52
-        },
-        {
-            "ticker": "APTV",
-            "name": "Aptiv",
-            "industry": "Consumer Discretionary",
-            "ath": 180.81,
-            "lowest_after_ath": 47.19,
-            "price": 58.33,
-            "correction_ratio": 0.739,
-            "price_to_ath": 0.323,
-            "days_since_ath": 1640,
-            "ma_20_spread": -0.0252,
-            "ma_50_spread": -0.1366,
-            "ma_20_50_spread": -0.1143,
-            "eps_q0": -48.5,
-            "eps_q1": -43.65,
-            "eps_q2": -38.8,
-            "eps_q3": -33.95,
-            "per": 77.77,
-            "roe": 1.95
-        },
-        {
-            "ticker": "GPN",
-            "name": "Global Payments",
-            "industry": "Financials",
-            "ath": 220.81,
-            "lowest_after_ath": 62.45,
-            "price": 70.97,
-            "correction_ratio": 0.717,
-            "price_to_ath": 0.321,
-            "days_since_ath": 1829,
-            "ma_20_spread": 0.0418,
-            "ma_50_spread": -0.007,
-            "ma_20_50_spread": -0.0468,
-            "eps_q0": -61.6,
-            "eps_q1": -55.44,
-            "eps_q2": -49.28,
-            "eps_q3": -43.12,
-            "per": 16.02,
-            "roe": 4.82
-        },
-        {
-            "ticker": "DOC",
-            "name": "Healthpeak Properties",
-            "industry": "Real Estate",
-            "ath": 51.06,
-            "lowest_after_ath": 15.24,
-            "price": 15.99,
-            "correction_ratio": 0.702,
-            "price_to_ath": 0.313,
-            "days_since_ath": 4727,
-            "ma_20_spread": -0.0387,
-            "ma_50_spread": -0.0578,
-            "ma_20_50_spread": -0.0199,
-            "eps_q0": 2406.4,
-            "eps_q1": 2165.76,
-            "eps_q2": 1925.12,
-            "eps_q3": 1684.48,
-            "per": 159.9,
-            "roe": 1.16
-        },
-        {
-            "ticker": "SWKS",
-            "name": "Skyworks Solutions",
-            "industry": "Information Technology",
-            "ath": 204.0,
-            "lowest_after_ath": 47.93,
-            "price": 62.66,
-            "correction_ratio": 0.765,
-            "price_to_ath": 0.307,
-            "days_since_ath": 1829,
-            "ma_20_spread": 0.0707,
-            "ma_50_spread": 0.0942,
-            "ma_20_50_spread": 0.0219,
-            "eps_q0": -51.1,
-            "eps_q1": -45.99,
-            "eps_q2": -40.88,
-            "eps_q3": -35.77,
-            "per": 24.01,
-            "roe": 6.49
-        },
-        {
-            "ticker": "CPB",
-            "name": "Campbell's Company (The)",
-            "industry": "Consumer Staples",
-            "ath": 67.89,
-            "lowest_after_ath": 19.76,
-            "price": 20.45,
-            "correction_ratio": 0.709,
-            "price_to_ath": 0.301,
-            "days_since_ath": 3586,
-            "ma_20_spread": -0.0213,
-            "ma_50_spread": -0.0989,
-            "ma_20_50_spread": -0.0793,
-            "eps_q0": -16.2,
-            "eps_q1": -14.58,
-            "eps_q2": -12.96,
-            "eps_q3": -11.34,
-            "per": 11.11,
-            "roe": 13.89
-        },
-        {
-            "ticker": "BF-B",
-            "name": "Brown\u2013Forman",
-            "industry": "Consumer Staples",
-            "ath": 83.4,
-            "lowest_after_ath": 22.61,
-            "price": 24.87,
-            "correction_ratio": 0.729,
-            "price_to_ath": 0.298,
-            "days_since_ath": 2067,
-            "ma_20_spread": -0.117,
-            "ma_50_spread": -0.0751,
-            "ma_20_50_spread": 0.0474,
-            "eps_q0": -1.1,
-            "eps_q1": -0.99,
-            "eps_q2": -0.88,
-            "eps_q3": -0.77,
-            "per": 14.46,
-            "roe": 20.42
-        },
-        {
-            "ticker": "FIS",
-            "name": "Fidelity National Information Services",
-            "industry": "Financials",
-            "ath": 158.21,
-            "lowest_after_ath": 43.3,
-            "price": 46.22,
-            "correction_ratio": 0.726,
-            "price_to_ath": 0.292,
-            "days_since_ath": 2270,
-            "ma_20_spread": -0.0085,
-            "ma_50_spread": -0.0425,
-            "ma_20_50_spread": -0.0343,
-            "eps_q0": 81.5,
-            "eps_q1": 73.35,
-            "eps_q2": 65.2,
-            "eps_q3": 57.05,
-            "per": 63.32,
-            "roe": 2.6
-        },
-        {
-            "ticker": "WY",
-            "name": "Weyerhaeuser",
-            "industry": "Real Estate",
-            "ath": 87.09,
-            "lowest_after_ath": 13.1,
-            "price": 24.25,
-            "correction_ratio": 0.85,
-            "price_to_ath": 0.278,
-            "days_since_ath": 7002,
-            "ma_20_spread": -0.0178,
-            "ma_50_spread": -0.0055,
-            "ma_20_50_spread": 0.0125,
-            "eps_q0": -8.6,
-            "eps_q1": -7.74,
-            "eps_q2": -6.88,
-            "eps_q3": -6.02,
-            "per": 53.89,
-            "roe": 3.38
-        },
-        {
-            "ticker": "NCLH",
-            "name": "Norwegian Cruise Line Holdings",
-            "industry": "Consumer Discretionary",
-            "ath": 64.27,
-            "lowest_after_ath": 7.03,
-            "price": 17.77,
-            "correction_ratio": 0.891,
-            "price_to_ath": 0.276,
-            "days_since_ath": 3831,
-            "ma_20_spread": -0.087,
-            "ma_50_spread": -0.13,
-            "ma_20_50_spread": -0.0471,
-            "eps_q0": -94.4,
-            "eps_q1": -84.96,
-            "eps_q2": -75.52,
-            "eps_q3": -66.08,
-            "per": 19.32,
-            "roe": 23.29
-        },
-        {
-            "ticker": "APA",
-            "name": "APA Corporation",
-            "industry": "Energy",
-            "ath": 149.23,
-            "lowest_after_ath": 3.8,
-            "price": 40.32,
-            "correction_ratio": 0.975,
-            "price_to_ath": 0.27,
-            "days_since_ath": 6554,
-            "ma_20_spread": 0.0366,
-            "ma_50_spread": 0.1119,
-            "ma_20_50_spread": 0.0726,
-            "eps_q0": -21.2,
-            "eps_q1": -19.08,
-            "eps_q2": -16.96,
-            "eps_q3": -14.84,
-            "per": 10.11,
-            "roe": 25.32
-        },
-        {
-            "ticker": "LULU",
-            "name": "Lululemon Athletica",
-            "industry": "Consumer Discretionary",
-            "ath": 516.39,
-            "lowest_after_ath": 136.91,
-            "price": 138.16,
-            "correction_ratio": 0.735,
-            "price_to_ath": 0.268,
-            "days_since_ath": 856,
-            "ma_20_spread": -0.1199,
-            "ma_50_spread": -0.1553,
-            "ma_20_50_spread": -0.0403,
-            "eps_q0": -21.6,
-            "eps_q1": -19.44,
-            "eps_q2": -17.28,
-            "eps_q3": -15.12,
-            "per": 10.42,
-            "roe": 34.01
-        },
-        {
-            "ticker": "FISV",
-            "name": "Fiserv",
-            "industry": "Financials",
-            "ath": 238.59,
-            "lowest_after_ath": 52.91,
-            "price": 62.02,
-            "correction_ratio": 0.778,
-            "price_to_ath": 0.26,
-            "days_since_ath": 422,
-            "ma_20_spread": 0.0373,
-            "ma_50_spread": 0.0445,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.78,
-            "roe": 0
-        },
-        {
-            "ticker": "IT",
-            "name": "Gartner",
-            "industry": "Information Technology",
-            "ath": 584.01,
-            "lowest_after_ath": 139.18,
-            "price": 150.23,
-            "correction_ratio": 0.762,
-            "price_to_ath": 0.257,
-            "days_since_ath": 450,
-            "ma_20_spread": -0.0132,
-            "ma_50_spread": -0.0382,
-            "ma_20_50_spread": -0.0254,
-            "eps_q0": -39.2,
-            "eps_q1": -35.28,
-            "eps_q2": -31.36,
-            "eps_q3": -27.44,
-            "per": 15.57,
-            "roe": 86.86
-        },
-        {
-            "ticker": "NKE",
-            "name": "Nike, Inc.",
-            "industry": "Consumer Discretionary",
-            "ath": 179.1,
-            "lowest_after_ath": 42.09,
-            "price": 44.39,
-            "correction_ratio": 0.765,
-            "price_to_ath": 0.248,
-            "days_since_ath": 1640,
-            "ma_20_spread": -0.0049,
-            "ma_50_spread": -0.1502,
-            "ma_20_50_spread": -0.146,
-            "eps_q0": -34.5,
-            "eps_q1": -31.05,
-            "eps_q2": -27.6,
-            "eps_q3": -24.15,
-            "per": 29.2,
-            "roe": 16.02
-        },
-        {
-            "ticker": "ALGN",
-            "name": "Align Technology",
-            "industry": "Health Care",
-            "ath": 737.45,
-            "lowest_after_ath": 122.0,
-            "price": 178.4,
-            "correction_ratio": 0.835,
-            "price_to_ath": 0.242,
-            "days_since_ath": 1682,
-            "ma_20_spread": -0.019,
-            "ma_50_spread": -0.0072,
-            "ma_20_50_spread": 0.012,
-            "eps_q0": 30.8,
-            "eps_q1": 27.72,
-            "eps_q2": 24.64,
-            "eps_q3": 21.56,
-            "per": 31.52,
-            "roe": 10.39
-        },
-        {
-            "ticker": "XYZ",
-            "name": "Block, Inc.",
-            "industry": "Financials",
-            "ath": 289.23,
-            "lowest_after_ath": 38.85,
-            "price": 69.46,
-            "correction_ratio": 0.866,
-            "price_to_ath": 0.24,
-            "days_since_ath": 1731,
-            "ma_20_spread": 0.0399,
-            "ma_50_spread": 0.1136,
-            "ma_20_50_spread": 0.0709,
-            "eps_q0": -94.1,
-            "eps_q1": -84.69,
-            "eps_q2": -75.28,
-            "eps_q3": -65.87,
-            "per": 33.08,
-            "roe": 6.01
-        },
-        {
-            "ticker": "KHC",
-            "name": "Kraft Heinz",
-            "industry": "Consumer Staples",
-            "ath": 97.77,
-            "lowest_after_ath": 19.99,
-            "price": 22.42,
-            "correction_ratio": 0.796,
-            "price_to_ath": 0.229,
-            "days_since_ath": 3362,
-            "ma_20_spread": -0.0024,
-            "ma_50_spread": -0.0219,
-            "ma_20_50_spread": -0.0195,
-            "eps_q0": -69.5,
-            "eps_q1": -62.55,
-            "eps_q2": -55.6,
-            "eps_q3": -48.65,
-            "per": 10.48,
-            "roe": -12.84
-        },
-        {
-            "ticker": "PCG",
-            "name": "PG&E Corporation",
-            "industry": "Utilities",
-            "ath": 71.57,
-            "lowest_after_ath": 3.55,
-            "price": 16.37,
-            "correction_ratio": 0.95,
-            "price_to_ath": 0.229,
-            "days_since_ath": 3152,
-            "ma_20_spread": -0.0575,
-            "ma_50_spread": -0.082,
-            "ma_20_50_spread": -0.026,
-            "eps_q0": 41.4,
-            "eps_q1": 37.26,
-            "eps_q2": 33.12,
-            "eps_q3": 28.98,
-            "per": 12.69,
-            "roe": 8.83
-        },
-        {
-            "ticker": "KDP",
-            "name": "Keurig Dr Pepper",
-            "industry": "Consumer Staples",
-            "ath": 126.65,
-            "lowest_after_ath": 18.98,
-            "price": 28.93,
-            "correction_ratio": 0.85,
-            "price_to_ath": 0.228,
-            "days_since_ath": 3012,
-            "ma_20_spread": 0.082,
-            "ma_50_spread": 0.0502,
-            "ma_20_50_spread": -0.0294,
-            "eps_q0": -47.8,
-            "eps_q1": -43.02,
-            "eps_q2": -38.24,
-            "eps_q3": -33.46,
-            "per": 21.43,
-            "roe": 6.31
-        },
-        {
-            "ticker": "C",
-            "name": "Citigroup",
-            "industry": "Financials",
-            "ath": 570.0,
-            "lowest_after_ath": 9.7,
-            "price": 127.61,
-            "correction_ratio": 0.983,
-            "price_to_ath": 0.224,
-            "days_since_ath": 7065,
-            "ma_20_spread": 0.0115,
-            "ma_50_spread": 0.0925,
-            "ma_20_50_spread": 0.08,
-            "eps_q0": 42.3,
-            "eps_q1": 38.07,
-            "eps_q2": 33.84,
-            "eps_q3": 29.61,
-            "per": 15.79,
-            "roe": 7.65
-        },
-        {
-            "ticker": "SMCI",
-            "name": "Supermicro",
-            "industry": "Information Technology",
-            "ath": 122.9,
-            "lowest_after_ath": 17.25,
-            "price": 26.32,
-            "correction_ratio": 0.86,
-            "price_to_ath": 0.214,
-            "days_since_ath": 786,
-            "ma_20_spread": 0.0058,
-            "ma_50_spread": -0.0564,
-            "ma_20_50_spread": -0.0618,
-            "eps_q0": 24.9,
-            "eps_q1": 22.41,
-            "eps_q2": 19.92,
-            "eps_q3": 17.43,
-            "per": 19.21,
-            "roe": 13.19
-        },
-        {
-            "ticker": "EL",
-            "name": "Est\u00e9e Lauder Companies (The)",
-            "industry": "Consumer Staples",
-            "ath": 374.2,
-            "lowest_after_ath": 48.37,
-            "price": 75.69,
-            "correction_ratio": 0.871,
-            "price_to_ath": 0.202,
-            "days_since_ath": 1577,
-            "ma_20_spread": 0.0152,
-            "ma_50_spread": -0.1125,
-            "ma_20_50_spread": -0.1258,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 25.09,
-            "roe": -4.34
-        },
-        {
-            "ticker": "VTRS",
-            "name": "Viatris",
-            "industry": "Health Care",
-            "ath": 76.69,
-            "lowest_after_ath": 6.85,
-            "price": 14.97,
-            "correction_ratio": 0.911,
-            "price_to_ath": 0.195,
-            "days_since_ath": 4027,
-            "ma_20_spread": 0.0593,
-            "ma_50_spread": 0.0495,
-            "ma_20_50_spread": -0.0093,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 5.62,
-            "roe": -21.08
-        },
-        {
-            "ticker": "CHTR",
-            "name": "Charter Communications",
-            "industry": "Communication Services",
-            "ath": 825.62,
-            "lowest_after_ath": 158.42,
-            "price": 158.65,
-            "correction_ratio": 0.808,
-            "price_to_ath": 0.192,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.2682,
-            "ma_50_spread": -0.2816,
-            "ma_20_50_spread": -0.0184,
-            "eps_q0": -4.4,
-            "eps_q1": -3.96,
-            "eps_q2": -3.52,
-            "eps_q3": -3.08,
-            "per": 4.29,
-            "roe": 27.5
-        },
-        {
-            "ticker": "ARE",
-            "name": "Alexandria Real Estate Equities",
-            "industry": "Real Estate",
-            "ath": 224.95,
-            "lowest_after_ath": 39.41,
-            "price": 41.05,
-            "correction_ratio": 0.825,
-            "price_to_ath": 0.182,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0905,
-            "ma_50_spread": -0.1516,
-            "ma_20_50_spread": -0.0671,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -513.12,
-            "roe": -4.14
-        },
-        {
-            "ticker": "BAX",
-            "name": "Baxter International",
-            "industry": "Health Care",
-            "ath": 95.19,
-            "lowest_after_ath": 15.73,
-            "price": 16.9,
-            "correction_ratio": 0.835,
-            "price_to_ath": 0.178,
-            "days_since_ath": 2200,
-            "ma_20_spread": -0.0442,
-            "ma_50_spread": -0.0662,
-            "ma_20_50_spread": -0.023,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 8.35,
-            "roe": -13.71
-        },
-        {
-            "ticker": "TTD",
-            "name": "Trade Desk (The)",
-            "industry": "Communication Services",
-            "ath": 141.53,
-            "lowest_after_ath": 19.74,
-            "price": 24.37,
-            "correction_ratio": 0.861,
-            "price_to_ath": 0.172,
-            "days_since_ath": 513,
-            "ma_20_spread": 0.0931,
-            "ma_50_spread": 0.0205,
-            "ma_20_50_spread": -0.0664,
-            "eps_q0": 2.6,
-            "eps_q1": 2.34,
-            "eps_q2": 2.08,
-            "eps_q3": 1.82,
-            "per": 27.08,
-            "roe": 16.32
-        },
-        {
-            "ticker": "PYPL",
-            "name": "PayPal",
-            "industry": "Financials",
-            "ath": 310.16,
-            "lowest_after_ath": 38.46,
-            "price": 50.94,
-            "correction_ratio": 0.876,
-            "price_to_ath": 0.164,
-            "days_since_ath": 1738,
-            "ma_20_spread": 0.0533,
-            "ma_50_spread": 0.0983,
-            "ma_20_50_spread": 0.0426,
-            "eps_q0": 28.2,
-            "eps_q1": 25.38,
-            "eps_q2": 22.56,
-            "eps_q3": 19.74,
-            "per": 9.42,
-            "roe": 25.73
-        },
-        {
-            "ticker": "EPAM",
-            "name": "EPAM Systems",
-            "industry": "Information Technology",
-            "ath": 725.4,
-            "lowest_after_ath": 110.97,
-            "price": 112.91,
-            "correction_ratio": 0.847,
-            "price_to_ath": 0.156,
-            "days_since_ath": 1640,
-            "ma_20_spread": -0.1095,
-            "ma_50_spread": -0.1563,
-            "ma_20_50_spread": -0.0525,
-            "eps_q0": 5.9,
-            "eps_q1": 5.31,
-            "eps_q2": 4.72,
-            "eps_q3": 4.13,
-            "per": 16.8,
-            "roe": 10.33
-        },
-        {
-            "ticker": "MOS",
-            "name": "Mosaic Company (The)",
-            "industry": "Materials",
-            "ath": 163.25,
-            "lowest_after_ath": 6.5,
-            "price": 23.03,
-            "correction_ratio": 0.96,
-            "price_to_ath": 0.141,
-            "days_since_ath": 6526,
-            "ma_20_spread": -0.0682,
-            "ma_50_spread": -0.1201,
-            "ma_20_50_spread": -0.0557,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 13.55,
-            "roe": 4.82
-        },
-        {
-            "ticker": "PSKY",
-            "name": "Paramount Skydance Corporation",
-            "industry": "Communication Services",
-            "ath": 101.97,
-            "lowest_after_ath": 8.62,
-            "price": 10.34,
-            "correction_ratio": 0.915,
-            "price_to_ath": 0.101,
-            "days_since_ath": 1871,
-            "ma_20_spread": -0.05,
-            "ma_50_spread": -0.0204,
-            "ma_20_50_spread": 0.0311,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 344.67,
-            "roe": -0.86
-        },
-        {
-            "ticker": "MRNA",
-            "name": "Moderna",
-            "industry": "Health Care",
-            "ath": 497.49,
-            "lowest_after_ath": 22.28,
-            "price": 45.72,
-            "correction_ratio": 0.955,
-            "price_to_ath": 0.092,
-            "days_since_ath": 1724,
-            "ma_20_spread": -0.1107,
-            "ma_50_spread": -0.1184,
-            "ma_20_50_spread": -0.0087,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -9.67,
-            "roe": -28.87
-        },
-        {
-            "ticker": "AIG",
-            "name": "American International Group",
-            "industry": "Financials",
-            "ath": 1459.4,
-            "lowest_after_ath": 6.6,
-            "price": 73.79,
-            "correction_ratio": 0.995,
-            "price_to_ath": 0.051,
-            "days_since_ath": 7072,
-            "ma_20_spread": -0.0357,
-            "ma_50_spread": -0.0423,
-            "ma_20_50_spread": -0.0068,
-            "eps_q0": -18.2,
-            "eps_q1": -16.38,
-            "eps_q2": -14.56,
-            "eps_q3": -12.74,
-            "per": 13.59,
-            "roe": 7.4
-        }
-    ],
-    "NASDAQ": [
-        {
-            "ticker": "INTC",
-            "name": "Intel Corp",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 94.95,
-            "lowest_after_ath": 85.87,
-            "price": 94.75,
-            "correction_ratio": 0.096,
-            "price_to_ath": 0.998,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.4282,
-            "ma_50_spread": 0.7701,
-            "ma_20_50_spread": 0.2394,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 64.34,
-            "roe": -2.91
-        },
-        {
-            "ticker": "STRC",
-            "name": "Strategy Variable Rate Perpetual Stretch Prf Shs Series A",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 100.42,
-            "lowest_after_ath": 93.1,
-            "price": 99.47,
-            "correction_ratio": 0.073,
-            "price_to_ath": 0.991,
-            "days_since_ath": 107,
-            "ma_20_spread": -0.0019,
-            "ma_50_spread": -0.0032,
-            "ma_20_50_spread": -0.0014,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": -11.11
-        },
-        {
-            "ticker": "CSCO",
-            "name": "Cisco Systems Inc",
-            "industry": "\ud1b5\uc2e0 \ubc0f \ub124\ud2b8\uc6cc\ud0b9",
-            "ath": 90.45,
-            "lowest_after_ath": 85.78,
-            "price": 89.57,
-            "correction_ratio": 0.052,
-            "price_to_ath": 0.99,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.057,
-            "ma_50_spread": 0.1033,
-            "ma_20_50_spread": 0.0437,
-            "eps_q0": 30.8,
-            "eps_q1": 27.72,
-            "eps_q2": 24.64,
-            "eps_q3": 21.56,
-            "per": 32.22,
-            "roe": 23.75
-        },
-        {
-            "ticker": "AMZN",
-            "name": "Amazon.com Inc",
-            "industry": "\ubc31\ud654\uc810",
-            "ath": 265.91,
-            "lowest_after_ath": 257.7,
-            "price": 263.04,
-            "correction_ratio": 0.031,
-            "price_to_ath": 0.989,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.0882,
-            "ma_50_spread": 0.1831,
-            "ma_20_50_spread": 0.0872,
-            "eps_q0": 5.9,
-            "eps_q1": 5.31,
-            "eps_q2": 4.72,
-            "eps_q3": 4.13,
-            "per": 36.69,
-            "roe": 22.29
-        },
-        {
-            "ticker": "EA",
-            "name": "Electronic Arts Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 204.89,
-            "lowest_after_ath": 196.4,
-            "price": 202.67,
-            "correction_ratio": 0.041,
-            "price_to_ath": 0.989,
-            "days_since_ath": 121,
-            "ma_20_spread": -0.0023,
-            "ma_50_spread": 0.0047,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": -70.0,
-            "eps_q1": -63.0,
-            "eps_q2": -56.0,
-            "eps_q3": -49.0,
-            "per": 75.91,
-            "roe": 10.03
-        },
-        {
-            "ticker": "BTSGU",
-            "name": "BrightSpring Health Services Units",
-            "industry": "\uc758\ub8cc \uc2dc\uc124 \ubc0f \uc11c\ube44\uc2a4",
-            "ath": 162.22,
-            "lowest_after_ath": 158.33,
-            "price": 160.0,
-            "correction_ratio": 0.024,
-            "price_to_ath": 0.986,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0418,
-            "ma_50_spread": 0.1077,
-            "ma_20_50_spread": 0.0633,
-            "eps_q0": 381.8,
-            "eps_q1": 343.62,
-            "eps_q2": 305.44,
-            "eps_q3": 267.26,
-            "per": 0,
-            "roe": 5.92
-        },
-        {
-            "ticker": "EWBC",
-            "name": "East West Bancorp Inc",
-            "industry": "\uc740\ud589",
-            "ath": 126.5,
-            "lowest_after_ath": 123.36,
-            "price": 124.7,
-            "correction_ratio": 0.025,
-            "price_to_ath": 0.986,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0586,
-            "ma_50_spread": 0.1074,
-            "ma_20_50_spread": 0.0461,
-            "eps_q0": 23.3,
-            "eps_q1": 20.97,
-            "eps_q2": 18.64,
-            "eps_q3": 16.31,
-            "per": 12.46,
-            "roe": 16.45
-        },
-        {
-            "ticker": "GOOGL",
-            "name": "Alphabet Inc Class A",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 355.79,
-            "lowest_after_ath": 344.21,
-            "price": 349.94,
-            "correction_ratio": 0.033,
-            "price_to_ath": 0.984,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.0664,
-            "ma_50_spread": 0.1208,
-            "ma_20_50_spread": 0.051,
-            "eps_q0": 29.8,
-            "eps_q1": 26.82,
-            "eps_q2": 23.84,
-            "eps_q3": 20.86,
-            "per": 32.37,
-            "roe": 35.71
-        },
-        {
-            "ticker": "FLEX",
-            "name": "Flex Ltd",
-            "industry": "\uc804\uc790 \uc7a5\ube44 \ubc0f \ubd80\ud488",
-            "ath": 92.05,
-            "lowest_after_ath": 84.67,
-            "price": 90.6,
-            "correction_ratio": 0.08,
-            "price_to_ath": 0.984,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1344,
-            "ma_50_spread": 0.2859,
-            "ma_20_50_spread": 0.1335,
-            "eps_q0": -9.1,
-            "eps_q1": -8.19,
-            "eps_q2": -7.28,
-            "eps_q3": -6.37,
-            "per": 40.63,
-            "roe": 16.85
-        },
-        {
-            "ticker": "GOOG",
-            "name": "Alphabet Inc Class C",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 353.39,
-            "lowest_after_ath": 342.43,
-            "price": 347.31,
-            "correction_ratio": 0.031,
-            "price_to_ath": 0.983,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.0652,
-            "ma_50_spread": 0.1165,
-            "ma_20_50_spread": 0.0482,
-            "eps_q0": 29.8,
-            "eps_q1": 26.82,
-            "eps_q2": 23.84,
-            "eps_q3": 20.86,
-            "per": 32.13,
-            "roe": 35.71
-        },
-        {
-            "ticker": "PFG",
-            "name": "Principal Financial Group Inc",
-            "industry": "\uc0dd\uba85 \ubc0f \uac74\uac15 \ubcf4\ud5d8",
-            "ath": 101.54,
-            "lowest_after_ath": 94.81,
-            "price": 99.63,
-            "correction_ratio": 0.066,
-            "price_to_ath": 0.981,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0497,
-            "ma_50_spread": 0.0801,
-            "ma_20_50_spread": 0.029,
-            "eps_q0": 782.7,
-            "eps_q1": 704.43,
-            "eps_q2": 626.16,
-            "eps_q3": 547.89,
-            "per": 14.29,
-            "roe": 13.39
-        },
-        {
-            "ticker": "STLD",
-            "name": "Steel Dynamics Inc",
-            "industry": "\ucca0 \ubc0f \uac15\ucca0",
-            "ath": 229.0,
-            "lowest_after_ath": 199.91,
-            "price": 224.37,
-            "correction_ratio": 0.127,
-            "price_to_ath": 0.98,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1077,
-            "ma_50_spread": 0.1803,
-            "ma_20_50_spread": 0.0655,
-            "eps_q0": 85.8,
-            "eps_q1": 77.22,
-            "eps_q2": 68.64,
-            "eps_q3": 60.06,
-            "per": 24.05,
-            "roe": 15.25
-        },
-        {
-            "ticker": "LIN",
-            "name": "Linde PLC",
-            "industry": "\uc0c1\ud488 \ud654\ud559",
-            "ath": 515.63,
-            "lowest_after_ath": 503.46,
-            "price": 504.71,
-            "correction_ratio": 0.024,
-            "price_to_ath": 0.979,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0067,
-            "ma_50_spread": 0.0168,
-            "ma_20_50_spread": 0.01,
-            "eps_q0": -11.3,
-            "eps_q1": -10.17,
-            "eps_q2": -9.04,
-            "eps_q3": -7.91,
-            "per": 34.59,
-            "roe": 17.82
-        },
-        {
-            "ticker": "ENLT",
-            "name": "Enlight Renewable Energy Ltd",
-            "industry": "\ubbfc\uc790 \ubc1c\uc804 \uc0ac\uc5c5",
-            "ath": 89.84,
-            "lowest_after_ath": 86.66,
-            "price": 87.94,
-            "correction_ratio": 0.035,
-            "price_to_ath": 0.979,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1089,
-            "ma_50_spread": 0.1752,
-            "ma_20_50_spread": 0.0598,
-            "eps_q0": 176.6,
-            "eps_q1": 158.94,
-            "eps_q2": 141.28,
-            "eps_q3": 123.62,
-            "per": 87.94,
-            "roe": 9.35
-        },
-        {
-            "ticker": "MCHPP",
-            "name": "Microchip Technology Dep Shs Repstg 1 20Th Pfd Conv Ser A",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 78.44,
-            "lowest_after_ath": 68.14,
-            "price": 76.69,
-            "correction_ratio": 0.131,
-            "price_to_ath": 0.978,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1459,
-            "ma_50_spread": 0.218,
-            "ma_20_50_spread": 0.0629,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": -1.09
-        },
-        {
-            "ticker": "NXPI",
-            "name": "NXP Semiconductors NV",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 296.08,
-            "lowest_after_ath": 148.09,
-            "price": 289.25,
-            "correction_ratio": 0.5,
-            "price_to_ath": 0.977,
-            "days_since_ath": 653,
-            "ma_20_spread": 0.3247,
-            "ma_50_spread": 0.3631,
-            "ma_20_50_spread": 0.029,
-            "eps_q0": -8.1,
-            "eps_q1": -7.29,
-            "eps_q2": -6.48,
-            "eps_q3": -5.67,
-            "per": 27.65,
-            "roe": 20.7
-        },
-        {
-            "ticker": "ROST",
-            "name": "Ross Stores Inc",
-            "industry": "\uc758\ub958 \ubc0f \uc561\uc138\uc11c\ub9ac \uc18c\ub9e4",
-            "ath": 230.44,
-            "lowest_after_ath": 223.82,
-            "price": 225.08,
-            "correction_ratio": 0.029,
-            "price_to_ath": 0.977,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0056,
-            "ma_50_spread": 0.049,
-            "ma_20_50_spread": 0.0431,
-            "eps_q0": 10.1,
-            "eps_q1": 9.09,
-            "eps_q2": 8.08,
-            "eps_q3": 7.07,
-            "per": 34.05,
-            "roe": 36.68
-        },
-        {
-            "ticker": "MU",
-            "name": "Micron Technology Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 531.36,
-            "lowest_after_ath": 488.23,
-            "price": 518.46,
-            "correction_ratio": 0.081,
-            "price_to_ath": 0.976,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1638,
-            "ma_50_spread": 0.2308,
-            "ma_20_50_spread": 0.0576,
-            "eps_q0": 770.8,
-            "eps_q1": 693.72,
-            "eps_q2": 616.64,
-            "eps_q3": 539.56,
-            "per": 24.48,
-            "roe": 39.82
-        },
-        {
-            "ticker": "AEP",
-            "name": "American Electric Power Company Inc",
-            "industry": "\uc804\ub825 \uc720\ud2f8\ub9ac\ud2f0",
-            "ath": 137.74,
-            "lowest_after_ath": 131.2,
-            "price": 134.44,
-            "correction_ratio": 0.047,
-            "price_to_ath": 0.976,
-            "days_since_ath": 23,
-            "ma_20_spread": 0.0025,
-            "ma_50_spread": 0.0165,
-            "ma_20_50_spread": 0.0139,
-            "eps_q0": -12.3,
-            "eps_q1": -11.07,
-            "eps_q2": -9.84,
-            "eps_q3": -8.61,
-            "per": 20.19,
-            "roe": 12.49
-        },
-        {
-            "ticker": "VLYPN",
-            "name": "Valley National Bancorp 8 250 Fixed Rate Reset Non Cumulative 8.250",
-            "industry": "\uc740\ud589",
-            "ath": 26.88,
-            "lowest_after_ath": 23.75,
-            "price": 26.12,
-            "correction_ratio": 0.116,
-            "price_to_ath": 0.972,
-            "days_since_ath": 590,
-            "ma_20_spread": 0.0073,
-            "ma_50_spread": 0.0095,
-            "ma_20_50_spread": 0.0022,
-            "eps_q0": 54.6,
-            "eps_q1": 49.14,
-            "eps_q2": 43.68,
-            "eps_q3": 38.22,
-            "per": 0,
-            "roe": 8.56
-        },
-        {
-            "ticker": "LAMR",
-            "name": "Lamar Advertising Co",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 139.88,
-            "lowest_after_ath": 99.84,
-            "price": 135.98,
-            "correction_ratio": 0.286,
-            "price_to_ath": 0.972,
-            "days_since_ath": 562,
-            "ma_20_spread": 0.0232,
-            "ma_50_spread": 0.0252,
-            "ma_20_50_spread": 0.002,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 23.57,
-            "roe": 57.22
-        },
-        {
-            "ticker": "CASY",
-            "name": "Caseys General Stores Inc",
-            "industry": "\uc2dd\ud488 \uc18c\ub9e4 \ubc0f \uc720\ud1b5",
-            "ath": 806.49,
-            "lowest_after_ath": 771.44,
-            "price": 781.5,
-            "correction_ratio": 0.043,
-            "price_to_ath": 0.969,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0266,
-            "ma_50_spread": 0.0956,
-            "ma_20_50_spread": 0.0672,
-            "eps_q0": 49.3,
-            "eps_q1": 44.37,
-            "eps_q2": 39.44,
-            "eps_q3": 34.51,
-            "per": 44.86,
-            "roe": 17.88
-        },
-        {
-            "ticker": "LNT",
-            "name": "Alliant Energy Corp",
-            "industry": "\uc804\ub825 \uc720\ud2f8\ub9ac\ud2f0",
-            "ath": 74.4,
-            "lowest_after_ath": 70.61,
-            "price": 72.0,
-            "correction_ratio": 0.051,
-            "price_to_ath": 0.968,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0059,
-            "ma_50_spread": 0.0041,
-            "ma_20_50_spread": 0.0101,
-            "eps_q0": -5.3,
-            "eps_q1": -4.77,
-            "eps_q2": -4.24,
-            "eps_q3": -3.71,
-            "per": 22.93,
-            "roe": 11.3
-        },
-        {
-            "ticker": "EBAY",
-            "name": "eBay Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 107.34,
-            "lowest_after_ath": 97.29,
-            "price": 103.79,
-            "correction_ratio": 0.094,
-            "price_to_ath": 0.967,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.039,
-            "ma_50_spread": 0.1089,
-            "ma_20_50_spread": 0.0672,
-            "eps_q0": -22.2,
-            "eps_q1": -19.98,
-            "eps_q2": -17.76,
-            "eps_q3": -15.54,
-            "per": 24.36,
-            "roe": 40.85
-        },
-        {
-            "ticker": "FITBM",
-            "name": "Fifth Third Bancorp Depositary Shares Representing a 1 40th Ownership Interest",
-            "industry": "\uc740\ud589",
-            "ath": 26.49,
-            "lowest_after_ath": 25.19,
-            "price": 25.62,
-            "correction_ratio": 0.049,
-            "price_to_ath": 0.967,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.012,
-            "ma_50_spread": -0.0157,
-            "ma_20_50_spread": -0.0037,
-            "eps_q0": -68.0,
-            "eps_q1": -61.2,
-            "eps_q2": -54.4,
-            "eps_q3": -47.6,
-            "per": 0,
-            "roe": 7.97
-        },
-        {
-            "ticker": "TIGO",
-            "name": "Millicom International Cellular SA",
-            "industry": "\ubb34\uc120 \ud1b5\uc2e0 \uc11c\ube44\uc2a4",
-            "ath": 85.05,
-            "lowest_after_ath": 79.89,
-            "price": 82.22,
-            "correction_ratio": 0.061,
-            "price_to_ath": 0.967,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0058,
-            "ma_50_spread": 0.0872,
-            "ma_20_50_spread": 0.081,
-            "eps_q0": 712.9,
-            "eps_q1": 641.61,
-            "eps_q2": 570.32,
-            "eps_q3": 499.03,
-            "per": 10.5,
-            "roe": 37.87
-        },
-        {
-            "ticker": "AGNCP",
-            "name": "Agnc Invt 1000 Dep Shs Repstg Cum Red Prf Series F",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 25.71,
-            "lowest_after_ath": 16.79,
-            "price": 24.84,
-            "correction_ratio": 0.347,
-            "price_to_ath": 0.966,
-            "days_since_ath": 1689,
-            "ma_20_spread": 0.0171,
-            "ma_50_spread": 0.0068,
-            "ma_20_50_spread": -0.0101,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 13.25
-        },
-        {
-            "ticker": "NVDA",
-            "name": "NVIDIA Corp",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 216.83,
-            "lowest_after_ath": 207.38,
-            "price": 209.25,
-            "correction_ratio": 0.044,
-            "price_to_ath": 0.965,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.0732,
-            "ma_50_spread": 0.1207,
-            "ma_20_50_spread": 0.0443,
-            "eps_q0": 94.5,
-            "eps_q1": 85.05,
-            "eps_q2": 75.6,
-            "eps_q3": 66.15,
-            "per": 42.7,
-            "roe": 101.48
-        },
-        {
-            "ticker": "SNDK",
-            "name": "Sandisk Corp",
-            "industry": "\ucef4\ud4e8\ud130 \ud558\ub4dc\uc6e8\uc5b4",
-            "ath": 1103.0,
-            "lowest_after_ath": 1060.0,
-            "price": 1064.21,
-            "correction_ratio": 0.039,
-            "price_to_ath": 0.965,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.1959,
-            "ma_50_spread": 0.4349,
-            "ma_20_50_spread": 0.1999,
-            "eps_q0": 672.1,
-            "eps_q1": 604.89,
-            "eps_q2": 537.68,
-            "eps_q3": 470.47,
-            "per": 9.01,
-            "roe": -9.37
-        },
-        {
-            "ticker": "EQIX",
-            "name": "Equinix Inc",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 1128.68,
-            "lowest_after_ath": 1063.29,
-            "price": 1089.07,
-            "correction_ratio": 0.058,
-            "price_to_ath": 0.965,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0271,
-            "ma_50_spread": 0.0889,
-            "ma_20_50_spread": 0.0602,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 79.03,
-            "roe": 9.72
-        },
-        {
-            "ticker": "AGNCZ",
-            "name": "AGNC Investment 8 75 Fixed Rate Cumulative Redeemable Prf Shs Series H",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 26.37,
-            "lowest_after_ath": 24.58,
-            "price": 25.41,
-            "correction_ratio": 0.068,
-            "price_to_ath": 0.964,
-            "days_since_ath": 72,
-            "ma_20_spread": 0.0113,
-            "ma_50_spread": -0.0008,
-            "ma_20_50_spread": -0.0119,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 13.25
-        },
-        {
-            "ticker": "JAZZ",
-            "name": "Jazz Pharmaceuticals PLC",
-            "industry": "\uc81c\uc57d",
-            "ath": 207.48,
-            "lowest_after_ath": 194.77,
-            "price": 199.92,
-            "correction_ratio": 0.061,
-            "price_to_ath": 0.964,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0138,
-            "ma_50_spread": 0.0599,
-            "ma_20_50_spread": 0.0454,
-            "eps_q0": 6.5,
-            "eps_q1": 5.85,
-            "eps_q2": 5.2,
-            "eps_q3": 4.55,
-            "per": 7.94,
-            "roe": -8.47
-        },
-        {
-            "ticker": "JBHT",
-            "name": "J B Hunt Transport Services Inc",
-            "industry": "\uc9c0\uc0c1 \ud654\ubb3c \ubc0f \ubb3c\ub958",
-            "ath": 256.18,
-            "lowest_after_ath": 241.83,
-            "price": 246.31,
-            "correction_ratio": 0.056,
-            "price_to_ath": 0.961,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.047,
-            "ma_50_spread": 0.1056,
-            "ma_20_50_spread": 0.056,
-            "eps_q0": 20.2,
-            "eps_q1": 18.18,
-            "eps_q2": 16.16,
-            "eps_q3": 14.14,
-            "per": 38.31,
-            "roe": 16.68
-        },
-        {
-            "ticker": "CSX",
-            "name": "CSX Corp",
-            "industry": "\uc9c0\uc0c1 \ud654\ubb3c \ubc0f \ubb3c\ub958",
-            "ath": 46.55,
-            "lowest_after_ath": 42.88,
-            "price": 44.68,
-            "correction_ratio": 0.079,
-            "price_to_ath": 0.96,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0359,
-            "ma_50_spread": 0.072,
-            "ma_20_50_spread": 0.0349,
-            "eps_q0": 24.9,
-            "eps_q1": 22.41,
-            "eps_q2": 19.92,
-            "eps_q3": 17.43,
-            "per": 27.41,
-            "roe": 23.68
-        },
-        {
-            "ticker": "FANG",
-            "name": "Diamondback Energy Inc",
-            "industry": "\uc624\uc77c, \uac00\uc2a4 \ud0d0\uc0ac \ubc0f \uc0dd\uc0b0",
-            "ath": 214.5,
-            "lowest_after_ath": 114.0,
-            "price": 205.32,
-            "correction_ratio": 0.469,
-            "price_to_ath": 0.957,
-            "days_since_ath": 653,
-            "ma_20_spread": 0.0741,
-            "ma_50_spread": 0.1015,
-            "ma_20_50_spread": 0.0254,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 35.9,
-            "roe": 3.74
-        },
-        {
-            "ticker": "HBANL",
-            "name": "Huntington Bancshares Dep Shs Repstg 1 40Th Int Non Cum Perp Prf Depositary",
-            "industry": "\uc740\ud589",
-            "ath": 26.61,
-            "lowest_after_ath": 24.31,
-            "price": 25.47,
-            "correction_ratio": 0.086,
-            "price_to_ath": 0.957,
-            "days_since_ath": 513,
-            "ma_20_spread": 0.009,
-            "ma_50_spread": 0.0076,
-            "ma_20_50_spread": -0.0013,
-            "eps_q0": -0.8,
-            "eps_q1": -0.72,
-            "eps_q2": -0.64,
-            "eps_q3": -0.56,
-            "per": 0,
-            "roe": 8.39
-        },
-        {
-            "ticker": "AGNCO",
-            "name": "AGNC Investment DS REP 1/1000 Cumulative Pref Shs Series E",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 26.59,
-            "lowest_after_ath": 8.87,
-            "price": 25.44,
-            "correction_ratio": 0.666,
-            "price_to_ath": 0.957,
-            "days_since_ath": 2291,
-            "ma_20_spread": 0.0138,
-            "ma_50_spread": 0.0078,
-            "ma_20_50_spread": -0.0059,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 13.25
-        },
-        {
-            "ticker": "AMD",
-            "name": "Advanced Micro Devices Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 352.99,
-            "lowest_after_ath": 272.0,
-            "price": 337.11,
-            "correction_ratio": 0.229,
-            "price_to_ath": 0.955,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.2461,
-            "ma_50_spread": 0.4712,
-            "ma_20_50_spread": 0.1806,
-            "eps_q0": 213.5,
-            "eps_q1": 192.15,
-            "eps_q2": 170.8,
-            "eps_q3": 149.45,
-            "per": 128.67,
-            "roe": 7.08
-        },
-        {
-            "ticker": "EVRG",
-            "name": "Evergy Inc",
-            "industry": "\uc804\ub825 \uc720\ud2f8\ub9ac\ud2f0",
-            "ath": 85.27,
-            "lowest_after_ath": 79.21,
-            "price": 81.33,
-            "correction_ratio": 0.071,
-            "price_to_ath": 0.954,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0093,
-            "ma_50_spread": -0.0075,
-            "ma_20_50_spread": 0.0019,
-            "eps_q0": 7.8,
-            "eps_q1": 7.02,
-            "eps_q2": 6.24,
-            "eps_q3": 5.46,
-            "per": 22.22,
-            "roe": 8.57
-        },
-        {
-            "ticker": "ADI",
-            "name": "Analog Devices Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 408.37,
-            "lowest_after_ath": 369.7,
-            "price": 389.31,
-            "correction_ratio": 0.095,
-            "price_to_ath": 0.953,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0785,
-            "ma_50_spread": 0.1417,
-            "ma_20_50_spread": 0.0586,
-            "eps_q0": 112.3,
-            "eps_q1": 101.07,
-            "eps_q2": 89.84,
-            "eps_q3": 78.61,
-            "per": 71.04,
-            "roe": 7.86
-        },
-        {
-            "ticker": "NTRS",
-            "name": "Northern Trust Corp",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 173.19,
-            "lowest_after_ath": 158.1,
-            "price": 164.83,
-            "correction_ratio": 0.087,
-            "price_to_ath": 0.952,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0504,
-            "ma_50_spread": 0.1219,
-            "ma_20_50_spread": 0.0681,
-            "eps_q0": 34.1,
-            "eps_q1": 30.69,
-            "eps_q2": 27.28,
-            "eps_q3": 23.87,
-            "per": 17.26,
-            "roe": 14.46
-        },
-        {
-            "ticker": "WMT",
-            "name": "Walmart Inc",
-            "industry": "\uc2dd\ud488 \uc18c\ub9e4 \ubc0f \uc720\ud1b5",
-            "ath": 134.69,
-            "lowest_after_ath": 118.02,
-            "price": 128.01,
-            "correction_ratio": 0.124,
-            "price_to_ath": 0.95,
-            "days_since_ath": 72,
-            "ma_20_spread": 0.007,
-            "ma_50_spread": 0.0202,
-            "ma_20_50_spread": 0.013,
-            "eps_q0": -19.4,
-            "eps_q1": -17.46,
-            "eps_q2": -15.52,
-            "eps_q3": -13.58,
-            "per": 46.89,
-            "roe": 21.85
-        },
-        {
-            "ticker": "AGNCN",
-            "name": "Agnc Invt 1000 DS Repstg Pref Shs Series C",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 27.09,
-            "lowest_after_ath": 21.87,
-            "price": 25.74,
-            "correction_ratio": 0.193,
-            "price_to_ath": 0.95,
-            "days_since_ath": 1780,
-            "ma_20_spread": 0.0138,
-            "ma_50_spread": 0.0101,
-            "ma_20_50_spread": -0.0036,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 13.25
-        },
-        {
-            "ticker": "FFIV",
-            "name": "F5 Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 346.0,
-            "lowest_after_ath": 223.76,
-            "price": 328.15,
-            "correction_ratio": 0.353,
-            "price_to_ath": 0.948,
-            "days_since_ath": 205,
-            "ma_20_spread": 0.0777,
-            "ma_50_spread": 0.1246,
-            "ma_20_50_spread": 0.0435,
-            "eps_q0": 8.2,
-            "eps_q1": 7.38,
-            "eps_q2": 6.56,
-            "eps_q3": 5.74,
-            "per": 27.14,
-            "roe": 20.84
-        },
-        {
-            "ticker": "HBANZ",
-            "name": "Huntington Bancshares Depositary Shares Representing A 1 1000Th Interest In A",
-            "industry": "\uc740\ud589",
-            "ath": 22.23,
-            "lowest_after_ath": 20.35,
-            "price": 21.03,
-            "correction_ratio": 0.085,
-            "price_to_ath": 0.946,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0026,
-            "ma_50_spread": -0.0051,
-            "ma_20_50_spread": -0.0077,
-            "eps_q0": -0.8,
-            "eps_q1": -0.72,
-            "eps_q2": -0.64,
-            "eps_q3": -0.56,
-            "per": 0,
-            "roe": 8.39
-        },
-        {
-            "ticker": "AVGO",
-            "name": "Broadcom Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 429.31,
-            "lowest_after_ath": 394.57,
-            "price": 405.45,
-            "correction_ratio": 0.081,
-            "price_to_ath": 0.944,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0661,
-            "ma_50_spread": 0.1716,
-            "ma_20_50_spread": 0.099,
-            "eps_q0": 33.5,
-            "eps_q1": 30.15,
-            "eps_q2": 26.8,
-            "eps_q3": 23.45,
-            "per": 79.19,
-            "roe": 33.37
-        },
-        {
-            "ticker": "AGNCL",
-            "name": "AGNC Invt Dep Shs Repstg 1 1000Th Pref Shs Series G",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 26.59,
-            "lowest_after_ath": 22.84,
-            "price": 25.0,
-            "correction_ratio": 0.141,
-            "price_to_ath": 0.94,
-            "days_since_ath": 394,
-            "ma_20_spread": 0.0233,
-            "ma_50_spread": 0.0067,
-            "ma_20_50_spread": -0.0162,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 13.25
-        },
-        {
-            "ticker": "UTHR",
-            "name": "United Therapeutics Corp",
-            "industry": "\uc81c\uc57d",
-            "ath": 607.89,
-            "lowest_after_ath": 551.3,
-            "price": 571.07,
-            "correction_ratio": 0.093,
-            "price_to_ath": 0.939,
-            "days_since_ath": 30,
-            "ma_20_spread": -0.0033,
-            "ma_50_spread": 0.0571,
-            "ma_20_50_spread": 0.0606,
-            "eps_q0": 20.9,
-            "eps_q1": 18.81,
-            "eps_q2": 16.72,
-            "eps_q3": 14.63,
-            "per": 20.48,
-            "roe": 19.71
-        },
-        {
-            "ticker": "ENTG",
-            "name": "Entegris Inc",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 159.15,
-            "lowest_after_ath": 142.61,
-            "price": 149.37,
-            "correction_ratio": 0.104,
-            "price_to_ath": 0.939,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.082,
-            "ma_50_spread": 0.1632,
-            "ma_20_50_spread": 0.0751,
-            "eps_q0": -51.7,
-            "eps_q1": -46.53,
-            "eps_q2": -41.36,
-            "eps_q3": -36.19,
-            "per": 96.37,
-            "roe": 6.16
-        },
-        {
-            "ticker": "CINF",
-            "name": "Cincinnati Financial Corp",
-            "industry": "\uc190\ud574\ubcf4\ud5d8",
-            "ath": 174.27,
-            "lowest_after_ath": 153.4,
-            "price": 163.22,
-            "correction_ratio": 0.12,
-            "price_to_ath": 0.937,
-            "days_since_ath": 86,
-            "ma_20_spread": -0.0017,
-            "ma_50_spread": 0.0028,
-            "ma_20_50_spread": 0.0045,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.33,
-            "roe": 18.73
-        },
-        {
-            "ticker": "AAPL",
-            "name": "Apple Inc",
-            "industry": "\uc804\ud654 \ubc0f \uc18c\ud615 \uc7a5\uce58",
-            "ath": 288.62,
-            "lowest_after_ath": 243.42,
-            "price": 270.17,
-            "correction_ratio": 0.157,
-            "price_to_ath": 0.936,
-            "days_since_ath": 149,
-            "ma_20_spread": 0.022,
-            "ma_50_spread": 0.0364,
-            "ma_20_50_spread": 0.0141,
-            "eps_q0": 15.9,
-            "eps_q1": 14.31,
-            "eps_q2": 12.72,
-            "eps_q3": 11.13,
-            "per": 34.2,
-            "roe": 152.02
-        },
-        {
-            "ticker": "KLAC",
-            "name": "KLA Corp",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 1939.36,
-            "lowest_after_ath": 1770.0,
-            "price": 1816.21,
-            "correction_ratio": 0.087,
-            "price_to_ath": 0.936,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0444,
-            "ma_50_spread": 0.1495,
-            "ma_20_50_spread": 0.1006,
-            "eps_q0": 39.0,
-            "eps_q1": 35.1,
-            "eps_q2": 31.2,
-            "eps_q3": 27.3,
-            "per": 52.84,
-            "roe": 100.73
-        },
-        {
-            "ticker": "XEL",
-            "name": "Xcel Energy Inc",
-            "industry": "\uc804\ub825 \uc720\ud2f8\ub9ac\ud2f0",
-            "ath": 84.23,
-            "lowest_after_ath": 76.18,
-            "price": 78.82,
-            "correction_ratio": 0.096,
-            "price_to_ath": 0.936,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0165,
-            "ma_50_spread": -0.0225,
-            "ma_20_50_spread": -0.0061,
-            "eps_q0": 22.2,
-            "eps_q1": 19.98,
-            "eps_q2": 17.76,
-            "eps_q3": 15.54,
-            "per": 23.05,
-            "roe": 9.36
-        },
-        {
-            "ticker": "IESC",
-            "name": "IES Holdings Inc",
-            "industry": "\uac74\uc124 \ubc0f \uc5d4\uc9c0\ub2c8\uc5b4\ub9c1",
-            "ath": 611.21,
-            "lowest_after_ath": 525.0,
-            "price": 572.01,
-            "correction_ratio": 0.141,
-            "price_to_ath": 0.936,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0565,
-            "ma_50_spread": 0.1441,
-            "ma_20_50_spread": 0.0829,
-            "eps_q0": 62.4,
-            "eps_q1": 56.16,
-            "eps_q2": 49.92,
-            "eps_q3": 43.68,
-            "per": 33.99,
-            "roe": 41.74
-        },
-        {
-            "ticker": "TXN",
-            "name": "Texas Instruments Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 287.83,
-            "lowest_after_ath": 230.02,
-            "price": 269.22,
-            "correction_ratio": 0.201,
-            "price_to_ath": 0.935,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1705,
-            "ma_50_spread": 0.2685,
-            "ma_20_50_spread": 0.0837,
-            "eps_q0": 31.0,
-            "eps_q1": 27.9,
-            "eps_q2": 24.8,
-            "eps_q3": 21.7,
-            "per": 45.94,
-            "roe": 32.35
-        },
-        {
-            "ticker": "AGNCM",
-            "name": "AGNC Investment 1000 DS Rep 6.875 Fixed to Floating Cumulative Redeemable Pref",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 26.5,
-            "lowest_after_ath": 17.31,
-            "price": 24.78,
-            "correction_ratio": 0.347,
-            "price_to_ath": 0.935,
-            "days_since_ath": 1752,
-            "ma_20_spread": 0.0139,
-            "ma_50_spread": 0.0044,
-            "ma_20_50_spread": -0.0093,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 13.25
-        },
-        {
-            "ticker": "WDC",
-            "name": "Western Digital Corp",
-            "industry": "\ucef4\ud4e8\ud130 \ud558\ub4dc\uc6e8\uc5b4",
-            "ath": 441.99,
-            "lowest_after_ath": 410.05,
-            "price": 412.76,
-            "correction_ratio": 0.072,
-            "price_to_ath": 0.934,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.1461,
-            "ma_50_spread": 0.3256,
-            "ma_20_50_spread": 0.1567,
-            "eps_q0": 210.1,
-            "eps_q1": 189.09,
-            "eps_q2": 168.08,
-            "eps_q3": 147.07,
-            "per": 38.94,
-            "roe": 41.13
-        },
-        {
-            "ticker": "MAR",
-            "name": "Marriott International Inc",
-            "industry": "\ud638\ud154, \ubaa8\ud154 \ubc0f \ud06c\ub8e8\uc988 \ub77c\uc778",
-            "ath": 380.0,
-            "lowest_after_ath": 349.05,
-            "price": 353.95,
-            "correction_ratio": 0.081,
-            "price_to_ath": 0.931,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0099,
-            "ma_50_spread": 0.036,
-            "ma_20_50_spread": 0.0463,
-            "eps_q0": -2.2,
-            "eps_q1": -1.98,
-            "eps_q2": -1.76,
-            "eps_q3": -1.54,
-            "per": 37.26,
-            "roe": 0
-        },
-        {
-            "ticker": "IBKR",
-            "name": "Interactive Brokers Group Inc",
-            "industry": "\ud22c\uc790 \uc740\ud589 \ubc0f \uc911\uac1c \uc11c\ube44\uc2a4",
-            "ath": 82.88,
-            "lowest_after_ath": 70.51,
-            "price": 77.05,
-            "correction_ratio": 0.149,
-            "price_to_ath": 0.93,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.0247,
-            "ma_50_spread": 0.0777,
-            "ma_20_50_spread": 0.0517,
-            "eps_q0": 25.4,
-            "eps_q1": 22.86,
-            "eps_q2": 20.32,
-            "eps_q3": 17.78,
-            "per": 33.21,
-            "roe": 23.56
-        },
-        {
-            "ticker": "COST",
-            "name": "Costco Wholesale Corp",
-            "industry": "\ud560\uc778\uc810",
-            "ath": 1078.23,
-            "lowest_after_ath": 844.06,
-            "price": 998.67,
-            "correction_ratio": 0.217,
-            "price_to_ath": 0.926,
-            "days_since_ath": 443,
-            "ma_20_spread": -0.0041,
-            "ma_50_spread": 0.0027,
-            "ma_20_50_spread": 0.0068,
-            "eps_q0": 45.6,
-            "eps_q1": 41.04,
-            "eps_q2": 36.48,
-            "eps_q3": 31.92,
-            "per": 52.07,
-            "roe": 29.65
-        },
-        {
-            "ticker": "STX",
-            "name": "Seagate Technology Holdings PLC",
-            "industry": "\ucef4\ud4e8\ud130 \ud558\ub4dc\uc6e8\uc5b4",
-            "ath": 697.0,
-            "lowest_after_ath": 632.0,
-            "price": 643.3,
-            "correction_ratio": 0.093,
-            "price_to_ath": 0.923,
-            "days_since_ath": 0,
-            "ma_20_spread": 0.2147,
-            "ma_50_spread": 0.4333,
-            "ma_20_50_spread": 0.18,
-            "eps_q0": 76.5,
-            "eps_q1": 68.85,
-            "eps_q2": 61.2,
-            "eps_q3": 53.55,
-            "per": 61.03,
-            "roe": 0
-        },
-        {
-            "ticker": "TTMI",
-            "name": "TTM Technologies Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 149.08,
-            "lowest_after_ath": 122.08,
-            "price": 137.5,
-            "correction_ratio": 0.181,
-            "price_to_ath": 0.922,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1423,
-            "ma_50_spread": 0.2745,
-            "ma_20_50_spread": 0.1157,
-            "eps_q0": 880.4,
-            "eps_q1": 792.36,
-            "eps_q2": 704.32,
-            "eps_q3": 616.28,
-            "per": 81.85,
-            "roe": 10.67
-        },
-        {
-            "ticker": "MPWR",
-            "name": "Monolithic Power Systems Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 1661.79,
-            "lowest_after_ath": 1453.67,
-            "price": 1526.84,
-            "correction_ratio": 0.125,
-            "price_to_ath": 0.919,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0924,
-            "ma_50_spread": 0.2503,
-            "ma_20_50_spread": 0.1446,
-            "eps_q0": -86.0,
-            "eps_q1": -77.4,
-            "eps_q2": -68.8,
-            "eps_q3": -60.2,
-            "per": 117.99,
-            "roe": 19.17
-        },
-        {
-            "ticker": "COKE",
-            "name": "Coca-Cola Consolidated Inc",
-            "industry": "\ubb34\uc54c\ucf5c \uc74c\ub8cc",
-            "ath": 219.65,
-            "lowest_after_ath": 177.28,
-            "price": 201.94,
-            "correction_ratio": 0.193,
-            "price_to_ath": 0.919,
-            "days_since_ath": 44,
-            "ma_20_spread": 0.0349,
-            "ma_50_spread": 0.0256,
-            "ma_20_50_spread": -0.009,
-            "eps_q0": 264.0,
-            "eps_q1": 237.6,
-            "eps_q2": 211.2,
-            "eps_q3": 184.8,
-            "per": 29.65,
-            "roe": 168.34
-        },
-        {
-            "ticker": "NDSN",
-            "name": "Nordson Corp",
-            "industry": "\uc0b0\uc5c5\uc6a9 \uae30\uacc4 \ubc0f \uc7a5\ube44",
-            "ath": 305.28,
-            "lowest_after_ath": 253.85,
-            "price": 280.34,
-            "correction_ratio": 0.168,
-            "price_to_ath": 0.918,
-            "days_since_ath": 72,
-            "ma_20_spread": 0.0134,
-            "ma_50_spread": 0.0124,
-            "ma_20_50_spread": -0.0009,
-            "eps_q0": 40.9,
-            "eps_q1": 36.81,
-            "eps_q2": 32.72,
-            "eps_q3": 28.63,
-            "per": 30.34,
-            "roe": 17.47
-        },
-        {
-            "ticker": "CHRW",
-            "name": "CH Robinson Worldwide Inc",
-            "industry": "\uc9c0\uc0c1 \ud654\ubb3c \ubc0f \ubb3c\ub958",
-            "ath": 203.34,
-            "lowest_after_ath": 149.36,
-            "price": 186.43,
-            "correction_ratio": 0.265,
-            "price_to_ath": 0.917,
-            "days_since_ath": 86,
-            "ma_20_spread": 0.0585,
-            "ma_50_spread": 0.0577,
-            "ma_20_50_spread": -0.0007,
-            "eps_q0": -8.7,
-            "eps_q1": -7.83,
-            "eps_q2": -6.96,
-            "eps_q3": -6.09,
-            "per": 38.6,
-            "roe": 32.91
-        },
-        {
-            "ticker": "MTSI",
-            "name": "MACOM Technology Solutions Holdings Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 294.0,
-            "lowest_after_ath": 260.85,
-            "price": 269.63,
-            "correction_ratio": 0.113,
-            "price_to_ath": 0.917,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0275,
-            "ma_50_spread": 0.1051,
-            "ma_20_50_spread": 0.0755,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 122.56,
-            "roe": 12.95
-        },
-        {
-            "ticker": "STRL",
-            "name": "Sterling Infrastructure Inc",
-            "industry": "\uac74\uc124 \ubc0f \uc5d4\uc9c0\ub2c8\uc5b4\ub9c1",
-            "ath": 512.36,
-            "lowest_after_ath": 459.37,
-            "price": 469.75,
-            "correction_ratio": 0.103,
-            "price_to_ath": 0.917,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0351,
-            "ma_50_spread": 0.0822,
-            "ma_20_50_spread": 0.0455,
-            "eps_q0": -22.6,
-            "eps_q1": -20.34,
-            "eps_q2": -18.08,
-            "eps_q3": -15.82,
-            "per": 50.03,
-            "roe": 32.05
-        },
-        {
-            "ticker": "MRVL",
-            "name": "Marvell Technology Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 170.84,
-            "lowest_after_ath": 143.93,
-            "price": 156.57,
-            "correction_ratio": 0.158,
-            "price_to_ath": 0.916,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1501,
-            "ma_50_spread": 0.4714,
-            "ma_20_50_spread": 0.2794,
-            "eps_q0": 97.9,
-            "eps_q1": 88.11,
-            "eps_q2": 78.32,
-            "eps_q3": 68.53,
-            "per": 51.17,
-            "roe": 19.25
-        },
-        {
-            "ticker": "VLYPO",
-            "name": "Valley National 5.50% Fixed to Floating Rate Non Cum Perp Pref Shs Series B",
-            "industry": "\uc740\ud589",
-            "ath": 27.3,
-            "lowest_after_ath": 13.84,
-            "price": 25.01,
-            "correction_ratio": 0.493,
-            "price_to_ath": 0.916,
-            "days_since_ath": 2305,
-            "ma_20_spread": 0.0061,
-            "ma_50_spread": 0.0042,
-            "ma_20_50_spread": -0.0019,
-            "eps_q0": 54.6,
-            "eps_q1": 49.14,
-            "eps_q2": 43.68,
-            "eps_q3": 38.22,
-            "per": 22.53,
-            "roe": 8.56
-        },
-        {
-            "ticker": "LSCC",
-            "name": "Lattice Semiconductor Corp",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 126.35,
-            "lowest_after_ath": 109.35,
-            "price": 115.67,
-            "correction_ratio": 0.135,
-            "price_to_ath": 0.915,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0513,
-            "ma_50_spread": 0.156,
-            "ma_20_50_spread": 0.0996,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 5783.5,
-            "roe": 0.43
-        },
-        {
-            "ticker": "NVMI",
-            "name": "Nova Ltd",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 550.0,
-            "lowest_after_ath": 492.07,
-            "price": 501.47,
-            "correction_ratio": 0.105,
-            "price_to_ath": 0.912,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0026,
-            "ma_50_spread": 0.074,
-            "ma_20_50_spread": 0.0712,
-            "eps_q0": 28.1,
-            "eps_q1": 25.29,
-            "eps_q2": 22.48,
-            "eps_q3": 19.67,
-            "per": 62.84,
-            "roe": 23.08
-        },
-        {
-            "ticker": "SOLS",
-            "name": "Solstice Advanced Materials Inc",
-            "industry": "\ud2b9\uc218 \ud654\ud559\uc81c",
-            "ath": 84.44,
-            "lowest_after_ath": 63.52,
-            "price": 76.96,
-            "correction_ratio": 0.248,
-            "price_to_ath": 0.911,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0402,
-            "ma_50_spread": -0.004,
-            "ma_20_50_spread": 0.0378,
-            "eps_q0": -69.2,
-            "eps_q1": -62.28,
-            "eps_q2": -55.36,
-            "eps_q3": -48.44,
-            "per": 51.65,
-            "roe": 12.5
-        },
-        {
-            "ticker": "AMAT",
-            "name": "Applied Materials Inc",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 420.5,
-            "lowest_after_ath": 377.07,
-            "price": 382.59,
-            "correction_ratio": 0.103,
-            "price_to_ath": 0.91,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0119,
-            "ma_50_spread": 0.0381,
-            "ma_20_50_spread": 0.0505,
-            "eps_q0": 71.0,
-            "eps_q1": 63.9,
-            "eps_q2": 56.8,
-            "eps_q3": 49.7,
-            "per": 39.2,
-            "roe": 38.86
-        },
-        {
-            "ticker": "AEIS",
-            "name": "Advanced Energy Industries Inc",
-            "industry": "\uc804\uae30 \ubd80\ud488 \ubc0f \uc7a5\ube44",
-            "ath": 397.44,
-            "lowest_after_ath": 355.12,
-            "price": 361.39,
-            "correction_ratio": 0.106,
-            "price_to_ath": 0.909,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0197,
-            "ma_50_spread": 0.0617,
-            "ma_20_50_spread": 0.083,
-            "eps_q0": 7.0,
-            "eps_q1": 6.3,
-            "eps_q2": 5.6,
-            "eps_q3": 4.9,
-            "per": 93.14,
-            "roe": 11.64
-        },
-        {
-            "ticker": "ROIV",
-            "name": "Roivant Sciences Ltd",
-            "industry": "\uc81c\uc57d",
-            "ath": 30.33,
-            "lowest_after_ath": 25.95,
-            "price": 27.52,
-            "correction_ratio": 0.144,
-            "price_to_ath": 0.907,
-            "days_since_ath": 51,
-            "ma_20_spread": -0.0333,
-            "ma_50_spread": -0.0262,
-            "ma_20_50_spread": 0.0073,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -23.75,
-            "roe": -19.14
-        },
-        {
-            "ticker": "FIVE",
-            "name": "Five Below Inc",
-            "industry": "\ubc31\ud654\uc810",
-            "ath": 251.63,
-            "lowest_after_ath": 227.16,
-            "price": 228.14,
-            "correction_ratio": 0.097,
-            "price_to_ath": 0.907,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0122,
-            "ma_50_spread": 0.0127,
-            "ma_20_50_spread": 0.0252,
-            "eps_q0": 27.1,
-            "eps_q1": 24.39,
-            "eps_q2": 21.68,
-            "eps_q3": 18.97,
-            "per": 35.32,
-            "roe": 17.92
-        },
-        {
-            "ticker": "SANM",
-            "name": "Sanmina Corp",
-            "industry": "\uc804\uc790 \uc7a5\ube44 \ubc0f \ubd80\ud488",
-            "ath": 230.56,
-            "lowest_after_ath": 183.09,
-            "price": 208.67,
-            "correction_ratio": 0.206,
-            "price_to_ath": 0.905,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2777,
-            "ma_50_spread": 0.4207,
-            "ma_20_50_spread": 0.1119,
-            "eps_q0": 45.8,
-            "eps_q1": 41.22,
-            "eps_q2": 36.64,
-            "eps_q3": 32.06,
-            "per": 44.21,
-            "roe": 10.96
-        },
-        {
-            "ticker": "FER",
-            "name": "Ferrovial SE",
-            "industry": "\uac74\uc124 \ubc0f \uc5d4\uc9c0\ub2c8\uc5b4\ub9c1",
-            "ath": 74.79,
-            "lowest_after_ath": 61.29,
-            "price": 67.58,
-            "correction_ratio": 0.18,
-            "price_to_ath": 0.904,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0278,
-            "ma_50_spread": -0.0079,
-            "ma_20_50_spread": 0.0204,
-            "eps_q0": -87.7,
-            "eps_q1": -78.93,
-            "eps_q2": -70.16,
-            "eps_q3": -61.39,
-            "per": 47.59,
-            "roe": 14.32
-        },
-        {
-            "ticker": "RVMD",
-            "name": "Revolution Medicines Inc",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 155.7,
-            "lowest_after_ath": 127.0,
-            "price": 140.55,
-            "correction_ratio": 0.184,
-            "price_to_ath": 0.903,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.1084,
-            "ma_50_spread": 0.2779,
-            "ma_20_50_spread": 0.1529,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -26.82,
-            "roe": -58.07
-        },
-        {
-            "ticker": "MKSI",
-            "name": "MKS Incorporated",
-            "industry": "\uc0b0\uc5c5\uc6a9 \uae30\uacc4 \ubc0f \uc7a5\ube44",
-            "ath": 294.05,
-            "lowest_after_ath": 261.23,
-            "price": 265.44,
-            "correction_ratio": 0.112,
-            "price_to_ath": 0.903,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0009,
-            "ma_50_spread": 0.0773,
-            "ma_20_50_spread": 0.0764,
-            "eps_q0": 17.6,
-            "eps_q1": 15.84,
-            "eps_q2": 14.08,
-            "eps_q3": 12.32,
-            "per": 60.74,
-            "roe": 11.7
-        },
-        {
-            "ticker": "LRCX",
-            "name": "Lam Research Corp",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 275.84,
-            "lowest_after_ath": 241.6,
-            "price": 248.75,
-            "correction_ratio": 0.124,
-            "price_to_ath": 0.902,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0169,
-            "ma_50_spread": 0.0523,
-            "ma_20_50_spread": 0.0704,
-            "eps_q0": 37.2,
-            "eps_q1": 33.48,
-            "eps_q2": 29.76,
-            "eps_q3": 26.04,
-            "per": 46.93,
-            "roe": 66.76
-        },
-        {
-            "ticker": "ASML",
-            "name": "ASML Holding NV ADR",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 1547.22,
-            "lowest_after_ath": 1248.11,
-            "price": 1394.08,
-            "correction_ratio": 0.193,
-            "price_to_ath": 0.901,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0207,
-            "ma_50_spread": -0.0062,
-            "ma_20_50_spread": 0.0149,
-            "eps_q0": 17.1,
-            "eps_q1": 15.39,
-            "eps_q2": 13.68,
-            "eps_q3": 11.97,
-            "per": 45.98,
-            "roe": 52.24
-        },
-        {
-            "ticker": "EXEL",
-            "name": "Exelixis Inc",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 49.62,
-            "lowest_after_ath": 33.76,
-            "price": 44.69,
-            "correction_ratio": 0.32,
-            "price_to_ath": 0.901,
-            "days_since_ath": 310,
-            "ma_20_spread": -0.0022,
-            "ma_50_spread": 0.0318,
-            "ma_20_50_spread": 0.0341,
-            "eps_q0": 74.8,
-            "eps_q1": 67.32,
-            "eps_q2": 59.84,
-            "eps_q3": 52.36,
-            "per": 16.08,
-            "roe": 35.53
-        },
-        {
-            "ticker": "FITB",
-            "name": "Fifth Third Bancorp",
-            "industry": "\uc740\ud589",
-            "ath": 55.44,
-            "lowest_after_ath": 42.94,
-            "price": 49.79,
-            "correction_ratio": 0.225,
-            "price_to_ath": 0.898,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0048,
-            "ma_50_spread": 0.0312,
-            "ma_20_50_spread": 0.0264,
-            "eps_q0": -68.0,
-            "eps_q1": -61.2,
-            "eps_q2": -54.4,
-            "eps_q3": -47.6,
-            "per": 16.76,
-            "roe": 7.97
-        },
-        {
-            "ticker": "NDAQ",
-            "name": "Nasdaq Inc",
-            "industry": "\uae08\uc735, \uc0c1\ud488 \uc2dc\uc7a5 \uc6b4\uc601 \ubc0f \uc11c\ube44\uc2a4 \uc81c\uacf5",
-            "ath": 101.79,
-            "lowest_after_ath": 77.09,
-            "price": 91.27,
-            "correction_ratio": 0.243,
-            "price_to_ath": 0.897,
-            "days_since_ath": 107,
-            "ma_20_spread": 0.0418,
-            "ma_50_spread": 0.059,
-            "ma_20_50_spread": 0.0165,
-            "eps_q0": 31.4,
-            "eps_q1": 28.26,
-            "eps_q2": 25.12,
-            "eps_q3": 21.98,
-            "per": 27.49,
-            "roe": 16.2
-        },
-        {
-            "ticker": "MCHP",
-            "name": "Microchip Technology Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 100.57,
-            "lowest_after_ath": 34.13,
-            "price": 90.17,
-            "correction_ratio": 0.661,
-            "price_to_ath": 0.897,
-            "days_since_ath": 709,
-            "ma_20_spread": 0.1691,
-            "ma_50_spread": 0.2564,
-            "ma_20_50_spread": 0.0746,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 33.87,
-            "roe": -1.09
-        },
-        {
-            "ticker": "PCAR",
-            "name": "Paccar Inc",
-            "industry": "\uc911\uc7a5\ube44 \ubc0f \ucc28\ub7c9",
-            "ath": 131.88,
-            "lowest_after_ath": 110.36,
-            "price": 118.14,
-            "correction_ratio": 0.163,
-            "price_to_ath": 0.896,
-            "days_since_ath": 86,
-            "ma_20_spread": -0.0459,
-            "ma_50_spread": -0.025,
-            "ma_20_50_spread": 0.0219,
-            "eps_q0": 19.8,
-            "eps_q1": 17.82,
-            "eps_q2": 15.84,
-            "eps_q3": 13.86,
-            "per": 25.14,
-            "roe": 13.11
-        },
-        {
-            "ticker": "ODFL",
-            "name": "Old Dominion Freight Line Inc",
-            "industry": "\uc9c0\uc0c1 \ud654\ubb3c \ubc0f \ubb3c\ub958",
-            "ath": 233.79,
-            "lowest_after_ath": 206.97,
-            "price": 209.35,
-            "correction_ratio": 0.115,
-            "price_to_ath": 0.895,
-            "days_since_ath": 0,
-            "ma_20_spread": -0.0127,
-            "ma_50_spread": 0.0438,
-            "ma_20_50_spread": 0.0572,
-            "eps_q0": -12.8,
-            "eps_q1": -11.52,
-            "eps_q2": -10.24,
-            "eps_q3": -8.96,
-            "per": 43.34,
-            "roe": 23.93
-        },
-        {
-            "ticker": "LITE",
-            "name": "Lumentum Holdings Inc",
-            "industry": "\ud1b5\uc2e0 \ubc0f \ub124\ud2b8\uc6cc\ud0b9",
-            "ath": 960.0,
-            "lowest_after_ath": 767.01,
-            "price": 858.32,
-            "correction_ratio": 0.201,
-            "price_to_ath": 0.894,
-            "days_since_ath": 23,
-            "ma_20_spread": 0.0072,
-            "ma_50_spread": 0.1442,
-            "ma_20_50_spread": 0.136,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 246.64,
-            "roe": 29.28
-        },
-        {
-            "ticker": "SITM",
-            "name": "SiTime Corp",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 591.13,
-            "lowest_after_ath": 501.53,
-            "price": 527.2,
-            "correction_ratio": 0.152,
-            "price_to_ath": 0.892,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.137,
-            "ma_50_spread": 0.304,
-            "ma_20_50_spread": 0.1469,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 79.08,
-            "roe": -4.62
-        },
-        {
-            "ticker": "AMKR",
-            "name": "Amkor Technology Inc",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 79.23,
-            "lowest_after_ath": 65.0,
-            "price": 70.61,
-            "correction_ratio": 0.18,
-            "price_to_ath": 0.891,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1337,
-            "ma_50_spread": 0.3448,
-            "ma_20_50_spread": 0.1862,
-            "eps_q0": 294.5,
-            "eps_q1": 265.05,
-            "eps_q2": 235.6,
-            "eps_q3": 206.15,
-            "per": 40.58,
-            "roe": 10.01
-        },
-        {
-            "ticker": "ON",
-            "name": "ON Semiconductor Corp",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 111.35,
-            "lowest_after_ath": 31.04,
-            "price": 98.86,
-            "correction_ratio": 0.721,
-            "price_to_ath": 0.888,
-            "days_since_ath": 1003,
-            "ma_20_spread": 0.2487,
-            "ma_50_spread": 0.428,
-            "ma_20_50_spread": 0.1436,
-            "eps_q0": -52.1,
-            "eps_q1": -46.89,
-            "eps_q2": -41.68,
-            "eps_q3": -36.47,
-            "per": 340.9,
-            "roe": 1.5
-        },
-        {
-            "ticker": "WWD",
-            "name": "Woodward Inc",
-            "industry": "\ud56d\uacf5\uc6b0\uc8fc \ubc0f \ubc29\uc704",
-            "ath": 407.0,
-            "lowest_after_ath": 356.99,
-            "price": 360.98,
-            "correction_ratio": 0.123,
-            "price_to_ath": 0.887,
-            "days_since_ath": 16,
-            "ma_20_spread": -0.051,
-            "ma_50_spread": -0.0444,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": 53.5,
-            "eps_q1": 48.15,
-            "eps_q2": 42.8,
-            "eps_q3": 37.45,
-            "per": 45.52,
-            "roe": 20.38
-        },
-        {
-            "ticker": "AAOI",
-            "name": "Applied Optoelectronics Inc",
-            "industry": "\uc804\uc790 \uc7a5\ube44 \ubc0f \ubd80\ud488",
-            "ath": 173.41,
-            "lowest_after_ath": 132.63,
-            "price": 152.83,
-            "correction_ratio": 0.235,
-            "price_to_ath": 0.881,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0955,
-            "ma_50_spread": 0.4032,
-            "ma_20_50_spread": 0.2808,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 47.8,
-            "roe": -7.94
-        },
-        {
-            "ticker": "MNST",
-            "name": "Monster Beverage Corp",
-            "industry": "\ubb34\uc54c\ucf5c \uc74c\ub8cc",
-            "ath": 87.38,
-            "lowest_after_ath": 70.86,
-            "price": 76.89,
-            "correction_ratio": 0.189,
-            "price_to_ath": 0.88,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0176,
-            "ma_50_spread": -0.0006,
-            "ma_20_50_spread": -0.0178,
-            "eps_q0": 65.9,
-            "eps_q1": 59.31,
-            "eps_q2": 52.72,
-            "eps_q3": 46.13,
-            "per": 39.63,
-            "roe": 26.82
-        },
-        {
-            "ticker": "ASND",
-            "name": "Ascendis Pharma A/S",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 250.74,
-            "lowest_after_ath": 216.24,
-            "price": 220.28,
-            "correction_ratio": 0.138,
-            "price_to_ath": 0.879,
-            "days_since_ath": 16,
-            "ma_20_spread": -0.0599,
-            "ma_50_spread": -0.0475,
-            "ma_20_50_spread": 0.0132,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 24.6,
-            "roe": 0
-        },
-        {
-            "ticker": "VRSN",
-            "name": "VeriSign  Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 310.6,
-            "lowest_after_ath": 208.86,
-            "price": 272.6,
-            "correction_ratio": 0.328,
-            "price_to_ath": 0.878,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0104,
-            "ma_50_spread": 0.095,
-            "ma_20_50_spread": 0.0837,
-            "eps_q0": 7.6,
-            "eps_q1": 6.84,
-            "eps_q2": 6.08,
-            "eps_q3": 5.32,
-            "per": 30.09,
-            "roe": 0
-        },
-        {
-            "ticker": "CDNS",
-            "name": "Cadence Design Systems Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 376.45,
-            "lowest_after_ath": 262.75,
-            "price": 329.95,
-            "correction_ratio": 0.302,
-            "price_to_ath": 0.876,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0869,
-            "ma_50_spread": 0.1135,
-            "ma_20_50_spread": 0.0245,
-            "eps_q0": 22.7,
-            "eps_q1": 20.43,
-            "eps_q2": 18.16,
-            "eps_q3": 15.89,
-            "per": 76.91,
-            "roe": 20.66
-        },
-        {
-            "ticker": "RPRX",
-            "name": "Royalty Pharma PLC",
-            "industry": "\uc81c\uc57d",
-            "ath": 56.5,
-            "lowest_after_ath": 24.05,
-            "price": 49.49,
-            "correction_ratio": 0.574,
-            "price_to_ath": 0.876,
-            "days_since_ath": 2144,
-            "ma_20_spread": 0.0142,
-            "ma_50_spread": 0.0497,
-            "ma_20_50_spread": 0.035,
-            "eps_q0": 2.9,
-            "eps_q1": 2.61,
-            "eps_q2": 2.32,
-            "eps_q3": 2.03,
-            "per": 27.8,
-            "roe": 13.2
-        },
-        {
-            "ticker": "CME",
-            "name": "CME Group Inc",
-            "industry": "\uae08\uc735, \uc0c1\ud488 \uc2dc\uc7a5 \uc6b4\uc601 \ubc0f \uc11c\ube44\uc2a4 \uc81c\uacf5",
-            "ath": 329.16,
-            "lowest_after_ath": 274.6,
-            "price": 287.27,
-            "correction_ratio": 0.166,
-            "price_to_ath": 0.873,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0226,
-            "ma_50_spread": -0.053,
-            "ma_20_50_spread": -0.0311,
-            "eps_q0": 20.7,
-            "eps_q1": 18.63,
-            "eps_q2": 16.56,
-            "eps_q3": 14.49,
-            "per": 24.51,
-            "roe": 15.92
-        },
-        {
-            "ticker": "VICR",
-            "name": "Vicor Corp",
-            "industry": "\uc804\uae30 \ubd80\ud488 \ubc0f \uc7a5\ube44",
-            "ath": 293.95,
-            "lowest_after_ath": 203.0,
-            "price": 256.7,
-            "correction_ratio": 0.309,
-            "price_to_ath": 0.873,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.218,
-            "ma_50_spread": 0.3417,
-            "ma_20_50_spread": 0.1016,
-            "eps_q0": 713.9,
-            "eps_q1": 642.51,
-            "eps_q2": 571.12,
-            "eps_q3": 499.73,
-            "per": 86.14,
-            "roe": 20.49
-        },
-        {
-            "ticker": "SATS",
-            "name": "EchoStar Corp",
-            "industry": "\ubb34\uc120 \ud1b5\uc2e0 \uc11c\ube44\uc2a4",
-            "ath": 137.44,
-            "lowest_after_ath": 116.32,
-            "price": 119.78,
-            "correction_ratio": 0.154,
-            "price_to_ath": 0.872,
-            "days_since_ath": 15,
-            "ma_20_spread": -0.046,
-            "ma_50_spread": 0.0224,
-            "ma_20_50_spread": 0.0717,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -1050.7,
-            "roe": -111.35
-        },
-        {
-            "ticker": "TSEM",
-            "name": "Tower Semiconductor Ltd",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 228.73,
-            "lowest_after_ath": 184.14,
-            "price": 199.18,
-            "correction_ratio": 0.195,
-            "price_to_ath": 0.871,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.029,
-            "ma_50_spread": 0.2002,
-            "ma_20_50_spread": 0.2361,
-            "eps_q0": 45.3,
-            "eps_q1": 40.77,
-            "eps_q2": 36.24,
-            "eps_q3": 31.71,
-            "per": 102.67,
-            "roe": 7.89
-        },
-        {
-            "ticker": "GLPI",
-            "name": "Gaming and Leisure Properties Inc",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 55.13,
-            "lowest_after_ath": 41.17,
-            "price": 47.99,
-            "correction_ratio": 0.253,
-            "price_to_ath": 0.87,
-            "days_since_ath": 1150,
-            "ma_20_spread": 0.0296,
-            "ma_50_spread": 0.0193,
-            "ma_20_50_spread": -0.01,
-            "eps_q0": 40.3,
-            "eps_q1": 36.27,
-            "eps_q2": 32.24,
-            "eps_q3": 28.21,
-            "per": 15.14,
-            "roe": 19.09
-        },
-        {
-            "ticker": "NXT",
-            "name": "Nextpower Inc",
-            "industry": "\uc7ac\uc0dd \uac00\ub2a5 \uc5d0\ub108\uc9c0 \uc7a5\ube44 \ubc0f \uc11c\ube44\uc2a4",
-            "ath": 131.72,
-            "lowest_after_ath": 103.73,
-            "price": 114.27,
-            "correction_ratio": 0.212,
-            "price_to_ath": 0.868,
-            "days_since_ath": 37,
-            "ma_20_spread": 0.0009,
-            "ma_50_spread": -0.003,
-            "ma_20_50_spread": -0.0039,
-            "eps_q0": 13.8,
-            "eps_q1": 12.42,
-            "eps_q2": 11.04,
-            "eps_q3": 9.66,
-            "per": 29.15,
-            "roe": 33.17
-        },
-        {
-            "ticker": "AMGN",
-            "name": "Amgen Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 391.29,
-            "lowest_after_ath": 333.58,
-            "price": 338.02,
-            "correction_ratio": 0.147,
-            "price_to_ath": 0.864,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0267,
-            "ma_50_spread": -0.0592,
-            "ma_20_50_spread": -0.0334,
-            "eps_q0": 112.6,
-            "eps_q1": 101.34,
-            "eps_q2": 90.08,
-            "eps_q3": 78.82,
-            "per": 23.75,
-            "roe": 106.1
-        },
-        {
-            "ticker": "FAST",
-            "name": "Fastenal Co",
-            "industry": "\uc0b0\uc5c5\uc6a9 \uae30\uacc4 \ubc0f \uc7a5\ube44",
-            "ath": 50.63,
-            "lowest_after_ath": 38.97,
-            "price": 43.71,
-            "correction_ratio": 0.23,
-            "price_to_ath": 0.863,
-            "days_since_ath": 247,
-            "ma_20_spread": -0.0457,
-            "ma_50_spread": -0.0439,
-            "ma_20_50_spread": 0.002,
-            "eps_q0": 13.8,
-            "eps_q1": 12.42,
-            "eps_q2": 11.04,
-            "eps_q3": 9.66,
-            "per": 38.68,
-            "roe": 33.84
-        },
-        {
-            "ticker": "IONS",
-            "name": "Ionis Pharmaceuticals Inc",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 86.74,
-            "lowest_after_ath": 68.9,
-            "price": 74.83,
-            "correction_ratio": 0.206,
-            "price_to_ath": 0.863,
-            "days_since_ath": 86,
-            "ma_20_spread": 0.0011,
-            "ma_50_spread": -0.0103,
-            "ma_20_50_spread": -0.0115,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -135.53,
-            "roe": -70.8
-        },
-        {
-            "ticker": "VNOM",
-            "name": "Viper Energy Inc",
-            "industry": "\uc624\uc77c, \uac00\uc2a4 \ud0d0\uc0ac \ubc0f \uc0dd\uc0b0",
-            "ath": 56.76,
-            "lowest_after_ath": 34.71,
-            "price": 48.88,
-            "correction_ratio": 0.388,
-            "price_to_ath": 0.861,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0495,
-            "ma_50_spread": 0.0602,
-            "ma_20_50_spread": 0.0102,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 19.97,
-            "roe": -2.89
-        },
-        {
-            "ticker": "MDLN",
-            "name": "Medline Inc",
-            "industry": "\uc758\ub8cc \uc7a5\ube44, \ubb3c\ud488 \ubc0f \uc720\ud1b5",
-            "ath": 50.88,
-            "lowest_after_ath": 40.76,
-            "price": 43.4,
-            "correction_ratio": 0.199,
-            "price_to_ath": 0.853,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0515,
-            "ma_50_spread": -0.0343,
-            "ma_20_50_spread": 0.0181,
-            "eps_q0": -37.0,
-            "eps_q1": -33.3,
-            "eps_q2": -29.6,
-            "eps_q3": -25.9,
-            "per": 30.35,
-            "roe": 6.53
-        },
-        {
-            "ticker": "NWS",
-            "name": "News Corp Class B",
-            "industry": "\uc18c\ube44\uc790 \ucd9c\ud310",
-            "ath": 35.58,
-            "lowest_after_ath": 25.49,
-            "price": 30.25,
-            "correction_ratio": 0.284,
-            "price_to_ath": 0.85,
-            "days_since_ath": 268,
-            "ma_20_spread": 0.0307,
-            "ma_50_spread": 0.0814,
-            "ma_20_50_spread": 0.0492,
-            "eps_q0": -10.2,
-            "eps_q1": -9.18,
-            "eps_q2": -8.16,
-            "eps_q3": -7.14,
-            "per": 39.29,
-            "roe": 6.33
-        },
-        {
-            "ticker": "ARM",
-            "name": "Arm Holdings PLC ADR",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 237.68,
-            "lowest_after_ath": 164.1,
-            "price": 201.69,
-            "correction_ratio": 0.31,
-            "price_to_ath": 0.849,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1677,
-            "ma_50_spread": 0.3768,
-            "ma_20_50_spread": 0.1791,
-            "eps_q0": -11.5,
-            "eps_q1": -10.35,
-            "eps_q2": -9.2,
-            "eps_q3": -8.05,
-            "per": 268.92,
-            "roe": 11.27
-        },
-        {
-            "ticker": "REG",
-            "name": "Regency Centers Corp",
-            "industry": "\uc0c1\uc5c5\uc6a9 REITs",
-            "ath": 93.49,
-            "lowest_after_ath": 20.72,
-            "price": 79.38,
-            "correction_ratio": 0.778,
-            "price_to_ath": 0.849,
-            "days_since_ath": 7023,
-            "ma_20_spread": 0.0046,
-            "ma_50_spread": 0.0206,
-            "ma_20_50_spread": 0.016,
-            "eps_q0": 134.1,
-            "eps_q1": 120.69,
-            "eps_q2": 107.28,
-            "eps_q3": 93.87,
-            "per": 28.15,
-            "roe": 7.68
-        },
-        {
-            "ticker": "HON",
-            "name": "Honeywell International Inc",
-            "industry": "\uc18c\ube44\uc7ac \ub300\uae30\uc5c5",
-            "ath": 248.18,
-            "lowest_after_ath": 207.83,
-            "price": 210.3,
-            "correction_ratio": 0.163,
-            "price_to_ath": 0.847,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0674,
-            "ma_50_spread": -0.0905,
-            "ma_20_50_spread": -0.0247,
-            "eps_q0": -43.3,
-            "eps_q1": -38.97,
-            "eps_q2": -34.64,
-            "eps_q3": -30.31,
-            "per": 33.59,
-            "roe": 24.26
-        },
-        {
-            "ticker": "CCEP",
-            "name": "Coca-Cola Europacific Partners PLC",
-            "industry": "\ubb34\uc54c\ucf5c \uc74c\ub8cc",
-            "ath": 110.9,
-            "lowest_after_ath": 89.72,
-            "price": 93.75,
-            "correction_ratio": 0.191,
-            "price_to_ath": 0.845,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0241,
-            "ma_50_spread": -0.0497,
-            "ma_20_50_spread": -0.0262,
-            "eps_q0": 65.7,
-            "eps_q1": 59.13,
-            "eps_q2": 52.56,
-            "eps_q3": 45.99,
-            "per": 18.79,
-            "roe": 22.89
-        },
-        {
-            "ticker": "ORLY",
-            "name": "O'Reilly Automotive Inc",
-            "industry": "\uc790\ub3d9\ucc28 \ucc28\ub7c9, \ubd80\ud488 \ubc0f \uc11c\ube44\uc2a4 \uc18c\ub9e4",
-            "ath": 108.72,
-            "lowest_after_ath": 86.77,
-            "price": 91.69,
-            "correction_ratio": 0.202,
-            "price_to_ath": 0.843,
-            "days_since_ath": 212,
-            "ma_20_spread": -0.0126,
-            "ma_50_spread": -0.0081,
-            "ma_20_50_spread": 0.0046,
-            "eps_q0": 9.8,
-            "eps_q1": 8.82,
-            "eps_q2": 7.84,
-            "eps_q3": 6.86,
-            "per": 30.87,
-            "roe": 0
-        },
-        {
-            "ticker": "MDGL",
-            "name": "Madrigal Pharmaceuticals Inc",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 615.0,
-            "lowest_after_ath": 416.21,
-            "price": 518.58,
-            "correction_ratio": 0.323,
-            "price_to_ath": 0.843,
-            "days_since_ath": 128,
-            "ma_20_spread": -0.0106,
-            "ma_50_spread": 0.0795,
-            "ma_20_50_spread": 0.091,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 40.53,
-            "roe": -42.49
-        },
-        {
-            "ticker": "META",
-            "name": "Meta Platforms Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 796.25,
-            "lowest_after_ath": 520.26,
-            "price": 669.12,
-            "correction_ratio": 0.347,
-            "price_to_ath": 0.84,
-            "days_since_ath": 261,
-            "ma_20_spread": 0.0395,
-            "ma_50_spread": 0.0593,
-            "ma_20_50_spread": 0.0191,
-            "eps_q0": 9.3,
-            "eps_q1": 8.37,
-            "eps_q2": 7.44,
-            "eps_q3": 6.51,
-            "per": 28.47,
-            "roe": 30.24
-        },
-        {
-            "ticker": "NBIS",
-            "name": "Nebius Group NV",
-            "industry": "\uacbd\uc601 \uc9c0\uc6d0 \uc11c\ube44\uc2a4",
-            "ath": 168.71,
-            "lowest_after_ath": 132.7,
-            "price": 141.19,
-            "correction_ratio": 0.213,
-            "price_to_ath": 0.837,
-            "days_since_ath": 16,
-            "ma_20_spread": -0.0094,
-            "ma_50_spread": 0.1768,
-            "ma_20_50_spread": 0.1879,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 1283.55,
-            "roe": 0.74
-        },
-        {
-            "ticker": "SBUX",
-            "name": "Starbucks Corp",
-            "industry": "\ub808\uc2a4\ud1a0\ub791 \ubc0f \ubc14",
-            "ath": 126.32,
-            "lowest_after_ath": 68.39,
-            "price": 105.5,
-            "correction_ratio": 0.459,
-            "price_to_ath": 0.835,
-            "days_since_ath": 1745,
-            "ma_20_spread": 0.0824,
-            "ma_50_spread": 0.0938,
-            "ma_20_50_spread": 0.0105,
-            "eps_q0": -62.4,
-            "eps_q1": -56.16,
-            "eps_q2": -49.92,
-            "eps_q3": -43.68,
-            "per": 87.92,
-            "roe": 0
-        },
-        {
-            "ticker": "BBIO",
-            "name": "BridgeBio Pharma Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 84.94,
-            "lowest_after_ath": 62.77,
-            "price": 70.94,
-            "correction_ratio": 0.261,
-            "price_to_ath": 0.835,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0486,
-            "ma_50_spread": -0.0048,
-            "ma_20_50_spread": 0.046,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 134.48,
-            "roe": 0
-        },
-        {
-            "ticker": "FOX",
-            "name": "Fox Corp Class B",
-            "industry": "\ubc29\uc1a1",
-            "ath": 68.18,
-            "lowest_after_ath": 48.76,
-            "price": 56.62,
-            "correction_ratio": 0.285,
-            "price_to_ath": 0.831,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0081,
-            "ma_50_spread": 0.0503,
-            "ma_20_50_spread": 0.0419,
-            "eps_q0": -38.6,
-            "eps_q1": -34.74,
-            "eps_q2": -30.88,
-            "eps_q3": -27.02,
-            "per": 13.58,
-            "roe": 16.82
-        },
-        {
-            "ticker": "LECO",
-            "name": "Lincoln Electric Holdings Inc",
-            "industry": "\uc0b0\uc5c5\uc6a9 \uae30\uacc4 \ubc0f \uc7a5\ube44",
-            "ath": 310.0,
-            "lowest_after_ath": 235.43,
-            "price": 257.51,
-            "correction_ratio": 0.241,
-            "price_to_ath": 0.831,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0074,
-            "ma_50_spread": -0.0207,
-            "ma_20_50_spread": -0.0279,
-            "eps_q0": -3.0,
-            "eps_q1": -2.7,
-            "eps_q2": -2.4,
-            "eps_q3": -2.1,
-            "per": 27.66,
-            "roe": 37.22
-        },
-        {
-            "ticker": "ARGX",
-            "name": "argenx SE ADR",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 934.62,
-            "lowest_after_ath": 661.85,
-            "price": 776.02,
-            "correction_ratio": 0.292,
-            "price_to_ath": 0.83,
-            "days_since_ath": 149,
-            "ma_20_spread": -0.0227,
-            "ma_50_spread": 0.019,
-            "ma_20_50_spread": 0.0426,
-            "eps_q0": -31.2,
-            "eps_q1": -28.08,
-            "eps_q2": -24.96,
-            "eps_q3": -21.84,
-            "per": 39.57,
-            "roe": 20.15
-        },
-        {
-            "ticker": "NWSA",
-            "name": "News Corp Class A",
-            "industry": "\uc18c\ube44\uc790 \ucd9c\ud310",
-            "ath": 31.61,
-            "lowest_after_ath": 22.2,
-            "price": 26.24,
-            "correction_ratio": 0.298,
-            "price_to_ath": 0.83,
-            "days_since_ath": 212,
-            "ma_20_spread": 0.0302,
-            "ma_50_spread": 0.0664,
-            "ma_20_50_spread": 0.0352,
-            "eps_q0": -10.2,
-            "eps_q1": -9.18,
-            "eps_q2": -8.16,
-            "eps_q3": -7.14,
-            "per": 34.08,
-            "roe": 6.33
-        },
-        {
-            "ticker": "FITBP",
-            "name": "Fifth Third Bancorp 40 Depository Shares representing Non Cum Series A Pref",
-            "industry": "\uc740\ud589",
-            "ath": 28.49,
-            "lowest_after_ath": 14.5,
-            "price": 23.54,
-            "correction_ratio": 0.491,
-            "price_to_ath": 0.826,
-            "days_since_ath": 2389,
-            "ma_20_spread": -0.0127,
-            "ma_50_spread": -0.0193,
-            "ma_20_50_spread": -0.0068,
-            "eps_q0": -68.0,
-            "eps_q1": -61.2,
-            "eps_q2": -54.4,
-            "eps_q3": -47.6,
-            "per": 6.76,
-            "roe": 7.97
-        },
-        {
-            "ticker": "EXPE",
-            "name": "Expedia Group Inc",
-            "industry": "\uc5ec\uac00 \ubc0f \uc624\ub77d\uc2dc\uc124",
-            "ath": 303.8,
-            "lowest_after_ath": 185.34,
-            "price": 250.57,
-            "correction_ratio": 0.39,
-            "price_to_ath": 0.825,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0187,
-            "ma_50_spread": 0.0731,
-            "ma_20_50_spread": 0.0535,
-            "eps_q0": -31.4,
-            "eps_q1": -28.26,
-            "eps_q2": -25.12,
-            "eps_q3": -21.98,
-            "per": 25.54,
-            "roe": 48.67
-        },
-        {
-            "ticker": "FOXA",
-            "name": "Fox Corp Class A",
-            "industry": "\ubc29\uc1a1",
-            "ath": 76.39,
-            "lowest_after_ath": 53.03,
-            "price": 62.94,
-            "correction_ratio": 0.306,
-            "price_to_ath": 0.824,
-            "days_since_ath": 114,
-            "ma_20_spread": 0.0062,
-            "ma_50_spread": 0.056,
-            "ma_20_50_spread": 0.0495,
-            "eps_q0": -38.6,
-            "eps_q1": -34.74,
-            "eps_q2": -30.88,
-            "eps_q3": -27.02,
-            "per": 15.09,
-            "roe": 16.82
-        },
-        {
-            "ticker": "CRDO",
-            "name": "Credo Technology Group Holding Ltd",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 213.8,
-            "lowest_after_ath": 86.49,
-            "price": 175.77,
-            "correction_ratio": 0.595,
-            "price_to_ath": 0.822,
-            "days_since_ath": 149,
-            "ma_20_spread": 0.1811,
-            "ma_50_spread": 0.399,
-            "ma_20_50_spread": 0.1845,
-            "eps_q0": 435.2,
-            "eps_q1": 391.68,
-            "eps_q2": 348.16,
-            "eps_q3": 304.64,
-            "per": 96.05,
-            "roe": 27.54
-        },
-        {
-            "ticker": "WTW",
-            "name": "Willis Towers Watson PLC",
-            "industry": "\ubcf5\ud569\ubcf4\ud5d8 \ubc0f \uc911\uac1c\uc778",
-            "ath": 352.79,
-            "lowest_after_ath": 273.59,
-            "price": 290.11,
-            "correction_ratio": 0.224,
-            "price_to_ath": 0.822,
-            "days_since_ath": 205,
-            "ma_20_spread": -0.001,
-            "ma_50_spread": -0.0095,
-            "ma_20_50_spread": -0.0085,
-            "eps_q0": -41.0,
-            "eps_q1": -36.9,
-            "eps_q2": -32.8,
-            "eps_q3": -28.7,
-            "per": 17.84,
-            "roe": 20.08
-        },
-        {
-            "ticker": "LPLA",
-            "name": "LPL Financial Holdings Inc",
-            "industry": "\ud22c\uc790 \uc740\ud589 \ubc0f \uc911\uac1c \uc11c\ube44\uc2a4",
-            "ath": 403.58,
-            "lowest_after_ath": 281.51,
-            "price": 330.89,
-            "correction_ratio": 0.302,
-            "price_to_ath": 0.82,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0451,
-            "ma_50_spread": 0.0697,
-            "ma_20_50_spread": 0.0235,
-            "eps_q0": 11.1,
-            "eps_q1": 9.99,
-            "eps_q2": 8.88,
-            "eps_q3": 7.77,
-            "per": 30.33,
-            "roe": 20.86
-        },
-        {
-            "ticker": "GILD",
-            "name": "Gilead Sciences Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 157.29,
-            "lowest_after_ath": 127.64,
-            "price": 128.84,
-            "correction_ratio": 0.189,
-            "price_to_ath": 0.819,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0558,
-            "ma_50_spread": -0.0873,
-            "ma_20_50_spread": -0.0334,
-            "eps_q0": 22.4,
-            "eps_q1": 20.16,
-            "eps_q2": 17.92,
-            "eps_q3": 15.68,
-            "per": 18.97,
-            "roe": 40.66
-        },
-        {
-            "ticker": "NBIX",
-            "name": "Neurocrine Biosciences Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 160.18,
-            "lowest_after_ath": 122.14,
-            "price": 131.23,
-            "correction_ratio": 0.237,
-            "price_to_ath": 0.819,
-            "days_since_ath": 142,
-            "ma_20_spread": 0.0057,
-            "ma_50_spread": 0.0083,
-            "ma_20_50_spread": 0.0025,
-            "eps_q0": 49.1,
-            "eps_q1": 44.19,
-            "eps_q2": 39.28,
-            "eps_q3": 34.37,
-            "per": 28.04,
-            "roe": 16.38
-        },
-        {
-            "ticker": "HBANM",
-            "name": "Huntington Bancshares Dep Shs Rep 1 1000 Prf Shs Series I",
-            "industry": "\uc740\ud589",
-            "ath": 27.04,
-            "lowest_after_ath": 10.0,
-            "price": 22.09,
-            "correction_ratio": 0.63,
-            "price_to_ath": 0.817,
-            "days_since_ath": 1787,
-            "ma_20_spread": 0.0087,
-            "ma_50_spread": -0.0106,
-            "ma_20_50_spread": -0.0191,
-            "eps_q0": -0.8,
-            "eps_q1": -0.72,
-            "eps_q2": -0.64,
-            "eps_q3": -0.56,
-            "per": 28.39,
-            "roe": 8.39
-        },
-        {
-            "ticker": "FCNCA",
-            "name": "First Citizens BancShares Inc (Delaware)",
-            "industry": "\uc740\ud589",
-            "ath": 2412.93,
-            "lowest_after_ath": 1473.62,
-            "price": 1972.41,
-            "correction_ratio": 0.389,
-            "price_to_ath": 0.817,
-            "days_since_ath": 464,
-            "ma_20_spread": -0.0034,
-            "ma_50_spread": 0.0214,
-            "ma_20_50_spread": 0.0249,
-            "eps_q0": 10.6,
-            "eps_q1": 9.54,
-            "eps_q2": 8.48,
-            "eps_q3": 7.42,
-            "per": 11.38,
-            "roe": 10.18
-        },
-        {
-            "ticker": "VRTX",
-            "name": "Vertex Pharmaceuticals Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 519.88,
-            "lowest_after_ath": 362.5,
-            "price": 423.24,
-            "correction_ratio": 0.303,
-            "price_to_ath": 0.814,
-            "days_since_ath": 541,
-            "ma_20_spread": -0.0315,
-            "ma_50_spread": -0.0704,
-            "ma_20_50_spread": -0.0401,
-            "eps_q0": 30.5,
-            "eps_q1": 27.45,
-            "eps_q2": 24.4,
-            "eps_q3": 21.35,
-            "per": 27.64,
-            "roe": 22.54
-        },
-        {
-            "ticker": "TTWO",
-            "name": "Take-Two Interactive Software Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 264.79,
-            "lowest_after_ath": 187.63,
-            "price": 215.34,
-            "correction_ratio": 0.291,
-            "price_to_ath": 0.813,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.0372,
-            "ma_50_spread": 0.0465,
-            "ma_20_50_spread": 0.0089,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 27.34,
-            "roe": -86.22
-        },
-        {
-            "ticker": "PANW",
-            "name": "Palo Alto Networks Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 223.61,
-            "lowest_after_ath": 139.57,
-            "price": 181.54,
-            "correction_ratio": 0.376,
-            "price_to_ath": 0.812,
-            "days_since_ath": 184,
-            "ma_20_spread": 0.0685,
-            "ma_50_spread": 0.116,
-            "ma_20_50_spread": 0.0445,
-            "eps_q0": 61.8,
-            "eps_q1": 55.62,
-            "eps_q2": 49.44,
-            "eps_q3": 43.26,
-            "per": 101.42,
-            "roe": 16.26
-        },
-        {
-            "ticker": "ESLT",
-            "name": "Elbit Systems Ltd",
-            "industry": "\ud56d\uacf5\uc6b0\uc8fc \ubc0f \ubc29\uc704",
-            "ath": 1016.06,
-            "lowest_after_ath": 800.61,
-            "price": 819.5,
-            "correction_ratio": 0.212,
-            "price_to_ath": 0.807,
-            "days_since_ath": 44,
-            "ma_20_spread": -0.0714,
-            "ma_50_spread": -0.0521,
-            "ma_20_50_spread": 0.0208,
-            "eps_q0": 86.9,
-            "eps_q1": 78.21,
-            "eps_q2": 69.52,
-            "eps_q3": 60.83,
-            "per": 71.7,
-            "roe": 14.46
-        },
-        {
-            "ticker": "HTHT",
-            "name": "H World Group Ltd ADR",
-            "industry": "\ud638\ud154, \ubaa8\ud154 \ubc0f \ud06c\ub8e8\uc988 \ub77c\uc778",
-            "ath": 64.53,
-            "lowest_after_ath": 21.98,
-            "price": 51.86,
-            "correction_ratio": 0.659,
-            "price_to_ath": 0.804,
-            "days_since_ath": 1899,
-            "ma_20_spread": -0.0174,
-            "ma_50_spread": -0.0081,
-            "ma_20_50_spread": 0.0095,
-            "eps_q0": 2293.9,
-            "eps_q1": 2064.51,
-            "eps_q2": 1835.12,
-            "eps_q3": 1605.73,
-            "per": 22.16,
-            "roe": 40.55
-        },
-        {
-            "ticker": "NTAP",
-            "name": "NetApp Inc",
-            "industry": "\ucef4\ud4e8\ud130 \ud558\ub4dc\uc6e8\uc5b4",
-            "ath": 135.45,
-            "lowest_after_ath": 71.84,
-            "price": 108.65,
-            "correction_ratio": 0.47,
-            "price_to_ath": 0.802,
-            "days_since_ath": 527,
-            "ma_20_spread": 0.0483,
-            "ma_50_spread": 0.0648,
-            "ma_20_50_spread": 0.0158,
-            "eps_q0": 11.7,
-            "eps_q1": 10.53,
-            "eps_q2": 9.36,
-            "eps_q3": 8.19,
-            "per": 18.23,
-            "roe": 112.59
-        },
-        {
-            "ticker": "CRWD",
-            "name": "CrowdStrike Holdings Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 566.9,
-            "lowest_after_ath": 342.72,
-            "price": 452.38,
-            "correction_ratio": 0.395,
-            "price_to_ath": 0.798,
-            "days_since_ath": 170,
-            "ma_20_spread": 0.0678,
-            "ma_50_spread": 0.0977,
-            "ma_20_50_spread": 0.028,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 73.3,
-            "roe": -4.14
-        },
-        {
-            "ticker": "EXE",
-            "name": "Expand Energy Corp",
-            "industry": "\uc624\uc77c, \uac00\uc2a4 \ud0d0\uc0ac \ubc0f \uc0dd\uc0b0",
-            "ath": 126.62,
-            "lowest_after_ath": 93.75,
-            "price": 100.99,
-            "correction_ratio": 0.26,
-            "price_to_ath": 0.798,
-            "days_since_ath": 149,
-            "ma_20_spread": 0.0254,
-            "ma_50_spread": -0.0274,
-            "ma_20_50_spread": -0.0514,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 13.34,
-            "roe": 10.07
-        },
-        {
-            "ticker": "ACGL",
-            "name": "Arch Capital Group Ltd",
-            "industry": "\uc190\ud574\ubcf4\ud5d8",
-            "ath": 116.47,
-            "lowest_after_ath": 82.45,
-            "price": 92.72,
-            "correction_ratio": 0.292,
-            "price_to_ath": 0.796,
-            "days_since_ath": 569,
-            "ma_20_spread": -0.0433,
-            "ma_50_spread": -0.039,
-            "ma_20_50_spread": 0.0045,
-            "eps_q0": 32.4,
-            "eps_q1": 29.16,
-            "eps_q2": 25.92,
-            "eps_q3": 22.68,
-            "per": 7.99,
-            "roe": 19.54
-        },
-        {
-            "ticker": "VLYPP",
-            "name": "Valley National 6 25 Fixed to Floating Rate Non Cumulative Perpetual Pref Shs",
-            "industry": "\uc740\ud589",
-            "ath": 31.66,
-            "lowest_after_ath": 13.73,
-            "price": 25.17,
-            "correction_ratio": 0.566,
-            "price_to_ath": 0.795,
-            "days_since_ath": 1731,
-            "ma_20_spread": 0.0024,
-            "ma_50_spread": 0.0034,
-            "ma_20_50_spread": 0.001,
-            "eps_q0": 54.6,
-            "eps_q1": 49.14,
-            "eps_q2": 43.68,
-            "eps_q3": 38.22,
-            "per": 22.68,
-            "roe": 8.56
-        },
-        {
-            "ticker": "PEP",
-            "name": "PepsiCo Inc",
-            "industry": "\ubb34\uc54c\ucf5c \uc74c\ub8cc",
-            "ath": 196.88,
-            "lowest_after_ath": 127.6,
-            "price": 155.29,
-            "correction_ratio": 0.352,
-            "price_to_ath": 0.789,
-            "days_since_ath": 1080,
-            "ma_20_spread": -0.0033,
-            "ma_50_spread": -0.0186,
-            "ma_20_50_spread": -0.0154,
-            "eps_q0": 26.9,
-            "eps_q1": 24.21,
-            "eps_q2": 21.52,
-            "eps_q3": 18.83,
-            "per": 24.34,
-            "roe": 43.88
-        },
-        {
-            "ticker": "GFS",
-            "name": "GlobalFoundries Inc",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 79.49,
-            "lowest_after_ath": 29.77,
-            "price": 62.74,
-            "correction_ratio": 0.625,
-            "price_to_ath": 0.789,
-            "days_since_ath": 1500,
-            "ma_20_spread": 0.1881,
-            "ma_50_spread": 0.2968,
-            "ma_20_50_spread": 0.0915,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 39.46,
-            "roe": 7.79
-        },
-        {
-            "ticker": "STRD",
-            "name": "Strategy 10 00 Perpetual Stride Prf Shs Series A",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 96.81,
-            "lowest_after_ath": 64.17,
-            "price": 76.32,
-            "correction_ratio": 0.337,
-            "price_to_ath": 0.788,
-            "days_since_ath": 289,
-            "ma_20_spread": 0.002,
-            "ma_50_spread": 0.0012,
-            "ma_20_50_spread": -0.0008,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": -11.11
-        },
-        {
-            "ticker": "FWONA",
-            "name": "Liberty Media Formula One Ord Shs Series A",
-            "industry": "\ubc29\uc1a1",
-            "ath": 99.52,
-            "lowest_after_ath": 73.7,
-            "price": 78.38,
-            "correction_ratio": 0.259,
-            "price_to_ath": 0.788,
-            "days_since_ath": 205,
-            "ma_20_spread": -0.0351,
-            "ma_50_spread": -0.0152,
-            "ma_20_50_spread": 0.0206,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 33.93,
-            "roe": 7.69
-        },
-        {
-            "ticker": "STRF",
-            "name": "Strategy 10 00 Perpetual Strife Prf Shs Series A",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 127.8,
-            "lowest_after_ath": 92.0,
-            "price": 100.6,
-            "correction_ratio": 0.28,
-            "price_to_ath": 0.787,
-            "days_since_ath": 296,
-            "ma_20_spread": 0.0197,
-            "ma_50_spread": 0.0152,
-            "ma_20_50_spread": -0.0044,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": -11.11
-        },
-        {
-            "ticker": "ARCC",
-            "name": "Ares Capital Corp",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 23.84,
-            "lowest_after_ath": 17.4,
-            "price": 18.67,
-            "correction_ratio": 0.27,
-            "price_to_ath": 0.783,
-            "days_since_ath": 450,
-            "ma_20_spread": 0.0071,
-            "ma_50_spread": 0.0075,
-            "ma_20_50_spread": 0.0004,
-            "eps_q0": -17.9,
-            "eps_q1": -16.11,
-            "eps_q2": -14.32,
-            "eps_q3": -12.53,
-            "per": 11.45,
-            "roe": 9.39
-        },
-        {
-            "ticker": "TLN",
-            "name": "Talen Energy Corp",
-            "industry": "\ubbfc\uc790 \ubc1c\uc804 \uc0ac\uc5c5",
-            "ath": 451.28,
-            "lowest_after_ath": 301.45,
-            "price": 351.91,
-            "correction_ratio": 0.332,
-            "price_to_ath": 0.78,
-            "days_since_ath": 212,
-            "ma_20_spread": 0.03,
-            "ma_50_spread": 0.0332,
-            "ma_20_50_spread": 0.0031,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 11.02,
-            "roe": -17.66
-        },
-        {
-            "ticker": "FWONK",
-            "name": "Liberty Media Formula One Ord Shs Series C",
-            "industry": "\ubc29\uc1a1",
-            "ath": 109.36,
-            "lowest_after_ath": 80.15,
-            "price": 85.09,
-            "correction_ratio": 0.267,
-            "price_to_ath": 0.778,
-            "days_since_ath": 205,
-            "ma_20_spread": -0.0356,
-            "ma_50_spread": -0.0198,
-            "ma_20_50_spread": 0.0163,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 36.84,
-            "roe": 7.69
-        },
-        {
-            "ticker": "MDLZ",
-            "name": "Mondelez International Inc",
-            "industry": "\uc2dd\ud488 \uac00\uacf5",
-            "ath": 78.59,
-            "lowest_after_ath": 51.2,
-            "price": 61.04,
-            "correction_ratio": 0.349,
-            "price_to_ath": 0.777,
-            "days_since_ath": 1101,
-            "ma_20_spread": 0.0564,
-            "ma_50_spread": 0.0533,
-            "ma_20_50_spread": -0.0029,
-            "eps_q0": -61.9,
-            "eps_q1": -55.71,
-            "eps_q2": -49.52,
-            "eps_q3": -43.33,
-            "per": 32.3,
-            "roe": 9.33
-        },
-        {
-            "ticker": "FITBI",
-            "name": "Fifth Third Bancorp Depositary Shares Representing 1/1000th Perp Pref Shs",
-            "industry": "\uc740\ud589",
-            "ath": 32.71,
-            "lowest_after_ath": 16.5,
-            "price": 25.36,
-            "correction_ratio": 0.496,
-            "price_to_ath": 0.775,
-            "days_since_ath": 3530,
-            "ma_20_spread": 0.0022,
-            "ma_50_spread": -0.0061,
-            "ma_20_50_spread": -0.0083,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 7.28,
-            "roe": 12.48
-        },
-        {
-            "ticker": "TW",
-            "name": "Tradeweb Markets Inc",
-            "industry": "\uae08\uc735, \uc0c1\ud488 \uc2dc\uc7a5 \uc6b4\uc601 \ubc0f \uc11c\ube44\uc2a4 \uc81c\uacf5",
-            "ath": 152.65,
-            "lowest_after_ath": 97.06,
-            "price": 118.12,
-            "correction_ratio": 0.364,
-            "price_to_ath": 0.774,
-            "days_since_ath": 394,
-            "ma_20_spread": -0.0072,
-            "ma_50_spread": -0.0231,
-            "ma_20_50_spread": -0.0161,
-            "eps_q0": 128.5,
-            "eps_q1": 115.65,
-            "eps_q2": 102.8,
-            "eps_q3": 89.95,
-            "per": 31.25,
-            "roe": 13.56
-        },
-        {
-            "ticker": "RKLB",
-            "name": "Rocket Lab Corp",
-            "industry": "\ud56d\uacf5\uc6b0\uc8fc \ubc0f \ubc29\uc704",
-            "ath": 99.58,
-            "lowest_after_ath": 56.13,
-            "price": 77.02,
-            "correction_ratio": 0.436,
-            "price_to_ath": 0.773,
-            "days_since_ath": 107,
-            "ma_20_spread": 0.011,
-            "ma_50_spread": 0.0656,
-            "ma_20_50_spread": 0.054,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 1502.83,
-            "roe": -18.84
-        },
-        {
-            "ticker": "AKAM",
-            "name": "Akamai Technologies Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 129.17,
-            "lowest_after_ath": 67.51,
-            "price": 99.8,
-            "correction_ratio": 0.477,
-            "price_to_ath": 0.773,
-            "days_since_ath": 814,
-            "ma_20_spread": -0.0126,
-            "ma_50_spread": -0.0417,
-            "ma_20_50_spread": -0.0295,
-            "eps_q0": -39.2,
-            "eps_q1": -35.28,
-            "eps_q2": -31.36,
-            "eps_q3": -27.44,
-            "per": 32.51,
-            "roe": 9.17
-        },
-        {
-            "ticker": "SNY",
-            "name": "Sanofi SA ADR",
-            "industry": "\uc81c\uc57d",
-            "ath": 60.12,
-            "lowest_after_ath": 43.32,
-            "price": 46.03,
-            "correction_ratio": 0.279,
-            "price_to_ath": 0.766,
-            "days_since_ath": 415,
-            "ma_20_spread": -0.0244,
-            "ma_50_spread": -0.0073,
-            "ma_20_50_spread": 0.0176,
-            "eps_q0": -13.8,
-            "eps_q1": -12.42,
-            "eps_q2": -11.04,
-            "eps_q3": -9.66,
-            "per": 19.84,
-            "roe": 6.43
-        },
-        {
-            "ticker": "MSFT",
-            "name": "Microsoft Corp",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 555.45,
-            "lowest_after_ath": 356.28,
-            "price": 424.46,
-            "correction_ratio": 0.359,
-            "price_to_ath": 0.764,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0569,
-            "ma_50_spread": 0.0729,
-            "ma_20_50_spread": 0.0151,
-            "eps_q0": 59.5,
-            "eps_q1": 53.55,
-            "eps_q2": 47.6,
-            "eps_q3": 41.65,
-            "per": 26.58,
-            "roe": 34.39
-        },
-        {
-            "ticker": "SSNC",
-            "name": "SS&C Technologies Holdings Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 91.07,
-            "lowest_after_ath": 65.05,
-            "price": 69.49,
-            "correction_ratio": 0.286,
-            "price_to_ath": 0.763,
-            "days_since_ath": 254,
-            "ma_20_spread": -0.0012,
-            "ma_50_spread": -0.0195,
-            "ma_20_50_spread": -0.0183,
-            "eps_q0": 6.2,
-            "eps_q1": 5.58,
-            "eps_q2": 4.96,
-            "eps_q3": 4.34,
-            "per": 21.58,
-            "roe": 11.8
-        },
-        {
-            "ticker": "NTRA",
-            "name": "Natera Inc",
-            "industry": "\uc758\ub8cc \uc2dc\uc124 \ubc0f \uc11c\ube44\uc2a4",
-            "ath": 256.36,
-            "lowest_after_ath": 181.0,
-            "price": 194.75,
-            "correction_ratio": 0.294,
-            "price_to_ath": 0.76,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0466,
-            "ma_50_spread": -0.0376,
-            "ma_20_50_spread": 0.0094,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -287.1,
-            "roe": -14.32
-        },
-        {
-            "ticker": "CTAS",
-            "name": "Cintas Corp",
-            "industry": "\uacbd\uc601 \uc9c0\uc6d0 \uc11c\ube44\uc2a4",
-            "ath": 229.24,
-            "lowest_after_ath": 165.6,
-            "price": 173.95,
-            "correction_ratio": 0.278,
-            "price_to_ath": 0.759,
-            "days_since_ath": 331,
-            "ma_20_spread": -0.0067,
-            "ma_50_spread": -0.0572,
-            "ma_20_50_spread": -0.0508,
-            "eps_q0": 8.4,
-            "eps_q1": 7.56,
-            "eps_q2": 6.72,
-            "eps_q3": 5.88,
-            "per": 36.7,
-            "roe": 41.3
-        },
-        {
-            "ticker": "RGLD",
-            "name": "Royal Gold Inc",
-            "industry": "\uae08",
-            "ath": 306.25,
-            "lowest_after_ath": 213.76,
-            "price": 231.02,
-            "correction_ratio": 0.302,
-            "price_to_ath": 0.754,
-            "days_since_ath": 93,
-            "ma_20_spread": -0.1066,
-            "ma_50_spread": -0.1173,
-            "ma_20_50_spread": -0.012,
-            "eps_q0": -12.8,
-            "eps_q1": -11.52,
-            "eps_q2": -10.24,
-            "eps_q3": -8.96,
-            "per": 34.58,
-            "roe": 9.12
-        },
-        {
-            "ticker": "FTNT",
-            "name": "Fortinet Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 114.82,
-            "lowest_after_ath": 70.12,
-            "price": 86.11,
-            "correction_ratio": 0.389,
-            "price_to_ath": 0.75,
-            "days_since_ath": 436,
-            "ma_20_spread": 0.0429,
-            "ma_50_spread": 0.0534,
-            "ma_20_50_spread": 0.0101,
-            "eps_q0": -3.8,
-            "eps_q1": -3.42,
-            "eps_q2": -3.04,
-            "eps_q3": -2.66,
-            "per": 35.58,
-            "roe": 135.72
-        },
-        {
-            "ticker": "FUTU",
-            "name": "Futu Holdings Ltd ADR",
-            "industry": "\ud540\ud14c\ud06c",
-            "ath": 204.25,
-            "lowest_after_ath": 21.23,
-            "price": 153.19,
-            "correction_ratio": 0.896,
-            "price_to_ath": 0.75,
-            "days_since_ath": 1906,
-            "ma_20_spread": -0.0164,
-            "ma_50_spread": 0.0271,
-            "ma_20_50_spread": 0.0441,
-            "eps_q0": 81.1,
-            "eps_q1": 72.99,
-            "eps_q2": 64.88,
-            "eps_q3": 56.77,
-            "per": 14.96,
-            "roe": 33.08
-        },
-        {
-            "ticker": "ALAB",
-            "name": "Astera Labs  Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 262.9,
-            "lowest_after_ath": 97.89,
-            "price": 196.85,
-            "correction_ratio": 0.628,
-            "price_to_ath": 0.749,
-            "days_since_ath": 226,
-            "ma_20_spread": 0.2048,
-            "ma_50_spread": 0.4264,
-            "ma_20_50_spread": 0.1839,
-            "eps_q0": 82.0,
-            "eps_q1": 73.8,
-            "eps_q2": 65.6,
-            "eps_q3": 57.4,
-            "per": 160.04,
-            "roe": 18.82
-        },
-        {
-            "ticker": "TSLA",
-            "name": "Tesla Inc",
-            "industry": "\uc790\ub3d9\ucc28 \ubc0f \ud2b8\ub7ed \uc81c\uc870",
-            "ath": 498.83,
-            "lowest_after_ath": 337.24,
-            "price": 372.8,
-            "correction_ratio": 0.324,
-            "price_to_ath": 0.747,
-            "days_since_ath": 128,
-            "ma_20_spread": 0.0047,
-            "ma_50_spread": -0.031,
-            "ma_20_50_spread": -0.0355,
-            "eps_q0": 16.6,
-            "eps_q1": 14.94,
-            "eps_q2": 13.28,
-            "eps_q3": 11.62,
-            "per": 342.02,
-            "roe": 4.9
-        },
-        {
-            "ticker": "BKNG",
-            "name": "Booking Holdings Inc",
-            "industry": "\uc5ec\uac00 \ubc0f \uc624\ub77d\uc2dc\uc124",
-            "ath": 233.58,
-            "lowest_after_ath": 150.62,
-            "price": 173.98,
-            "correction_ratio": 0.355,
-            "price_to_ath": 0.745,
-            "days_since_ath": 296,
-            "ma_20_spread": -0.0282,
-            "ma_50_spread": 0.0019,
-            "ma_20_50_spread": 0.0309,
-            "eps_q0": 33.7,
-            "eps_q1": 30.33,
-            "eps_q2": 26.96,
-            "eps_q3": 23.59,
-            "per": 26.28,
-            "roe": 0
-        },
-        {
-            "ticker": "UAL",
-            "name": "United Airlines Holdings Inc",
-            "industry": "\ud56d\uacf5\uc0ac",
-            "ath": 119.21,
-            "lowest_after_ath": 84.64,
-            "price": 88.62,
-            "correction_ratio": 0.29,
-            "price_to_ath": 0.743,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0594,
-            "ma_50_spread": -0.0811,
-            "ma_20_50_spread": -0.023,
-            "eps_q0": 80.6,
-            "eps_q1": 72.54,
-            "eps_q2": 64.48,
-            "eps_q3": 56.42,
-            "per": 7.93,
-            "roe": 25.73
-        },
-        {
-            "ticker": "ULTA",
-            "name": "Ulta Beauty Inc",
-            "industry": "\uae30\ud0c0 \uc804\ubb38 \uc18c\ub9e4",
-            "ath": 714.97,
-            "lowest_after_ath": 499.32,
-            "price": 530.23,
-            "correction_ratio": 0.302,
-            "price_to_ath": 0.742,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0239,
-            "ma_50_spread": -0.086,
-            "ma_20_50_spread": -0.0637,
-            "eps_q0": -9.3,
-            "eps_q1": -8.37,
-            "eps_q2": -7.44,
-            "eps_q3": -6.51,
-            "per": 20.7,
-            "roe": 43.59
-        },
-        {
-            "ticker": "HST",
-            "name": "Host Hotels and Resorts  Inc",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 28.37,
-            "lowest_after_ath": 3.02,
-            "price": 21.06,
-            "correction_ratio": 0.894,
-            "price_to_ath": 0.742,
-            "days_since_ath": 7016,
-            "ma_20_spread": 0.0324,
-            "ma_50_spread": 0.064,
-            "ma_20_50_spread": 0.0307,
-            "eps_q0": 25.0,
-            "eps_q1": 22.5,
-            "eps_q2": 20.0,
-            "eps_q3": 17.5,
-            "per": 19.15,
-            "roe": 11.49
-        },
-        {
-            "ticker": "HAS",
-            "name": "Hasbro Inc",
-            "industry": "\uc7a5\ub09c\uac10 \ubc0f \uc5b4\ub9b0\uc774 \uc81c\ud488",
-            "ath": 126.87,
-            "lowest_after_ath": 41.33,
-            "price": 94.02,
-            "correction_ratio": 0.674,
-            "price_to_ath": 0.741,
-            "days_since_ath": 2466,
-            "ma_20_spread": 0.0106,
-            "ma_50_spread": -0.004,
-            "ma_20_50_spread": -0.0145,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 14.83,
-            "roe": -36.35
-        },
-        {
-            "ticker": "SNPS",
-            "name": "Synopsys Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 651.73,
-            "lowest_after_ath": 376.18,
-            "price": 481.22,
-            "correction_ratio": 0.423,
-            "price_to_ath": 0.738,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0952,
-            "ma_50_spread": 0.1186,
-            "ma_20_50_spread": 0.0214,
-            "eps_q0": -78.0,
-            "eps_q1": -70.2,
-            "eps_q2": -62.4,
-            "eps_q3": -54.6,
-            "per": 73.69,
-            "roe": 5.54
-        },
-        {
-            "ticker": "ISRG",
-            "name": "Intuitive Surgical Inc",
-            "industry": "\ucca8\ub2e8 \uc758\ub8cc \uc7a5\ube44 \ubc0f \uae30\uc220",
-            "ath": 616.0,
-            "lowest_after_ath": 425.0,
-            "price": 453.83,
-            "correction_ratio": 0.31,
-            "price_to_ath": 0.737,
-            "days_since_ath": 464,
-            "ma_20_spread": -0.0203,
-            "ma_50_spread": -0.0479,
-            "ma_20_50_spread": -0.0282,
-            "eps_q0": 17.6,
-            "eps_q1": 15.84,
-            "eps_q2": 14.08,
-            "eps_q3": 12.32,
-            "per": 55.28,
-            "roe": 17.23
-        },
-        {
-            "ticker": "TER",
-            "name": "Teradyne Inc",
-            "industry": "\ubc18\ub3c4\uccb4 \uc7a5\ube44 \ubc0f \ud14c\uc2a4\ud2b8",
-            "ath": 422.11,
-            "lowest_after_ath": 301.86,
-            "price": 306.33,
-            "correction_ratio": 0.285,
-            "price_to_ath": 0.726,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.1541,
-            "ma_50_spread": -0.0679,
-            "ma_20_50_spread": 0.102,
-            "eps_q0": 75.9,
-            "eps_q1": 68.31,
-            "eps_q2": 60.72,
-            "eps_q3": 53.13,
-            "per": 88.53,
-            "roe": 19.73
-        },
-        {
-            "ticker": "RYAAY",
-            "name": "Ryanair Holdings PLC ADR",
-            "industry": "\ud56d\uacf5\uc0ac",
-            "ath": 74.24,
-            "lowest_after_ath": 53.6,
-            "price": 53.91,
-            "correction_ratio": 0.278,
-            "price_to_ath": 0.726,
-            "days_since_ath": 114,
-            "ma_20_spread": -0.0921,
-            "ma_50_spread": -0.1204,
-            "ma_20_50_spread": -0.0312,
-            "eps_q0": -79.5,
-            "eps_q1": -71.55,
-            "eps_q2": -63.6,
-            "eps_q3": -55.65,
-            "per": 10.83,
-            "roe": 26.44
-        },
-        {
-            "ticker": "JKHY",
-            "name": "Jack Henry & Associates Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 212.62,
-            "lowest_after_ath": 136.57,
-            "price": 153.75,
-            "correction_ratio": 0.358,
-            "price_to_ath": 0.723,
-            "days_since_ath": 1360,
-            "ma_20_spread": -0.0007,
-            "ma_50_spread": -0.035,
-            "ma_20_50_spread": -0.0344,
-            "eps_q0": 27.4,
-            "eps_q1": 24.66,
-            "eps_q2": 21.92,
-            "eps_q3": 19.18,
-            "per": 22.06,
-            "roe": 24.28
-        },
-        {
-            "ticker": "CEG",
-            "name": "Constellation Energy Corp",
-            "industry": "\uc804\ub825 \uc720\ud2f8\ub9ac\ud2f0",
-            "ath": 412.7,
-            "lowest_after_ath": 243.3,
-            "price": 297.0,
-            "correction_ratio": 0.41,
-            "price_to_ath": 0.72,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.0231,
-            "ma_50_spread": -0.0122,
-            "ma_20_50_spread": -0.0345,
-            "eps_q0": -49.3,
-            "eps_q1": -44.37,
-            "eps_q2": -39.44,
-            "eps_q3": -34.51,
-            "per": 40.14,
-            "roe": 16.36
-        },
-        {
-            "ticker": "IDXX",
-            "name": "IDEXX Laboratories Inc",
-            "industry": "\uc758\ub8cc \uc7a5\ube44, \ubb3c\ud488 \ubc0f \uc720\ud1b5",
-            "ath": 769.98,
-            "lowest_after_ath": 544.01,
-            "price": 553.66,
-            "correction_ratio": 0.293,
-            "price_to_ath": 0.719,
-            "days_since_ath": 156,
-            "ma_20_spread": -0.0353,
-            "ma_50_spread": -0.0652,
-            "ma_20_50_spread": -0.031,
-            "eps_q0": 14.8,
-            "eps_q1": 13.32,
-            "eps_q2": 11.84,
-            "eps_q3": 10.36,
-            "per": 42.36,
-            "roe": 66.2
-        },
-        {
-            "ticker": "TMUS",
-            "name": "T-Mobile US Inc",
-            "industry": "\ubb34\uc120 \ud1b5\uc2e0 \uc11c\ube44\uc2a4",
-            "ath": 276.49,
-            "lowest_after_ath": 181.36,
-            "price": 198.17,
-            "correction_ratio": 0.344,
-            "price_to_ath": 0.717,
-            "days_since_ath": 422,
-            "ma_20_spread": 0.017,
-            "ma_50_spread": -0.0415,
-            "ma_20_50_spread": -0.0575,
-            "eps_q0": -29.5,
-            "eps_q1": -26.55,
-            "eps_q2": -23.6,
-            "eps_q3": -20.65,
-            "per": 21.06,
-            "roe": 18.18
-        },
-        {
-            "ticker": "EXC",
-            "name": "Exelon Corp",
-            "industry": "\uc804\ub825 \uc720\ud2f8\ub9ac\ud2f0",
-            "ath": 65.71,
-            "lowest_after_ath": 17.9,
-            "price": 47.02,
-            "correction_ratio": 0.728,
-            "price_to_ath": 0.716,
-            "days_since_ath": 6505,
-            "ma_20_spread": -0.0158,
-            "ma_50_spread": -0.0263,
-            "ma_20_50_spread": -0.0106,
-            "eps_q0": -8.2,
-            "eps_q1": -7.38,
-            "eps_q2": -6.56,
-            "eps_q3": -5.74,
-            "per": 17.22,
-            "roe": 9.94
-        },
-        {
-            "ticker": "NTES",
-            "name": "NetEase Inc ADR",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 159.55,
-            "lowest_after_ath": 108.67,
-            "price": 113.49,
-            "correction_ratio": 0.319,
-            "price_to_ath": 0.711,
-            "days_since_ath": 226,
-            "ma_20_spread": -0.0014,
-            "ma_50_spread": -0.0113,
-            "ma_20_50_spread": -0.0099,
-            "eps_q0": -28.8,
-            "eps_q1": -25.92,
-            "eps_q2": -23.04,
-            "eps_q3": -20.16,
-            "per": 14.8,
-            "roe": 22.62
-        },
-        {
-            "ticker": "SLMBP",
-            "name": "SLM Floating Rate Non Cumulative Pref Shs Series B",
-            "industry": "\uc18c\ube44\uc790 \ub300\ucd9c",
-            "ath": 105.75,
-            "lowest_after_ath": 9.25,
-            "price": 74.41,
-            "correction_ratio": 0.913,
-            "price_to_ath": 0.704,
-            "days_since_ath": 7282,
-            "ma_20_spread": -0.0013,
-            "ma_50_spread": -0.0045,
-            "ma_20_50_spread": -0.0032,
-            "eps_q0": 1.1,
-            "eps_q1": 0.99,
-            "eps_q2": 0.88,
-            "eps_q3": 0.77,
-            "per": 34.69,
-            "roe": 30.93
-        },
-        {
-            "ticker": "LOGI",
-            "name": "Logitech international SA",
-            "industry": "\ucef4\ud4e8\ud130 \ud558\ub4dc\uc6e8\uc5b4",
-            "ath": 140.17,
-            "lowest_after_ath": 41.81,
-            "price": 97.7,
-            "correction_ratio": 0.702,
-            "price_to_ath": 0.697,
-            "days_since_ath": 1787,
-            "ma_20_spread": 0.0228,
-            "ma_50_spread": 0.0506,
-            "ma_20_50_spread": 0.0271,
-            "eps_q0": 25.4,
-            "eps_q1": 22.86,
-            "eps_q2": 20.32,
-            "eps_q3": 17.78,
-            "per": 20.48,
-            "roe": 32.07
-        },
-        {
-            "ticker": "RMBS",
-            "name": "Rambus Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 161.8,
-            "lowest_after_ath": 104.5,
-            "price": 112.16,
-            "correction_ratio": 0.354,
-            "price_to_ath": 0.693,
-            "days_since_ath": 9,
-            "ma_20_spread": -0.0401,
-            "ma_50_spread": 0.0884,
-            "ma_20_50_spread": 0.1338,
-            "eps_q0": -0.7,
-            "eps_q1": -0.63,
-            "eps_q2": -0.56,
-            "eps_q3": -0.49,
-            "per": 53.41,
-            "roe": 18.02
-        },
-        {
-            "ticker": "NFLX",
-            "name": "Netflix Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 134.12,
-            "lowest_after_ath": 75.01,
-            "price": 92.12,
-            "correction_ratio": 0.441,
-            "price_to_ath": 0.687,
-            "days_since_ath": 303,
-            "ma_20_spread": -0.0602,
-            "ma_50_spread": -0.0207,
-            "ma_20_50_spread": 0.042,
-            "eps_q0": 82.8,
-            "eps_q1": 74.52,
-            "eps_q2": 66.24,
-            "eps_q3": 57.96,
-            "per": 29.72,
-            "roe": 48.49
-        },
-        {
-            "ticker": "TRMB",
-            "name": "Trimble Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 96.49,
-            "lowest_after_ath": 39.57,
-            "price": 66.28,
-            "correction_ratio": 0.59,
-            "price_to_ath": 0.687,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.0075,
-            "ma_50_spread": -0.0094,
-            "ma_20_50_spread": -0.0019,
-            "eps_q0": 73.6,
-            "eps_q1": 66.24,
-            "eps_q2": 58.88,
-            "eps_q3": 51.52,
-            "per": 37.66,
-            "roe": 7.32
-        },
-        {
-            "ticker": "BKR",
-            "name": "Baker Hughes Co",
-            "industry": "\uc624\uc77c \uad00\ub828 \uc11c\ube44\uc2a4 \ubc0f \uc7a5\ube44",
-            "ath": 100.29,
-            "lowest_after_ath": 9.12,
-            "price": 68.81,
-            "correction_ratio": 0.909,
-            "price_to_ath": 0.686,
-            "days_since_ath": 6771,
-            "ma_20_spread": 0.095,
-            "ma_50_spread": 0.1134,
-            "ma_20_50_spread": 0.0169,
-            "eps_q0": 131.3,
-            "eps_q1": 118.17,
-            "eps_q2": 105.04,
-            "eps_q3": 91.91,
-            "per": 21.98,
-            "roe": 17.18
-        },
-        {
-            "ticker": "ADSK",
-            "name": "Autodesk Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 344.39,
-            "lowest_after_ath": 163.2,
-            "price": 235.87,
-            "correction_ratio": 0.526,
-            "price_to_ath": 0.685,
-            "days_since_ath": 1710,
-            "ma_20_spread": -0.002,
-            "ma_50_spread": -0.0189,
-            "ma_20_50_spread": -0.017,
-            "eps_q0": 4.3,
-            "eps_q1": 3.87,
-            "eps_q2": 3.44,
-            "eps_q3": 3.01,
-            "per": 45.01,
-            "roe": 39.67
-        },
-        {
-            "ticker": "CG",
-            "name": "Carlyle Group Inc",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 69.85,
-            "lowest_after_ath": 44.83,
-            "price": 47.81,
-            "correction_ratio": 0.358,
-            "price_to_ath": 0.684,
-            "days_since_ath": 226,
-            "ma_20_spread": -0.0286,
-            "ma_50_spread": -0.0292,
-            "ma_20_50_spread": -0.0006,
-            "eps_q0": 69.8,
-            "eps_q1": 62.82,
-            "eps_q2": 55.84,
-            "eps_q3": 48.86,
-            "per": 21.93,
-            "roe": 14.1
-        },
-        {
-            "ticker": "ONC",
-            "name": "BeOne Medicines AG ADR",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 426.56,
-            "lowest_after_ath": 118.18,
-            "price": 290.8,
-            "correction_ratio": 0.723,
-            "price_to_ath": 0.682,
-            "days_since_ath": 1689,
-            "ma_20_spread": -0.0577,
-            "ma_50_spread": -0.0529,
-            "ma_20_50_spread": 0.0051,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 117.73,
-            "roe": 7.46
-        },
-        {
-            "ticker": "QCOM",
-            "name": "Qualcomm Inc",
-            "industry": "\ubc18\ub3c4\uccb4",
-            "ath": 230.63,
-            "lowest_after_ath": 120.8,
-            "price": 156.0,
-            "correction_ratio": 0.476,
-            "price_to_ath": 0.676,
-            "days_since_ath": 681,
-            "ma_20_spread": 0.1542,
-            "ma_50_spread": 0.1534,
-            "ma_20_50_spread": -0.0007,
-            "eps_q0": -5.5,
-            "eps_q1": -4.95,
-            "eps_q2": -4.4,
-            "eps_q3": -3.85,
-            "per": 31.39,
-            "roe": 21.48
-        },
-        {
-            "ticker": "FITBO",
-            "name": "Fifth Third Bancorp 1000 DS Representing Preferred Series K",
-            "industry": "\uc740\ud589",
-            "ath": 28.49,
-            "lowest_after_ath": 17.58,
-            "price": 19.25,
-            "correction_ratio": 0.383,
-            "price_to_ath": 0.676,
-            "days_since_ath": 1990,
-            "ma_20_spread": -0.0027,
-            "ma_50_spread": -0.0117,
-            "ma_20_50_spread": -0.009,
-            "eps_q0": -68.0,
-            "eps_q1": -61.2,
-            "eps_q2": -54.4,
-            "eps_q3": -47.6,
-            "per": 5.53,
-            "roe": 7.97
-        },
-        {
-            "ticker": "SAIA",
-            "name": "Saia Inc",
-            "industry": "\uc9c0\uc0c1 \ud654\ubb3c \ubc0f \ubb3c\ub958",
-            "ath": 628.34,
-            "lowest_after_ath": 229.12,
-            "price": 422.04,
-            "correction_ratio": 0.635,
-            "price_to_ath": 0.672,
-            "days_since_ath": 786,
-            "ma_20_spread": 0.0257,
-            "ma_50_spread": 0.1052,
-            "ma_20_50_spread": 0.0775,
-            "eps_q0": -37.6,
-            "eps_q1": -33.84,
-            "eps_q2": -30.08,
-            "eps_q3": -26.32,
-            "per": 44.29,
-            "roe": 10.43
-        },
-        {
-            "ticker": "MELI",
-            "name": "MercadoLibre Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 2645.22,
-            "lowest_after_ath": 1593.21,
-            "price": 1767.02,
-            "correction_ratio": 0.398,
-            "price_to_ath": 0.668,
-            "days_since_ath": 303,
-            "ma_20_spread": -0.0205,
-            "ma_50_spread": -0.0022,
-            "ma_20_50_spread": 0.0187,
-            "eps_q0": -12.5,
-            "eps_q1": -11.25,
-            "eps_q2": -10.0,
-            "eps_q3": -8.75,
-            "per": 44.83,
-            "roe": 35.99
-        },
-        {
-            "ticker": "TCOM",
-            "name": "Trip.com Group Ltd ADR",
-            "industry": "\uc5ec\uac00 \ubc0f \uc624\ub77d\uc2dc\uc124",
-            "ath": 78.99,
-            "lowest_after_ath": 48.48,
-            "price": 52.78,
-            "correction_ratio": 0.386,
-            "price_to_ath": 0.668,
-            "days_since_ath": 107,
-            "ma_20_spread": 0.004,
-            "ma_50_spread": 0.0085,
-            "ma_20_50_spread": 0.0045,
-            "eps_q0": 98.5,
-            "eps_q1": 88.65,
-            "eps_q2": 78.8,
-            "eps_q3": 68.95,
-            "per": 7.57,
-            "roe": 21.12
-        },
-        {
-            "ticker": "SHOP",
-            "name": "Shopify Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 182.19,
-            "lowest_after_ath": 104.92,
-            "price": 121.26,
-            "correction_ratio": 0.424,
-            "price_to_ath": 0.666,
-            "days_since_ath": 184,
-            "ma_20_spread": -0.0101,
-            "ma_50_spread": -0.011,
-            "ma_20_50_spread": -0.001,
-            "eps_q0": -42.5,
-            "eps_q1": -38.25,
-            "eps_q2": -34.0,
-            "eps_q3": -29.75,
-            "per": 129.0,
-            "roe": 9.84
-        },
-        {
-            "ticker": "PLTR",
-            "name": "Palantir Technologies Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 207.52,
-            "lowest_after_ath": 122.68,
-            "price": 137.97,
-            "correction_ratio": 0.409,
-            "price_to_ath": 0.665,
-            "days_since_ath": 177,
-            "ma_20_spread": -0.0294,
-            "ma_50_spread": -0.048,
-            "ma_20_50_spread": -0.0191,
-            "eps_q0": 670.4,
-            "eps_q1": 603.36,
-            "eps_q2": 536.32,
-            "eps_q3": 469.28,
-            "per": 215.58,
-            "roe": 25.98
-        },
-        {
-            "ticker": "DDOG",
-            "name": "Datadog Inc (Pre-Reincorporation)",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 201.69,
-            "lowest_after_ath": 98.01,
-            "price": 133.98,
-            "correction_ratio": 0.514,
-            "price_to_ath": 0.664,
-            "days_since_ath": 170,
-            "ma_20_spread": 0.0976,
-            "ma_50_spread": 0.1064,
-            "ma_20_50_spread": 0.008,
-            "eps_q0": 2.1,
-            "eps_q1": 1.89,
-            "eps_q2": 1.68,
-            "eps_q3": 1.47,
-            "per": 418.69,
-            "roe": 3.34
-        },
-        {
-            "ticker": "FTAI",
-            "name": "FTAI Aviation Ltd",
-            "industry": "\ud56d\uacf5\uc6b0\uc8fc \ubc0f \ubc29\uc704",
-            "ath": 323.51,
-            "lowest_after_ath": 202.84,
-            "price": 213.11,
-            "correction_ratio": 0.373,
-            "price_to_ath": 0.659,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.1319,
-            "ma_50_spread": -0.1687,
-            "ma_20_50_spread": -0.0423,
-            "eps_q0": 12.8,
-            "eps_q1": 11.52,
-            "eps_q2": 10.24,
-            "eps_q3": 8.96,
-            "per": 46.33,
-            "roe": 241.16
-        },
-        {
-            "ticker": "MEDP",
-            "name": "Medpace Holdings Inc",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 628.92,
-            "lowest_after_ath": 373.0,
-            "price": 413.59,
-            "correction_ratio": 0.407,
-            "price_to_ath": 0.658,
-            "days_since_ath": 107,
-            "ma_20_spread": -0.1459,
-            "ma_50_spread": -0.117,
-            "ma_20_50_spread": 0.0337,
-            "eps_q0": 8.1,
-            "eps_q1": 7.29,
-            "eps_q2": 6.48,
-            "eps_q3": 5.67,
-            "per": 26.03,
-            "roe": 77.25
-        },
-        {
-            "ticker": "BRKRP",
-            "name": "Bruker 6 375 Mandatory Convertible Preference Shares Ser A",
-            "industry": "\ucca8\ub2e8 \uc758\ub8cc \uc7a5\ube44 \ubc0f \uae30\uc220",
-            "ath": 419.83,
-            "lowest_after_ath": 264.3,
-            "price": 275.16,
-            "correction_ratio": 0.37,
-            "price_to_ath": 0.655,
-            "days_since_ath": 107,
-            "ma_20_spread": -0.0807,
-            "ma_50_spread": -0.0664,
-            "ma_20_50_spread": 0.0155,
-            "eps_q0": 89.8,
-            "eps_q1": 80.82,
-            "eps_q2": 71.84,
-            "eps_q3": 62.86,
-            "per": 0,
-            "roe": -0.38
-        },
-        {
-            "ticker": "SYM",
-            "name": "Symbotic Inc",
-            "industry": "\uc0b0\uc5c5\uc6a9 \uae30\uacc4 \ubc0f \uc7a5\ube44",
-            "ath": 87.88,
-            "lowest_after_ath": 45.75,
-            "price": 57.35,
-            "correction_ratio": 0.479,
-            "price_to_ath": 0.653,
-            "days_since_ath": 156,
-            "ma_20_spread": -0.0076,
-            "ma_50_spread": 0.0514,
-            "ma_20_50_spread": 0.0595,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 76.42,
-            "roe": -8.98
-        },
-        {
-            "ticker": "HBAN",
-            "name": "Huntington Bancshares Inc",
-            "industry": "\uc740\ud589",
-            "ath": 24.97,
-            "lowest_after_ath": 1.0,
-            "price": 16.31,
-            "correction_ratio": 0.96,
-            "price_to_ath": 0.653,
-            "days_since_ath": 7079,
-            "ma_20_spread": -0.0103,
-            "ma_50_spread": 0.0012,
-            "ma_20_50_spread": 0.0115,
-            "eps_q0": -0.8,
-            "eps_q1": -0.72,
-            "eps_q2": -0.64,
-            "eps_q3": -0.56,
-            "per": 12.55,
-            "roe": 8.39
-        },
-        {
-            "ticker": "ADP",
-            "name": "Automatic Data Processing Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 329.93,
-            "lowest_after_ath": 188.16,
-            "price": 215.06,
-            "correction_ratio": 0.43,
-            "price_to_ath": 0.652,
-            "days_since_ath": 331,
-            "ma_20_spread": 0.0752,
-            "ma_50_spread": 0.0388,
-            "ma_20_50_spread": -0.0338,
-            "eps_q0": 10.3,
-            "eps_q1": 9.27,
-            "eps_q2": 8.24,
-            "eps_q3": 7.21,
-            "per": 20.64,
-            "roe": 73.84
-        },
-        {
-            "ticker": "INCY",
-            "name": "Incyte Corp",
-            "industry": "\uc81c\uc57d",
-            "ath": 153.15,
-            "lowest_after_ath": 50.27,
-            "price": 99.1,
-            "correction_ratio": 0.672,
-            "price_to_ath": 0.647,
-            "days_since_ath": 3334,
-            "ma_20_spread": 0.0303,
-            "ma_50_spread": 0.0325,
-            "ma_20_50_spread": 0.0021,
-            "eps_q0": 91.7,
-            "eps_q1": 82.53,
-            "eps_q2": 73.36,
-            "eps_q3": 64.19,
-            "per": 15.46,
-            "roe": 30.82
-        },
-        {
-            "ticker": "ABNB",
-            "name": "Airbnb Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 219.94,
-            "lowest_after_ath": 81.91,
-            "price": 140.28,
-            "correction_ratio": 0.628,
-            "price_to_ath": 0.638,
-            "days_since_ath": 1906,
-            "ma_20_spread": 0.0361,
-            "ma_50_spread": 0.0608,
-            "ma_20_50_spread": 0.0239,
-            "eps_q0": -26.0,
-            "eps_q1": -23.4,
-            "eps_q2": -20.8,
-            "eps_q3": -18.2,
-            "per": 34.81,
-            "roe": 30.23
-        },
-        {
-            "ticker": "BPYPM",
-            "name": "Brookfield Property Preferred Pref Shs Class A",
-            "industry": "\uae30\uc5c5 \uae08\uc735 \uc11c\ube44\uc2a4",
-            "ath": 26.12,
-            "lowest_after_ath": 11.38,
-            "price": 16.62,
-            "correction_ratio": 0.564,
-            "price_to_ath": 0.636,
-            "days_since_ath": 1584,
-            "ma_20_spread": -0.0002,
-            "ma_50_spread": 0.0236,
-            "ma_20_50_spread": 0.0239,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 0
-        },
-        {
-            "ticker": "HBANP",
-            "name": "Huntington Bancshares 4.500 Depositary Shares Rep Perp Prf Shs Series H",
-            "industry": "\uc740\ud589",
-            "ath": 26.56,
-            "lowest_after_ath": 13.16,
-            "price": 16.86,
-            "correction_ratio": 0.505,
-            "price_to_ath": 0.635,
-            "days_since_ath": 1773,
-            "ma_20_spread": -0.0101,
-            "ma_50_spread": -0.0276,
-            "ma_20_50_spread": -0.0177,
-            "eps_q0": -0.8,
-            "eps_q1": -0.72,
-            "eps_q2": -0.64,
-            "eps_q3": -0.56,
-            "per": 21.67,
-            "roe": 8.39
-        },
-        {
-            "ticker": "INSM",
-            "name": "Insmed Inc",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 212.75,
-            "lowest_after_ath": 132.57,
-            "price": 135.03,
-            "correction_ratio": 0.377,
-            "price_to_ath": 0.635,
-            "days_since_ath": 149,
-            "ma_20_spread": -0.0939,
-            "ma_50_spread": -0.0886,
-            "ma_20_50_spread": 0.0059,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 180.25,
-            "roe": -249.28
-        },
-        {
-            "ticker": "GEHC",
-            "name": "GE Healthcare Technologies Inc",
-            "industry": "\ucca8\ub2e8 \uc758\ub8cc \uc7a5\ube44 \ubc0f \uae30\uc220",
-            "ath": 94.8,
-            "lowest_after_ath": 57.65,
-            "price": 59.49,
-            "correction_ratio": 0.392,
-            "price_to_ath": 0.627,
-            "days_since_ath": 443,
-            "ma_20_spread": -0.1664,
-            "ma_50_spread": -0.1958,
-            "ma_20_50_spread": -0.0353,
-            "eps_q0": -18.3,
-            "eps_q1": -16.47,
-            "eps_q2": -14.64,
-            "eps_q3": -12.81,
-            "per": 13.07,
-            "roe": 22.38
-        },
-        {
-            "ticker": "PTC",
-            "name": "PTC Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 219.69,
-            "lowest_after_ath": 130.89,
-            "price": 137.5,
-            "correction_ratio": 0.404,
-            "price_to_ath": 0.626,
-            "days_since_ath": 275,
-            "ma_20_spread": -0.0105,
-            "ma_50_spread": -0.0688,
-            "ma_20_50_spread": -0.059,
-            "eps_q0": 102.5,
-            "eps_q1": 92.25,
-            "eps_q2": 82.0,
-            "eps_q3": 71.75,
-            "per": 20.25,
-            "roe": 23.14
-        },
-        {
-            "ticker": "CRWV",
-            "name": "CoreWeave Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 187.0,
-            "lowest_after_ath": 63.8,
-            "price": 114.19,
-            "correction_ratio": 0.659,
-            "price_to_ath": 0.611,
-            "days_since_ath": 317,
-            "ma_20_spread": 0.084,
-            "ma_50_spread": 0.2432,
-            "ma_20_50_spread": 0.1468,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -209.12,
-            "roe": -50.27
-        },
-        {
-            "ticker": "ALNY",
-            "name": "Alnylam Pharmaceuticals Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 495.55,
-            "lowest_after_ath": 294.06,
-            "price": 301.19,
-            "correction_ratio": 0.407,
-            "price_to_ath": 0.608,
-            "days_since_ath": 191,
-            "ma_20_spread": -0.0536,
-            "ma_50_spread": -0.0617,
-            "ma_20_50_spread": -0.0086,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 129.27,
-            "roe": 73.28
-        },
-        {
-            "ticker": "FSLR",
-            "name": "First Solar Inc",
-            "industry": "\uc7ac\uc0dd \uac00\ub2a5 \uc5d0\ub108\uc9c0 \uc7a5\ube44 \ubc0f \uc11c\ube44\uc2a4",
-            "ath": 317.0,
-            "lowest_after_ath": 11.43,
-            "price": 190.61,
-            "correction_ratio": 0.964,
-            "price_to_ath": 0.601,
-            "days_since_ath": 6561,
-            "ma_20_spread": -0.0235,
-            "ma_50_spread": -0.0467,
-            "ma_20_50_spread": -0.0238,
-            "eps_q0": 32.5,
-            "eps_q1": 29.25,
-            "eps_q2": 26.0,
-            "eps_q3": 22.75,
-            "per": 13.4,
-            "roe": 17.45
-        },
-        {
-            "ticker": "KMB",
-            "name": "Kimberly-Clark Corp",
-            "industry": "\uac1c\uc778 \uc0dd\ud65c \ud544\uc218 \uc6a9\ud488",
-            "ath": 160.16,
-            "lowest_after_ath": 92.42,
-            "price": 96.1,
-            "correction_ratio": 0.423,
-            "price_to_ath": 0.6,
-            "days_since_ath": 2088,
-            "ma_20_spread": -0.0112,
-            "ma_50_spread": -0.0463,
-            "ma_20_50_spread": -0.0355,
-            "eps_q0": 17.3,
-            "eps_q1": 15.57,
-            "eps_q2": 13.84,
-            "eps_q3": 12.11,
-            "per": 18.59,
-            "roe": 111.73
-        },
-        {
-            "ticker": "ROP",
-            "name": "Roper Technologies Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 595.17,
-            "lowest_after_ath": 313.07,
-            "price": 355.97,
-            "correction_ratio": 0.474,
-            "price_to_ath": 0.598,
-            "days_since_ath": 422,
-            "ma_20_spread": -0.0031,
-            "ma_50_spread": 0.0091,
-            "ma_20_50_spread": 0.0122,
-            "eps_q0": 53.7,
-            "eps_q1": 48.33,
-            "eps_q2": 42.96,
-            "eps_q3": 37.59,
-            "per": 22.23,
-            "roe": 9.01
-        },
-        {
-            "ticker": "KSPI",
-            "name": "Kaspi.kz AO ADR",
-            "industry": "\ud540\ud14c\ud06c",
-            "ath": 143.72,
-            "lowest_after_ath": 68.59,
-            "price": 85.9,
-            "correction_ratio": 0.523,
-            "price_to_ath": 0.598,
-            "days_since_ath": 653,
-            "ma_20_spread": 0.0513,
-            "ma_50_spread": 0.1229,
-            "ma_20_50_spread": 0.0681,
-            "eps_q0": -8.8,
-            "eps_q1": -7.92,
-            "eps_q2": -7.04,
-            "eps_q3": -6.16,
-            "per": 7.16,
-            "roe": 51.15
-        },
-        {
-            "ticker": "CHKP",
-            "name": "Check Point Software Technologies Ltd",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 234.36,
-            "lowest_after_ath": 130.93,
-            "price": 139.96,
-            "correction_ratio": 0.441,
-            "price_to_ath": 0.597,
-            "days_since_ath": 401,
-            "ma_20_spread": -0.002,
-            "ma_50_spread": -0.0555,
-            "ma_20_50_spread": -0.0536,
-            "eps_q0": 18.3,
-            "eps_q1": 16.47,
-            "eps_q2": 14.64,
-            "eps_q3": 12.81,
-            "per": 14.55,
-            "roe": 37.27
-        },
-        {
-            "ticker": "APP",
-            "name": "Applovin Corp",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 745.61,
-            "lowest_after_ath": 359.0,
-            "price": 443.43,
-            "correction_ratio": 0.519,
-            "price_to_ath": 0.595,
-            "days_since_ath": 212,
-            "ma_20_spread": 0.0169,
-            "ma_50_spread": 0.0137,
-            "ma_20_50_spread": -0.0032,
-            "eps_q0": 84.0,
-            "eps_q1": 75.6,
-            "eps_q2": 67.2,
-            "eps_q3": 58.8,
-            "per": 44.08,
-            "roe": 212.94
-        },
-        {
-            "ticker": "DASH",
-            "name": "DoorDash Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 285.5,
-            "lowest_after_ath": 143.3,
-            "price": 169.33,
-            "correction_ratio": 0.498,
-            "price_to_ath": 0.593,
-            "days_since_ath": 198,
-            "ma_20_spread": 0.0032,
-            "ma_50_spread": 0.011,
-            "ma_20_50_spread": 0.0077,
-            "eps_q0": 51.1,
-            "eps_q1": 45.99,
-            "eps_q2": 40.88,
-            "eps_q3": 35.77,
-            "per": 79.5,
-            "roe": 10.44
-        },
-        {
-            "ticker": "STRK",
-            "name": "Strategy 8 00 Perpetual Strike Prf Shs Series A",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 129.48,
-            "lowest_after_ath": 65.12,
-            "price": 76.69,
-            "correction_ratio": 0.497,
-            "price_to_ath": 0.592,
-            "days_since_ath": 296,
-            "ma_20_spread": 0.0252,
-            "ma_50_spread": 0.0038,
-            "ma_20_50_spread": -0.0209,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": -11.11
-        },
-        {
-            "ticker": "BPYPP",
-            "name": "Brookfield Property Partners 6 50 Cumulative Redeemable Perpetual Preferred",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 27.22,
-            "lowest_after_ath": 11.0,
-            "price": 16.0,
-            "correction_ratio": 0.596,
-            "price_to_ath": 0.588,
-            "days_since_ath": 2375,
-            "ma_20_spread": -0.0098,
-            "ma_50_spread": 0.0092,
-            "ma_20_50_spread": 0.0191,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 7.29,
-            "roe": -0.75
-        },
-        {
-            "ticker": "CTSH",
-            "name": "Cognizant Technology Solutions Corp",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 93.47,
-            "lowest_after_ath": 51.33,
-            "price": 54.7,
-            "correction_ratio": 0.451,
-            "price_to_ath": 0.585,
-            "days_since_ath": 1500,
-            "ma_20_spread": -0.075,
-            "ma_50_spread": -0.1063,
-            "ma_20_50_spread": -0.0338,
-            "eps_q0": 18.7,
-            "eps_q1": 16.83,
-            "eps_q2": 14.96,
-            "eps_q3": 13.09,
-            "per": 12.0,
-            "roe": 15.16
-        },
-        {
-            "ticker": "PAYX",
-            "name": "Paychex Inc",
-            "industry": "\uace0\uc6a9 \uc11c\ube44\uc2a4",
-            "ath": 161.24,
-            "lowest_after_ath": 85.45,
-            "price": 94.05,
-            "correction_ratio": 0.47,
-            "price_to_ath": 0.583,
-            "days_since_ath": 331,
-            "ma_20_spread": 0.0347,
-            "ma_50_spread": 0.0188,
-            "ma_20_50_spread": -0.0154,
-            "eps_q0": 7.9,
-            "eps_q1": 7.11,
-            "eps_q2": 6.32,
-            "eps_q3": 5.53,
-            "per": 20.76,
-            "roe": 0
-        },
-        {
-            "ticker": "VRSK",
-            "name": "Verisk Analytics Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 322.92,
-            "lowest_after_ath": 161.7,
-            "price": 188.19,
-            "correction_ratio": 0.499,
-            "price_to_ath": 0.583,
-            "days_since_ath": 331,
-            "ma_20_spread": 0.0601,
-            "ma_50_spread": -0.0103,
-            "ma_20_50_spread": -0.0665,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 29.04,
-            "roe": 437.95
-        },
-        {
-            "ticker": "TPG",
-            "name": "TPG Inc",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 72.98,
-            "lowest_after_ath": 36.95,
-            "price": 42.08,
-            "correction_ratio": 0.494,
-            "price_to_ath": 0.577,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0106,
-            "ma_50_spread": 0.0026,
-            "ma_20_50_spread": -0.0079,
-            "eps_q0": 494.1,
-            "eps_q1": 444.69,
-            "eps_q2": 395.28,
-            "eps_q3": 345.87,
-            "per": 93.51,
-            "roe": 15.52
-        },
-        {
-            "ticker": "REGN",
-            "name": "Regeneron Pharmaceuticals Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 1211.2,
-            "lowest_after_ath": 476.49,
-            "price": 686.36,
-            "correction_ratio": 0.607,
-            "price_to_ath": 0.567,
-            "days_since_ath": 611,
-            "ma_20_spread": -0.0867,
-            "ma_50_spread": -0.0956,
-            "ma_20_50_spread": -0.0097,
-            "eps_q0": -8.0,
-            "eps_q1": -7.2,
-            "eps_q2": -6.4,
-            "eps_q3": -5.6,
-            "per": 16.54,
-            "roe": 14.86
-        },
-        {
-            "ticker": "SMMT",
-            "name": "Summit Therapeutics Inc",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 36.91,
-            "lowest_after_ath": 13.83,
-            "price": 20.83,
-            "correction_ratio": 0.625,
-            "price_to_ath": 0.564,
-            "days_since_ath": 373,
-            "ma_20_spread": -0.0316,
-            "ma_50_spread": 0.1416,
-            "ma_20_50_spread": 0.1789,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -17.65,
-            "roe": -206.1
-        },
-        {
-            "ticker": "GEN",
-            "name": "Gen Digital Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 34.2,
-            "lowest_after_ath": 15.12,
-            "price": 19.14,
-            "correction_ratio": 0.558,
-            "price_to_ath": 0.56,
-            "days_since_ath": 3145,
-            "ma_20_spread": -0.0038,
-            "ma_50_spread": -0.063,
-            "ma_20_50_spread": -0.0594,
-            "eps_q0": 20.8,
-            "eps_q1": 18.72,
-            "eps_q2": 16.64,
-            "eps_q3": 14.56,
-            "per": 19.73,
-            "roe": 26.9
-        },
-        {
-            "ticker": "IREN",
-            "name": "IREN Ltd",
-            "industry": "\ube14\ub85d \uccb4\uc778 \ubc0f \uc554\ud638\ud654\ud3d0",
-            "ath": 76.87,
-            "lowest_after_ath": 30.76,
-            "price": 42.86,
-            "correction_ratio": 0.6,
-            "price_to_ath": 0.558,
-            "days_since_ath": 177,
-            "ma_20_spread": -0.0131,
-            "ma_50_spread": 0.0254,
-            "ma_20_50_spread": 0.039,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 29.76,
-            "roe": 20.53
-        },
-        {
-            "ticker": "BPYPO",
-            "name": "Brookfield Ppty Partners 6 375 Cum Red Perp Pfd Unit Class A",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 27.52,
-            "lowest_after_ath": 8.13,
-            "price": 15.33,
-            "correction_ratio": 0.705,
-            "price_to_ath": 0.557,
-            "days_since_ath": 2375,
-            "ma_20_spread": 0.0053,
-            "ma_50_spread": 0.0167,
-            "ma_20_50_spread": 0.0114,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 6.98,
-            "roe": -0.75
-        },
-        {
-            "ticker": "WMG",
-            "name": "Warner Music Group Corp",
-            "industry": "\uc5d4\ud130\ud14c\uc778\uba3c\ud2b8 \uc81c\uc791",
-            "ath": 50.23,
-            "lowest_after_ath": 21.57,
-            "price": 27.92,
-            "correction_ratio": 0.571,
-            "price_to_ath": 0.556,
-            "days_since_ath": 1647,
-            "ma_20_spread": -0.0171,
-            "ma_50_spread": 0.0197,
-            "ma_20_50_spread": 0.0373,
-            "eps_q0": -25.4,
-            "eps_q1": -22.86,
-            "eps_q2": -20.32,
-            "eps_q3": -17.78,
-            "per": 48.98,
-            "roe": 39.84
-        },
-        {
-            "ticker": "SBAC",
-            "name": "SBA Communications Corp",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 391.15,
-            "lowest_after_ath": 162.41,
-            "price": 215.97,
-            "correction_ratio": 0.585,
-            "price_to_ath": 0.552,
-            "days_since_ath": 1584,
-            "ma_20_spread": 0.008,
-            "ma_50_spread": 0.0906,
-            "ma_20_50_spread": 0.082,
-            "eps_q0": 113.3,
-            "eps_q1": 101.97,
-            "eps_q2": 90.64,
-            "eps_q3": 79.31,
-            "per": 22.06,
-            "roe": 0
-        },
-        {
-            "ticker": "TSCO",
-            "name": "Tractor Supply Co",
-            "industry": "\uae30\ud0c0 \uc804\ubb38 \uc18c\ub9e4",
-            "ath": 63.99,
-            "lowest_after_ath": 34.37,
-            "price": 34.77,
-            "correction_ratio": 0.463,
-            "price_to_ath": 0.543,
-            "days_since_ath": 282,
-            "ma_20_spread": -0.1746,
-            "ma_50_spread": -0.2492,
-            "ma_20_50_spread": -0.0905,
-            "eps_q0": -8.3,
-            "eps_q1": -7.47,
-            "eps_q2": -6.64,
-            "eps_q3": -5.81,
-            "per": 17.13,
-            "roe": 45.5
-        },
-        {
-            "ticker": "BPYPN",
-            "name": "Brookfield Ppty Partners 5 750 Cum Red Perp Series 3 Class A",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 25.59,
-            "lowest_after_ath": 8.0,
-            "price": 13.9,
-            "correction_ratio": 0.687,
-            "price_to_ath": 0.543,
-            "days_since_ath": 2263,
-            "ma_20_spread": 0.0057,
-            "ma_50_spread": 0.0131,
-            "ma_20_50_spread": 0.0073,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 6.33,
-            "roe": -0.75
-        },
-        {
-            "ticker": "DLTR",
-            "name": "Dollar Tree Inc",
-            "industry": "\ud560\uc778\uc810",
-            "ath": 177.19,
-            "lowest_after_ath": 60.49,
-            "price": 95.7,
-            "correction_ratio": 0.659,
-            "price_to_ath": 0.54,
-            "days_since_ath": 1472,
-            "ma_20_spread": -0.0724,
-            "ma_50_spread": -0.1386,
-            "ma_20_50_spread": -0.0714,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 16.11,
-            "roe": 31.69
-        },
-        {
-            "ticker": "ASTS",
-            "name": "AST SpaceMobile Inc",
-            "industry": "\ubb34\uc120 \ud1b5\uc2e0 \uc11c\ube44\uc2a4",
-            "ath": 129.89,
-            "lowest_after_ath": 67.49,
-            "price": 69.85,
-            "correction_ratio": 0.48,
-            "price_to_ath": 0.538,
-            "days_since_ath": 93,
-            "ma_20_spread": -0.1867,
-            "ma_50_spread": -0.1965,
-            "ma_20_50_spread": -0.0121,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -462.34,
-            "roe": -30.12
-        },
-        {
-            "ticker": "COO",
-            "name": "Cooper Companies Inc",
-            "industry": "\uc758\ub8cc \uc7a5\ube44, \ubb3c\ud488 \ubc0f \uc720\ud1b5",
-            "ath": 115.9,
-            "lowest_after_ath": 60.64,
-            "price": 61.34,
-            "correction_ratio": 0.477,
-            "price_to_ath": 0.529,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.1051,
-            "ma_50_spread": -0.1621,
-            "ma_20_50_spread": -0.0637,
-            "eps_q0": 25.4,
-            "eps_q1": 22.86,
-            "eps_q2": 20.32,
-            "eps_q3": 17.78,
-            "per": 30.52,
-            "roe": 4.87
-        },
-        {
-            "ticker": "ERIC",
-            "name": "Telefonaktiebolaget LM Ericsson ADR",
-            "industry": "\ud1b5\uc2e0 \ubc0f \ub124\ud2b8\uc6cc\ud0b9",
-            "ath": 21.7,
-            "lowest_after_ath": 4.33,
-            "price": 11.44,
-            "correction_ratio": 0.801,
-            "price_to_ath": 0.527,
-            "days_since_ath": 6869,
-            "ma_20_spread": -0.0158,
-            "ma_50_spread": -0.0026,
-            "ma_20_50_spread": 0.0135,
-            "eps_q0": -78.6,
-            "eps_q1": -70.74,
-            "eps_q2": -62.88,
-            "eps_q3": -55.02,
-            "per": 14.12,
-            "roe": 27.01
-        },
-        {
-            "ticker": "CPRT",
-            "name": "Copart Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 64.38,
-            "lowest_after_ath": 32.2,
-            "price": 33.33,
-            "correction_ratio": 0.5,
-            "price_to_ath": 0.518,
-            "days_since_ath": 520,
-            "ma_20_spread": 0.0011,
-            "ma_50_spread": -0.0336,
-            "ma_20_50_spread": -0.0346,
-            "eps_q0": -9.5,
-            "eps_q1": -8.55,
-            "eps_q2": -7.6,
-            "eps_q3": -6.65,
-            "per": 20.96,
-            "roe": 17.13
-        },
-        {
-            "ticker": "CDW",
-            "name": "CDW Corp",
-            "industry": "\ud1b5\ud569 \ud558\ub4dc\uc6e8\uc5b4 \ubc0f \uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 263.37,
-            "lowest_after_ath": 112.98,
-            "price": 135.56,
-            "correction_ratio": 0.571,
-            "price_to_ath": 0.515,
-            "days_since_ath": 758,
-            "ma_20_spread": 0.0339,
-            "ma_50_spread": 0.0831,
-            "ma_20_50_spread": 0.0477,
-            "eps_q0": 5.8,
-            "eps_q1": 5.22,
-            "eps_q2": 4.64,
-            "eps_q3": 4.06,
-            "per": 16.78,
-            "roe": 43.02
-        },
-        {
-            "ticker": "NTNX",
-            "name": "Nutanix Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 83.36,
-            "lowest_after_ath": 34.01,
-            "price": 42.0,
-            "correction_ratio": 0.592,
-            "price_to_ath": 0.504,
-            "days_since_ath": 345,
-            "ma_20_spread": 0.0663,
-            "ma_50_spread": 0.0635,
-            "ma_20_50_spread": -0.0026,
-            "eps_q0": 82.6,
-            "eps_q1": 74.34,
-            "eps_q2": 66.08,
-            "eps_q3": 57.82,
-            "per": 45.65,
-            "roe": 0
-        },
-        {
-            "ticker": "INTU",
-            "name": "Intuit Inc",
-            "industry": "\ud540\ud14c\ud06c",
-            "ath": 813.7,
-            "lowest_after_ath": 342.11,
-            "price": 395.08,
-            "correction_ratio": 0.58,
-            "price_to_ath": 0.486,
-            "days_since_ath": 275,
-            "ma_20_spread": 0.0043,
-            "ma_50_spread": -0.0458,
-            "ma_20_50_spread": -0.0499,
-            "eps_q0": 47.1,
-            "eps_q1": 42.39,
-            "eps_q2": 37.68,
-            "eps_q3": 32.97,
-            "per": 25.7,
-            "roe": 23.46
-        },
-        {
-            "ticker": "SOFI",
-            "name": "SoFi Technologies Inc",
-            "industry": "\uc18c\ube44\uc790 \ub300\ucd9c",
-            "ath": 32.73,
-            "lowest_after_ath": 14.93,
-            "price": 15.52,
-            "correction_ratio": 0.544,
-            "price_to_ath": 0.474,
-            "days_since_ath": 170,
-            "ma_20_spread": -0.1175,
-            "ma_50_spread": -0.1242,
-            "ma_20_50_spread": -0.0076,
-            "eps_q0": -47.8,
-            "eps_q1": -43.02,
-            "eps_q2": -38.24,
-            "eps_q3": -33.46,
-            "per": 39.81,
-            "roe": 5.66
-        },
-        {
-            "ticker": "HOOD",
-            "name": "Robinhood Markets Inc",
-            "industry": "\ud540\ud14c\ud06c",
-            "ath": 153.86,
-            "lowest_after_ath": 63.51,
-            "price": 71.2,
-            "correction_ratio": 0.587,
-            "price_to_ath": 0.463,
-            "days_since_ath": 205,
-            "ma_20_spread": -0.0969,
-            "ma_50_spread": -0.0681,
-            "ma_20_50_spread": 0.0319,
-            "eps_q0": -34.0,
-            "eps_q1": -30.6,
-            "eps_q2": -27.2,
-            "eps_q3": -23.8,
-            "per": 34.56,
-            "roe": 21.99
-        },
-        {
-            "ticker": "CMCSA",
-            "name": "Comcast Corp",
-            "industry": "\ubb34\uc120 \ud1b5\uc2e0 \uc11c\ube44\uc2a4",
-            "ath": 57.92,
-            "lowest_after_ath": 24.13,
-            "price": 26.76,
-            "correction_ratio": 0.583,
-            "price_to_ath": 0.462,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.0583,
-            "ma_50_spread": -0.0945,
-            "ma_20_50_spread": -0.0383,
-            "eps_q0": -35.6,
-            "eps_q1": -32.04,
-            "eps_q2": -28.48,
-            "eps_q3": -24.92,
-            "per": 5.25,
-            "roe": 20.92
-        },
-        {
-            "ticker": "PDD",
-            "name": "PDD Holdings Inc ADR",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 212.6,
-            "lowest_after_ath": 23.21,
-            "price": 97.67,
-            "correction_ratio": 0.891,
-            "price_to_ath": 0.459,
-            "days_since_ath": 1899,
-            "ma_20_spread": -0.0298,
-            "ma_50_spread": -0.0377,
-            "ma_20_50_spread": -0.0081,
-            "eps_q0": -10.6,
-            "eps_q1": -9.54,
-            "eps_q2": -8.48,
-            "eps_q3": -7.42,
-            "per": 9.96,
-            "roe": 27.29
-        },
-        {
-            "ticker": "AXON",
-            "name": "Axon Enterprise Inc",
-            "industry": "\ud56d\uacf5\uc6b0\uc8fc \ubc0f \ubc29\uc704",
-            "ath": 885.92,
-            "lowest_after_ath": 339.01,
-            "price": 400.54,
-            "correction_ratio": 0.617,
-            "price_to_ath": 0.452,
-            "days_since_ath": 268,
-            "ma_20_spread": 0.0191,
-            "ma_50_spread": -0.1201,
-            "ma_20_50_spread": -0.1365,
-            "eps_q0": -98.0,
-            "eps_q1": -88.2,
-            "eps_q2": -78.4,
-            "eps_q3": -68.6,
-            "per": 267.03,
-            "roe": 4.48
-        },
-        {
-            "ticker": "PODD",
-            "name": "Insulet Corp",
-            "industry": "\uc758\ub8cc \uc7a5\ube44, \ubb3c\ud488 \ubc0f \uc720\ud1b5",
-            "ath": 354.88,
-            "lowest_after_ath": 158.35,
-            "price": 160.02,
-            "correction_ratio": 0.554,
-            "price_to_ath": 0.451,
-            "days_since_ath": 163,
-            "ma_20_spread": -0.1844,
-            "ma_50_spread": -0.2693,
-            "ma_20_50_spread": -0.1041,
-            "eps_q0": 0.9,
-            "eps_q1": 0.81,
-            "eps_q2": 0.72,
-            "eps_q3": 0.63,
-            "per": 46.12,
-            "roe": 18.12
-        },
-        {
-            "ticker": "TROW",
-            "name": "T Rowe Price Group Inc",
-            "industry": "\ud22c\uc790 \uad00\ub9ac \ubc0f \ud380\ub4dc \uc6b4\uc601",
-            "ath": 224.56,
-            "lowest_after_ath": 77.85,
-            "price": 100.47,
-            "correction_ratio": 0.653,
-            "price_to_ath": 0.447,
-            "days_since_ath": 1703,
-            "ma_20_spread": 0.0511,
-            "ma_50_spread": 0.0827,
-            "ma_20_50_spread": 0.0301,
-            "eps_q0": 1.2,
-            "eps_q1": 1.08,
-            "eps_q2": 0.96,
-            "eps_q3": 0.84,
-            "per": 10.87,
-            "roe": 18.79
-        },
-        {
-            "ticker": "KTOS",
-            "name": "Kratos Defense and Security Solutions Inc",
-            "industry": "\ud56d\uacf5\uc6b0\uc8fc \ubc0f \ubc29\uc704",
-            "ath": 134.0,
-            "lowest_after_ath": 59.06,
-            "price": 59.56,
-            "correction_ratio": 0.559,
-            "price_to_ath": 0.444,
-            "days_since_ath": 100,
-            "ma_20_spread": -0.1366,
-            "ma_50_spread": -0.2553,
-            "ma_20_50_spread": -0.1375,
-            "eps_q0": 51.3,
-            "eps_q1": 46.17,
-            "eps_q2": 41.04,
-            "eps_q3": 35.91,
-            "per": 458.15,
-            "roe": 1.31
-        },
-        {
-            "ticker": "MDB",
-            "name": "MongoDB Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 590.0,
-            "lowest_after_ath": 135.15,
-            "price": 258.29,
-            "correction_ratio": 0.771,
-            "price_to_ath": 0.438,
-            "days_since_ath": 1626,
-            "ma_20_spread": 0.0263,
-            "ma_50_spread": -0.0404,
-            "ma_20_50_spread": -0.065,
-            "eps_q0": -1.9,
-            "eps_q1": -1.71,
-            "eps_q2": -1.52,
-            "eps_q3": -1.33,
-            "per": 36.65,
-            "roe": -2.48
-        },
-        {
-            "ticker": "TRI",
-            "name": "Thomson Reuters Corp",
-            "industry": "\uc804\ubb38 \uc815\ubcf4 \uc11c\ube44\uc2a4",
-            "ath": 218.42,
-            "lowest_after_ath": 79.71,
-            "price": 93.29,
-            "correction_ratio": 0.635,
-            "price_to_ath": 0.427,
-            "days_since_ath": 289,
-            "ma_20_spread": 0.0353,
-            "ma_50_spread": -0.0004,
-            "ma_20_50_spread": -0.0345,
-            "eps_q0": -43.4,
-            "eps_q1": -39.06,
-            "eps_q2": -34.72,
-            "eps_q3": -30.38,
-            "per": 28.36,
-            "roe": 12.4
-        },
-        {
-            "ticker": "COIN",
-            "name": "Coinbase Global Inc",
-            "industry": "\ube14\ub85d \uccb4\uc778 \ubc0f \uc554\ud638\ud654\ud3d0",
-            "ath": 444.65,
-            "lowest_after_ath": 139.36,
-            "price": 181.73,
-            "correction_ratio": 0.687,
-            "price_to_ath": 0.409,
-            "days_since_ath": 289,
-            "ma_20_spread": -0.0311,
-            "ma_50_spread": -0.0259,
-            "ma_20_50_spread": 0.0054,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 40.93,
-            "roe": 10.05
-        },
-        {
-            "ticker": "BIIB",
-            "name": "Biogen Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 480.18,
-            "lowest_after_ath": 110.04,
-            "price": 194.38,
-            "correction_ratio": 0.771,
-            "price_to_ath": 0.405,
-            "days_since_ath": 4062,
-            "ma_20_spread": 0.0744,
-            "ma_50_spread": 0.0512,
-            "ma_20_50_spread": -0.0216,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 22.14,
-            "roe": 7.39
-        },
-        {
-            "ticker": "WDAY",
-            "name": "Workday Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 311.28,
-            "lowest_after_ath": 110.36,
-            "price": 122.43,
-            "correction_ratio": 0.645,
-            "price_to_ath": 0.393,
-            "days_since_ath": 793,
-            "ma_20_spread": -0.002,
-            "ma_50_spread": -0.0624,
-            "ma_20_50_spread": -0.0605,
-            "eps_q0": 54.3,
-            "eps_q1": 48.87,
-            "eps_q2": 43.44,
-            "eps_q3": 38.01,
-            "per": 47.27,
-            "roe": 8.23
-        },
-        {
-            "ticker": "LI",
-            "name": "Li Auto Inc ADR",
-            "industry": "\uc790\ub3d9\ucc28 \ubc0f \ud2b8\ub7ed \uc81c\uc870",
-            "ath": 47.7,
-            "lowest_after_ath": 12.52,
-            "price": 17.75,
-            "correction_ratio": 0.738,
-            "price_to_ath": 0.372,
-            "days_since_ath": 1983,
-            "ma_20_spread": -0.0368,
-            "ma_50_spread": -0.0138,
-            "ma_20_50_spread": 0.0239,
-            "eps_q0": -99.8,
-            "eps_q1": -89.82,
-            "eps_q2": -79.84,
-            "eps_q3": -69.86,
-            "per": 110.94,
-            "roe": 1.58
-        },
-        {
-            "ticker": "PAA",
-            "name": "Plains All American Pipeline Units",
-            "industry": "\uc624\uc77c \ubc0f \uac00\uc2a4 \uc218\uc1a1 \uc11c\ube44\uc2a4",
-            "ath": 61.09,
-            "lowest_after_ath": 3.0,
-            "price": 22.64,
-            "correction_ratio": 0.951,
-            "price_to_ath": 0.371,
-            "days_since_ath": 4251,
-            "ma_20_spread": 0.0438,
-            "ma_50_spread": 0.0496,
-            "ma_20_50_spread": 0.0055,
-            "eps_q0": 850.0,
-            "eps_q1": 765.0,
-            "eps_q2": 680.0,
-            "eps_q3": 595.0,
-            "per": 20.21,
-            "roe": 10.59
-        },
-        {
-            "ticker": "VOD",
-            "name": "Vodafone Group PLC ADR",
-            "industry": "\ubb34\uc120 \ud1b5\uc2e0 \uc11c\ube44\uc2a4",
-            "ath": 42.14,
-            "lowest_after_ath": 8.0,
-            "price": 15.34,
-            "correction_ratio": 0.81,
-            "price_to_ath": 0.364,
-            "days_since_ath": 4447,
-            "ma_20_spread": -0.0099,
-            "ma_50_spread": 0.0145,
-            "ma_20_50_spread": 0.0247,
-            "eps_q0": -22.1,
-            "eps_q1": -19.89,
-            "eps_q2": -17.68,
-            "eps_q3": -15.47,
-            "per": 16.97,
-            "roe": -6.62
-        },
-        {
-            "ticker": "AFRM",
-            "name": "Affirm Holdings Inc",
-            "industry": "\ud540\ud14c\ud06c",
-            "ath": 176.65,
-            "lowest_after_ath": 8.62,
-            "price": 63.48,
-            "correction_ratio": 0.951,
-            "price_to_ath": 0.359,
-            "days_since_ath": 1633,
-            "ma_20_spread": 0.1098,
-            "ma_50_spread": 0.234,
-            "ma_20_50_spread": 0.1119,
-            "eps_q0": 61.3,
-            "eps_q1": 55.17,
-            "eps_q2": 49.04,
-            "eps_q3": 42.91,
-            "per": 78.37,
-            "roe": 8.92
-        },
-        {
-            "ticker": "ZS",
-            "name": "Zscaler Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 376.11,
-            "lowest_after_ath": 84.93,
-            "price": 134.73,
-            "correction_ratio": 0.774,
-            "price_to_ath": 0.358,
-            "days_since_ath": 1626,
-            "ma_20_spread": 0.0089,
-            "ma_50_spread": -0.0713,
-            "ma_20_50_spread": -0.0795,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 29.37,
-            "roe": -3.56
-        },
-        {
-            "ticker": "DXCM",
-            "name": "Dexcom Inc",
-            "industry": "\uc758\ub8cc \uc7a5\ube44, \ubb3c\ud488 \ubc0f \uc720\ud1b5",
-            "ath": 164.86,
-            "lowest_after_ath": 54.11,
-            "price": 57.56,
-            "correction_ratio": 0.672,
-            "price_to_ath": 0.349,
-            "days_since_ath": 1626,
-            "ma_20_spread": -0.0808,
-            "ma_50_spread": -0.1323,
-            "ma_20_50_spread": -0.056,
-            "eps_q0": 76.2,
-            "eps_q1": 68.58,
-            "eps_q2": 60.96,
-            "eps_q3": 53.34,
-            "per": 27.54,
-            "roe": 34.5
-        },
-        {
-            "ticker": "ADBE",
-            "name": "Adobe Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 699.54,
-            "lowest_after_ath": 224.13,
-            "price": 243.57,
-            "correction_ratio": 0.68,
-            "price_to_ath": 0.348,
-            "days_since_ath": 1619,
-            "ma_20_spread": 0.0067,
-            "ma_50_spread": -0.0297,
-            "ma_20_50_spread": -0.0362,
-            "eps_q0": 4.3,
-            "eps_q1": 3.87,
-            "eps_q2": 3.44,
-            "eps_q3": 3.01,
-            "per": 14.19,
-            "roe": 58.77
-        },
-        {
-            "ticker": "WBD",
-            "name": "Warner Bros Discovery Inc",
-            "industry": "\ubc29\uc1a1",
-            "ath": 78.14,
-            "lowest_after_ath": 6.64,
-            "price": 27.05,
-            "correction_ratio": 0.915,
-            "price_to_ath": 0.346,
-            "days_since_ath": 1871,
-            "ma_20_spread": -0.0088,
-            "ma_50_spread": -0.0216,
-            "ma_20_50_spread": -0.013,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 93.28,
-            "roe": 2.08
-        },
-        {
-            "ticker": "RGC",
-            "name": "Regencell Bioscience Holdings Ltd",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 83.6,
-            "lowest_after_ath": 9.39,
-            "price": 28.95,
-            "correction_ratio": 0.888,
-            "price_to_ath": 0.346,
-            "days_since_ath": 317,
-            "ma_20_spread": -0.0174,
-            "ma_50_spread": 0.0642,
-            "ma_20_50_spread": 0.0831,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": -54.81
-        },
-        {
-            "ticker": "BIDU",
-            "name": "Baidu Inc ADR",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 354.82,
-            "lowest_after_ath": 73.58,
-            "price": 121.01,
-            "correction_ratio": 0.793,
-            "price_to_ath": 0.341,
-            "days_since_ath": 1892,
-            "ma_20_spread": 0.0183,
-            "ma_50_spread": 0.003,
-            "ma_20_50_spread": -0.015,
-            "eps_q0": -65.7,
-            "eps_q1": -59.13,
-            "eps_q2": -52.56,
-            "eps_q3": -45.99,
-            "per": 70.35,
-            "roe": 1.9
-        },
-        {
-            "ticker": "CSGP",
-            "name": "Costar Group Inc",
-            "industry": "\uc628\ub77c\uc778 \uc11c\ube44\uc2a4",
-            "ath": 101.05,
-            "lowest_after_ath": 33.31,
-            "price": 34.14,
-            "correction_ratio": 0.67,
-            "price_to_ath": 0.338,
-            "days_since_ath": 1647,
-            "ma_20_spread": -0.1069,
-            "ma_50_spread": -0.1919,
-            "ma_20_50_spread": -0.0953,
-            "eps_q0": -22.6,
-            "eps_q1": -20.34,
-            "eps_q2": -18.08,
-            "eps_q3": -15.82,
-            "per": 487.71,
-            "roe": 0.09
-        },
-        {
-            "ticker": "DKNG",
-            "name": "Draftkings Inc",
-            "industry": "\uce74\uc9c0\ub178 \ubc0f \ub3c4\ubc15",
-            "ath": 74.38,
-            "lowest_after_ath": 9.77,
-            "price": 23.14,
-            "correction_ratio": 0.869,
-            "price_to_ath": 0.311,
-            "days_since_ath": 1864,
-            "ma_20_spread": 0.0082,
-            "ma_50_spread": -0.0114,
-            "ma_20_50_spread": -0.0194,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 13.13,
-            "roe": 0.45
-        },
-        {
-            "ticker": "AGNC",
-            "name": "AGNC Investment Corp",
-            "industry": "\ud2b9\uc218 REITs",
-            "ath": 36.77,
-            "lowest_after_ath": 6.25,
-            "price": 10.97,
-            "correction_ratio": 0.83,
-            "price_to_ath": 0.298,
-            "days_since_ath": 4972,
-            "ma_20_spread": 0.0315,
-            "ma_50_spread": 0.0328,
-            "ma_20_50_spread": 0.0013,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 8.57,
-            "roe": 13.25
-        },
-        {
-            "ticker": "MSTR",
-            "name": "Strategy Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 543.0,
-            "lowest_after_ath": 104.17,
-            "price": 158.19,
-            "correction_ratio": 0.808,
-            "price_to_ath": 0.291,
-            "days_since_ath": 527,
-            "ma_20_spread": 0.0691,
-            "ma_50_spread": 0.129,
-            "ma_20_50_spread": 0.056,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 4.35,
-            "roe": -11.11
-        },
-        {
-            "ticker": "JD",
-            "name": "JD.com Inc ADR",
-            "industry": "\ubc31\ud654\uc810",
-            "ath": 108.29,
-            "lowest_after_ath": 20.82,
-            "price": 29.7,
-            "correction_ratio": 0.808,
-            "price_to_ath": 0.274,
-            "days_since_ath": 1899,
-            "ma_20_spread": -0.0053,
-            "ma_50_spread": 0.0413,
-            "ma_20_50_spread": 0.0468,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 15.71,
-            "roe": 7.62
-        },
-        {
-            "ticker": "APA",
-            "name": "APA Corp (US)",
-            "industry": "\uc624\uc77c, \uac00\uc2a4 \ud0d0\uc0ac \ubc0f \uc0dd\uc0b0",
-            "ath": 149.23,
-            "lowest_after_ath": 3.8,
-            "price": 40.32,
-            "correction_ratio": 0.975,
-            "price_to_ath": 0.27,
-            "days_since_ath": 6554,
-            "ma_20_spread": 0.0366,
-            "ma_50_spread": 0.1119,
-            "ma_20_50_spread": 0.0726,
-            "eps_q0": -21.2,
-            "eps_q1": -19.08,
-            "eps_q2": -16.96,
-            "eps_q3": -14.84,
-            "per": 10.11,
-            "roe": 25.32
-        },
-        {
-            "ticker": "LULU",
-            "name": "Lululemon Athletica Inc",
-            "industry": "\uc758\ub958 \ubc0f \uc561\uc138\uc11c\ub9ac",
-            "ath": 516.39,
-            "lowest_after_ath": 136.91,
-            "price": 138.16,
-            "correction_ratio": 0.735,
-            "price_to_ath": 0.268,
-            "days_since_ath": 856,
-            "ma_20_spread": -0.1199,
-            "ma_50_spread": -0.1553,
-            "ma_20_50_spread": -0.0403,
-            "eps_q0": -21.6,
-            "eps_q1": -19.44,
-            "eps_q2": -17.28,
-            "eps_q3": -15.12,
-            "per": 10.42,
-            "roe": 34.01
-        },
-        {
-            "ticker": "FISV",
-            "name": "Fiserv Inc",
-            "industry": "\uacbd\uc601 \uc9c0\uc6d0 \uc11c\ube44\uc2a4",
-            "ath": 238.59,
-            "lowest_after_ath": 52.91,
-            "price": 62.02,
-            "correction_ratio": 0.778,
-            "price_to_ath": 0.26,
-            "days_since_ath": 422,
-            "ma_20_spread": 0.0373,
-            "ma_50_spread": 0.0445,
-            "ma_20_50_spread": 0.007,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.78,
-            "roe": 0
-        },
-        {
-            "ticker": "OKTA",
-            "name": "Okta Inc",
-            "industry": "IT \uc11c\ube44\uc2a4 \ubc0f \ucee8\uc124\ud305",
-            "ath": 294.0,
-            "lowest_after_ath": 44.12,
-            "price": 76.16,
-            "correction_ratio": 0.85,
-            "price_to_ath": 0.259,
-            "days_since_ath": 1906,
-            "ma_20_spread": 0.0294,
-            "ma_50_spread": 0.0039,
-            "ma_20_50_spread": -0.0247,
-            "eps_q0": 173.9,
-            "eps_q1": 156.51,
-            "eps_q2": 139.12,
-            "eps_q3": 121.73,
-            "per": 58.14,
-            "roe": 3.51
-        },
-        {
-            "ticker": "GMAB",
-            "name": "Genmab A/S ADR",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 103.19,
-            "lowest_after_ath": 12.1,
-            "price": 26.11,
-            "correction_ratio": 0.883,
-            "price_to_ath": 0.253,
-            "days_since_ath": 2921,
-            "ma_20_spread": -0.0583,
-            "ma_50_spread": -0.0509,
-            "ma_20_50_spread": 0.0078,
-            "eps_q0": -94.6,
-            "eps_q1": -85.14,
-            "eps_q2": -75.68,
-            "eps_q3": -66.22,
-            "per": 16.95,
-            "roe": 17.54
-        },
-        {
-            "ticker": "ALGN",
-            "name": "Align Technology Inc",
-            "industry": "\uc758\ub8cc \uc7a5\ube44, \ubb3c\ud488 \ubc0f \uc720\ud1b5",
-            "ath": 737.45,
-            "lowest_after_ath": 122.0,
-            "price": 178.4,
-            "correction_ratio": 0.835,
-            "price_to_ath": 0.242,
-            "days_since_ath": 1682,
-            "ma_20_spread": -0.019,
-            "ma_50_spread": -0.0072,
-            "ma_20_50_spread": 0.012,
-            "eps_q0": 30.8,
-            "eps_q1": 27.72,
-            "eps_q2": 24.64,
-            "eps_q3": 21.56,
-            "per": 31.52,
-            "roe": 10.39
-        },
-        {
-            "ticker": "KHC",
-            "name": "Kraft Heinz Co",
-            "industry": "\uc2dd\ud488 \uac00\uacf5",
-            "ath": 97.77,
-            "lowest_after_ath": 19.99,
-            "price": 22.42,
-            "correction_ratio": 0.796,
-            "price_to_ath": 0.229,
-            "days_since_ath": 3362,
-            "ma_20_spread": -0.0024,
-            "ma_50_spread": -0.0219,
-            "ma_20_50_spread": -0.0195,
-            "eps_q0": -69.5,
-            "eps_q1": -62.55,
-            "eps_q2": -55.6,
-            "eps_q3": -48.65,
-            "per": 10.48,
-            "roe": -12.84
-        },
-        {
-            "ticker": "ROKU",
-            "name": "Roku Inc",
-            "industry": "\uc5d4\ud130\ud14c\uc778\uba3c\ud2b8 \uc81c\uc791",
-            "ath": 490.76,
-            "lowest_after_ath": 38.26,
-            "price": 112.62,
-            "correction_ratio": 0.922,
-            "price_to_ath": 0.229,
-            "days_since_ath": 1738,
-            "ma_20_spread": 0.0424,
-            "ma_50_spread": 0.1294,
-            "ma_20_50_spread": 0.0834,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 187.7,
-            "roe": 3.43
-        },
-        {
-            "ticker": "KDP",
-            "name": "Keurig Dr Pepper Inc",
-            "industry": "\ubb34\uc54c\ucf5c \uc74c\ub8cc",
-            "ath": 126.65,
-            "lowest_after_ath": 18.98,
-            "price": 28.93,
-            "correction_ratio": 0.85,
-            "price_to_ath": 0.228,
-            "days_since_ath": 3012,
-            "ma_20_spread": 0.082,
-            "ma_50_spread": 0.0502,
-            "ma_20_50_spread": -0.0294,
-            "eps_q0": -47.8,
-            "eps_q1": -43.02,
-            "eps_q2": -38.24,
-            "eps_q3": -33.46,
-            "per": 21.43,
-            "roe": 6.31
-        },
-        {
-            "ticker": "ILMN",
-            "name": "Illumina Inc",
-            "industry": "\ucca8\ub2e8 \uc758\ub8cc \uc7a5\ube44 \ubc0f \uae30\uc220",
-            "ath": 540.63,
-            "lowest_after_ath": 68.7,
-            "price": 120.37,
-            "correction_ratio": 0.873,
-            "price_to_ath": 0.223,
-            "days_since_ath": 1906,
-            "ma_20_spread": -0.0604,
-            "ma_50_spread": -0.0401,
-            "ma_20_50_spread": 0.0215,
-            "eps_q0": 78.6,
-            "eps_q1": 70.74,
-            "eps_q2": 62.88,
-            "eps_q3": 55.02,
-            "per": 22.13,
-            "roe": 33.36
-        },
-        {
-            "ticker": "BNTX",
-            "name": "Biontech SE ADR",
-            "industry": "\uc0dd\uba85 \uacf5\ud559 \ubc0f \uc758\ud559 \uc5f0\uad6c",
-            "ath": 464.0,
-            "lowest_after_ath": 76.53,
-            "price": 101.57,
-            "correction_ratio": 0.835,
-            "price_to_ath": 0.219,
-            "days_since_ath": 1724,
-            "ma_20_spread": 0.0245,
-            "ma_50_spread": 0.0365,
-            "ma_20_50_spread": 0.0116,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -22.75,
-            "roe": -5.88
-        },
-        {
-            "ticker": "SMCI",
-            "name": "Super Micro Computer Inc",
-            "industry": "\ucef4\ud4e8\ud130 \ud558\ub4dc\uc6e8\uc5b4",
-            "ath": 122.9,
-            "lowest_after_ath": 17.25,
-            "price": 26.32,
-            "correction_ratio": 0.86,
-            "price_to_ath": 0.214,
-            "days_since_ath": 786,
-            "ma_20_spread": 0.0058,
-            "ma_50_spread": -0.0564,
-            "ma_20_50_spread": -0.0618,
-            "eps_q0": 24.9,
-            "eps_q1": 22.41,
-            "eps_q2": 19.92,
-            "eps_q3": 17.43,
-            "per": 19.21,
-            "roe": 13.19
-        },
-        {
-            "ticker": "GRAB",
-            "name": "Grab Holdings Ltd",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 18.11,
-            "lowest_after_ath": 2.19,
-            "price": 3.82,
-            "correction_ratio": 0.879,
-            "price_to_ath": 0.211,
-            "days_since_ath": 1927,
-            "ma_20_spread": -0.006,
-            "ma_50_spread": -0.0201,
-            "ma_20_50_spread": -0.0142,
-            "eps_q0": 561.5,
-            "eps_q1": 505.35,
-            "eps_q2": 449.2,
-            "eps_q3": 393.05,
-            "per": 63.67,
-            "roe": 3.05
-        },
-        {
-            "ticker": "VTRS",
-            "name": "Viatris Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 76.69,
-            "lowest_after_ath": 6.85,
-            "price": 14.97,
-            "correction_ratio": 0.911,
-            "price_to_ath": 0.195,
-            "days_since_ath": 4027,
-            "ma_20_spread": 0.0593,
-            "ma_50_spread": 0.0495,
-            "ma_20_50_spread": -0.0093,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 5.62,
-            "roe": -21.08
-        },
-        {
-            "ticker": "CHTR",
-            "name": "Charter Communications Inc",
-            "industry": "\ud1b5\ud569 \ud1b5\uc2e0 \uc11c\ube44\uc2a4",
-            "ath": 825.62,
-            "lowest_after_ath": 158.42,
-            "price": 158.65,
-            "correction_ratio": 0.808,
-            "price_to_ath": 0.192,
-            "days_since_ath": 1703,
-            "ma_20_spread": -0.2682,
-            "ma_50_spread": -0.2816,
-            "ma_20_50_spread": -0.0184,
-            "eps_q0": -4.4,
-            "eps_q1": -3.96,
-            "eps_q2": -3.52,
-            "eps_q3": -3.08,
-            "per": 4.29,
-            "roe": 27.5
-        },
-        {
-            "ticker": "TTD",
-            "name": "Trade Desk Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 141.53,
-            "lowest_after_ath": 19.74,
-            "price": 24.37,
-            "correction_ratio": 0.861,
-            "price_to_ath": 0.172,
-            "days_since_ath": 513,
-            "ma_20_spread": 0.0931,
-            "ma_50_spread": 0.0205,
-            "ma_20_50_spread": -0.0664,
-            "eps_q0": 2.6,
-            "eps_q1": 2.34,
-            "eps_q2": 2.08,
-            "eps_q3": 1.82,
-            "per": 27.08,
-            "roe": 16.32
-        },
-        {
-            "ticker": "PYPL",
-            "name": "PayPal Holdings Inc",
-            "industry": "\uacbd\uc601 \uc9c0\uc6d0 \uc11c\ube44\uc2a4",
-            "ath": 310.16,
-            "lowest_after_ath": 38.46,
-            "price": 50.94,
-            "correction_ratio": 0.876,
-            "price_to_ath": 0.164,
-            "days_since_ath": 1738,
-            "ma_20_spread": 0.0533,
-            "ma_50_spread": 0.0983,
-            "ma_20_50_spread": 0.0426,
-            "eps_q0": 28.2,
-            "eps_q1": 25.38,
-            "eps_q2": 22.56,
-            "eps_q3": 19.74,
-            "per": 9.42,
-            "roe": 25.73
-        },
-        {
-            "ticker": "ZM",
-            "name": "Zoom Communications Inc",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 588.84,
-            "lowest_after_ath": 55.06,
-            "price": 95.76,
-            "correction_ratio": 0.906,
-            "price_to_ath": 0.163,
-            "days_since_ath": 2018,
-            "ma_20_spread": 0.1017,
-            "ma_50_spread": 0.1662,
-            "ma_20_50_spread": 0.0585,
-            "eps_q0": 83.2,
-            "eps_q1": 74.88,
-            "eps_q2": 66.56,
-            "eps_q3": 58.24,
-            "per": 15.5,
-            "roe": 20.28
-        },
-        {
-            "ticker": "TEAM",
-            "name": "Atlassian Corp",
-            "industry": "\uc18c\ud504\ud2b8\uc6e8\uc5b4",
-            "ath": 483.13,
-            "lowest_after_ath": 56.01,
-            "price": 70.49,
-            "correction_ratio": 0.884,
-            "price_to_ath": 0.146,
-            "days_since_ath": 1647,
-            "ma_20_spread": 0.0534,
-            "ma_50_spread": -0.0142,
-            "ma_20_50_spread": -0.0642,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 12.72,
-            "roe": -13.47
-        },
-        {
-            "ticker": "PSKY",
-            "name": "Paramount Skydance Corp",
-            "industry": "\uc5d4\ud130\ud14c\uc778\uba3c\ud2b8 \uc81c\uc791",
-            "ath": 101.97,
-            "lowest_after_ath": 8.62,
-            "price": 10.34,
-            "correction_ratio": 0.915,
-            "price_to_ath": 0.101,
-            "days_since_ath": 1871,
-            "ma_20_spread": -0.05,
-            "ma_50_spread": -0.0204,
-            "ma_20_50_spread": 0.0311,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 344.67,
-            "roe": -0.86
-        },
-        {
-            "ticker": "MRNA",
-            "name": "Moderna Inc",
-            "industry": "\uc81c\uc57d",
-            "ath": 497.49,
-            "lowest_after_ath": 22.28,
-            "price": 45.72,
-            "correction_ratio": 0.955,
-            "price_to_ath": 0.092,
-            "days_since_ath": 1724,
-            "ma_20_spread": -0.1107,
-            "ma_50_spread": -0.1184,
-            "ma_20_50_spread": -0.0087,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -9.67,
-            "roe": -28.87
-        },
-        {
-            "ticker": "RIVN",
-            "name": "Rivian Automotive Inc",
-            "industry": "\uc790\ub3d9\ucc28 \ubc0f \ud2b8\ub7ed \uc81c\uc870",
-            "ath": 179.47,
-            "lowest_after_ath": 8.26,
-            "price": 16.06,
-            "correction_ratio": 0.954,
-            "price_to_ath": 0.089,
-            "days_since_ath": 1626,
-            "ma_20_spread": -0.0048,
-            "ma_50_spread": 0.0222,
-            "ma_20_50_spread": 0.0271,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -8.27,
-            "roe": -65.0
-        }
-    ],
-    "KOSPI": [
-        {
-            "ticker": "005935.KS",
-            "name": "\uc0bc\uc131\uc804\uc790\uc6b0",
-            "industry": "N/A",
-            "ath": 163800.0,
-            "lowest_after_ath": 0,
-            "price": 163500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.998,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1345,
-            "ma_50_spread": 0.1883,
-            "ma_20_50_spread": 0.0475,
-            "eps_q0": 155.4,
-            "eps_q1": 139.86,
-            "eps_q2": 124.32,
-            "eps_q3": 108.78,
-            "per": 4.54,
-            "roe": 10.78
-        },
-        {
-            "ticker": "011070.KS",
-            "name": "LG\uc774\ub178\ud14d",
-            "industry": "N/A",
-            "ath": 596000.0,
-            "lowest_after_ath": 0,
-            "price": 592000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.993,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.4175,
-            "ma_50_spread": 0.7658,
-            "ma_20_50_spread": 0.2457,
-            "eps_q0": 27.1,
-            "eps_q1": 24.39,
-            "eps_q2": 21.68,
-            "eps_q3": 18.97,
-            "per": 17.02,
-            "roe": 6.14
-        },
-        {
-            "ticker": "005930.KS",
-            "name": "\uc0bc\uc131\uc804\uc790",
-            "industry": "N/A",
-            "ath": 229500.0,
-            "lowest_after_ath": 0,
-            "price": 226000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.985,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0777,
-            "ma_50_spread": 0.1408,
-            "ma_20_50_spread": 0.0585,
-            "eps_q0": 155.4,
-            "eps_q1": 139.86,
-            "eps_q2": 124.32,
-            "eps_q3": 108.78,
-            "per": 5.55,
-            "roe": 10.78
-        },
-        {
-            "ticker": "034730.KS",
-            "name": "SK",
-            "industry": "N/A",
-            "ath": 433500.0,
-            "lowest_after_ath": 0,
-            "price": 425000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.98,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1654,
-            "ma_50_spread": 0.1882,
-            "ma_20_50_spread": 0.0195,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 6.91,
-            "roe": 2.84
-        },
-        {
-            "ticker": "009150.KS",
-            "name": "\uc0bc\uc131\uc804\uae30",
-            "industry": "N/A",
-            "ath": 845000.0,
-            "lowest_after_ath": 0,
-            "price": 827000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.979,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2965,
-            "ma_50_spread": 0.6278,
-            "ma_20_50_spread": 0.2555,
-            "eps_q0": 6.9,
-            "eps_q1": 6.21,
-            "eps_q2": 5.52,
-            "eps_q3": 4.83,
-            "per": 34.34,
-            "roe": 7.78
-        },
-        {
-            "ticker": "402340.KS",
-            "name": "SK\uc2a4\ud018\uc5b4",
-            "industry": "N/A",
-            "ath": 848500.0,
-            "lowest_after_ath": 0,
-            "price": 830000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.978,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2845,
-            "ma_50_spread": 0.3809,
-            "ma_20_50_spread": 0.0751,
-            "eps_q0": 334.2,
-            "eps_q1": 300.78,
-            "eps_q2": 267.36,
-            "eps_q3": 233.94,
-            "per": 4.9,
-            "roe": 37.14
-        },
-        {
-            "ticker": "052690.KS",
-            "name": "\ud55c\uc804\uae30\uc220",
-            "industry": "N/A",
-            "ath": 198000.0,
-            "lowest_after_ath": 0,
-            "price": 193300.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.976,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.093,
-            "ma_50_spread": 0.1533,
-            "ma_20_50_spread": 0.0552,
-            "eps_q0": -70.1,
-            "eps_q1": -63.09,
-            "eps_q2": -56.08,
-            "eps_q3": -49.07,
-            "per": 87.86,
-            "roe": 4.73
-        },
-        {
-            "ticker": "000660.KS",
-            "name": "SK\ud558\uc774\ub2c9\uc2a4",
-            "industry": "N/A",
-            "ath": 1328000.0,
-            "lowest_after_ath": 0,
-            "price": 1293000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.974,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1716,
-            "ma_50_spread": 0.2795,
-            "ma_20_50_spread": 0.0921,
-            "eps_q0": 397.6,
-            "eps_q1": 357.84,
-            "eps_q2": 318.08,
-            "eps_q3": 278.32,
-            "per": 3.74,
-            "roe": 61.17
-        },
-        {
-            "ticker": "329180.KS",
-            "name": "HD\ud604\ub300\uc911\uacf5\uc5c5",
-            "industry": "N/A",
-            "ath": 710000.0,
-            "lowest_after_ath": 0,
-            "price": 690000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.972,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2782,
-            "ma_50_spread": 0.2544,
-            "ma_20_50_spread": -0.0186,
-            "eps_q0": 33.5,
-            "eps_q1": 30.15,
-            "eps_q2": 26.8,
-            "eps_q3": 23.45,
-            "per": 21.81,
-            "roe": 18.82
-        },
-        {
-            "ticker": "000150.KS",
-            "name": "\ub450\uc0b0",
-            "industry": "N/A",
-            "ath": 1618000.0,
-            "lowest_after_ath": 0,
-            "price": 1572000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.972,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1793,
-            "ma_50_spread": 0.3097,
-            "ma_20_50_spread": 0.1105,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 46.13,
-            "roe": 2.07
-        },
-        {
-            "ticker": "033780.KS",
-            "name": "KT&G",
-            "industry": "N/A",
-            "ath": 181500.0,
-            "lowest_after_ath": 0,
-            "price": 176500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.972,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0536,
-            "ma_50_spread": 0.08,
-            "ma_20_50_spread": 0.025,
-            "eps_q0": -16.4,
-            "eps_q1": -14.76,
-            "eps_q2": -13.12,
-            "eps_q3": -11.48,
-            "per": 14.14,
-            "roe": 11.8
-        },
-        {
-            "ticker": "010120.KS",
-            "name": "LS ELECTRIC",
-            "industry": "N/A",
-            "ath": 281500.0,
-            "lowest_after_ath": 0,
-            "price": 273000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.97,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.4297,
-            "ma_50_spread": 0.6335,
-            "ma_20_50_spread": 0.1426,
-            "eps_q0": 33.0,
-            "eps_q1": 29.7,
-            "eps_q2": 26.4,
-            "eps_q3": 23.1,
-            "per": 62.95,
-            "roe": 14.06
-        },
-        {
-            "ticker": "064350.KS",
-            "name": "\ud604\ub300\ub85c\ud15c",
-            "industry": "N/A",
-            "ath": 274000.0,
-            "lowest_after_ath": 0,
-            "price": 264000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.964,
-            "days_since_ath": 58,
-            "ma_20_spread": 0.2005,
-            "ma_50_spread": 0.2595,
-            "ma_20_50_spread": 0.0491,
-            "eps_q0": 28.0,
-            "eps_q1": 25.2,
-            "eps_q2": 22.4,
-            "eps_q3": 19.6,
-            "per": 20.46,
-            "roe": 30.63
-        },
-        {
-            "ticker": "278470.KS",
-            "name": "\uc5d0\uc774\ud53c\uc54c",
-            "industry": "N/A",
-            "ath": 469500.0,
-            "lowest_after_ath": 0,
-            "price": 451000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.961,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1345,
-            "ma_50_spread": 0.2929,
-            "ma_20_50_spread": 0.1396,
-            "eps_q0": 127.6,
-            "eps_q1": 114.84,
-            "eps_q2": 102.08,
-            "eps_q3": 89.32,
-            "per": 25.5,
-            "roe": 75.3
-        },
-        {
-            "ticker": "032830.KS",
-            "name": "\uc0bc\uc131\uc0dd\uba85",
-            "industry": "N/A",
-            "ath": 262500.0,
-            "lowest_after_ath": 0,
-            "price": 252000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.96,
-            "days_since_ath": 16,
-            "ma_20_spread": 0.0391,
-            "ma_50_spread": 0.0991,
-            "ma_20_50_spread": 0.0578,
-            "eps_q0": 187.0,
-            "eps_q1": 168.3,
-            "eps_q2": 149.6,
-            "eps_q3": 130.9,
-            "per": 16.34,
-            "roe": 4.76
-        },
-        {
-            "ticker": "298040.KS",
-            "name": "\ud6a8\uc131\uc911\uacf5\uc5c5",
-            "industry": "N/A",
-            "ath": 4170000.0,
-            "lowest_after_ath": 0,
-            "price": 3982000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.955,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2861,
-            "ma_50_spread": 0.4169,
-            "ma_20_50_spread": 0.1017,
-            "eps_q0": 92.2,
-            "eps_q1": 82.98,
-            "eps_q2": 73.76,
-            "eps_q3": 64.54,
-            "per": 33.0,
-            "roe": 22.12
-        },
-        {
-            "ticker": "009540.KS",
-            "name": "HD\ud55c\uad6d\uc870\uc120\ud574\uc591",
-            "industry": "N/A",
-            "ath": 494500.0,
-            "lowest_after_ath": 0,
-            "price": 472000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.954,
-            "days_since_ath": 177,
-            "ma_20_spread": 0.1344,
-            "ma_50_spread": 0.1459,
-            "ma_20_50_spread": 0.0101,
-            "eps_q0": 26.5,
-            "eps_q1": 23.85,
-            "eps_q2": 21.2,
-            "eps_q3": 18.55,
-            "per": 8.29,
-            "roe": 18.85
-        },
-        {
-            "ticker": "086790.KS",
-            "name": "\ud558\ub098\uae08\uc735\uc9c0\uc8fc",
-            "industry": "N/A",
-            "ath": 133700.0,
-            "lowest_after_ath": 0,
-            "price": 127100.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.951,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0624,
-            "ma_50_spread": 0.0897,
-            "ma_20_50_spread": 0.0258,
-            "eps_q0": 10.9,
-            "eps_q1": 9.81,
-            "eps_q2": 8.72,
-            "eps_q3": 7.63,
-            "per": 7.34,
-            "roe": 9.05
-        },
-        {
-            "ticker": "267250.KS",
-            "name": "HD\ud604\ub300",
-            "industry": "N/A",
-            "ath": 317000.0,
-            "lowest_after_ath": 0,
-            "price": 301000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.95,
-            "days_since_ath": 58,
-            "ma_20_spread": 0.1572,
-            "ma_50_spread": 0.1316,
-            "ma_20_50_spread": -0.0221,
-            "eps_q0": 120.9,
-            "eps_q1": 108.81,
-            "eps_q2": 96.72,
-            "eps_q3": 84.63,
-            "per": 13.94,
-            "roe": 12.96
-        },
-        {
-            "ticker": "042700.KS",
-            "name": "\ud55c\ubbf8\ubc18\ub3c4\uccb4",
-            "industry": "N/A",
-            "ath": 379500.0,
-            "lowest_after_ath": 0,
-            "price": 357500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.942,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.218,
-            "ma_50_spread": 0.2571,
-            "ma_20_50_spread": 0.0322,
-            "eps_q0": -48.9,
-            "eps_q1": -44.01,
-            "eps_q2": -39.12,
-            "eps_q3": -34.23,
-            "per": 67.35,
-            "roe": 34.76
-        },
-        {
-            "ticker": "443060.KS",
-            "name": "HD\ud604\ub300\ub9c8\ub9b0\uc194\ub8e8\uc158",
-            "industry": "N/A",
-            "ath": 287000.0,
-            "lowest_after_ath": 0,
-            "price": 268500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.936,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2993,
-            "ma_50_spread": 0.4199,
-            "ma_20_50_spread": 0.0929,
-            "eps_q0": 7.5,
-            "eps_q1": 6.75,
-            "eps_q2": 6.0,
-            "eps_q3": 5.25,
-            "per": 27.68,
-            "roe": 33.73
-        },
-        {
-            "ticker": "006260.KS",
-            "name": "LS",
-            "industry": "N/A",
-            "ath": 447500.0,
-            "lowest_after_ath": 0,
-            "price": 418500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.935,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2743,
-            "ma_50_spread": 0.4384,
-            "ma_20_50_spread": 0.1288,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 21.29,
-            "roe": 6.69
-        },
-        {
-            "ticker": "241560.KS",
-            "name": "\ub450\uc0b0\ubc25\ucea3",
-            "industry": "N/A",
-            "ath": 79700.0,
-            "lowest_after_ath": 0,
-            "price": 74500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.935,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.074,
-            "ma_50_spread": 0.1564,
-            "ma_20_50_spread": 0.0767,
-            "eps_q0": -33.9,
-            "eps_q1": -30.51,
-            "eps_q2": -27.12,
-            "eps_q3": -23.73,
-            "per": 11.88,
-            "roe": 5.83
-        },
-        {
-            "ticker": "055550.KS",
-            "name": "\uc2e0\ud55c\uc9c0\uc8fc",
-            "industry": "N/A",
-            "ath": 107200.0,
-            "lowest_after_ath": 0,
-            "price": 100000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.933,
-            "days_since_ath": 79,
-            "ma_20_spread": 0.0238,
-            "ma_50_spread": 0.0461,
-            "ma_20_50_spread": 0.0218,
-            "eps_q0": 9.0,
-            "eps_q1": 8.1,
-            "eps_q2": 7.2,
-            "eps_q3": 6.3,
-            "per": 7.78,
-            "roe": 0
-        },
-        {
-            "ticker": "267260.KS",
-            "name": "HD\ud604\ub300\uc77c\ub809\ud2b8\ub9ad",
-            "industry": "N/A",
-            "ath": 1350000.0,
-            "lowest_after_ath": 0,
-            "price": 1260000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.933,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1878,
-            "ma_50_spread": 0.2597,
-            "ma_20_50_spread": 0.0605,
-            "eps_q0": 89.6,
-            "eps_q1": 80.64,
-            "eps_q2": 71.68,
-            "eps_q3": 62.72,
-            "per": 37.52,
-            "roe": 41.34
-        },
-        {
-            "ticker": "017670.KS",
-            "name": "SK\ud154\ub808\ucf64",
-            "industry": "N/A",
-            "ath": 102600.0,
-            "lowest_after_ath": 0,
-            "price": 95600.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.932,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0261,
-            "ma_50_spread": 0.1329,
-            "ma_20_50_spread": 0.1041,
-            "eps_q0": -61.3,
-            "eps_q1": -55.17,
-            "eps_q2": -49.04,
-            "eps_q3": -42.91,
-            "per": 15.99,
-            "roe": 3.03
-        },
-        {
-            "ticker": "062040.KS",
-            "name": "\uc0b0\uc77c\uc804\uae30",
-            "industry": "N/A",
-            "ath": 237000.0,
-            "lowest_after_ath": 0,
-            "price": 221000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.932,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.2125,
-            "ma_50_spread": 0.3544,
-            "ma_20_50_spread": 0.1171,
-            "eps_q0": 50.9,
-            "eps_q1": 45.81,
-            "eps_q2": 40.72,
-            "eps_q3": 35.63,
-            "per": 26.28,
-            "roe": 127.66
-        },
-        {
-            "ticker": "105560.KS",
-            "name": "KB\uae08\uc735",
-            "industry": "N/A",
-            "ath": 172500.0,
-            "lowest_after_ath": 0,
-            "price": 160600.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.931,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0291,
-            "ma_50_spread": 0.0393,
-            "ma_20_50_spread": 0.0099,
-            "eps_q0": 11.5,
-            "eps_q1": 10.35,
-            "eps_q2": 9.2,
-            "eps_q3": 8.05,
-            "per": 8.52,
-            "roe": 0
-        },
-        {
-            "ticker": "082740.KS",
-            "name": "\ud55c\ud654\uc5d4\uc9c4",
-            "industry": "N/A",
-            "ath": 94400.0,
-            "lowest_after_ath": 0,
-            "price": 87700.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.929,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.5273,
-            "ma_50_spread": 0.6601,
-            "ma_20_50_spread": 0.087,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 29.85,
-            "roe": 36.6
-        },
-        {
-            "ticker": "000990.KS",
-            "name": "DB\ud558\uc774\ud14d",
-            "industry": "N/A",
-            "ath": 164500.0,
-            "lowest_after_ath": 0,
-            "price": 152600.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.928,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.3447,
-            "ma_50_spread": 0.5632,
-            "ma_20_50_spread": 0.1625,
-            "eps_q0": 19.5,
-            "eps_q1": 17.55,
-            "eps_q2": 15.6,
-            "eps_q3": 13.65,
-            "per": 17.78,
-            "roe": 11.9
-        },
-        {
-            "ticker": "047040.KS",
-            "name": "\ub300\uc6b0\uac74\uc124",
-            "industry": "N/A",
-            "ath": 40350.0,
-            "lowest_after_ath": 0,
-            "price": 36900.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.914,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.3718,
-            "ma_50_spread": 1.0535,
-            "ma_20_50_spread": 0.4969,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 40.27,
-            "roe": -23.46
-        },
-        {
-            "ticker": "016360.KS",
-            "name": "\uc0bc\uc131\uc99d\uad8c",
-            "industry": "N/A",
-            "ath": 119400.0,
-            "lowest_after_ath": 0,
-            "price": 108700.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.91,
-            "days_since_ath": 72,
-            "ma_20_spread": 0.0228,
-            "ma_50_spread": 0.0632,
-            "ma_20_50_spread": 0.0395,
-            "eps_q0": 45.5,
-            "eps_q1": 40.95,
-            "eps_q2": 36.4,
-            "eps_q3": 31.85,
-            "per": 8.06,
-            "roe": 13.09
-        },
-        {
-            "ticker": "267270.KS",
-            "name": "HD\uac74\uc124\uae30\uacc4",
-            "industry": "N/A",
-            "ath": 217500.0,
-            "lowest_after_ath": 0,
-            "price": 196000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.901,
-            "days_since_ath": 2,
-            "ma_20_spread": 0.1656,
-            "ma_50_spread": 0.3332,
-            "ma_20_50_spread": 0.1438,
-            "eps_q0": 69.5,
-            "eps_q1": 62.55,
-            "eps_q2": 55.6,
-            "eps_q3": 48.65,
-            "per": 17.53,
-            "roe": 4.67
-        },
-        {
-            "ticker": "000880.KS",
-            "name": "\ud55c\ud654",
-            "industry": "N/A",
-            "ath": 148500.0,
-            "lowest_after_ath": 0,
-            "price": 132500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.892,
-            "days_since_ath": 58,
-            "ma_20_spread": 0.0579,
-            "ma_50_spread": 0.0703,
-            "ma_20_50_spread": 0.0117,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 7.58,
-            "roe": 4.51
-        },
-        {
-            "ticker": "007660.KS",
-            "name": "\uc774\uc218\ud398\ud0c0\uc2dc\uc2a4",
-            "industry": "N/A",
-            "ath": 164400.0,
-            "lowest_after_ath": 0,
-            "price": 146000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.888,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.1397,
-            "ma_50_spread": 0.2304,
-            "ma_20_50_spread": 0.0796,
-            "eps_q0": 119.1,
-            "eps_q1": 107.19,
-            "eps_q2": 95.28,
-            "eps_q3": 83.37,
-            "per": 27.64,
-            "roe": 29.62
-        },
-        {
-            "ticker": "006800.KS",
-            "name": "\ubbf8\ub798\uc5d0\uc14b\uc99d\uad8c",
-            "industry": "N/A",
-            "ath": 76738.23,
-            "lowest_after_ath": 0,
-            "price": 67700.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.882,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0053,
-            "ma_50_spread": 0.0114,
-            "ma_20_50_spread": 0.006,
-            "eps_q0": 109.2,
-            "eps_q1": 98.28,
-            "eps_q2": 87.36,
-            "eps_q3": 76.44,
-            "per": 20.31,
-            "roe": 12.3
-        },
-        {
-            "ticker": "047050.KS",
-            "name": "\ud3ec\uc2a4\ucf54\uc778\ud130\ub0b4\uc154\ub110",
-            "industry": "N/A",
-            "ath": 96700.0,
-            "lowest_after_ath": 0,
-            "price": 84900.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.878,
-            "days_since_ath": 1010,
-            "ma_20_spread": 0.0892,
-            "ma_50_spread": 0.1278,
-            "ma_20_50_spread": 0.0354,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 16.64,
-            "roe": 9.28
-        },
-        {
-            "ticker": "307950.KS",
-            "name": "\ud604\ub300\uc624\ud1a0\uc5d0\ubc84",
-            "industry": "N/A",
-            "ath": 543000.0,
-            "lowest_after_ath": 0,
-            "price": 474000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.873,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.1353,
-            "ma_50_spread": 0.1334,
-            "ma_20_50_spread": -0.0017,
-            "eps_q0": 5.6,
-            "eps_q1": 5.04,
-            "eps_q2": 4.48,
-            "eps_q3": 3.92,
-            "per": 45.4,
-            "roe": 10.36
-        },
-        {
-            "ticker": "030200.KS",
-            "name": "KT",
-            "industry": "N/A",
-            "ath": 69400.0,
-            "lowest_after_ath": 0,
-            "price": 60500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.872,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0202,
-            "ma_50_spread": -0.0169,
-            "ma_20_50_spread": 0.0033,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.37,
-            "roe": 9.81
-        },
-        {
-            "ticker": "079550.KS",
-            "name": "LIG\ub514\ud39c\uc2a4\uc564\uc5d0\uc5b4\ub85c\uc2a4\ud398\uc774\uc2a4",
-            "industry": "N/A",
-            "ath": 1118000.0,
-            "lowest_after_ath": 0,
-            "price": 968000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.866,
-            "days_since_ath": 9,
-            "ma_20_spread": 0.0694,
-            "ma_50_spread": 0.2818,
-            "ma_20_50_spread": 0.1986,
-            "eps_q0": -93.4,
-            "eps_q1": -84.06,
-            "eps_q2": -74.72,
-            "eps_q3": -65.38,
-            "per": 40.64,
-            "roe": 17.33
-        },
-        {
-            "ticker": "006400.KS",
-            "name": "\uc0bc\uc131SDI",
-            "industry": "N/A",
-            "ath": 828000.0,
-            "lowest_after_ath": 0,
-            "price": 712000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.86,
-            "days_since_ath": 1724,
-            "ma_20_spread": 0.3216,
-            "ma_50_spread": 0.5569,
-            "ma_20_50_spread": 0.178,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 51.24,
-            "roe": -3.88
-        },
-        {
-            "ticker": "012450.KS",
-            "name": "\ud55c\ud654\uc5d0\uc5b4\ub85c\uc2a4\ud398\uc774\uc2a4",
-            "industry": "N/A",
-            "ath": 1655000.0,
-            "lowest_after_ath": 0,
-            "price": 1420000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.858,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.027,
-            "ma_50_spread": 0.0256,
-            "ma_20_50_spread": 0.0541,
-            "eps_q0": -65.7,
-            "eps_q1": -59.13,
-            "eps_q2": -52.56,
-            "eps_q3": -45.99,
-            "per": 24.32,
-            "roe": 15.57
-        },
-        {
-            "ticker": "034020.KS",
-            "name": "\ub450\uc0b0\uc5d0\ub108\ube4c\ub9ac\ud2f0",
-            "industry": "N/A",
-            "ath": 151594.77,
-            "lowest_after_ath": 0,
-            "price": 129200.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.852,
-            "days_since_ath": 6757,
-            "ma_20_spread": 0.1837,
-            "ma_50_spread": 0.2428,
-            "ma_20_50_spread": 0.0499,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 120.39,
-            "roe": 1.73
-        },
-        {
-            "ticker": "000720.KS",
-            "name": "\ud604\ub300\uac74\uc124",
-            "industry": "N/A",
-            "ath": 198400.0,
-            "lowest_after_ath": 0,
-            "price": 168600.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.85,
-            "days_since_ath": 23,
-            "ma_20_spread": -0.0144,
-            "ma_50_spread": 0.063,
-            "ma_20_50_spread": 0.0784,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 25.37,
-            "roe": 5.65
-        },
-        {
-            "ticker": "028260.KS",
-            "name": "\uc0bc\uc131\ubb3c\uc0b0",
-            "industry": "N/A",
-            "ath": 364000.0,
-            "lowest_after_ath": 0,
-            "price": 308500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.848,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0371,
-            "ma_50_spread": 0.0406,
-            "ma_20_50_spread": 0.0034,
-            "eps_q0": 64.9,
-            "eps_q1": 58.41,
-            "eps_q2": 51.92,
-            "eps_q3": 45.43,
-            "per": 18.0,
-            "roe": 8.25
-        },
-        {
-            "ticker": "071050.KS",
-            "name": "\ud55c\uad6d\uae08\uc735\uc9c0\uc8fc",
-            "industry": "N/A",
-            "ath": 300500.0,
-            "lowest_after_ath": 0,
-            "price": 249000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.829,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0152,
-            "ma_50_spread": 0.0393,
-            "ma_20_50_spread": 0.0237,
-            "eps_q0": 228.9,
-            "eps_q1": 206.01,
-            "eps_q2": 183.12,
-            "eps_q3": 160.23,
-            "per": 6.96,
-            "roe": 18.54
-        },
-        {
-            "ticker": "012330.KS",
-            "name": "\ud604\ub300\ubaa8\ube44\uc2a4",
-            "industry": "N/A",
-            "ath": 531000.0,
-            "lowest_after_ath": 0,
-            "price": 439000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.827,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0527,
-            "ma_50_spread": 0.0401,
-            "ma_20_50_spread": -0.0119,
-            "eps_q0": -40.3,
-            "eps_q1": -36.27,
-            "eps_q2": -32.24,
-            "eps_q3": -28.21,
-            "per": 8.26,
-            "roe": 7.69
-        },
-        {
-            "ticker": "039490.KS",
-            "name": "\ud0a4\uc6c0\uc99d\uad8c",
-            "industry": "N/A",
-            "ath": 517000.0,
-            "lowest_after_ath": 0,
-            "price": 423500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.819,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.046,
-            "ma_50_spread": -0.0428,
-            "ma_20_50_spread": 0.0033,
-            "eps_q0": 68.8,
-            "eps_q1": 61.92,
-            "eps_q2": 55.04,
-            "eps_q3": 48.16,
-            "per": 7.67,
-            "roe": 18.05
-        },
-        {
-            "ticker": "005940.KS",
-            "name": "NH\ud22c\uc790\uc99d\uad8c",
-            "industry": "N/A",
-            "ath": 42600.0,
-            "lowest_after_ath": 0,
-            "price": 34600.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.812,
-            "days_since_ath": 72,
-            "ma_20_spread": 0.0197,
-            "ma_50_spread": 0.0287,
-            "ma_20_50_spread": 0.0089,
-            "eps_q0": 128.5,
-            "eps_q1": 115.65,
-            "eps_q2": 102.8,
-            "eps_q3": 89.95,
-            "per": 10.62,
-            "roe": 0
-        },
-        {
-            "ticker": "005380.KS",
-            "name": "\ud604\ub300\ucc28",
-            "industry": "N/A",
-            "ath": 687000.0,
-            "lowest_after_ath": 0,
-            "price": 556000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.809,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0892,
-            "ma_50_spread": 0.0731,
-            "ma_20_50_spread": -0.0148,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 11.27,
-            "roe": 8.36
-        },
-        {
-            "ticker": "316140.KS",
-            "name": "\uc6b0\ub9ac\uae08\uc735\uc9c0\uc8fc",
-            "industry": "N/A",
-            "ath": 41500.0,
-            "lowest_after_ath": 0,
-            "price": 33500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.807,
-            "days_since_ath": 79,
-            "ma_20_spread": -0.0168,
-            "ma_50_spread": -0.0234,
-            "ma_20_50_spread": -0.0067,
-            "eps_q0": -2.1,
-            "eps_q1": -1.89,
-            "eps_q2": -1.68,
-            "eps_q3": -1.47,
-            "per": 6.72,
-            "roe": 8.52
-        },
-        {
-            "ticker": "086280.KS",
-            "name": "\ud604\ub300\uae00\ub85c\ube44\uc2a4",
-            "industry": "N/A",
-            "ath": 296000.0,
-            "lowest_after_ath": 0,
-            "price": 238500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.806,
-            "days_since_ath": 100,
-            "ma_20_spread": 0.0722,
-            "ma_50_spread": 0.0209,
-            "ma_20_50_spread": -0.0478,
-            "eps_q0": -14.4,
-            "eps_q1": -12.96,
-            "eps_q2": -11.52,
-            "eps_q3": -10.08,
-            "per": 9.74,
-            "roe": 17.29
-        },
-        {
-            "ticker": "005830.KS",
-            "name": "DB\uc190\ud574\ubcf4\ud5d8",
-            "industry": "N/A",
-            "ath": 214000.0,
-            "lowest_after_ath": 0,
-            "price": 172200.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.805,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0205,
-            "ma_50_spread": -0.0298,
-            "ma_20_50_spread": -0.0493,
-            "eps_q0": 104.4,
-            "eps_q1": 93.96,
-            "eps_q2": 83.52,
-            "eps_q3": 73.08,
-            "per": 5.92,
-            "roe": 17.62
-        },
-        {
-            "ticker": "001040.KS",
-            "name": "CJ",
-            "industry": "N/A",
-            "ath": 285652.19,
-            "lowest_after_ath": 0,
-            "price": 227500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.796,
-            "days_since_ath": 3915,
-            "ma_20_spread": 0.1052,
-            "ma_50_spread": 0.1227,
-            "ma_20_50_spread": 0.0158,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 11.99,
-            "roe": 0.82
-        },
-        {
-            "ticker": "003230.KS",
-            "name": "\uc0bc\uc591\uc2dd\ud488",
-            "industry": "N/A",
-            "ath": 1665000.0,
-            "lowest_after_ath": 0,
-            "price": 1314000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.789,
-            "days_since_ath": 233,
-            "ma_20_spread": 0.022,
-            "ma_50_spread": 0.0921,
-            "ma_20_50_spread": 0.0686,
-            "eps_q0": 25.7,
-            "eps_q1": 23.13,
-            "eps_q2": 20.56,
-            "eps_q3": 17.99,
-            "per": 14.98,
-            "roe": 37.02
-        },
-        {
-            "ticker": "454910.KS",
-            "name": "\ub450\uc0b0\ub85c\ubcf4\ud2f1\uc2a4",
-            "industry": "N/A",
-            "ath": 130600.0,
-            "lowest_after_ath": 0,
-            "price": 102200.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.783,
-            "days_since_ath": 93,
-            "ma_20_spread": 0.1194,
-            "ma_50_spread": 0.113,
-            "ma_20_50_spread": -0.0057,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": -586.24,
-            "roe": -14.78
-        },
-        {
-            "ticker": "010140.KS",
-            "name": "\uc0bc\uc131\uc911\uacf5\uc5c5",
-            "industry": "N/A",
-            "ath": 42212.65,
-            "lowest_after_ath": 0,
-            "price": 33000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.782,
-            "days_since_ath": 6869,
-            "ma_20_spread": 0.1117,
-            "ma_50_spread": 0.1542,
-            "ma_20_50_spread": 0.0382,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 18.15,
-            "roe": 13.66
-        },
-        {
-            "ticker": "078930.KS",
-            "name": "GS",
-            "industry": "N/A",
-            "ath": 105000.0,
-            "lowest_after_ath": 0,
-            "price": 82100.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.782,
-            "days_since_ath": 5483,
-            "ma_20_spread": 0.1486,
-            "ma_50_spread": 0.1867,
-            "ma_20_50_spread": 0.0332,
-            "eps_q0": 1760.0,
-            "eps_q1": 1584.0,
-            "eps_q2": 1408.0,
-            "eps_q3": 1232.0,
-            "per": 7.86,
-            "roe": 5.57
-        },
-        {
-            "ticker": "161390.KS",
-            "name": "\ud55c\uad6d\ud0c0\uc774\uc5b4\uc564\ud14c\ud06c\ub180\ub85c\uc9c0",
-            "industry": "N/A",
-            "ath": 78400.0,
-            "lowest_after_ath": 0,
-            "price": 61200.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.781,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0173,
-            "ma_50_spread": -0.0009,
-            "ma_20_50_spread": -0.0179,
-            "eps_q0": 234.9,
-            "eps_q1": 211.41,
-            "eps_q2": 187.92,
-            "eps_q3": 164.43,
-            "per": 4.85,
-            "roe": 7.65
-        },
-        {
-            "ticker": "005387.KS",
-            "name": "\ud604\ub300\ucc282\uc6b0B",
-            "industry": "N/A",
-            "ath": 332000.0,
-            "lowest_after_ath": 0,
-            "price": 258500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.779,
-            "days_since_ath": 100,
-            "ma_20_spread": 0.0512,
-            "ma_50_spread": -0.0035,
-            "ma_20_50_spread": -0.0521,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 0,
-            "roe": 8.36
-        },
-        {
-            "ticker": "047810.KS",
-            "name": "\ud55c\uad6d\ud56d\uacf5\uc6b0\uc8fc",
-            "industry": "N/A",
-            "ath": 215500.0,
-            "lowest_after_ath": 0,
-            "price": 166300.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.772,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.1,
-            "ma_50_spread": -0.0906,
-            "ma_20_50_spread": 0.0105,
-            "eps_q0": 412.3,
-            "eps_q1": 371.07,
-            "eps_q2": 329.84,
-            "eps_q3": 288.61,
-            "per": 31.06,
-            "roe": 10.34
-        },
-        {
-            "ticker": "024110.KS",
-            "name": "\uae30\uc5c5\uc740\ud589",
-            "industry": "N/A",
-            "ath": 29550.0,
-            "lowest_after_ath": 0,
-            "price": 22550.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.763,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0158,
-            "ma_50_spread": -0.0348,
-            "ma_20_50_spread": -0.0498,
-            "eps_q0": 1.8,
-            "eps_q1": 1.62,
-            "eps_q2": 1.44,
-            "eps_q3": 1.26,
-            "per": 6.19,
-            "roe": 7.65
-        },
-        {
-            "ticker": "138040.KS",
-            "name": "\uba54\ub9ac\uce20\uae08\uc735\uc9c0\uc8fc",
-            "industry": "N/A",
-            "ath": 149800.0,
-            "lowest_after_ath": 0,
-            "price": 113900.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.76,
-            "days_since_ath": 72,
-            "ma_20_spread": -0.0121,
-            "ma_50_spread": -0.0296,
-            "ma_20_50_spread": -0.0177,
-            "eps_q0": -8.7,
-            "eps_q1": -7.83,
-            "eps_q2": -6.96,
-            "eps_q3": -6.09,
-            "per": 6.46,
-            "roe": 21.18
-        },
-        {
-            "ticker": "010950.KS",
-            "name": "S-Oil",
-            "industry": "N/A",
-            "ath": 177100.0,
-            "lowest_after_ath": 0,
-            "price": 134300.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.758,
-            "days_since_ath": 58,
-            "ma_20_spread": 0.1429,
-            "ma_50_spread": 0.1588,
-            "ma_20_50_spread": 0.0138,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 12.88,
-            "roe": 2.01
-        },
-        {
-            "ticker": "373220.KS",
-            "name": "LG\uc5d0\ub108\uc9c0\uc194\ub8e8\uc158",
-            "industry": "N/A",
-            "ath": 629000.0,
-            "lowest_after_ath": 0,
-            "price": 473000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.752,
-            "days_since_ath": 1269,
-            "ma_20_spread": 0.0931,
-            "ma_50_spread": 0.1655,
-            "ma_20_50_spread": 0.0663,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 50.32,
-            "roe": 0.27
-        },
-        {
-            "ticker": "207940.KS",
-            "name": "\uc0bc\uc131\ubc14\uc774\uc624\ub85c\uc9c1\uc2a4",
-            "industry": "N/A",
-            "ath": 1987000.0,
-            "lowest_after_ath": 0,
-            "price": 1473000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.741,
-            "days_since_ath": 107,
-            "ma_20_spread": -0.0563,
-            "ma_50_spread": -0.0799,
-            "ma_20_50_spread": -0.0251,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 30.39,
-            "roe": 0
-        },
-        {
-            "ticker": "000270.KS",
-            "name": "\uae30\uc544",
-            "industry": "N/A",
-            "ath": 212500.0,
-            "lowest_after_ath": 0,
-            "price": 156900.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.738,
-            "days_since_ath": 65,
-            "ma_20_spread": 0.0184,
-            "ma_50_spread": -0.0321,
-            "ma_20_50_spread": -0.0495,
-            "eps_q0": -15.4,
-            "eps_q1": -13.86,
-            "eps_q2": -12.32,
-            "eps_q3": -10.78,
-            "per": 6.61,
-            "roe": 12.91
-        },
-        {
-            "ticker": "009830.KS",
-            "name": "\ud55c\ud654\uc194\ub8e8\uc158",
-            "industry": "N/A",
-            "ath": 65036.1,
-            "lowest_after_ath": 0,
-            "price": 47950.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.737,
-            "days_since_ath": 1934,
-            "ma_20_spread": 0.1109,
-            "ma_50_spread": 0.0486,
-            "ma_20_50_spread": -0.056,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 13.01,
-            "roe": -7.69
-        },
-        {
-            "ticker": "0126Z0.KS",
-            "name": "\uc0bc\uc131\uc5d0\ud53c\uc2a4\ud640\ub529\uc2a4",
-            "industry": "N/A",
-            "ath": 773000.0,
-            "lowest_after_ath": 0,
-            "price": 559000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.723,
-            "days_since_ath": 121,
-            "ma_20_spread": 0.0152,
-            "ma_50_spread": 0.0015,
-            "ma_20_50_spread": -0.0135,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 30.68,
-            "roe": 0
-        },
-        {
-            "ticker": "000810.KS",
-            "name": "\uc0bc\uc131\ud654\uc7ac",
-            "industry": "N/A",
-            "ath": 646000.0,
-            "lowest_after_ath": 0,
-            "price": 464000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.718,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.0054,
-            "ma_50_spread": -0.0443,
-            "ma_20_50_spread": -0.0391,
-            "eps_q0": 13.3,
-            "eps_q1": 11.97,
-            "eps_q2": 10.64,
-            "eps_q3": 9.31,
-            "per": 8.15,
-            "roe": 10.95
-        },
-        {
-            "ticker": "003550.KS",
-            "name": "LG",
-            "industry": "N/A",
-            "ath": 138768.98,
-            "lowest_after_ath": 0,
-            "price": 98300.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.708,
-            "days_since_ath": 1829,
-            "ma_20_spread": 0.0589,
-            "ma_50_spread": 0.056,
-            "ma_20_50_spread": -0.0028,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 9.62,
-            "roe": 3.42
-        },
-        {
-            "ticker": "066570.KS",
-            "name": "LG\uc804\uc790",
-            "industry": "N/A",
-            "ath": 193000.0,
-            "lowest_after_ath": 0,
-            "price": 135800.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.704,
-            "days_since_ath": 1927,
-            "ma_20_spread": 0.1128,
-            "ma_50_spread": 0.1294,
-            "ma_20_50_spread": 0.0149,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 10.42,
-            "roe": 4.57
-        },
-        {
-            "ticker": "010130.KS",
-            "name": "\uace0\ub824\uc544\uc5f0",
-            "industry": "N/A",
-            "ath": 2407000.0,
-            "lowest_after_ath": 0,
-            "price": 1604000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.666,
-            "days_since_ath": 513,
-            "ma_20_spread": -0.0026,
-            "ma_50_spread": -0.0273,
-            "ma_20_50_spread": -0.0247,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 24.78,
-            "roe": 8.2
-        },
-        {
-            "ticker": "064400.KS",
-            "name": "LG\uc528\uc5d4\uc5d0\uc2a4",
-            "industry": "N/A",
-            "ath": 100800.0,
-            "lowest_after_ath": 0,
-            "price": 66700.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.662,
-            "days_since_ath": 310,
-            "ma_20_spread": 0.0467,
-            "ma_50_spread": 0.0269,
-            "ma_20_50_spread": -0.0189,
-            "eps_q0": 34.7,
-            "eps_q1": 31.23,
-            "eps_q2": 27.76,
-            "eps_q3": 24.29,
-            "per": 12.43,
-            "roe": 17.34
-        },
-        {
-            "ticker": "180640.KS",
-            "name": "\ud55c\uc9c4\uce7c",
-            "industry": "N/A",
-            "ath": 175900.0,
-            "lowest_after_ath": 0,
-            "price": 113300.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.644,
-            "days_since_ath": 65,
-            "ma_20_spread": -0.003,
-            "ma_50_spread": -0.0803,
-            "ma_20_50_spread": -0.0775,
-            "eps_q0": -30.9,
-            "eps_q1": -27.81,
-            "eps_q2": -24.72,
-            "eps_q3": -21.63,
-            "per": 0,
-            "roe": 4.72
-        },
-        {
-            "ticker": "272210.KS",
-            "name": "\ud55c\ud654\uc2dc\uc2a4\ud15c",
-            "industry": "N/A",
-            "ath": 184000.0,
-            "lowest_after_ath": 0,
-            "price": 118100.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.642,
-            "days_since_ath": 58,
-            "ma_20_spread": -0.0927,
-            "ma_50_spread": -0.0949,
-            "ma_20_50_spread": -0.0024,
-            "eps_q0": -96.8,
-            "eps_q1": -87.12,
-            "eps_q2": -77.44,
-            "eps_q3": -67.76,
-            "per": 56.41,
-            "roe": 5.38
-        },
-        {
-            "ticker": "015760.KS",
-            "name": "\ud55c\uad6d\uc804\ub825",
-            "industry": "N/A",
-            "ath": 69500.0,
-            "lowest_after_ath": 0,
-            "price": 44500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.64,
-            "days_since_ath": 100,
-            "ma_20_spread": 0.0103,
-            "ma_50_spread": -0.0752,
-            "ma_20_50_spread": -0.0846,
-            "eps_q0": 30.3,
-            "eps_q1": 27.27,
-            "eps_q2": 24.24,
-            "eps_q3": 21.21,
-            "per": 2.64,
-            "roe": 19.11
-        },
-        {
-            "ticker": "010060.KS",
-            "name": "OCI\ud640\ub529\uc2a4",
-            "industry": "N/A",
-            "ath": 605154.06,
-            "lowest_after_ath": 0,
-            "price": 371500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.614,
-            "days_since_ath": 5490,
-            "ma_20_spread": 0.3924,
-            "ma_50_spread": 0.81,
-            "ma_20_50_spread": 0.2999,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 18.56,
-            "roe": -3.06
-        },
-        {
-            "ticker": "005490.KS",
-            "name": "POSCO\ud640\ub529\uc2a4",
-            "industry": "N/A",
-            "ath": 765000.0,
-            "lowest_after_ath": 0,
-            "price": 469000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.613,
-            "days_since_ath": 6785,
-            "ma_20_spread": 0.2128,
-            "ma_50_spread": 0.2722,
-            "ma_20_50_spread": 0.049,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 16.18,
-            "roe": 0.81
-        },
-        {
-            "ticker": "352820.KS",
-            "name": "\ud558\uc774\ube0c",
-            "industry": "N/A",
-            "ath": 421500.0,
-            "lowest_after_ath": 0,
-            "price": 252500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.599,
-            "days_since_ath": 1626,
-            "ma_20_spread": -0.0138,
-            "ma_50_spread": -0.1912,
-            "ma_20_50_spread": -0.1799,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 24.85,
-            "roe": -7.2
-        },
-        {
-            "ticker": "066970.KS",
-            "name": "\uc5d8\uc564\uc5d0\ud504",
-            "industry": "N/A",
-            "ath": 349500.0,
-            "lowest_after_ath": 0,
-            "price": 209000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.598,
-            "days_since_ath": 1122,
-            "ma_20_spread": 0.1301,
-            "ma_50_spread": 0.4287,
-            "ma_20_50_spread": 0.2642,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 83.16,
-            "roe": 0
-        },
-        {
-            "ticker": "068270.KS",
-            "name": "\uc140\ud2b8\ub9ac\uc628",
-            "industry": "N/A",
-            "ath": 341497.25,
-            "lowest_after_ath": 0,
-            "price": 204000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.597,
-            "days_since_ath": 1969,
-            "ma_20_spread": 0.0099,
-            "ma_50_spread": -0.0269,
-            "ma_20_50_spread": -0.0365,
-            "eps_q0": 123.3,
-            "eps_q1": 110.97,
-            "eps_q2": 98.64,
-            "eps_q3": 86.31,
-            "per": 27.88,
-            "roe": 5.91
-        },
-        {
-            "ticker": "000100.KS",
-            "name": "\uc720\ud55c\uc591\ud589",
-            "industry": "N/A",
-            "ath": 166900.0,
-            "lowest_after_ath": 0,
-            "price": 93200.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.558,
-            "days_since_ath": 562,
-            "ma_20_spread": -0.0122,
-            "ma_50_spread": -0.0581,
-            "ma_20_50_spread": -0.0464,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 28.92,
-            "roe": 8.21
-        },
-        {
-            "ticker": "032640.KS",
-            "name": "LG\uc720\ud50c\ub7ec\uc2a4",
-            "industry": "N/A",
-            "ath": 31400.0,
-            "lowest_after_ath": 0,
-            "price": 16050.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.511,
-            "days_since_ath": 6771,
-            "ma_20_spread": -0.0355,
-            "ma_50_spread": -0.0084,
-            "ma_20_50_spread": 0.0281,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 8.46,
-            "roe": 5.71
-        },
-        {
-            "ticker": "096770.KS",
-            "name": "SK\uc774\ub178\ubca0\uc774\uc158",
-            "industry": "N/A",
-            "ath": 310181.78,
-            "lowest_after_ath": 0,
-            "price": 149800.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.483,
-            "days_since_ath": 1913,
-            "ma_20_spread": 0.1787,
-            "ma_50_spread": 0.2304,
-            "ma_20_50_spread": 0.0438,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 26.57,
-            "roe": -12.92
-        },
-        {
-            "ticker": "259960.KS",
-            "name": "\ud06c\ub798\ud504\ud1a4",
-            "industry": "N/A",
-            "ath": 580000.0,
-            "lowest_after_ath": 0,
-            "price": 277500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.478,
-            "days_since_ath": 1626,
-            "ma_20_spread": 0.0946,
-            "ma_50_spread": 0.1256,
-            "ma_20_50_spread": 0.0284,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 11.48,
-            "roe": 10.47
-        },
-        {
-            "ticker": "035420.KS",
-            "name": "NAVER",
-            "industry": "N/A",
-            "ath": 465000.0,
-            "lowest_after_ath": 0,
-            "price": 220000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.473,
-            "days_since_ath": 1738,
-            "ma_20_spread": 0.0564,
-            "ma_50_spread": 0.0012,
-            "ma_20_50_spread": -0.0522,
-            "eps_q0": -43.5,
-            "eps_q1": -39.15,
-            "eps_q2": -34.8,
-            "eps_q3": -30.45,
-            "per": 14.21,
-            "roe": 6.5
-        },
-        {
-            "ticker": "003490.KS",
-            "name": "\ub300\ud55c\ud56d\uacf5",
-            "industry": "N/A",
-            "ath": 60214.96,
-            "lowest_after_ath": 0,
-            "price": 25100.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.417,
-            "days_since_ath": 6750,
-            "ma_20_spread": 0.0254,
-            "ma_50_spread": 0.0092,
-            "ma_20_50_spread": -0.0158,
-            "eps_q0": -56.5,
-            "eps_q1": -50.85,
-            "eps_q2": -45.2,
-            "eps_q3": -39.55,
-            "per": 8.27,
-            "roe": 5.77
-        },
-        {
-            "ticker": "018260.KS",
-            "name": "\uc0bc\uc131\uc5d0\uc2a4\ub514\uc5d0\uc2a4",
-            "industry": "N/A",
-            "ath": 429500.0,
-            "lowest_after_ath": 0,
-            "price": 170200.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.396,
-            "days_since_ath": 4174,
-            "ma_20_spread": 0.0282,
-            "ma_50_spread": 0.0295,
-            "ma_20_50_spread": 0.0013,
-            "eps_q0": -56.4,
-            "eps_q1": -50.76,
-            "eps_q2": -45.12,
-            "eps_q3": -39.48,
-            "per": 14.61,
-            "roe": 6.58
-        },
-        {
-            "ticker": "051910.KS",
-            "name": "LG\ud654\ud559",
-            "industry": "N/A",
-            "ath": 1050000.0,
-            "lowest_after_ath": 0,
-            "price": 407500.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.388,
-            "days_since_ath": 1934,
-            "ma_20_spread": 0.1372,
-            "ma_50_spread": 0.2052,
-            "ma_20_50_spread": 0.0598,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 17.44,
-            "roe": -3.78
-        },
-        {
-            "ticker": "326030.KS",
-            "name": "SK\ubc14\uc774\uc624\ud31c",
-            "industry": "N/A",
-            "ath": 269500.0,
-            "lowest_after_ath": 0,
-            "price": 101800.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.378,
-            "days_since_ath": 2123,
-            "ma_20_spread": 0.0121,
-            "ma_50_spread": -0.0028,
-            "ma_20_50_spread": -0.0147,
-            "eps_q0": -28.2,
-            "eps_q1": -25.38,
-            "eps_q2": -22.56,
-            "eps_q3": -19.74,
-            "per": 21.57,
-            "roe": 36.17
-        },
-        {
-            "ticker": "003670.KS",
-            "name": "\ud3ec\uc2a4\ucf54\ud4e8\ucc98\uc5e0",
-            "industry": "N/A",
-            "ath": 694000.0,
-            "lowest_after_ath": 0,
-            "price": 261000.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.376,
-            "days_since_ath": 1010,
-            "ma_20_spread": 0.1293,
-            "ma_50_spread": 0.1883,
-            "ma_20_50_spread": 0.0523,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 237.53,
-            "roe": 0.93
-        },
-        {
-            "ticker": "090430.KS",
-            "name": "\uc544\ubaa8\ub808\ud37c\uc2dc\ud53d",
-            "industry": "N/A",
-            "ath": 455500.0,
-            "lowest_after_ath": 0,
-            "price": 141400.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.31,
-            "days_since_ath": 3957,
-            "ma_20_spread": 0.0556,
-            "ma_50_spread": 0.0256,
-            "ma_20_50_spread": -0.0284,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 21.89,
-            "roe": 4.57
-        },
-        {
-            "ticker": "035720.KS",
-            "name": "\uce74\uce74\uc624",
-            "industry": "N/A",
-            "ath": 173000.0,
-            "lowest_after_ath": 0,
-            "price": 48400.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.28,
-            "days_since_ath": 1773,
-            "ma_20_spread": 0.01,
-            "ma_50_spread": -0.042,
-            "ma_20_50_spread": -0.0515,
-            "eps_q0": 0,
-            "eps_q1": 0.0,
-            "eps_q2": 0.0,
-            "eps_q3": 0.0,
-            "per": 27.8,
-            "roe": 3.61
-        },
-        {
-            "ticker": "323410.KS",
-            "name": "\uce74\uce74\uc624\ubc45\ud06c",
-            "industry": "N/A",
-            "ath": 94400.0,
-            "lowest_after_ath": 0,
-            "price": 24550.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.26,
-            "days_since_ath": 1717,
-            "ma_20_spread": -0.0103,
-            "ma_50_spread": -0.0201,
-            "ma_20_50_spread": -0.0099,
-            "eps_q0": 24.6,
-            "eps_q1": 22.14,
-            "eps_q2": 19.68,
-            "eps_q3": 17.22,
-            "per": 19.46,
-            "roe": 7.23
-        },
-        {
-            "ticker": "042660.KS",
-            "name": "\ud55c\ud654\uc624\uc158",
-            "industry": "N/A",
-            "ath": 564918.88,
-            "lowest_after_ath": 0,
-            "price": 132300.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.234,
-            "days_since_ath": 6771,
-            "ma_20_spread": 0.0334,
-            "ma_50_spread": 0.0206,
-            "ma_20_50_spread": -0.0123,
-            "eps_q0": 5.7,
-            "eps_q1": 5.13,
-            "eps_q2": 4.56,
-            "eps_q3": 3.99,
-            "per": 22.54,
-            "roe": 22.57
-        },
-        {
-            "ticker": "377300.KS",
-            "name": "\uce74\uce74\uc624\ud398\uc774",
-            "industry": "N/A",
-            "ath": 248500.0,
-            "lowest_after_ath": 0,
-            "price": 56600.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.228,
-            "days_since_ath": 1612,
-            "ma_20_spread": 0.0562,
-            "ma_50_spread": -0.0094,
-            "ma_20_50_spread": -0.0621,
-            "eps_q0": 3.5,
-            "eps_q1": 3.15,
-            "eps_q2": 2.8,
-            "eps_q3": 2.45,
-            "per": 55.84,
-            "roe": 2.88
-        },
-        {
-            "ticker": "028050.KS",
-            "name": "\uc0bc\uc131E&A",
-            "industry": "N/A",
-            "ath": 281000.0,
-            "lowest_after_ath": 0,
-            "price": 54300.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.193,
-            "days_since_ath": 5399,
-            "ma_20_spread": 0.0913,
-            "ma_50_spread": 0.3451,
-            "ma_20_50_spread": 0.2325,
-            "eps_q0": 3.9,
-            "eps_q1": 3.51,
-            "eps_q2": 3.12,
-            "eps_q3": 2.73,
-            "per": 13.28,
-            "roe": 0
-        },
-        {
-            "ticker": "011200.KS",
-            "name": "HMM",
-            "industry": "N/A",
-            "ath": 321589.12,
-            "lowest_after_ath": 0,
-            "price": 20750.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.065,
-            "days_since_ath": 5693,
-            "ma_20_spread": -0.0034,
-            "ma_50_spread": -0.0147,
-            "ma_20_50_spread": -0.0114,
-            "eps_q0": -59.5,
-            "eps_q1": -53.55,
-            "eps_q2": -47.6,
-            "eps_q3": -41.65,
-            "per": 17.7,
-            "roe": 6.9
-        },
-        {
-            "ticker": "001440.KS",
-            "name": "\ub300\ud55c\uc804\uc120",
-            "industry": "N/A",
-            "ath": 19956508.0,
-            "lowest_after_ath": 0,
-            "price": 51200.0,
-            "correction_ratio": 1.0,
-            "price_to_ath": 0.003,
-            "days_since_ath": 6743,
-            "ma_20_spread": 0.379,
-            "ma_50_spread": 0.5428,
-            "ma_20_50_spread": 0.1188,
-            "eps_q0": 3503.0,
-            "eps_q1": 3152.7,
-            "eps_q2": 2802.4,
-            "eps_q3": 2452.1,
-            "per": 65.89,
-            "roe": 5.75
-        }
-    ]
-};
@@ -0,0 +1,171 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+# Minimum number of valid daily closes a ticker needs to be listed (MA50 must exist)
+MIN_DAILY_BARS = 50
+
+
+def to_wide(h, column, tickers):
+    # Pivot a (symbol, date) history frame into a date x ticker array, columns in `tickers` order
+    if not isinstance(h, pd.DataFrame) or h.empty or column not in h.columns:
+        return pd.DatetimeIndex([]), np.full((0, len(tickers)), np.nan)
+    wide = h[column].unstack(level=0).reindex(columns=tickers).sort_index()
+    return pd.DatetimeIndex(wide.index), wide.to_numpy(dtype=float)
+
+
+def last_valid(values, n):
+    # Move every column's valid values to the bottom (keeping their order) and return the
+    # last `n` rows, so row -1 is each ticker's latest valid value. Short columns are NaN-padded.
+    valid = ~np.isnan(values)
+    order = np.argsort(valid, axis=0, kind='stable')
+    packed = np.take_along_axis(values, order, axis=0)
+    if len(packed) < n:
+        pad = np.full((n - len(packed), values.shape[1]), np.nan)
+        packed = np.vstack([pad, packed])
+    return packed[-n:], valid.sum(axis=0)
+
+
+def rolling_mean(values, window):
+    # Column-wise rolling mean of a date x ticker array; NaN until `window` valid rows in a row
+    valid = ~np.isnan(values)
+    zero = np.zeros((1, values.shape[1]))
+    sums = np.vstack([zero, np.cumsum(np.where(valid, values, 0), axis=0)])
+    counts = np.vstack([zero, np.cumsum(valid, axis=0)])
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        full = counts[window:] - counts[:-window] == window
+        out[window - 1:] = np.where(full, (sums[window:] - sums[:-window]) / window, np.nan)
+    return out
+
+
+def _fenwick_add(tree, i, delta):
+    i += 1
+    while i < len(tree):
+        tree[i] += delta
+        i += i & -i
+
+
+def _fenwick_below(tree, i):
+    # Count of the ranks below `i`
+    total = 0
+    while i > 0:
+        total += tree[i]
+        i -= i & -i
+    return total
+
+
+def rolling_percentile(values, window):
+    # Share (in %) of the valid values among each row's trailing `window` rows (itself
+    # included) that are below the row's value, for every column of a date x ticker array.
+    # NaN where the value is missing. Values are replaced by their rank among the column's
+    # distinct values and a Fenwick tree counts the ranks inside the window, so a row entering,
+    # a row leaving and ranking the new row cost O(log n) each instead of a window rescan.
+    out = np.full(values.shape, np.nan)
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        valid = ~np.isnan(column)
+        distinct = np.unique(column[valid])
+        ranks = np.searchsorted(distinct, column).tolist()
+        valid = valid.tolist()
+        tree = [0] * (len(distinct) + 1)
+        inside = 0
+        for i in range(len(column)):
+            if i >= window and valid[i - window]:
+                _fenwick_add(tree, ranks[i - window], -1)
+                inside -= 1
+            if not valid[i]:
+                continue
+            _fenwick_add(tree, ranks[i], 1)
+            inside += 1
+            out[i, j] = _fenwick_below(tree, ranks[i]) / inside * 100
+    return out
+
+
+# A year of sessions: the spread percentile ranks today's spread against the past year's
+SPREAD_WINDOW = 253
+
+
+def ma_spread_percentile(close, window=SPREAD_WINDOW):
+    # |MA10 - MA50| + |MA20 - MA50| of the latest day, ranked against the spreads of the last
+    # `window` days (the old get_sp500_data metric). Columns are packed so each ticker's own
+    # series ends on the last row; None where a ticker has no more than 50 closes.
+    packed, counts = last_valid(close, len(close))
+    ma_10, ma_20, ma_50 = (rolling_mean(packed, w) for w in (10, 20, 50))
+    spread = np.abs(ma_10 - ma_50) + np.abs(ma_20 - ma_50)
+    rank = rolling_percentile(spread, window)[-1] if len(spread) else np.full(close.shape[1], np.nan)
+    return [round(float(r), 2) if c > MIN_DAILY_BARS and not np.isnan(r) else None for r, c in zip(rank, counts)]
+
+
+def _spread(a, b):
+    # (a - b) / b rounded like the per-ticker code did, None where b is missing or not positive
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out = np.round((a - b) / b, 4)
+    ok = ~np.isnan(b) & (b > 0) & ~np.isnan(out)
+    return [float(v) if k else None for v, k in zip(out, ok)]
+
+
+# Compute price / ATH / moving-average metrics for every ticker of a batch at once.
+# Returns {ticker: metrics} in record order for the tickers that have enough daily bars;
+# the others are left out exactly like the old `len(hist_1y_df) < 50` filter did.
+def compute_metrics(h1, h20, tickers, now=None):
+    now = now or datetime.now()
+    tickers = list(tickers)
+    n = len(tickers)
+    cols = np.arange(n)
+
+    # Daily: latest close and the MA20/MA50 of the last valid closes
+    _, close = to_wide(h1, 'close', tickers)
+    tail, counts = last_valid(close, MIN_DAILY_BARS)
+    price = tail[-1]
+    ma_20 = tail[-20:].mean(axis=0)
+    ma_50 = tail.mean(axis=0)
+
+    # Weekly: ATH, when it happened and the lowest low from that bar on
+    dates, high = to_wide(h20, 'high', tickers)
+    _, low = to_wide(h20, 'low', tickers)
+    has_weekly = ~np.all(np.isnan(high), axis=0) if len(high) else np.zeros(n, dtype=bool)
+    if len(high):
+        ath_pos = np.where(np.isnan(high), -np.inf, high).argmax(axis=0)
+        ath = high[ath_pos, cols]
+        after = np.where(np.arange(len(low))[:, None] >= ath_pos, low, np.nan)
+        with np.errstate(invalid='ignore'):
+            lowest = np.fmin.reduce(after, axis=0)
+        days = (np.datetime64(now, 'ns') - dates.values[ath_pos]) // np.timedelta64(1, 'D')
+    else:
+        ath = lowest = np.full(n, np.nan)
+        days = np.zeros(n, dtype=int)
+
+    ath = np.where(has_weekly, ath, price)
+    lowest = np.where(has_weekly, lowest, price)
+    days = np.where(has_weekly, days, 0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        price_to_ath = np.where(ath > 0, np.round(price / ath, 3), 0)
+    ma_20_spread = _spread(price, ma_20)
+    ma_50_spread = _spread(price, ma_50)
+    ma_20_ok = ~np.isnan(ma_20) & (ma_20 > 0)
+    ma_20_50_spread = [s if ok else None for s, ok in zip(_spread(ma_20, ma_50), ma_20_ok)]
+    spread_percentile = ma_spread_percentile(close)
+
+    metrics = {}
+    for j, ticker in enumerate(tickers):
+        if counts[j] < MIN_DAILY_BARS:
+            continue
+        # ATH/low were plain floats in the per-ticker code, keep their rounding identical
+        all_time_high = float(ath[j]) if has_weekly[j] else price[j]
+        lowest_after_ath = float(lowest[j]) if has_weekly[j] else price[j]
+        correction_ratio = round((all_time_high - lowest_after_ath) / all_time_high, 3) if all_time_high and all_time_high > 0 else 0
+        metrics[ticker] = {
+            "ath": round(all_time_high, 2) if all_time_high else 0,
+            "lowest_after_ath": round(lowest_after_ath, 2) if lowest_after_ath else 0,
+            "price": round(price[j], 2) if price[j] else 0,
+            "correction_ratio": correction_ratio,
+            "price_to_ath": price_to_ath[j] if all_time_high and all_time_high > 0 else 0,
+            "days_since_ath": int(days[j]),
+            "ma_20_spread": ma_20_spread[j],
+            "ma_50_spread": ma_50_spread[j],
+            "ma_20_50_spread": ma_20_50_spread[j],
+            "ma_spread_percentile": spread_percentile[j] if spread_percentile[j] is not None else -1,
+        }
+    return metrics
@@ -0,0 +1,355 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytz
+
+import history_store
+import instrumentation
+
+# Market data sources behind one interface, so every market can be routed to the sources
+# that serve it best and fall back to the others for whatever is missing:
+#   history(symbols, interval, period=None, start=None) -> yahooquery-style (symbol, date) frame
+#   quotes(symbols)       -> {symbol: {'price', 'time', 'market_cap'}}
+#   fundamentals(symbols) -> {symbol: {module: dict}} (Yahoo quoteSummary modules, plus the
+#                            TIME_SERIES ones)
+# `serves` lists the kinds of request a provider answers. Symbols are always Yahoo-style
+# (AAPL, BRK-B, 005930.KS); a provider translates them to its own codes.
+
+# yahooquery and FinanceDataReader (and the HTTP stacks behind them) make up most of the
+# start-up time, so they are imported on first use: a run only loads the libraries of the
+# markets it fetches. Tests and the benchmark replace the modules by assigning yq / fdr.
+yq = None
+fdr = None
+
+
+def yahooquery():
+    global yq
+    if yq is None:
+        import yahooquery as module
+        yq = module
+    return yq
+
+
+def finance_datareader():
+    global fdr
+    if fdr is None:
+        import FinanceDataReader as module
+        fdr = module
+    return fdr
+
+
+# Years of history behind a yahooquery period string
+PERIOD_YEARS = {'1y': 1, '2y': 2, '5y': 5, '10y': 10, '20y': 20}
+
+
+def _period_start(period):
+    years = PERIOD_YEARS.get(period, 1)
+    return (pd.Timestamp(datetime.now()) - pd.DateOffset(years=years)).strftime('%Y-%m-%d')
+
+
+def _to_weekly(df):
+    # Daily bars to Yahoo-style weekly bars, labelled with the Monday of their week
+    weekly = df.resample('W-MON', label='left', closed='left').agg(
+        {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'})
+    weekly = weekly.dropna(subset=['close'])
+    weekly['adjclose'] = weekly['close']
+    return weekly
+
+
+# Fundamentals read from Yahoo's fundamentals time series instead of quoteSummary, handed out
+# like a module {'history': [{'asOfDate', <type>}, ...]}: module -> (yahooquery type, frequency).
+# earningsHistory stops at four quarters; the quarterly series reaches further back.
+TIME_SERIES = {'quarterlyEps': ('DilutedEPS', 'q')}
+
+
+def time_series_modules(frame, module):
+    # yahooquery get_financial_data frame (index: symbol) -> {symbol: {'history': [...]}}
+    kind = TIME_SERIES[module][0]
+    if not isinstance(frame, pd.DataFrame) or frame.empty or kind not in frame.columns:
+        return {}
+    out = {}
+    for symbol, row in frame.iterrows():
+        if pd.isna(row[kind]):
+            continue
+        out.setdefault(symbol, {'history': []})['history'].append(
+            {'asOfDate': str(row['asOfDate'])[:10], kind: float(row[kind])})
+    return out
+
+
+def _stack(frames):
+    # {symbol: frame} -> (symbol, date) frame like yahooquery's history
+    frames = {s: df for s, df in frames.items() if df is not None and not df.empty}
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, names=['symbol', 'date'])
+
+
+class YahooQueryProvider:
+    # Batched Yahoo requests through yahooquery: one request per batch and kind, paced by
+    # the shared rate limiter
+    name = 'yahoo'
+    serves = ('history', 'quotes', 'fundamentals')
+
+    def __init__(self, limiter, modules):
+        self.limiter = limiter
+        self.modules = modules
+
+    def history(self, symbols, interval, period=None, start=None):
+        self.limiter.acquire()
+        t = yahooquery().Ticker(symbols)
+        if start:
+            h = t.history(start=start, interval=interval)
+        else:
+            h = t.history(period=period, interval=interval)
+        instrumentation.report.request(self.name, rows=len(h) if isinstance(h, pd.DataFrame) else 0)
+        return h
+
+    def quotes(self, symbols):
+        self.limiter.acquire()
+        raw = yahooquery().Ticker(symbols).quotes
+        instrumentation.report.request(self.name, rows=len(raw) if isinstance(raw, dict) else 0)
+        quotes = {}
+        if not isinstance(raw, dict):
+            return quotes
+        for symbol, quote in raw.items():
+            if not isinstance(quote, dict) or not quote.get('regularMarketPrice'):
+                continue
+            when = quote.get('regularMarketTime')
+            if isinstance(when, (int, float)):
+                when = pd.Timestamp(when, unit='s')
+            else:
+                when = pd.Timestamp(when) if when else pd.Timestamp(datetime.now())
+            if when.tzinfo is not None:
+                when = when.tz_localize(None)
+            quotes[symbol] = {'price': float(quote['regularMarketPrice']), 'time': when, 'market_cap': quote.get('marketCap') or 0}
+        return quotes
+
+    def fundamentals(self, symbols):
+        # One multi-module quoteSummary pass for the whole batch instead of one per property.
+        # Yahoo reports errors as strings (per ticker or per module), they all become {} here.
+        self.limiter.acquire()
+        t = yahooquery().Ticker(symbols)
+        raw = t.get_modules([m for m in self.modules if m not in TIME_SERIES])
+        instrumentation.report.request(self.name)
+        if not isinstance(raw, dict):
+            raw = {}
+        for module in (m for m in self.modules if m in TIME_SERIES):
+            kind, frequency = TIME_SERIES[module]
+            self.limiter.acquire()
+            series = time_series_modules(t.get_financial_data([kind], frequency=frequency, trailing=False), module)
+            instrumentation.report.request(self.name)
+            for symbol, value in series.items():
+                if isinstance(raw.get(symbol), dict):
+                    raw[symbol][module] = value
+        fundamentals = {}
+        for symbol in symbols:
+            modules = raw.get(symbol)
+            if not isinstance(modules, dict):
+                modules = {}
+            fundamentals[symbol] = {
+                module: modules.get(module) if isinstance(modules.get(module), dict) else {}
+                for module in self.modules
+            }
+        return fundamentals
+
+
+class YFinanceProvider:
+    # yfinance, as the old get_sp500_data.py used it. Optional: only imported when a route
+    # names it, and skipped with a message when the package is not installed.
+    name = 'yfinance'
+    serves = ('history', 'quotes')
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+
+    def _yf(self):
+        import yfinance
+        return yfinance
+
+    def history(self, symbols, interval, period=None, start=None):
+        yf = self._yf()
+        self.limiter.acquire()
+        raw = yf.download(list(symbols), start=start, period=None if start else period, interval=interval,
+                          group_by='ticker', auto_adjust=False, progress=False, threads=False)
+        frames = {}
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    continue
+                df = raw[symbol]
+            else:
+                df = raw
+            df = df.rename(columns=lambda c: str(c).lower().replace(' ', '')).dropna(subset=['close'])
+            frames[symbol] = df
+        h = _stack(frames)
+        instrumentation.report.request(self.name, rows=len(h))
+        return h
+
+    def quotes(self, symbols):
+        yf = self._yf()
+        quotes = {}
+        for symbol in symbols:
+            self.limiter.acquire()
+            try:
+                info = yf.Ticker(symbol).fast_info
+                price = info.get('lastPrice')
+                market_cap = info.get('marketCap')
+            except Exception as e:
+                print(f"[{symbol}] yfinance quote failed: {e}")
+                continue
+            instrumentation.report.request(self.name)
+            if price:
+                quotes[symbol] = {'price': float(price), 'time': pd.Timestamp(datetime.now()), 'market_cap': market_cap or 0}
+        return quotes
+
+
+# FinanceDataReader's KRX listing carries the last price and market cap of every KOSPI and
+# KOSDAQ share, so one download answers every Korean quote of the run
+KRX_LISTING_TTL_SECONDS = 600
+KRX_TIMEZONE = pytz.timezone('Asia/Seoul')
+_krx_listing = {'fetched': 0.0, 'frame': None}
+_krx_lock = threading.Lock()
+
+
+def _krx_code(symbol):
+    # 005930.KS / 035720.KQ -> 005930 / 035720
+    return str(symbol).split('.')[0]
+
+
+def _krx_session_time(now=None):
+    # Close of the latest KRX session that has started: before 09:00 (or at the weekend)
+    # the listing still shows the previous weekday
+    now = now or datetime.now(KRX_TIMEZONE)
+    session = now.replace(tzinfo=None)
+    if session.hour < 9:
+        session -= timedelta(days=1)
+    while session.weekday() >= 5:
+        session -= timedelta(days=1)
+    close = session.replace(hour=15, minute=30, second=0, microsecond=0)
+    return pd.Timestamp(min(close, now.replace(tzinfo=None)))
+
+
+class FinanceDataReaderProvider:
+    # Korean shares from the domestic sources behind FinanceDataReader: quotes from the bulk
+    # KRX listing, daily history per code (weekly bars are resampled from it)
+    name = 'fdr'
+    serves = ('history', 'quotes')
+
+    def _listing(self):
+        with _krx_lock:
+            if _krx_listing['frame'] is None or time.monotonic() - _krx_listing['fetched'] > KRX_LISTING_TTL_SECONDS:
+                df = finance_datareader().StockListing('KRX')
+                instrumentation.report.request(self.name, rows=len(df))
+                _krx_listing['frame'] = df.set_index('Code')
+                _krx_listing['fetched'] = time.monotonic()
+            return _krx_listing['frame']
+
+    def quotes(self, symbols):
+        listing = self._listing()
+        when = _krx_session_time()
+        quotes = {}
+        for symbol in symbols:
+            code = _krx_code(symbol)
+            if code not in listing.index:
+                continue
+            row = listing.loc[code]
+            price = pd.to_numeric(row.get('Close'), errors='coerce')
+            if pd.isna(price) or not price:
+                continue
+            market_cap = pd.to_numeric(row.get('Marcap'), errors='coerce')
+            quotes[symbol] = {'price': float(price), 'time': when, 'market_cap': 0 if pd.isna(market_cap) else float(market_cap)}
+        return quotes
+
+    def history(self, symbols, interval, period=None, start=None):
+        start = start or _period_start(period)
+        frames = {}
+        for symbol in symbols:
+            try:
+                df = finance_datareader().DataReader(_krx_code(symbol), start)
+            except Exception as e:
+                print(f"[{symbol}] FinanceDataReader history failed: {e}")
+                continue
+            instrumentation.report.request(self.name, rows=len(df))
+            if df is None or df.empty:
+                continue
+            df = df.rename(columns=str.lower)[['open', 'high', 'low', 'close', 'volume']]
+            df.index = pd.DatetimeIndex(df.index).tz_localize(None)
+            df = df.dropna(subset=['close'])
+            df['adjclose'] = df['close']
+            frames[symbol] = _to_weekly(df) if interval == '1wk' else df
+        return _stack(frames)
+
+
+def _empty(value):
+    return value is None or value == 0 or value == {} or (isinstance(value, float) and pd.isna(value))
+
+
+class Router:
+    # The provider chain of one market for every kind of request. Each provider only gets
+    # what the ones before it left missing: symbols without history, quote fields or
+    # fundamentals modules. A provider that fails altogether is skipped unless it is the
+    # last one, whose error goes to the caller (the scheduler retries / splits the chunk)
+    # with the provider's name as its `provider` attribute, for the run report.
+    def __init__(self, routes):
+        self.routes = routes
+
+    def _chain(self, kind):
+        return [p for p in self.routes.get(kind, []) if kind in p.serves]
+
+    def _call(self, provider, is_last, kind, *args, **kwargs):
+        try:
+            return getattr(provider, kind)(*args, **kwargs)
+        except ImportError as e:
+            print(f"Provider {provider.name} is not available ({e}), skipping it")
+        except Exception as e:
+            if is_last:
+                e.provider = provider.name
+                raise
+            print(f"Provider {provider.name} failed for {kind} ({e}), falling back")
+        instrumentation.report.provider_event(provider.name, 'errors')
+        return None
+
+    def history(self, symbols, interval, period=None, start=None):
+        chain = self._chain('history')
+        if len(chain) == 1:
+            return self._call(chain[0], True, 'history', list(symbols), interval, period=period, start=start)
+        # Providers index their bars differently (dates, timestamps), so the frames are
+        # normalised per symbol before they are stacked again
+        frames = {}
+        for n, provider in enumerate(chain):
+            missing = [s for s in symbols if s not in frames]
+            if not missing:
+                break
+            h = self._call(provider, n == len(chain) - 1, 'history', missing, interval, period=period, start=start)
+            frames.update(history_store.split_history(h))
+        return _stack(frames)
+
+    def quotes(self, symbols):
+        quotes = {}
+        chain = self._chain('quotes')
+        for n, provider in enumerate(chain):
+            missing = [s for s in symbols if s not in quotes or any(_empty(v) for v in quotes[s].values())]
+            if not missing:
+                break
+            for symbol, quote in (self._call(provider, n == len(chain) - 1, 'quotes', missing) or {}).items():
+                merged = quotes.setdefault(symbol, {})
+                for field, value in quote.items():
+                    if _empty(merged.get(field)):
+                        merged[field] = value
+        return {s: q for s, q in quotes.items() if not _empty(q.get('price'))}
+
+    def fundamentals(self, symbols):
+        fundamentals = {}
+        chain = self._chain('fundamentals')
+        for n, provider in enumerate(chain):
+            missing = [s for s in symbols if s not in fundamentals or any(_empty(m) for m in fundamentals[s].values())]
+            if not missing:
+                break
+            for symbol, modules in (self._call(provider, n == len(chain) - 1, 'fundamentals', missing) or {}).items():
+                merged = fundamentals.setdefault(symbol, {})
+                for module, value in modules.items():
+                    if _empty(merged.get(module)):
+                        merged[module] = value
+        return fundamentals
@@ -0,0 +1,136 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import instrumentation
+
+
+class TokenBucket:
+    # Classic token bucket shared by all worker threads: `rate` requests per second on
+    # average, with bursts of up to `capacity` requests.
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_for = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait_for)
+
+    def pause(self, seconds):
+        # Stop handing out tokens for a while (after the provider told us to slow down)
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+class AdaptiveChunkSize:
+    # Chunk size that halves after a throttled response and grows by a quarter while
+    # chunks come back faster than `target_seconds`.
+    def __init__(self, initial=50, minimum=10, maximum=200, target_seconds=10.0):
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.lock = threading.Lock()
+
+    def throttled(self):
+        with self.lock:
+            self.size = max(self.minimum, self.size // 2)
+
+    def record(self, elapsed, count):
+        with self.lock:
+            if count < self.size:
+                return  # tail chunk, says nothing about the current size
+            if elapsed < self.target_seconds:
+                self.size = min(self.maximum, self.size + max(1, self.size // 4))
+            elif elapsed > 2 * self.target_seconds:
+                self.size = max(self.minimum, self.size - max(1, self.size // 4))
+
+
+def is_throttled(error):
+    text = str(error)
+    return '429' in text or 'Too Many Requests' in text or 'rate limit' in text.lower()
+
+
+class ChunkScheduler:
+    # Runs `work(market, items)` over chunks of every market's item list concurrently.
+    # Chunks are cut lazily so each one uses the current adaptive size, and markets are
+    # interleaved round-robin so no market waits for another to finish.
+    def __init__(self, max_workers, limiter, sizer, max_requeues=3, throttle_pause=30.0):
+        self.max_workers = max_workers
+        self.limiter = limiter
+        self.sizer = sizer
+        self.max_requeues = max_requeues
+        self.throttle_pause = throttle_pause
+
+    def _timed(self, work, market, chunk):
+        started = time.monotonic()
+        try:
+            value = work(market, chunk)
+        except Exception:
+            instrumentation.report.chunk(market, len(chunk), time.monotonic() - started, False)
+            raise
+        elapsed = time.monotonic() - started
+        instrumentation.report.chunk(market, len(chunk), elapsed, True)
+        return value, elapsed
+
+    def run(self, queues, work, on_result):
+        pending = {market: deque(items) for market, items in queues.items()}
+        totals = {market: len(items) for market, items in queues.items()}
+        done_counts = {market: 0 for market in queues}
+        requeues = {}
+        order = deque(queues)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while True:
+                while len(running) < self.max_workers and any(pending.values()):
+                    order.rotate(-1)
+                    market = order[0]
+                    if not pending[market]:
+                        continue
+                    size = min(self.sizer.size, len(pending[market]))
+                    chunk = [pending[market].popleft() for _ in range(size)]
+                    future = executor.submit(self._timed, work, market, chunk)
+                    running[future] = (market, chunk)
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    market, chunk = running.pop(future)
+                    try:
+                        value, elapsed = future.result()
+                    except Exception as e:
+                        key = (market, chunk[0][0])
+                        if is_throttled(e) and requeues.get(key, 0) < self.max_requeues:
+                            requeues[key] = requeues.get(key, 0) + 1
+                            print(f"[{market}] Throttled, retrying {len(chunk)} tickers with smaller chunks")
+                            instrumentation.report.provider_event(getattr(e, 'provider', 'unknown'), 'throttled')
+                            self.sizer.throttled()
+                            self.limiter.pause(self.throttle_pause * random.uniform(0.5, 1.0))
+                            pending[market].extendleft(reversed(chunk))
+                            continue
+                        print(f"[{market}] Error fetching chunk starting at {chunk[0][0]}: {e}")
+                        done_counts[market] += len(chunk)
+                        continue
+
+                    self.sizer.record(elapsed, len(chunk))
+                    on_result(market, chunk, value)
+                    done_counts[market] += len(chunk)
+                    print(f"[{market}] Processed {done_counts[market]}/{totals[market]} ({len(chunk)} tickers in {elapsed:.1f}s, next chunk {self.sizer.size})")
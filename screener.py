@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+
+# Screens are evaluated here, once per published snapshot, as boolean masks over a whole
+# market table; the browser only renders the results.
+#
+# A rule is a dict naming a record field and the range it must be in:
+#   {'field': 'price_to_ath', 'min': 0.80}
+#   {'field': 'days_since_ath', 'min': 40, 'max': 365}
+#   {'field': 'eps_q0', 'missing': True}
+#   {'field': 'name', 'contains': ['ADR', 'Depositary']}
+# combined with {'all': [...]}, {'any': [...]} and {'not': rule}. {'listed_in': 'SP500'} is
+# true for tickers of another market that the S&P 500 table lists too, and a 'markets' key
+# limits a rule to those markets (it is false everywhere else). Missing values (None) fail
+# every comparison; 'missing': True matches exactly the records without a value.
+
+# Cells shown green in the table; their count is the default table order
+GREEN_CELLS = [
+    ('price_to_ath', {'field': 'price_to_ath', 'min': 0.80}),
+    ('days_since_ath', {'field': 'days_since_ath', 'min': 40, 'max': 365}),
+    ('ma_20_spread', {'field': 'ma_20_spread', 'min': -0.03, 'max': 0.03}),
+    ('ma_50_spread', {'field': 'ma_50_spread', 'min': -0.03, 'max': 0.03}),
+    ('ma_20_50_spread', {'field': 'ma_20_50_spread', 'min': -0.03, 'max': 0.03}),
+    ('eps_q0', {'field': 'eps_q0', 'min': 20}),
+    ('eps_q1', {'field': 'eps_q1', 'min': 20}),
+    ('eps_q2', {'field': 'eps_q2', 'min': 20}),
+    ('eps_q3', {'field': 'eps_q3', 'min': 20}),
+    ('per', {'field': 'per', 'min': 15, 'max': 50}),
+    ('roe', {'field': 'roe', 'min': 20}),
+]
+
+# A screen passes the records matching all of its `rules` and none of its `exclude` rules,
+# and publishes the `top` of them by `sort` (descending) with the `fields` its cards show
+SCREENS = {
+    'recommended': {
+        'label': '추천 종목',
+        'rules': [
+            ('correction', {'field': 'correction_ratio', 'max': 0.40}),
+            ('near_ath', {'field': 'price_to_ath', 'min': 0.80}),
+            ('ath_age', {'field': 'days_since_ath', 'min': 40, 'max': 365}),
+            # Both of the last two quarters grew 20%+, or neither has EPS growth yet (no
+            # year-ago quarter on Yahoo); one of each does not pass
+            ('eps', {'any': [
+                {'all': [{'field': 'eps_q0', 'missing': True}, {'field': 'eps_q1', 'missing': True}]},
+                {'all': [{'field': 'eps_q0', 'min': 20}, {'field': 'eps_q1', 'min': 20}]},
+            ]}),
+            ('ma_support', {'any': [
+                {'field': 'ma_20_spread', 'min': -0.03, 'max': 0.03},
+                {'field': 'ma_50_spread', 'min': -0.03, 'max': 0.03},
+            ]}),
+        ],
+        'exclude': [
+            ('in_sp500', {'listed_in': 'SP500'}),
+            ('adr', {'markets': ['NASDAQ', 'NYSE'], 'field': 'name', 'contains': ['ADR', 'Depositary']}),
+        ],
+        'sort': 'price_to_ath',
+        'top': 6,
+        'fields': ['ticker', 'name', 'price_to_ath', 'ma_20_50_spread'],
+    },
+}
+
+
+def flag_names():
+    # Bit order of the `flags` field: green cells, then every rule of every screen
+    names = [f"green.{name}" for name, _ in GREEN_CELLS]
+    for screen, definition in SCREENS.items():
+        names += [f"{screen}.{name}" for name, _ in definition['rules'] + definition.get('exclude', [])]
+    return names
+
+
+def describe():
+    # Screen metadata for the manifest
+    return {
+        "flags": flag_names(),
+        "screens": {screen: {"label": d['label'], "top": d['top']} for screen, d in SCREENS.items()},
+    }
+
+
+def _mask(rule, table, market, listed):
+    n = len(table)
+    if 'markets' in rule and market not in rule['markets']:
+        return np.zeros(n, dtype=bool)
+    if 'all' in rule:
+        return np.logical_and.reduce([_mask(r, table, market, listed) for r in rule['all']] + [np.ones(n, dtype=bool)])
+    if 'any' in rule:
+        return np.logical_or.reduce([_mask(r, table, market, listed) for r in rule['any']] + [np.zeros(n, dtype=bool)])
+    if 'not' in rule:
+        return ~_mask(rule['not'], table, market, listed)
+    if 'listed_in' in rule:
+        if market == rule['listed_in']:
+            return np.zeros(n, dtype=bool)
+        return table['ticker'].isin(listed.get(rule['listed_in'], ())).to_numpy()
+
+    column = table[rule['field']] if rule['field'] in table.columns else pd.Series([None] * n, dtype=object)
+    if 'contains' in rule:
+        text = column.fillna('').astype(str)
+        return np.logical_or.reduce([text.str.contains(s, regex=False).to_numpy() for s in rule['contains']] + [np.zeros(n, dtype=bool)])
+    values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+    if rule.get('missing'):
+        return np.isnan(values)
+    mask = ~np.isnan(values)
+    with np.errstate(invalid='ignore'):
+        if 'min' in rule:
+            mask &= values >= rule['min']
+        if 'max' in rule:
+            mask &= values <= rule['max']
+        if 'equals' in rule:
+            mask &= values == rule['equals']
+    return mask
+
+
+# Add `green_cells` and `flags` (bitmask in flag_names() order) to the records of one market
+# and return its recommendations {screen: [top records]}. `listed` maps market -> tickers
+# for the 'listed_in' rules.
+def screen_market(market, records, listed):
+    if not records:
+        return {screen: [] for screen in SCREENS}
+    table = pd.DataFrame.from_records(records)
+
+    masks = [_mask(rule, table, market, listed) for _, rule in GREEN_CELLS]
+    green_cells = np.sum(masks, axis=0)
+    passed = {}
+    for screen, definition in SCREENS.items():
+        rule_masks = [_mask(rule, table, market, listed) for _, rule in definition['rules']]
+        exclude_masks = [_mask(rule, table, market, listed) for _, rule in definition.get('exclude', [])]
+        masks += rule_masks + exclude_masks
+        passed[screen] = np.logical_and.reduce(rule_masks + [~m for m in exclude_masks] + [np.ones(len(table), dtype=bool)])
+
+    flags = np.zeros(len(table), dtype=np.int64)
+    for bit, mask in enumerate(masks):
+        flags |= mask.astype(np.int64) << bit
+    for record, count, flag in zip(records, green_cells, flags):
+        record['green_cells'] = int(count)
+        record['flags'] = int(flag)
+
+    recommendations = {}
+    for screen, definition in SCREENS.items():
+        picked = table[passed[screen]]
+        order = picked[definition['sort']].fillna(0).clip(lower=0).sort_values(ascending=False, kind='stable')
+        recommendations[screen] = [{f: records[i].get(f) for f in definition['fields']} for i in order.index[:definition['top']]]
+    return recommendations
+
+
+def screen_markets(market_data, listed=None):
+    # screen_market for every market of {market: records}; `listed` adds the tickers of
+    # markets that are not part of `market_data`
+    listed = dict(listed or {})
+    listed.update({market: {r['ticker'] for r in records} for market, records in market_data.items()})
+    return {market: screen_market(market, records, listed) for market, records in market_data.items()}
@@ -1,14 +1,307 @@
-// We are now using the actual data from market_data.js which defines `marketData`
-const mockMarketData = typeof marketData !== 'undefined' ? marketData : { "SP500": [], "NASDAQ": [], "KOSPI": [] };
+// Market data is published as one columnar file per market (data/SP500.json, ...).
+// Only the active market is fetched up front, the others when they are needed.
+// The manifest decides which markets exist (the full-universe mode adds NYSE and KOSDAQ).
+let MARKETS = ['SP500', 'NASDAQ', 'KOSPI'];
+const marketLabels = { SP500: 'S&P 500', NASDAQ: 'NASDAQ', KOSPI: 'KOSPI' };
+const marketData = {};
+const marketIndexes = {};
+const marketRequests = {};
+const partialMarkets = new Set();
 let currentMarket = 'SP500';
-let displayData = [...(mockMarketData[currentMarket] || [])];
+let displayData = [];
+
+// Turn { keys: [...], columns: [[...], ...] } back into an array of stock objects
+function decodeColumnar(payload) {
+    const { keys, columns } = payload;
+    const count = columns.length ? columns[0].length : 0;
+    const rows = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const row = {};
+        for (let k = 0; k < keys.length; k++) {
+            row[keys[k]] = columns[k][i];
+        }
+        rows[i] = row;
+    }
+    return rows;
+}
+
+// Inverse of decodeColumnar
+function encodeColumnar(rows, keys) {
+    return { keys, columns: keys.map(key => rows.map(row => (row[key] === undefined ? null : row[key]))) };
+}
+
+// --- Snapshot cache + deltas ---
+// data/manifest.json names the current version of every market and the recent deltas.
+// A snapshot cached in the browser (Cache API) is brought up to date with those deltas;
+// the full file is only downloaded when the cached base is missing or too old.
+const DATA_CACHE_NAME = 'stockmap-market-data-v1';
+let manifestRequest = null;
+
+function fetchJson(url, options) {
+    return fetch(url, options).then(resp => {
+        if (!resp.ok) throw new Error(`${resp.status} ${resp.statusText}`);
+        return resp.json();
+    });
+}
+
+function loadManifest() {
+    if (!manifestRequest) {
+        manifestRequest = fetchJson('data/manifest.json', { cache: 'no-cache' })
+            .then(manifest => {
+                if (manifest && manifest.markets && Object.keys(manifest.markets).length) {
+                    MARKETS = Object.keys(manifest.markets);
+                    MARKETS.forEach(market => {
+                        if (manifest.markets[market].label) marketLabels[market] = manifest.markets[market].label;
+                    });
+                }
+                return manifest;
+            })
+            .catch(err => {
+                console.warn('Manifest unavailable, loading full snapshots:', err);
+                return null;
+            });
+    }
+    return manifestRequest;
+}
+
+function openDataCache() {
+    if (!('caches' in window)) return Promise.resolve(null);
+    return caches.open(DATA_CACHE_NAME).catch(() => null);
+}
+
+// Deltas leading from `version` to the newest one, or null if the chain is broken
+function deltaChain(deltas, version) {
+    const start = deltas.findIndex(d => d.from === version);
+    if (start === -1) return null;
+    const chain = deltas.slice(start);
+    for (let i = 1; i < chain.length; i++) {
+        if (chain[i].from !== chain[i - 1].to) return null;
+    }
+    return chain;
+}
+
+// Ascending order of a text column carried over to the new record indices. Only used when
+// no ticker or name changed: the rows keep their relative order, equal values are ordered
+// by their new index like artifact.sort_orders does.
+function carryOrder(ascending, oldRows, newIndex, column) {
+    let rank = 0;
+    const ranked = ascending.map((i, position) => {
+        if (position > 0 && oldRows[i][column] !== oldRows[ascending[position - 1]][column]) rank = position;
+        return [rank, newIndex.get(oldRows[i].ticker)];
+    });
+    return ranked.sort((a, b) => a[0] - b[0] || a[1] - b[1]).map(([, i]) => i);
+}
+
+// Ascending order of a numeric column like artifact.sort_orders: null sorts below every
+// number, ties keep the record order
+function numericOrder(rows, column) {
+    const value = i => (rows[i][column] === undefined || rows[i][column] === null ? -Infinity : rows[i][column]);
+    return rows.map((_, i) => i).sort((a, b) => value(a) - value(b) || a - b);
+}
+
+function applyDelta(payload, delta) {
+    const oldRows = decodeColumnar(payload);
+    const byTicker = new Map(oldRows.map(row => [row.ticker, { ...row }]));
+    delta.removed.forEach(ticker => byTicker.delete(ticker));
+    Object.entries(delta.changed).forEach(([ticker, fields]) => {
+        const row = byTicker.get(ticker);
+        if (row) Object.assign(row, fields);
+    });
+    delta.added.forEach(row => byTicker.set(row.ticker, row));
+    const rows = delta.order.map(ticker => byTicker.get(ticker)).filter(Boolean);
+    const next = { ...payload, ...encodeColumnar(rows, delta.keys), version: delta.to, count: rows.length };
+    // Sort orders and the search index only come with deltas that add, remove or rename
+    // tickers; otherwise the cached ones are carried over to the new record order
+    if (delta.orders && delta.search) return { ...next, orders: delta.orders, search: delta.search };
+    if (!payload.orders || !payload.search) return next;
+    const newIndex = new Map(rows.map((row, i) => [row.ticker, i]));
+    const orders = {};
+    Object.entries(payload.orders).forEach(([column, ascending]) => {
+        orders[column] = rows.some(row => typeof row[column] === 'string')
+            ? carryOrder(ascending, oldRows, newIndex, column)
+            : numericOrder(rows, column);
+    });
+    const carrySearch = index => ({ keys: index.keys, rows: index.rows.map(i => newIndex.get(oldRows[i].ticker)) });
+    return { ...next, orders, search: { ticker: carrySearch(payload.search.ticker), name: carrySearch(payload.search.name) } };
+}
+
+// Large markets are sharded: the snapshot carries the first (top ranked) shard inline and
+// lists the others, which are downloaded in parallel and appended column by column
+async function loadShards(payload, onPartial) {
+    if (!payload.shards || !payload.shards.length) return payload;
+    if (onPartial) onPartial(payload);
+    const shards = await Promise.all(payload.shards.map(file => fetchJson(`data/${file}`)));
+    const columns = payload.columns.map((column, k) => column.concat(...shards.map(shard => shard.columns[k])));
+    const { shards: _, ...rest } = payload;
+    return { ...rest, columns };
+}
+
+async function loadSnapshot(market, onPartial) {
+    const cacheKey = `data/${market}.json`;
+    const [manifest, cache] = await Promise.all([loadManifest(), openDataCache()]);
+    const entry = manifest && manifest.markets ? manifest.markets[market] : null;
+
+    if (entry && cache) {
+        try {
+            const hit = await cache.match(cacheKey);
+            let payload = hit ? await hit.json() : null;
+            if (payload && payload.version === entry.version) return payload;
+
+            const chain = payload ? deltaChain(entry.deltas || [], payload.version) : null;
+            if (chain) {
+                for (const step of chain) {
+                    payload = applyDelta(payload, await fetchJson(`data/${step.file}`));
+                }
+                if (payload.version === entry.version && payload.count === entry.count) {
+                    await cache.put(cacheKey, new Response(JSON.stringify(payload)));
+                    return payload;
+                }
+            }
+        } catch (err) {
+            console.warn(`Could not update cached ${market} data, downloading the snapshot:`, err);
+        }
+    }
+
+    const payload = await loadShards(await fetchJson(entry ? `${cacheKey}?v=${entry.version}` : cacheKey), onPartial);
+    if (cache) {
+        cache.put(cacheKey, new Response(JSON.stringify(payload))).catch(() => {});
+    }
+    return payload;
+}
+
+// The snapshot with the latest intraday price refresh on top (artifact.publish_intraday).
+// The refresh is rewritten every few minutes, so it is applied on every load, never cached.
+async function loadMarketPayload(market, onPartial) {
+    const [payload, manifest] = await Promise.all([loadSnapshot(market, onPartial), loadManifest()]);
+    const entry = manifest && manifest.markets ? manifest.markets[market] : null;
+    const intraday = entry ? entry.intraday : null;
+    if (!intraday || intraday.from !== payload.version) return payload;
+    try {
+        return applyDelta(payload, await fetchJson(`data/${intraday.file}?v=${intraday.to}`));
+    } catch (err) {
+        console.warn(`Could not load the intraday ${market} prices, showing the last snapshot:`, err);
+        return payload;
+    }
+}
+
+// Fetch a market once; concurrent callers share the same request. While the shards of a
+// large market are still downloading, marketData holds its first shard and a
+// 'marketloaded' event announces the complete data.
+function loadMarket(market) {
+    if (!marketRequests[market]) {
+        const onPartial = payload => {
+            marketData[market] = decodeColumnar(payload);
+            indexPrices(market);
+            delete marketIndexes[market]; // they cover all shards
+            partialMarkets.add(market);
+            document.dispatchEvent(new CustomEvent('marketpartial', { detail: market }));
+        };
+        marketRequests[market] = loadMarketPayload(market, onPartial)
+            .then(payload => {
+                marketData[market] = decodeColumnar(payload);
+                indexPrices(market);
+                if (payload.orders && payload.search) {
+                    marketIndexes[market] = { orders: payload.orders, search: payload.search, descending: {} };
+                }
+                if (partialMarkets.delete(market)) {
+                    document.dispatchEvent(new CustomEvent('marketloaded', { detail: market }));
+                }
+                return marketData[market];
+            })
+            .catch(err => {
+                console.error(`Failed to load ${market} data:`, err);
+                delete marketRequests[market];
+                marketData[market] = marketData[market] || [];
+                return marketData[market];
+            });
+    }
+    return marketRequests[market];
+}
+
+function loadAllMarkets() {
+    return loadManifest().then(() => Promise.all(MARKETS.map(loadMarket)));
+}
+// --- Precomputed sort orders and search index ---
+// Every market file lists, per sortable column, the record indices in ascending order and
+// a sorted prefix index over tickers and names (artifact.py), so switching the order is an
+// index lookup and a search is a binary search. Without them (a partially loaded market,
+// an older snapshot) the table falls back to sorting and scanning.
+
+// Same as artifact.normalize_search: NFKC, lower case, letters and digits only
+function normalizeSearch(text) {
+    return (text || '').normalize('NFKC').toLowerCase().replace(/[^\p{L}\p{N}]/gu, '');
+}
+
+// Descending order from the ascending one; rows with equal values keep the published order
+function descendingOrder(ascending, rows, column) {
+    const descending = [];
+    let end = ascending.length;
+    while (end > 0) {
+        let start = end - 1;
+        const value = rows[ascending[start]][column];
+        while (start > 0) {
+            const other = rows[ascending[start - 1]][column];
+            if (!(other === value || (other == null && value == null))) break;
+            start--;
+        }
+        for (let i = start; i < end; i++) descending.push(ascending[i]);
+        end = start;
+    }
+    return descending;
+}
+
+// Rows of a market in the order of `column`, or null when there is no precomputed order
+function orderedRows(market, column, order) {
+    const rows = marketData[market] || [];
+    const indexes = marketIndexes[market];
+    const ascending = indexes ? indexes.orders[column] : null;
+    if (!ascending || ascending.length !== rows.length) return null;
+    if (order === 'asc') return ascending.map(i => rows[i]);
+    if (!indexes.descending[column]) indexes.descending[column] = descendingOrder(ascending, rows, column);
+    return indexes.descending[column].map(i => rows[i]);
+}
+
+// Record indices whose key in a prefix index ({ keys, rows }, keys sorted) starts with `key`
+function prefixMatches(index, key) {
+    if (!index || !key) return [];
+    let lo = 0;
+    let hi = index.keys.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (index.keys[mid] < key) lo = mid + 1;
+        else hi = mid;
+    }
+    const matches = [];
+    for (let i = lo; i < index.keys.length && index.keys[i].startsWith(key); i++) {
+        matches.push(index.rows[i]);
+    }
+    return matches;
+}
+
+// Table position of the match shown highest in the current order, -1 if there is none
+function firstShownMatch(market, matches) {
+    const rows = marketData[market] || [];
+    let best = -1;
+    matches.forEach(i => {
+        const position = rows[i] ? tableView.tickerIndex.get(rows[i].ticker.toUpperCase()) : undefined;
+        if (position !== undefined && (best < 0 || position < best)) best = position;
+    });
+    return best;
+}
+
 let currentSortColumn = null;
 let currentSortOrder = null; // 'desc', 'asc', or null
 
 // Function to sort data
 function sortData(column, order) {
     if (order === null) {
-        displayData = [...(mockMarketData[currentMarket] || [])];
+        displayData = [...(marketData[currentMarket] || [])];
+        return;
+    }
+
+    const ordered = orderedRows(currentMarket, column, order);
+    if (ordered) {
+        displayData = ordered;
         return;
     }
 
@@ -64,31 +357,203 @@ function getMaSpreadClass(val) {
 }
 
 
-// Function to calculate how many green cells a stock has
-function getGreenCellCount(stock) {
-    let count = 0;
-    if (getPriceToAthClass(stock.price_to_ath)) count++;
-    if (getDaysSinceAthClass(stock.days_since_ath)) count++;
-    if (getMaSpreadClass(stock.ma_20_spread)) count++;
-    if (getMaSpreadClass(stock.ma_50_spread)) count++;
-    if (getMaSpreadClass(stock.ma_20_50_spread)) count++;
-    if (getEpsClass(stock.eps_q0)) count++;
-    if (getEpsClass(stock.eps_q1)) count++;
-    if (getEpsClass(stock.eps_q2)) count++;
-    if (getEpsClass(stock.eps_q3)) count++;
-    if (getPerClass(stock.per) === 'bg-lightgreen') count++;
-    if (getRoeClass(stock.roe)) count++;
-    return count;
+// --- Trade journal ---
+// Open positions (keyed by ticker) and closed trades (keyed by id) are IndexedDB records, so
+// a change writes the rows it touches instead of re-serialising the whole journal. Chart
+// attachments are blobs in a store of their own; buyDetails/sellDetails only keep their
+// chartId. The journal is read once into `journal` and every form and table works on that
+// cache. The arrays of older versions (localStorage 'stockTrades' / 'stockHistory') are
+// moved over the first time the journal opens; without IndexedDB they stay the storage.
+const JOURNAL_DB_NAME = 'stockmap-journal';
+const JOURNAL_DB_VERSION = 1;
+const LEGACY_TRADES_KEY = 'stockTrades';
+const LEGACY_HISTORY_KEY = 'stockHistory';
+const journal = { trades: new Map(), history: new Map(), chartUrls: new Map() };
+let journalDb = null;
+let journalRequest = null;
+let chartSequence = 0;
+
+// Current price of every loaded ticker, for valuing the holdings
+const tickerPrices = new Map();
+
+function indexPrices(market) {
+    (marketData[market] || []).forEach(stock => {
+        if (stock.price) tickerPrices.set(stock.ticker, stock.price);
+    });
+}
+
+function idbRequest(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function idbTransaction(tx) {
+    return new Promise((resolve, reject) => {
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error);
+    });
+}
+
+function openJournalDb() {
+    if (!('indexedDB' in window)) return Promise.resolve(null);
+    return new Promise(resolve => {
+        const request = indexedDB.open(JOURNAL_DB_NAME, JOURNAL_DB_VERSION);
+        request.onupgradeneeded = () => {
+            const db = request.result;
+            db.createObjectStore('trades', { keyPath: 'ticker' });
+            db.createObjectStore('history', { keyPath: 'id' });
+            db.createObjectStore('charts');
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => {
+            console.warn('IndexedDB unavailable, keeping the trade journal in localStorage:', request.error);
+            resolve(null);
+        };
+    });
+}
+
+// Chart attachment as a blob: images pasted as data: URLs keep their bytes, links are stored
+// as text/uri-list
+function chartBlob(chart) {
+    const match = /^data:([^;,]*)(;base64)?,(.*)$/s.exec(chart);
+    if (!match) return new Blob([chart], { type: 'text/uri-list' });
+    if (!match[2]) return new Blob([decodeURIComponent(match[3])], { type: match[1] });
+    const binary = atob(match[3]);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return new Blob([bytes], { type: match[1] });
+}
+
+// Fold the single reason/chart of old records into their details and move inline charts to
+// `charts` ([chartId, blob] pairs to write), leaving their ids in the details
+function detachCharts(record, fields, charts) {
+    let details = record[fields.details] || [];
+    if (details.length === 0 && (record[fields.reason] || record[fields.chart])) {
+        details = [{ date: record[fields.date], reason: record[fields.reason], chart: record[fields.chart] }];
+    }
+    const detached = { ...record };
+    delete detached[fields.chart];
+    detached[fields.details] = details.map(detail => {
+        if (!detail.chart) return detail;
+        const { chart, ...rest } = detail;
+        const chartId = `${Date.now().toString(36)}-${chartSequence++}`;
+        charts.push([chartId, chartBlob(chart)]);
+        if (!chart.startsWith('data:')) journal.chartUrls.set(chartId, chart);
+        return { ...rest, chartId };
+    });
+    return detached;
+}
+
+const TRADE_FIELDS = { details: 'buyDetails', date: 'date', reason: 'reason', chart: 'chart' };
+const HISTORY_FIELDS = { details: 'sellDetails', date: 'sellDate', reason: 'sellReason', chart: 'sellChart' };
+
+function chartIds(record, fields) {
+    return (record[fields.details] || []).map(d => d.chartId).filter(Boolean);
+}
+
+// Move the localStorage journal of older versions into the database, in one transaction
+async function migrateLegacyJournal(db) {
+    const trades = JSON.parse(localStorage.getItem(LEGACY_TRADES_KEY) || '[]');
+    const history = JSON.parse(localStorage.getItem(LEGACY_HISTORY_KEY) || '[]');
+    if (!trades.length && !history.length) return;
+    const charts = [];
+    const tx = db.transaction(['trades', 'history', 'charts'], 'readwrite');
+    trades.forEach(t => tx.objectStore('trades').put(detachCharts(t, TRADE_FIELDS, charts)));
+    history.forEach(h => tx.objectStore('history').put(detachCharts(h, HISTORY_FIELDS, charts)));
+    charts.forEach(([id, blob]) => tx.objectStore('charts').put(blob, id));
+    await idbTransaction(tx);
+    localStorage.removeItem(LEGACY_TRADES_KEY);
+    localStorage.removeItem(LEGACY_HISTORY_KEY);
+    console.log(`Moved ${trades.length} holdings and ${history.length} closed trades to IndexedDB`);
 }
 
-// Helper to get current price for a ticker
-function getCurrentPrice(ticker) {
-    if (typeof mockMarketData === 'undefined') return null;
-    for (const market in mockMarketData) {
-        const stock = mockMarketData[market].find(s => s.ticker === ticker);
-        if (stock) return stock.price;
+// Fill the journal cache once; every caller shares the same request
+function loadJournal() {
+    if (!journalRequest) {
+        journalRequest = (async () => {
+            let trades, history;
+            journalDb = await openJournalDb();
+            if (journalDb) {
+                try {
+                    await migrateLegacyJournal(journalDb);
+                    const tx = journalDb.transaction(['trades', 'history']);
+                    [trades, history] = await Promise.all([
+                        idbRequest(tx.objectStore('trades').getAll()),
+                        idbRequest(tx.objectStore('history').getAll()),
+                    ]);
+                } catch (err) {
+                    console.warn('Could not read the trade journal from IndexedDB, using localStorage:', err);
+                    journalDb = null;
+                }
+            }
+            if (!journalDb) {
+                trades = JSON.parse(localStorage.getItem(LEGACY_TRADES_KEY) || '[]');
+                history = JSON.parse(localStorage.getItem(LEGACY_HISTORY_KEY) || '[]');
+            }
+            // Holdings in the order they were first bought, closed trades in the order of their ids
+            trades.sort((a, b) => (a.id || 0) - (b.id || 0));
+            trades.forEach(t => journal.trades.set(t.ticker, t));
+            history.forEach(h => journal.history.set(h.id, h));
+            return journal;
+        })();
+    }
+    return journalRequest;
+}
+
+// Apply changes to the cache and persist them: `put` holds changed records, `remove` the
+// records to delete ({ trades: [...], history: [...] } each). Returns once they are stored.
+function updateJournal({ put = {}, remove = {} }) {
+    const charts = [];
+    const removedCharts = [];
+    const stored = {};
+    const stores = [['trades', TRADE_FIELDS, 'ticker'], ['history', HISTORY_FIELDS, 'id']];
+    stores.forEach(([store, fields, key]) => {
+        (remove[store] || []).forEach(record => {
+            journal[store].delete(record[key]);
+            removedCharts.push(...chartIds(record, fields));
+        });
+        stored[store] = (put[store] || []).map(record => {
+            const detached = journalDb ? detachCharts(record, fields, charts) : record;
+            journal[store].set(detached[key], detached);
+            return detached;
+        });
+    });
+
+    if (!journalDb) {
+        try {
+            localStorage.setItem(LEGACY_TRADES_KEY, JSON.stringify([...journal.trades.values()]));
+            localStorage.setItem(LEGACY_HISTORY_KEY, JSON.stringify([...journal.history.values()]));
+        } catch (err) {
+            return Promise.reject(err);
+        }
+        return Promise.resolve();
+    }
+    const tx = journalDb.transaction(['trades', 'history', 'charts'], 'readwrite');
+    stores.forEach(([store, , key]) => {
+        (remove[store] || []).forEach(record => tx.objectStore(store).delete(record[key]));
+        stored[store].forEach(record => tx.objectStore(store).put(record));
+    });
+    charts.forEach(([id, blob]) => tx.objectStore('charts').put(blob, id));
+    removedCharts.forEach(id => {
+        tx.objectStore('charts').delete(id);
+        journal.chartUrls.delete(id);
+    });
+    return idbTransaction(tx);
+}
+
+// Link or object URL of a detail's chart attachment
+async function detailChart(detail) {
+    if (!detail.chartId) return detail.chart;
+    if (!journal.chartUrls.has(detail.chartId) && journalDb) {
+        const blob = await idbRequest(journalDb.transaction('charts').objectStore('charts').get(detail.chartId));
+        if (blob) {
+            journal.chartUrls.set(detail.chartId, blob.type === 'text/uri-list' ? await blob.text() : URL.createObjectURL(blob));
+        }
     }
-    return null;
+    return journal.chartUrls.get(detail.chartId);
 }
 
 // Helper to format numbers and strings safely
@@ -107,95 +572,232 @@ function formatPercent(num) {
     return (num * 100).toFixed(2) + '%';
 }
 
-// Function to render table
-function renderTable(data) {
-    const tableBody = document.getElementById('stockTableBody');
-    tableBody.innerHTML = '';
+// --- Virtualized stock table ---
+// Only the rows in view (plus ROW_BUFFER above and below) exist in the DOM. Their <tr>
+// nodes are reused while scrolling and two spacer rows stand in for the rows that are
+// not rendered, so sorting, searching and switching tabs cost the same for 100 or 10k stocks.
+const ROW_BUFFER = 10;
+const DEFAULT_ROW_HEIGHT = 53;
+const tableView = { data: [], tickerIndex: new Map(), rowHeight: 0, first: -1, last: -1, rows: [], highlight: null, frame: null };
+const stockCellCache = new WeakMap();
+
+// EPS growth is null while Yahoo has no year-ago quarter for it
+function epsCell(val) {
+    return val !== undefined && val !== null ? [`${formatNumber(val)}%`, getEpsClass(val)] : ['-', ''];
+}
 
-    if (data.length === 0) {
-        tableBody.innerHTML = '<tr><td colspan="16" style="text-align:center; padding: 2rem;">검색 결과가 없습니다.</td></tr>';
-        return;
+function maSpreadCell(val) {
+    return val !== undefined && val !== null ? [formatPercent(val), getMaSpreadClass(val)] : ['-', ''];
+}
+
+// KOSPI (.KS) and KOSDAQ (.KQ) symbols trade in won
+function isKoreanTicker(ticker) {
+    return ticker.endsWith('.KS') || ticker.endsWith('.KQ');
+}
+
+// [text, class] of every column after the index column, computed once per stock record
+function stockCells(stock) {
+    let cells = stockCellCache.get(stock);
+    if (!cells) {
+        const currency = isKoreanTicker(stock.ticker) ? '₩' : '$';
+        const percentile = stock.ma_spread_percentile;
+        cells = [
+            [stock.ticker, 'sticky-col ticker'],
+            [stock.name, 'name'],
+            [currency + formatNumber(stock.ath), ''],
+            [currency + formatNumber(stock.lowest_after_ath), ''],
+            [currency + formatNumber(stock.price), ''],
+            [formatPercent(stock.correction_ratio), getCorrectionClass(stock.correction_ratio)],
+            [formatPercent(stock.price_to_ath), getPriceToAthClass(stock.price_to_ath)],
+            [`${formatNumber(stock.days_since_ath)}일`, getDaysSinceAthClass(stock.days_since_ath)],
+            maSpreadCell(stock.ma_20_spread),
+            maSpreadCell(stock.ma_50_spread),
+            maSpreadCell(stock.ma_20_50_spread),
+            [percentile !== undefined && percentile !== null && percentile >= 0 ? formatNumber(percentile) + '%' : '-', ''],
+            epsCell(stock.eps_q0),
+            epsCell(stock.eps_q1),
+            epsCell(stock.eps_q2),
+            epsCell(stock.eps_q3),
+            [formatNumber(stock.per), getPerClass(stock.per)],
+            [formatNumber(stock.roe), getRoeClass(stock.roe)],
+        ];
+        stockCellCache.set(stock, cells);
     }
+    return cells;
+}
+
+function tableColumnCount() {
+    return document.querySelectorAll('#stockTable thead th').length;
+}
+
+function createSpacerRow() {
+    const row = document.createElement('tr');
+    row.className = 'table-spacer';
+    const td = document.createElement('td');
+    td.colSpan = tableColumnCount();
+    td.style.padding = '0';
+    td.style.border = '0';
+    row.appendChild(td);
+    return row;
+}
+
+function createStockRow() {
+    const row = document.createElement('tr');
+    const columns = tableColumnCount();
+    for (let k = 0; k < columns; k++) row.appendChild(document.createElement('td'));
+    row.cells[0].className = 'sticky-col index-col';
+    row.cells[2].style.textAlign = 'left';
+    return row;
+}
 
-    data.forEach((stock, index) => {
-        const row = document.createElement('tr');
-        row.id = `row-${stock.ticker.toUpperCase()}`;
-
-        row.innerHTML = `
-            <td class="sticky-col index-col">${index + 1}</td>
-            <td class="sticky-col ticker">${stock.ticker}</td>
-            <td class="name" style="text-align: left;">${stock.name}</td>
-            <td>${currentMarket === 'KOSPI' ? '₩' : '$'}${formatNumber(stock.ath)}</td>
-            <td>${currentMarket === 'KOSPI' ? '₩' : '$'}${formatNumber(stock.lowest_after_ath)}</td>
-            <td>${currentMarket === 'KOSPI' ? '₩' : '$'}${formatNumber(stock.price)}</td>
-            <td class="${getCorrectionClass(stock.correction_ratio)}">${formatPercent(stock.correction_ratio)}</td>
-            <td class="${getPriceToAthClass(stock.price_to_ath)}">${formatPercent(stock.price_to_ath)}</td>
-            <td class="${getDaysSinceAthClass(stock.days_since_ath)}">${formatNumber(stock.days_since_ath)}일</td>
-            <td class="${stock.ma_20_spread !== undefined && stock.ma_20_spread !== null ? getMaSpreadClass(stock.ma_20_spread) : ''}">${stock.ma_20_spread !== undefined && stock.ma_20_spread !== null ? formatPercent(stock.ma_20_spread) : '-'}</td>
-            <td class="${stock.ma_50_spread !== undefined && stock.ma_50_spread !== null ? getMaSpreadClass(stock.ma_50_spread) : ''}">${stock.ma_50_spread !== undefined && stock.ma_50_spread !== null ? formatPercent(stock.ma_50_spread) : '-'}</td>
-            <td class="${stock.ma_20_50_spread !== undefined && stock.ma_20_50_spread !== null ? getMaSpreadClass(stock.ma_20_50_spread) : ''}">${stock.ma_20_50_spread !== undefined && stock.ma_20_50_spread !== null ? formatPercent(stock.ma_20_50_spread) : '-'}</td>
-            <td class="${getEpsClass(stock.eps_q0)}">${formatNumber(stock.eps_q0)}%</td>
-            <td class="${getEpsClass(stock.eps_q1)}">${formatNumber(stock.eps_q1)}%</td>
-            <td class="${getEpsClass(stock.eps_q2)}">${formatNumber(stock.eps_q2)}%</td>
-            <td class="${getEpsClass(stock.eps_q3)}">${formatNumber(stock.eps_q3)}%</td>
-            <td class="${getPerClass(stock.per)}">${formatNumber(stock.per)}</td>
-            <td class="${getRoeClass(stock.roe)}">${formatNumber(stock.roe)}</td>
-        `;
-
-        tableBody.appendChild(row);
+function fillStockRow(row, index) {
+    const stock = tableView.data[index];
+    row.id = `row-${stock.ticker.toUpperCase()}`;
+    row.cells[0].textContent = index + 1;
+    stockCells(stock).forEach(([text, className], k) => {
+        const td = row.cells[k + 1];
+        if (td.textContent !== String(text)) td.textContent = text;
+        if (td.className !== className) td.className = className;
     });
+    row.style.backgroundColor = stock.ticker === tableView.highlight ? 'rgba(88, 166, 255, 0.3)' : '';
 }
 
-// Function to find and render recommended stocks for all markets
-function renderRecommendations() {
-    const wrapper = document.getElementById('recommendationsWrapper');
-    wrapper.innerHTML = '';
+// Render the rows of tableView.data that are in view of the scroll container
+function renderVisibleRows(force) {
+    const tableBody = document.getElementById('stockTableBody');
+    const container = tableBody.closest('.table-container');
+    const data = tableView.data;
+    if (!data.length) return;
+
+    const rowHeight = tableView.rowHeight || DEFAULT_ROW_HEIGHT;
+    const headerHeight = document.querySelector('#stockTable thead').offsetHeight;
+    const visible = Math.max(Math.ceil(container.clientHeight / rowHeight), 20);
+    // A shorter table than before may still be scrolled past its end until the next layout
+    const maxFirst = Math.max(data.length - visible - 2 * ROW_BUFFER, 0);
+    const first = Math.min(Math.max(Math.floor((container.scrollTop - headerHeight) / rowHeight) - ROW_BUFFER, 0), maxFirst);
+    const last = Math.min(first + visible + 2 * ROW_BUFFER, data.length);
+    if (!force && first === tableView.first && last === tableView.last) return;
+    tableView.first = first;
+    tableView.last = last;
+
+    if (!tableBody.firstChild || !tableBody.firstChild.classList.contains('table-spacer')) {
+        tableBody.innerHTML = '';
+        tableView.rows = [];
+        tableBody.appendChild(createSpacerRow());
+        tableBody.appendChild(createSpacerRow());
+    }
+    const bottomSpacer = tableBody.lastChild;
+    while (tableView.rows.length < last - first) {
+        const row = createStockRow();
+        tableBody.insertBefore(row, bottomSpacer);
+        tableView.rows.push(row);
+    }
+    while (tableView.rows.length > last - first) {
+        tableView.rows.pop().remove();
+    }
+    tableView.rows.forEach((row, k) => fillStockRow(row, first + k));
 
-    const markets = [
-        { key: 'SP500', name: 'S&P 500' },
-        { key: 'NASDAQ', name: 'NASDAQ' },
-        { key: 'KOSPI', name: 'KOSPI' }
-    ];
+    // Rows are single-line (nowrap), so one measured row gives the height of all of them
+    if (!tableView.rowHeight && tableView.rows.length && tableView.rows[0].offsetHeight) {
+        tableView.rowHeight = tableView.rows[0].offsetHeight;
+        renderVisibleRows(true);
+        return;
+    }
+    tableBody.firstChild.firstChild.style.height = `${first * rowHeight}px`;
+    bottomSpacer.firstChild.style.height = `${(data.length - last) * rowHeight}px`;
+}
 
-    const sp500Tickers = new Set((mockMarketData['SP500'] || []).map(stock => stock.ticker));
+// Function to render table
+function renderTable(data) {
+    const tableBody = document.getElementById('stockTableBody');
+    tableView.data = data;
+    tableView.tickerIndex = new Map(data.map((stock, index) => [stock.ticker.toUpperCase(), index]));
 
-    markets.forEach(m => {
-        const marketItems = mockMarketData[m.key] || [];
+    if (data.length === 0) {
+        tableView.rows = [];
+        tableBody.innerHTML = `<tr><td colspan="${tableColumnCount()}" style="text-align:center; padding: 2rem;">검색 결과가 없습니다.</td></tr>`;
+        return;
+    }
+    renderVisibleRows(true);
+}
 
-        // Filter logic based on criteria:
-        const recommendedStocks = marketItems.filter(stock => {
-            // Exclude stocks that are already in S&P 500 if the current market is not S&P 500
-            if (m.key !== 'SP500' && sp500Tickers.has(stock.ticker)) {
-                return false;
-            }
+// Scroll the table (and the page) to a row of tableView.data and flash it
+function scrollToStockRow(index) {
+    const tableBody = document.getElementById('stockTableBody');
+    const container = tableBody.closest('.table-container');
+    const rowHeight = tableView.rowHeight || DEFAULT_ROW_HEIGHT;
+    const headerHeight = document.querySelector('#stockTable thead').offsetHeight;
+    const ticker = tableView.data[index].ticker;
+
+    container.scrollTop = headerHeight + index * rowHeight - (container.clientHeight - rowHeight) / 2;
+    tableView.highlight = ticker;
+    renderVisibleRows(true);
+
+    const targetRow = tableView.rows[index - tableView.first];
+    if (targetRow) {
+        // Scroll so the row is visible instantly (no smooth animation)
+        targetRow.scrollIntoView({ behavior: 'auto', block: 'center' });
+        targetRow.style.transition = 'background-color 0.5s';
+    }
+    setTimeout(() => {
+        if (tableView.highlight !== ticker) return;
+        tableView.highlight = null;
+        tableView.rows.forEach(row => { row.style.backgroundColor = ''; });
+    }, 1000);
+}
 
-            // Exclude ADRs (Depositary Receipts) if market is NASDAQ
-            if (m.key === 'NASDAQ' && stock.name && (stock.name.includes('ADR') || stock.name.includes('Depositary'))) {
-                return false;
-            }
+// --- Trend sparklines ---
+// data/trends.json (archive.write_trends) holds, per ticker, its last archived prices scaled
+// to 0-100, their change, and for how many days in a row it has traded near its ATH
+const SPARKLINE_WIDTH = 60;
+const SPARKLINE_HEIGHT = 18;
+let trendsRequest = null;
+
+function loadTrends(manifest) {
+    if (!trendsRequest) {
+        const file = manifest && manifest.exports ? manifest.exports.trends : null;
+        trendsRequest = !file ? Promise.resolve(null) : fetchJson(`data/${file}?v=${manifest.generated_at || ''}`)
+            .catch(err => {
+                console.warn('Trend summary unavailable:', err);
+                return null;
+            });
+    }
+    return trendsRequest;
+}
 
-            const cond1 = stock.correction_ratio <= 0.40;
-            const cond2 = stock.price_to_ath >= 0.80;
-            const cond3 = stock.days_since_ath >= 40 && stock.days_since_ath <= 365;
-            // Allow EPS check to pass if data is 0 (missing from Yahoo API) OR if it meets the >= 20 criterion.
-            const cond4 = (stock.eps_q0 === 0 && stock.eps_q1 === 0) || (stock.eps_q0 >= 20 && stock.eps_q1 >= 20);
+// SVG polyline of 0-100 points; days without a price (null) break the line
+function sparkline(trend) {
+    const { points } = trend;
+    const step = points.length > 1 ? SPARKLINE_WIDTH / (points.length - 1) : 0;
+    const segments = [[]];
+    points.forEach((point, i) => {
+        if (point === null) {
+            segments.push([]);
+            return;
+        }
+        const y = SPARKLINE_HEIGHT - 1 - (point / 100) * (SPARKLINE_HEIGHT - 2);
+        segments[segments.length - 1].push(`${(i * step).toFixed(1)},${y.toFixed(1)}`);
+    });
+    const lines = segments.filter(segment => segment.length > 1).map(segment => `<polyline points="${segment.join(' ')}"/>`);
+    const direction = trend.change === null || trend.change >= 0 ? 'positive' : 'negative';
+    return `<svg class="sparkline ${direction}" width="${SPARKLINE_WIDTH}" height="${SPARKLINE_HEIGHT}" viewBox="0 0 ${SPARKLINE_WIDTH} ${SPARKLINE_HEIGHT}">${lines.join('')}</svg>`;
+}
 
-            // Condition 5: Either MA20 spread or MA50 spread is in the 'green' range (-3% to +3%)
-            const isMa20Green = stock.ma_20_spread !== undefined && stock.ma_20_spread !== null && stock.ma_20_spread >= -0.03 && stock.ma_20_spread <= 0.03;
-            const isMa50Green = stock.ma_50_spread !== undefined && stock.ma_50_spread !== null && stock.ma_50_spread >= -0.03 && stock.ma_50_spread <= 0.03;
-            const cond5 = isMa20Green || isMa50Green;
+function trendTitle(trend, trends) {
+    return `최근 ${trends.dates.length}일 ${formatPercent(trend.change)} · 최고가 ${Math.round(trends.near_ath * 100)}% 이상 ${trend.near_ath_days}일째`;
+}
 
-            return cond1 && cond2 && cond3 && cond4 && cond5;
-        });
+// Render the recommendation row of every market. The screen is evaluated by the data
+// pipeline (screener.py) and its top picks are listed in the manifest.
+function renderRecommendations(manifest, trends) {
+    const wrapper = document.getElementById('recommendationsWrapper');
+    wrapper.innerHTML = '';
 
-        recommendedStocks.sort((a, b) => {
-            const valA = a.price_to_ath >= 0 ? a.price_to_ath : 0;
-            const valB = b.price_to_ath >= 0 ? b.price_to_ath : 0;
-            return valB - valA;
-        });
+    const markets = MARKETS.map(key => ({ key, name: marketLabels[key] || key }));
 
-        // Take only top 6 recommendations per market
-        const topRecommendations = recommendedStocks.slice(0, 6);
+    markets.forEach(m => {
+        const entry = manifest && manifest.markets ? manifest.markets[m.key] : null;
+        const topRecommendations = entry && entry.recommendations ? entry.recommendations.recommended || [] : [];
 
         // Create row container
         const rowDiv = document.createElement('div');
@@ -223,7 +825,9 @@ function renderRecommendations() {
             topRecommendations.forEach(stock => {
                 const card = document.createElement('div');
                 card.className = 'rec-card';
+                const trend = trends && trends.tickers ? trends.tickers[stock.ticker] : null;
                 card.innerHTML = `
+                    ${trend ? `<div class="rec-trend" title="${trendTitle(trend, trends)}">${sparkline(trend)}</div>` : ''}
                     <div class="rec-ticker">${stock.ticker}</div>
                     <div class="rec-name">${stock.name}</div>
                     <div class="rec-metrics">
@@ -252,6 +856,90 @@ function renderRecommendations() {
 }
 
 
+// --- CSV export ---
+// The CSV is built in a Web Worker and handed back as a Blob, which is downloaded through an
+// object URL. The worker runs the source of csvParts, so it needs no file of its own; where
+// workers are unavailable the same function runs on the page.
+const EXPORT_COLUMNS = [
+    ['ticker', '티커'], ['name', '기업명'], ['ath', '역사적 최고가'], ['lowest_after_ath', '최고가 이후 최저가'],
+    ['price', '오늘 종가'], ['correction_ratio', '조정 비율'], ['price_to_ath', '종가/최고가 비율'],
+    ['days_since_ath', '최고가 경과일'], ['ma_20_spread', '20 이평선 이격도'], ['ma_50_spread', '50 이평선 이격도'],
+    ['ma_20_50_spread', '20-50 이평선 이격도'], ['ma_spread_percentile', '이평선 수렴 백분위'],
+    ['eps_q0', 'EPS Q0'], ['eps_q1', 'EPS Q-1'], ['eps_q2', 'EPS Q-2'], ['eps_q3', 'EPS Q-3'],
+    ['per', 'PER'], ['roe', 'ROE'],
+];
+const MARKET_COLUMN = ['market', '시장'];
+const CSV_CHUNK_ROWS = 1000;
+const CSV_TYPE = 'text/csv;charset=utf-8';
+let exportWorker = null;
+let exportSequence = 0;
+
+// CSV text of `groups` ([{ market, rows }]) in chunks of `chunkRows` lines, with a UTF-8 BOM
+// for Excel. The 'market' column is filled from the group.
+function csvParts(columns, groups, chunkRows) {
+    const quote = value => {
+        if (value === null || value === undefined) return '';
+        const text = String(value);
+        return /[",\r\n]/.test(text) ? '"' + text.split('"').join('""') + '"' : text;
+    };
+    const parts = ['\uFEFF' + columns.map(c => quote(c[1])).join(',') + '\n'];
+    groups.forEach(({ market, rows }) => {
+        for (let start = 0; start < rows.length; start += chunkRows) {
+            const lines = [];
+            for (let i = start; i < Math.min(start + chunkRows, rows.length); i++) {
+                lines.push(columns.map(([key]) => quote(key === 'market' ? market : rows[i][key])).join(','));
+            }
+            parts.push(lines.join('\n') + '\n');
+        }
+    });
+    return parts;
+}
+
+function csvWorker() {
+    if (!exportWorker) {
+        const source = `${csvParts.toString()}
+onmessage = e => {
+    const { id, columns, groups } = e.data;
+    postMessage({ id, blob: new Blob(csvParts(columns, groups, ${CSV_CHUNK_ROWS}), { type: '${CSV_TYPE}' }) });
+};`;
+        exportWorker = new Worker(URL.createObjectURL(new Blob([source], { type: 'text/javascript' })));
+    }
+    return exportWorker;
+}
+
+function exportCsv(columns, groups) {
+    const onPage = () => new Blob(csvParts(columns, groups, CSV_CHUNK_ROWS), { type: CSV_TYPE });
+    return new Promise((resolve, reject) => {
+        const worker = csvWorker();
+        const id = ++exportSequence;
+        const onMessage = e => {
+            if (e.data.id !== id) return;
+            worker.removeEventListener('message', onMessage);
+            worker.removeEventListener('error', reject);
+            resolve(e.data.blob);
+        };
+        worker.addEventListener('message', onMessage);
+        worker.addEventListener('error', reject);
+        worker.postMessage({ id, columns, groups });
+    }).catch(err => {
+        console.warn('CSV worker unavailable, exporting on the page:', err);
+        exportWorker = null;
+        return onPage();
+    });
+}
+
+function downloadBlob(blob, fileName) {
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement("a");
+    link.href = url;
+    link.download = fileName;
+    document.body.appendChild(link); // Required for Firefox
+    link.click();
+    document.body.removeChild(link);
+    setTimeout(() => URL.revokeObjectURL(url), 0);
+}
+
+
 // Initialize
 document.addEventListener('DOMContentLoaded', () => {
     // --- View Switching ---
@@ -274,7 +962,8 @@ document.addEventListener('DOMContentLoaded', () => {
                 fundermentalsView.style.display = 'none';
                 tradeHistoryView.style.display = 'block';
                 headerContent.style.display = 'none';
-                renderTradeHistory();
+                // Holdings are valued with current prices from every market
+                Promise.all([loadAllMarkets(), loadJournal()]).then(renderTradeHistory);
             }
         });
     });
@@ -362,7 +1051,7 @@ document.addEventListener('DOMContentLoaded', () => {
     });
 
     // Handle trade form submission
-    tradeForm.onsubmit = (e) => {
+    tradeForm.onsubmit = async (e) => {
         e.preventDefault();
         const tradeData = {
             ticker: modalTicker.value,
@@ -374,12 +1063,12 @@ document.addEventListener('DOMContentLoaded', () => {
             id: Date.now()
         };
 
-        // Save to localStorage with averaging logic
-        let trades = JSON.parse(localStorage.getItem('stockTrades') || '[]');
-        const existingTradeIndex = trades.findIndex(t => t.ticker === tradeData.ticker);
+        // Save with averaging logic
+        await loadJournal();
+        const existing = journal.trades.get(tradeData.ticker);
+        let saved;
 
-        if (existingTradeIndex !== -1) {
-            const existing = trades[existingTradeIndex];
+        if (existing) {
             const totalQuantity = existing.quantity + tradeData.quantity;
             const totalCost = (existing.quantity * existing.price) + (tradeData.quantity * tradeData.price);
             const avgPrice = totalCost / totalQuantity;
@@ -397,13 +1086,12 @@ document.addEventListener('DOMContentLoaded', () => {
                 });
             }
 
-            trades[existingTradeIndex] = {
+            saved = {
                 ...existing,
                 quantity: totalQuantity,
                 price: avgPrice,
                 date: tradeData.date, // Update with latest buy date
                 reason: tradeData.reason || existing.reason,
-                chart: tradeData.chart || existing.chart,
                 buyDetails: buyDetails
             };
         } else {
@@ -416,10 +1104,16 @@ document.addEventListener('DOMContentLoaded', () => {
             } else {
                 tradeData.buyDetails = [];
             }
-            trades.push(tradeData);
+            saved = tradeData;
         }
 
-        localStorage.setItem('stockTrades', JSON.stringify(trades));
+        try {
+            await updateJournal({ put: { trades: [saved] } });
+        } catch (err) {
+            console.error('Could not save the trade:', err);
+            alert('저장하지 못했습니다.');
+            return;
+        }
 
         // Reset and close
         tradeForm.reset();
@@ -443,7 +1137,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const maxSellQtySpan = document.getElementById('maxSellQty');
 
     // Handle sell form submission
-    sellForm.onsubmit = (e) => {
+    sellForm.onsubmit = async (e) => {
         e.preventDefault();
         const ticker = sellTickerInput.value;
         const sellQty = parseFloat(sellQtyInput.value);
@@ -452,18 +1146,16 @@ document.addEventListener('DOMContentLoaded', () => {
         const sellReason = document.getElementById('sellReason').value;
         const sellChart = document.getElementById('sellChart').value;
 
-        let trades = JSON.parse(localStorage.getItem('stockTrades') || '[]');
-        const tradeIndex = trades.findIndex(t => t.ticker === ticker);
+        await loadJournal();
+        const trade = journal.trades.get(ticker);
 
-        if (tradeIndex === -1 || trades[tradeIndex].quantity < sellQty) {
+        if (!trade || trade.quantity < sellQty) {
             alert('보유 수량이 부족하거나 오류가 발생했습니다.');
             return;
         }
 
-        const trade = trades[tradeIndex];
-
         // Fee Calculation (Toss Securities)
-        const isKR = ticker.endsWith('.KS') || ticker.endsWith('.KQ');
+        const isKR = isKoreanTicker(ticker);
         const buyFeeRate = isKR ? 0.00015 : 0.001;
         const sellFeeRate = isKR ? 0.00195 : 0.001; // Domestic Sell: 0.015% fee + 0.18% tax
 
@@ -471,13 +1163,12 @@ document.addEventListener('DOMContentLoaded', () => {
         const revenue = sellQty * sellPrice * (1 - sellFeeRate);
         const profit = revenue - costBasis;
 
-        // Load History
-        let history = JSON.parse(localStorage.getItem('stockHistory') || '[]');
-        const existingHistoryIndex = history.findIndex(h => h.ticker === ticker);
+        // Closed trades of the same ticker are aggregated into one entry
+        const existing = [...journal.history.values()].find(h => h.ticker === ticker);
+        let historyEntry;
 
-        if (existingHistoryIndex !== -1) {
+        if (existing) {
             // Aggregate with existing history
-            const existing = history[existingHistoryIndex];
 
             const totalQty = existing.quantity + sellQty;
 
@@ -509,7 +1200,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 });
             }
 
-            history[existingHistoryIndex] = {
+            historyEntry = {
                 ...existing,
                 sellDate: sellDate > existing.sellDate ? sellDate : existing.sellDate,
                 quantity: totalQty,
@@ -522,7 +1213,7 @@ document.addEventListener('DOMContentLoaded', () => {
         } else {
             // Create new history entry
             const profitRate = (profit / costBasis) * 100;
-            const historyEntry = {
+            historyEntry = {
                 ticker: ticker,
                 buyDate: trade.date,
                 sellDate: sellDate,
@@ -539,19 +1230,22 @@ document.addEventListener('DOMContentLoaded', () => {
                 }],
                 id: Date.now()
             };
-            history.push(historyEntry);
         }
 
-        // Save History
-        localStorage.setItem('stockHistory', JSON.stringify(history));
-
-        // Update Trades (Handle partial sell)
+        // Save the history entry and the holding (handle partial sell) together
+        const change = { put: { history: [historyEntry] } };
         if (trade.quantity === sellQty) {
-            trades.splice(tradeIndex, 1);
+            change.remove = { trades: [trade] };
         } else {
-            trade.quantity -= sellQty;
+            change.put.trades = [{ ...trade, quantity: trade.quantity - sellQty }];
+        }
+        try {
+            await updateJournal(change);
+        } catch (err) {
+            console.error('Could not save the sale:', err);
+            alert('저장하지 못했습니다.');
+            return;
         }
-        localStorage.setItem('stockTrades', JSON.stringify(trades));
 
         sellForm.reset();
         sellModal.style.display = 'none';
@@ -564,8 +1258,8 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Function to render trade history
     function renderTradeHistory() {
-        const trades = JSON.parse(localStorage.getItem('stockTrades') || '[]');
-        const historyList = JSON.parse(localStorage.getItem('stockHistory') || '[]');
+        const trades = [...journal.trades.values()];
+        const historyList = [...journal.history.values()];
 
         // --- Calculate Summary Stats ---
         let evalKRW = 0, costKRW = 0;
@@ -573,8 +1267,8 @@ document.addEventListener('DOMContentLoaded', () => {
         let realizedProfitKRW = 0, realizedProfitUSD = 0;
 
         trades.forEach(t => {
-            const isKR = t.ticker.endsWith('.KS') || t.ticker.endsWith('.KQ');
-            const currentPrice = getCurrentPrice(t.ticker) || t.price;
+            const isKR = isKoreanTicker(t.ticker);
+            const currentPrice = tickerPrices.get(t.ticker) || t.price;
             const evalAmount = t.quantity * currentPrice;
             const costAmount = t.quantity * t.price;
             if (isKR) {
@@ -587,7 +1281,7 @@ document.addEventListener('DOMContentLoaded', () => {
         });
 
         historyList.forEach(h => {
-            const isKR = h.ticker.endsWith('.KS') || h.ticker.endsWith('.KQ');
+            const isKR = isKoreanTicker(h.ticker);
             if (isKR) realizedProfitKRW += h.profit;
             else realizedProfitUSD += h.profit;
         });
@@ -628,10 +1322,10 @@ document.addEventListener('DOMContentLoaded', () => {
             trades.forEach(trade => {
                 const row = document.createElement('tr');
                 const totalCost = trade.quantity * trade.price;
-                const isKR = trade.ticker.endsWith('.KS') || trade.ticker.endsWith('.KQ');
+                const isKR = isKoreanTicker(trade.ticker);
                 const currency = isKR ? '₩' : '$';
 
-                const currentPrice = getCurrentPrice(trade.ticker) || trade.price; // Fallback to buy price
+                const currentPrice = tickerPrices.get(trade.ticker) || trade.price; // Fallback to buy price
                 const evalAmount = trade.quantity * currentPrice;
                 const pl = evalAmount - totalCost;
                 const plClass = pl >= 0 ? 'positive' : 'negative';
@@ -657,7 +1351,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     </td>
                     <td>
                         <div class="reason-chart-cell">
-                            ${(trade.buyDetails && trade.buyDetails.some(d => d.chart)) || trade.chart ? `<button class="icon-btn chart-btn" title="차트 보기"><i class="ri-line-chart-line"></i></button>` : '-'}
+                            ${(trade.buyDetails && trade.buyDetails.some(d => d.chart || d.chartId)) || trade.chart ? `<button class="icon-btn chart-btn" title="차트 보기"><i class="ri-line-chart-line"></i></button>` : '-'}
                         </div>
                     </td>
                     <td><button class="sell-btn" data-ticker="${trade.ticker}">매도</button></td>
@@ -685,7 +1379,9 @@ document.addEventListener('DOMContentLoaded', () => {
                         if (details.length === 0 && trade.chart) {
                             details = [{ date: trade.date, chart: trade.chart }];
                         }
-                        showDetailModal('매수 차트', details.map(d => ({ date: d.date, chart: d.chart })));
+                        Promise.all(details.map(detailChart)).then(charts => {
+                            showDetailModal('매수 차트', details.map((d, i) => ({ date: d.date, chart: charts[i] })));
+                        });
                     });
                 }
 
@@ -694,9 +1390,8 @@ document.addEventListener('DOMContentLoaded', () => {
                 row.querySelector('.delete-item-btn').addEventListener('click', (e) => {
                     e.stopPropagation();
                     if (confirm(`${trade.ticker} 정보를 삭제하시겠습니까?`)) {
-                        let trades = JSON.parse(localStorage.getItem('stockTrades') || '[]');
-                        trades = trades.filter(t => t.ticker !== trade.ticker);
-                        localStorage.setItem('stockTrades', JSON.stringify(trades));
+                        updateJournal({ remove: { trades: [trade] } })
+                            .catch(err => console.error('Could not delete the holding:', err));
                         renderTradeHistory();
                     }
                 });
@@ -748,7 +1443,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     </td>
                     <td>
                         <div class="reason-chart-cell">
-                            ${(item.sellDetails && item.sellDetails.some(d => d.chart)) || item.sellChart ? `<button class="icon-btn sell-chart-btn" title="차트 보기"><i class="ri-line-chart-line"></i></button>` : '-'}
+                            ${(item.sellDetails && item.sellDetails.some(d => d.chart || d.chartId)) || item.sellChart ? `<button class="icon-btn sell-chart-btn" title="차트 보기"><i class="ri-line-chart-line"></i></button>` : '-'}
                         </div>
                     </td>
                 `;
@@ -773,7 +1468,9 @@ document.addEventListener('DOMContentLoaded', () => {
                         if (details.length === 0 && item.sellChart) {
                             details = [{ date: item.sellDate, chart: item.sellChart }];
                         }
-                        showDetailModal('매도 차트', details.map(d => ({ date: d.date, chart: d.chart })));
+                        Promise.all(details.map(detailChart)).then(charts => {
+                            showDetailModal('매도 차트', details.map((d, i) => ({ date: d.date, chart: charts[i] })));
+                        });
                     });
                 }
 
@@ -781,9 +1478,8 @@ document.addEventListener('DOMContentLoaded', () => {
                 row.querySelector('.delete-item-btn').addEventListener('click', (e) => {
                     e.stopPropagation();
                     if (confirm(`해당 거래 기록을 삭제하시겠습니까 ? `)) {
-                        let history = JSON.parse(localStorage.getItem('stockHistory') || '[]');
-                        history = history.filter(h => h.id !== item.id);
-                        localStorage.setItem('stockHistory', JSON.stringify(history));
+                        updateJournal({ remove: { history: [item] } })
+                            .catch(err => console.error('Could not delete the trade record:', err));
                         renderTradeHistory();
                     }
                 });
@@ -807,40 +1503,94 @@ document.addEventListener('DOMContentLoaded', () => {
         nasdaqTab.textContent = 'NASDAQ 300';
     }
 
-    // Default sort by green cell count for the initial market (SP500)
-    displayData.sort((a, b) => getGreenCellCount(b) - getGreenCellCount(a));
-
-    // Initial render
-    renderTable(displayData);
-    renderRecommendations();
+    // Show the table of the active market, sorted by green cell count by default
+    function showMarket(market) {
+        if (market !== currentMarket) return; // another tab was clicked meanwhile
+        displayData = orderedRows(market, 'green_cells', 'desc');
+        if (!displayData) {
+            displayData = [...(marketData[market] || [])];
+            displayData.sort((a, b) => (b.green_cells || 0) - (a.green_cells || 0));
+        }
+        renderTable(displayData);
+    }
 
-    // Tab switching logic
-    const tabBtns = document.querySelectorAll('.tab-btn');
-    tabBtns.forEach(btn => {
-        btn.addEventListener('click', () => {
-            // Update active styling
-            tabBtns.forEach(b => b.classList.remove('active'));
-            btn.classList.add('active');
+    // The first shard of a large market is shown right away and replaced once all shards
+    // are in; an active search is run again on the complete table
+    document.addEventListener('marketpartial', e => showMarket(e.detail));
+    document.addEventListener('marketloaded', e => {
+        if (e.detail !== currentMarket) return;
+        showMarket(e.detail);
+        if (document.getElementById('searchInput').value) {
+            document.getElementById('searchInput').dispatchEvent(new Event('input'));
+        }
+    });
 
-            // Update current market and table data
-            currentMarket = btn.getAttribute('data-market');
-            displayData = [...(mockMarketData[currentMarket] || [])];
+    // Tabs follow the manifest: labels come from it, markets it doesn't list are hidden
+    // and markets missing from the page (NYSE, KOSDAQ in the full universe) are added
+    const tabContainer = document.querySelector('.market-tabs');
+    function syncMarketTabs(manifest) {
+        MARKETS.forEach(market => {
+            let btn = tabContainer.querySelector(`.tab-btn[data-market="${market}"]`);
+            if (!btn) {
+                btn = document.createElement('button');
+                btn.className = 'tab-btn';
+                btn.setAttribute('data-market', market);
+                tabContainer.appendChild(btn);
+            }
+            if (manifest.markets[market].label || !btn.textContent) {
+                btn.textContent = marketLabels[market] || market;
+            }
+        });
+        tabContainer.querySelectorAll('.tab-btn').forEach(btn => {
+            btn.style.display = MARKETS.includes(btn.getAttribute('data-market')) ? '' : 'none';
+        });
+    }
 
-            // Sort by green cell count by default
-            displayData.sort((a, b) => getGreenCellCount(b) - getGreenCellCount(a));
+    // Initial render: only the active market is loaded, the recommendation row comes with
+    // the manifest. Other markets are loaded when their tab is opened (or by the trade
+    // history and the all-markets export, which need every market).
+    loadManifest().then(manifest => {
+        if (manifest && manifest.markets) syncMarketTabs(manifest);
+        renderRecommendations(manifest);
+        loadTrends(manifest).then(trends => {
+            if (trends) renderRecommendations(manifest, trends);
+        });
+        return loadMarket(currentMarket);
+    }).then(() => showMarket(currentMarket));
 
-            // Reset sorting
-            currentSortColumn = null;
-            currentSortOrder = null;
-            document.querySelectorAll('th.sortable .sort-icon').forEach(icon => {
-                icon.className = 'ri-expand-up-down-line sort-icon';
-            });
+    // Tab switching logic
+    tabContainer.addEventListener('click', e => {
+        const btn = e.target.closest('.tab-btn');
+        if (!btn) return;
+        // Update active styling
+        tabContainer.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
+        btn.classList.add('active');
+
+        // Update current market and table data
+        currentMarket = btn.getAttribute('data-market');
+
+        // Reset sorting
+        currentSortColumn = null;
+        currentSortOrder = null;
+        document.querySelectorAll('th.sortable .sort-icon').forEach(icon => {
+            icon.className = 'ri-expand-up-down-line sort-icon';
+        });
 
-            // Clear search
-            document.getElementById('searchInput').value = '';
+        // Clear search
+        document.getElementById('searchInput').value = '';
 
-            renderTable(displayData);
-        });
+        // Already loaded markets render synchronously. Otherwise a search entered while the
+        // market loads (a recommendation card sets one right after switching) is run again.
+        if (marketData[currentMarket]) {
+            showMarket(currentMarket);
+        } else {
+            const market = currentMarket;
+            loadMarket(market).then(() => {
+                showMarket(market);
+                const searchInput = document.getElementById('searchInput');
+                if (market === currentMarket && searchInput.value) searchInput.dispatchEvent(new Event('input'));
+            });
+        }
     });
 
     // Setup sorting
@@ -887,6 +1637,17 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     });
 
+    // Only the rows in view are rendered, the rest follows the scroll position
+    const stockTableContainer = document.getElementById('stockTableBody').closest('.table-container');
+    stockTableContainer.addEventListener('scroll', () => {
+        if (tableView.frame) return;
+        tableView.frame = requestAnimationFrame(() => {
+            tableView.frame = null;
+            renderVisibleRows();
+        });
+    }, { passive: true });
+    window.addEventListener('resize', () => renderVisibleRows());
+
     // Search functionality (Scroll to ticker)
     const searchInput = document.getElementById('searchInput');
     searchInput.addEventListener('input', (e) => {
@@ -894,35 +1655,29 @@ document.addEventListener('DOMContentLoaded', () => {
         if (!query) return;
 
         // 1. Try exact ticker match
-        let targetRow = document.getElementById(`row-${query}`);
+        let index = tableView.tickerIndex.has(query) ? tableView.tickerIndex.get(query) : -1;
+
+        // 2. Try prefix ticker match, then a name prefix, through the search index
+        const indexes = marketIndexes[currentMarket];
+        if (index < 0 && indexes) {
+            const key = normalizeSearch(e.target.value);
+            index = firstShownMatch(currentMarket, prefixMatches(indexes.search.ticker, key));
+            if (index < 0) index = firstShownMatch(currentMarket, prefixMatches(indexes.search.name, key));
+        }
 
-        // 2. Try prefix ticker match
-        if (!targetRow) {
-            const matchedTicker = displayData.find(s => s.ticker.toUpperCase().startsWith(query));
-            if (matchedTicker) {
-                targetRow = document.getElementById(`row-${matchedTicker.ticker.toUpperCase()}`);
-            }
+        // Without an index (or for a match inside a word): scan the rows
+        if (index < 0) {
+            index = tableView.data.findIndex(s => s.ticker.toUpperCase().startsWith(query));
         }
 
         // 3. Try partial name match (case-insensitive)
-        if (!targetRow) {
+        if (index < 0) {
             const lowerQuery = e.target.value.trim().toLowerCase();
-            const matchedName = displayData.find(s => s.name.toLowerCase().includes(lowerQuery));
-            if (matchedName) {
-                targetRow = document.getElementById(`row-${matchedName.ticker.toUpperCase()}`);
-            }
+            index = tableView.data.findIndex(s => s.name.toLowerCase().includes(lowerQuery));
         }
 
-        if (targetRow) {
-            // Scroll table so row is visible instantly (no smooth animation)
-            targetRow.scrollIntoView({ behavior: 'auto', block: 'center' });
-
-            // Highlight the row temporarily
-            targetRow.style.backgroundColor = 'rgba(88, 166, 255, 0.3)';
-            targetRow.style.transition = 'background-color 0.5s';
-            setTimeout(() => {
-                targetRow.style.backgroundColor = '';
-            }, 1000);
+        if (index >= 0) {
+            scrollToStockRow(index);
         }
     });
 
@@ -983,7 +1738,7 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
-    // Download functionality
+    // Download functionality: the table as shown, or every market with a market column
     const downloadBtn = document.getElementById('downloadBtn');
     if (downloadBtn) {
         downloadBtn.addEventListener('click', () => {
@@ -991,43 +1746,28 @@ document.addEventListener('DOMContentLoaded', () => {
                 alert("다운로드할 데이터가 없습니다.");
                 return;
             }
-
-            // CSV Header
-            let csvContent = "data:text/csv;charset=utf-8,\uFEFF"; // \uFEFF for UTF-8 BOM (Excel support)
-            csvContent += "티커,기업명,역사적 최고가,최고가 이후 최저가,오늘 종가,조정 비율,종가/최고가 비율,최고가 경과일,20 이평선 이격도,50 이평선 이격도,20-50 이평선 이격도,EPS Q0,EPS Q-1,EPS Q-2,EPS Q-3,PER,ROE\n";
-
-            // CSV Rows
-            displayData.forEach(row => {
-                const rowData = [
-                    row.ticker,
-                    '"' + row.name.split('"').join('""') + '"', // Handle commas quoting in names
-                    row.ath,
-                    row.lowest_after_ath,
-                    row.price,
-                    row.correction_ratio,
-                    row.price_to_ath,
-                    row.days_since_ath,
-                    row.ma_20_spread,
-                    row.ma_50_spread,
-                    row.ma_20_50_spread,
-                    row.eps_q0,
-                    row.eps_q1,
-                    row.eps_q2,
-                    row.eps_q3,
-                    row.per,
-                    row.roe
-                ];
-                csvContent += rowData.join(",") + "\n";
-            });
-
-            // Trigger Download
-            const encodedUri = encodeURI(csvContent);
-            const link = document.createElement("a");
-            link.setAttribute("href", encodedUri);
-            link.setAttribute("download", "StockMap_Data.csv");
-            document.body.appendChild(link); // Required for Firefox
-            link.click();
-            document.body.removeChild(link);
+            downloadBtn.disabled = true;
+            exportCsv(EXPORT_COLUMNS, [{ market: currentMarket, rows: displayData }])
+                .then(blob => downloadBlob(blob, "StockMap_Data.csv"))
+                .finally(() => { downloadBtn.disabled = false; });
+        });
+    }
+    const downloadAllBtn = document.getElementById('downloadAllBtn');
+    if (downloadAllBtn) {
+        downloadAllBtn.addEventListener('click', () => {
+            downloadAllBtn.disabled = true;
+            loadAllMarkets()
+                .then(() => exportCsv([MARKET_COLUMN, ...EXPORT_COLUMNS], MARKETS.map(market => ({ market, rows: marketData[market] || [] }))))
+                .then(blob => downloadBlob(blob, "StockMap_AllMarkets.csv"))
+                .finally(() => { downloadAllBtn.disabled = false; });
         });
     }
+    // The daily snapshot of all markets as Parquet (artifact.export_parquet), once published
+    const parquetLink = document.getElementById('parquetLink');
+    loadManifest().then(manifest => {
+        if (parquetLink && manifest && manifest.exports && manifest.exports.parquet) {
+            parquetLink.href = `data/${manifest.exports.parquet}?v=${manifest.generated_at || ''}`;
+            parquetLink.style.display = '';
+        }
+    });
 });
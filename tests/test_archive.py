@@ -0,0 +1,47 @@
+import json
+import os
+from datetime import date, timedelta
+
+import archive
+import artifact
+
+
+def archive_days(root, count, start=date(2026, 1, 1)):
+    # T0 is always near its ATH, T1 on every third day, T2 never
+    for n in range(count):
+        records = [{"ticker": f"T{i}", "price": 100.0 + n + i,
+                    "price_to_ath": 0.99 if i == 0 or (i == 1 and n % 3) else 0.5} for i in range(3)]
+        archive.append({"SP500": records}, day=start + timedelta(days=n), root=root)
+
+
+def test_streaks_carried_over_match_a_full_scan(tmp_path, monkeypatch):
+    root = str(tmp_path / 'archive')
+    archive_days(root, 12)
+    state = archive.trends(root, days=5)['streaks']
+    archive_days(root, 3, start=date(2026, 1, 13))
+
+    read = []
+    original = archive._read
+    monkeypatch.setattr(archive, '_read', lambda path, *a, **k: read.append(path) or original(path, *a, **k))
+    carried = archive.trends(root, days=5, state=state)
+    # Only the days since the state: the three before the window and the window itself
+    assert len(read) == 8
+    assert carried == archive.trends(root, days=5)
+    assert carried['tickers']['T0']['near_ath_days'] == 15
+
+
+def test_rewriting_unchanged_trends_changes_nothing(tmp_path):
+    root = str(tmp_path)
+    archive_days(os.path.join(root, 'archive'), 8)
+    archive.write_trends(root)
+    with open(os.path.join(root, artifact.MANIFEST_NAME)) as f:
+        manifest = f.read()
+    with open(os.path.join(root, archive.TRENDS_NAME)) as f:
+        trends = f.read()
+
+    archive.write_trends(root)
+    with open(os.path.join(root, artifact.MANIFEST_NAME)) as f:
+        assert f.read() == manifest
+    with open(os.path.join(root, archive.TRENDS_NAME)) as f:
+        assert f.read() == trends
+    assert json.loads(trends)['tickers']['T0']['near_ath_days'] == 8
@@ -0,0 +1,56 @@
+import os
+
+import artifact
+
+
+def make_records(n=30, shift=0.0):
+    return [{
+        "ticker": f"T{i:03d}",
+        "name": f"Company {i}",
+        "price": round(100 + i + shift, 2),
+        "price_to_ath": round(0.5 + i / 100, 3),
+        "eps_q0": None if i % 4 == 0 else i * 1.5,
+    } for i in range(n)]
+
+
+def snapshot_files(root):
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+
+def test_publishing_the_same_data_twice_changes_nothing(tmp_path):
+    root = str(tmp_path)
+    market_data = {"SP500": make_records(), "KOSPI": make_records(10)}
+    artifact.publish(market_data, root=root, labels={"SP500": "S&P 500"})
+    artifact.export_parquet(root)
+    first = snapshot_files(root)
+
+    artifact.publish({name: make_records(len(r)) for name, r in market_data.items()}, root=root,
+                     labels={"SP500": "S&P 500"})
+    artifact.export_parquet(root)
+    assert snapshot_files(root) == first
+
+
+def test_repeated_intraday_refresh_changes_nothing(tmp_path):
+    root = str(tmp_path)
+    artifact.publish({"SP500": make_records()}, root=root, version="v1")
+    artifact.publish_intraday({"SP500": make_records(shift=1.5)}, root=root)
+    first = snapshot_files(root)
+    assert os.path.join("intraday", "SP500.json") in first
+
+    artifact.publish_intraday({"SP500": make_records(shift=1.5)}, root=root)
+    assert snapshot_files(root) == first
+
+
+def test_changed_data_bumps_the_manifest(tmp_path):
+    root = str(tmp_path)
+    artifact.publish({"SP500": make_records()}, root=root, version="v1")
+    artifact.publish({"SP500": make_records(shift=1.0)}, root=root, version="v2")
+    manifest = artifact.load_manifest(root)
+    assert manifest["markets"]["SP500"]["version"] == "v2"
+    assert [d["to"] for d in manifest["markets"]["SP500"]["deltas"]] == ["v2"]
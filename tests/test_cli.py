@@ -0,0 +1,89 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+import pytz
+
+import checkpoint
+import fetch_all_data
+
+
+ITEMS = [(f"T{i:02d}", f"Company {i}", "Tech") for i in range(12)]
+
+
+def fake_record(item):
+    i = int(item[0][1:])
+    return {
+        "ticker": item[0], "name": item[1], "industry": item[2],
+        "ath": 100.0, "lowest_after_ath": 60.0, "price": 60.0 + i, "correction_ratio": 0.3,
+        "price_to_ath": round((60.0 + i) / 100, 3), "days_since_ath": 100,
+        "ma_20_spread": 0.01, "ma_50_spread": 0.02, "ma_20_50_spread": 0.01,
+        "eps_q0": 25.0, "eps_q1": 30.0, "eps_q2": None, "eps_q3": None, "per": 15.0, "roe": 20.0,
+    }
+
+
+@pytest.fixture
+def offline_run(tmp_path, monkeypatch):
+    # A run of a two-market universe, with the fetch replaced by checkpointed fake records.
+    # Every relative path (cache/, data/) lands in tmp_path.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(fetch_all_data.UNIVERSES, 'default', [
+        ("SP500", "SP500", lambda: ITEMS[:8], "S&P 500"),
+        ("NASDAQ", "NASDAQ", lambda: ITEMS[4:], "NASDAQ 300"),
+    ])
+
+    def run_markets(markets, run_id, resume=False):
+        writers = {}
+        for name, items in markets.items():
+            writers[name] = checkpoint.CheckpointWriter(run_id, name, fetch_all_data.sort_key)
+            writers[name].write_chunk([item[0] for item in items], [fake_record(item) for item in items])
+        return writers
+
+    monkeypatch.setattr(fetch_all_data, 'run_markets', run_markets)
+    return tmp_path
+
+
+def test_parse_args_reads_output_and_markets():
+    args = fetch_all_data.parse_args(['--output', 'out', '--markets', 'sp500', '--dry-run'])
+    assert (args.output, args.markets, args.dry_run) == ('out', ['SP500'], True)
+
+
+def test_output_directory_gets_the_data_and_the_run_report(offline_run):
+    fetch_all_data.main(output='out')
+    assert os.path.exists(os.path.join('out', 'SP500.json'))
+    assert os.path.exists(os.path.join('out', 'run_report.json'))
+    assert not os.path.exists('data')
+    with open(os.path.join('out', 'run_report.json')) as f:
+        assert json.load(f)["records"] == {"SP500": 8, "NASDAQ": 8}
+
+
+def test_dry_run_writes_nothing(offline_run):
+    fetch_all_data.main(output='out', dry_run=True)
+    assert not os.path.exists('out')
+
+
+def test_sessions_are_checked_per_market():
+    eastern = pytz.timezone('US/Eastern')
+    seoul = pytz.timezone('Asia/Seoul')
+    monday_us = eastern.localize(datetime(2026, 10, 19, 10, 0))
+    monday_kr = seoul.localize(datetime(2026, 10, 19, 10, 0))
+    assert fetch_all_data.is_market_open('SP500', monday_us)
+    assert not fetch_all_data.is_market_open('SP500', monday_us.replace(hour=9, minute=29))
+    assert fetch_all_data.is_market_open('KOSPI', monday_kr)
+    assert not fetch_all_data.is_market_open('KOSDAQ', monday_kr.replace(hour=15, minute=30))
+    assert not fetch_all_data.is_market_open('KOSPI', monday_kr.replace(day=18))  # Sunday
+
+
+def test_refresh_only_quotes_markets_in_session(offline_run, monkeypatch):
+    fetch_all_data.main(output='out')
+    quoted = []
+    monkeypatch.setattr(fetch_all_data, 'is_market_open', lambda market=None, now=None: market == 'NASDAQ')
+    monkeypatch.setattr(fetch_all_data, 'fetch_all_quotes', lambda symbols, name: quoted.append(name) or {})
+    fetch_all_data.refresh_prices(output='out')
+    assert quoted == ['NASDAQ']
+
+    quoted.clear()
+    monkeypatch.setattr(fetch_all_data, 'is_market_open', lambda market=None, now=None: False)
+    fetch_all_data.refresh_prices(output='out')
+    assert quoted == []
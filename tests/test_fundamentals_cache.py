@@ -0,0 +1,37 @@
+from datetime import date
+
+import fundamentals_cache
+
+QUARTERS = ['2024-03-31', '2024-06-30', '2024-09-30', '2024-12-31',
+            '2025-03-31', '2025-06-30', '2025-09-30', '2025-12-31']
+
+
+def modules(history, series):
+    return {
+        'earningsHistory': {'history': [{'quarter': q, 'epsActual': v} for q, v in history]},
+        'quarterlyEps': {'history': [{'asOfDate': q, 'DilutedEPS': v} for q, v in series]},
+        'calendarEvents': {'earnings': {'earningsDate': ['2026-02-01']}},
+    }
+
+
+def test_first_fetch_has_growth_for_every_quarter():
+    # earningsHistory only has the last four quarters; the series brings the year-ago ones
+    entry = fundamentals_cache.parse_entry(modules(
+        [(q, 2.0) for q in QUARTERS[4:]],
+        [(q, 1.0) for q in QUARTERS]), today=date(2026, 1, 10))
+    assert all(g is not None for g in fundamentals_cache.eps_growth(entry))
+
+
+def test_quarters_are_compared_within_one_series():
+    entry = fundamentals_cache.parse_entry(modules(
+        [(q, 2.0) for q in QUARTERS[3:]],
+        [(q, 1.0) for q in QUARTERS[:4]] + [(q, 1.5) for q in QUARTERS[4:]]), today=date(2026, 1, 10))
+    # Q0 (2025-12-31) has its year-ago actual in earningsHistory, Q1..Q3 only in the series
+    assert fundamentals_cache.eps_growth(entry) == [0.0, 50.0, 50.0, 50.0]
+
+
+def test_entries_without_the_series_are_refetched_once():
+    entry = fundamentals_cache.parse_entry(modules([], []), today=date(2026, 1, 10))
+    assert not fundamentals_cache.is_stale(entry, date(2026, 1, 10))
+    del entry['diluted_eps']
+    assert fundamentals_cache.is_stale(entry, date(2026, 1, 10))
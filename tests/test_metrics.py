@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import metrics
+
+
+def brute_force_percentile(values, window):
+    # Every row ranked against its trailing window by rescanning it
+    def rank(w):
+        if np.isnan(w[-1]):
+            return np.nan
+        valid = w[~np.isnan(w)]
+        return (valid < w[-1]).sum() / len(valid) * 100
+    return pd.DataFrame(values).rolling(window, min_periods=1).apply(rank, raw=True).to_numpy()
+
+
+@pytest.mark.parametrize('window', [1, 2, 5, 20, 253, 1000])
+def test_rolling_percentile_matches_brute_force(window):
+    rng = np.random.default_rng(window)
+    values = rng.normal(size=(300, 4)).round(1)  # rounded, so there are ties
+    values[rng.random(values.shape) < 0.15] = np.nan
+    values[:40, 2] = np.nan
+    values[:, 3] = np.nan
+    np.testing.assert_allclose(metrics.rolling_percentile(values, window),
+                               brute_force_percentile(values, window), equal_nan=True)
+
+
+def test_ma_spread_percentile_ranks_the_latest_spread():
+    rng = np.random.default_rng(0)
+    close = 100 + rng.normal(size=(260, 3)).cumsum(axis=0)
+    close[:230, 1] = np.nan  # too short to be ranked
+    ranks = metrics.ma_spread_percentile(close, window=100)
+
+    ma = {w: pd.DataFrame(close[:, 0]).rolling(w).mean()[0] for w in (10, 20, 50)}
+    spread = ((ma[10] - ma[50]).abs() + (ma[20] - ma[50]).abs()).to_numpy()[-100:]
+    expected = (spread[~np.isnan(spread)] < spread[-1]).mean() * 100
+    assert ranks[0] == round(expected, 2)
+    assert ranks[1] is None
+    assert ranks[2] is not None
@@ -0,0 +1,26 @@
+import screener
+
+
+def eps_record(ticker, q0, q1):
+    return {"ticker": ticker, "name": ticker, "correction_ratio": 0.2, "price_to_ath": 0.9,
+            "days_since_ath": 100, "ma_20_spread": 0.01, "ma_50_spread": 0.01, "eps_q0": q0, "eps_q1": q1}
+
+
+def test_eps_rule_needs_both_quarters_grown_or_both_missing():
+    records = [
+        eps_record('BOTH_GROWN', 25, 30),
+        eps_record('BOTH_MISSING', None, None),
+        eps_record('GROWN_THEN_MISSING', 25, None),
+        eps_record('MISSING_THEN_GROWN', None, 25),
+        eps_record('ONE_SLOW', 25, 10),
+        eps_record('ZERO', 0, 0),
+    ]
+    picks = screener.screen_market('SP500', records, {})['recommended']
+    assert sorted(r['ticker'] for r in picks) == ['BOTH_GROWN', 'BOTH_MISSING']
+
+
+def test_flags_record_the_eps_rule():
+    records = [eps_record('A', 25, None), eps_record('B', 25, 20)]
+    screener.screen_market('SP500', records, {})
+    bit = 1 << screener.flag_names().index('recommended.eps')
+    assert [bool(r['flags'] & bit) for r in records] == [False, True]
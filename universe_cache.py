@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timedelta
+
+import instrumentation
+
+UNIVERSE_DIR = os.path.join('cache', 'universe')
+
+# Index membership changes a few times a quarter, so listings are reused for a week by default
+UNIVERSE_TTL_HOURS = float(os.environ.get('STOCKMAP_UNIVERSE_TTL_HOURS', 24 * 7))
+
+# Number of membership changes kept in each universe file
+MAX_CHANGES = 20
+
+
+def _read_json(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def fetch_url(url, headers, root=UNIVERSE_DIR):
+    # Conditional GET: the last body is kept together with its ETag/Last-Modified so an
+    # unchanged page costs a 304 instead of a full download
+    key = hashlib.sha1(url.encode()).hexdigest()[:16]
+    meta_path = os.path.join(root, 'http', key + '.json')
+    body_path = os.path.join(root, 'http', key + '.body')
+    meta = _read_json(meta_path) or {}
+
+    request_headers = dict(headers)
+    if os.path.exists(body_path):
+        if meta.get('etag'):
+            request_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            request_headers['If-Modified-Since'] = meta['last_modified']
+
+    provider = urllib.parse.urlparse(url).hostname
+    try:
+        resp = urllib.request.urlopen(urllib.request.Request(url, headers=request_headers))
+        body = resp.read()
+        instrumentation.report.request(provider, nbytes=len(body))
+    except urllib.error.HTTPError as e:
+        instrumentation.report.request(provider)
+        if e.code == 304:
+            instrumentation.report.count('http not modified')
+            with open(body_path, 'rb') as f:
+                return f.read()
+        raise
+
+    os.makedirs(os.path.dirname(body_path), exist_ok=True)
+    with open(body_path, 'wb') as f:
+        f.write(body)
+    _write_json(meta_path, {
+        'url': url,
+        'etag': resp.headers.get('ETag'),
+        'last_modified': resp.headers.get('Last-Modified'),
+    })
+    return body
+
+
+def _content_hash(items):
+    return hashlib.sha256(json.dumps(items, ensure_ascii=False).encode()).hexdigest()
+
+
+def load_universe(name, root=UNIVERSE_DIR):
+    return _read_json(os.path.join(root, f"{name}.json"))
+
+
+# Return the (ticker, name, sector) items of a universe, calling `fetch_items` only when the
+# cached listing is older than `ttl_hours`. Each refresh records which tickers were added to
+# or removed from the universe; if the listing endpoint is down the stale copy is used.
+def cached_universe(name, fetch_items, ttl_hours=UNIVERSE_TTL_HOURS, root=UNIVERSE_DIR):
+    path = os.path.join(root, f"{name}.json")
+    cached = _read_json(path)
+    now = datetime.now()
+
+    if cached:
+        age = now - datetime.fromisoformat(cached['fetched_at'])
+        if age < timedelta(hours=ttl_hours):
+            print(f"[{name}] Using cached listing from {cached['fetched_at']} ({len(cached['items'])} companies)")
+            return [tuple(item) for item in cached['items']]
+
+    try:
+        items = [list(item) for item in fetch_items()]
+    except Exception as e:
+        if not cached:
+            raise
+        print(f"[{name}] Listing fetch failed ({e}), reusing listing from {cached['fetched_at']}")
+        return [tuple(item) for item in cached['items']]
+
+    content_hash = _content_hash(items)
+    changes = cached.get('changes', []) if cached else []
+    if cached and cached.get('hash') != content_hash:
+        old = {item[0] for item in cached['items']}
+        new = {item[0] for item in items}
+        added = sorted(new - old)
+        removed = sorted(old - new)
+        if added or removed:
+            print(f"[{name}] Universe changed: +{len(added)} {added} / -{len(removed)} {removed}")
+            changes = (changes + [{'date': now.isoformat(timespec='seconds'), 'added': added, 'removed': removed}])[-MAX_CHANGES:]
+
+    _write_json(path, {
+        'name': name,
+        'fetched_at': now.isoformat(timespec='seconds'),
+        'hash': content_hash,
+        'items': items,
+        'changes': changes,
+    })
+    return [tuple(item) for item in items]